@@ -105,6 +105,30 @@ INSERT INTO `customers` VALUES ('noa.reg1@flytau.com','2003-05-10','2025-12-01',
 /*!40000 ALTER TABLE `customers` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `disruption_job`
+--
+
+DROP TABLE IF EXISTS `disruption_job`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `disruption_job` (
+  `job_id` varchar(12) NOT NULL,
+  `disruption_filter` varchar(500) NOT NULL,
+  `state` varchar(20) NOT NULL,
+  `started_at` datetime NOT NULL,
+  `updated_at` datetime NOT NULL,
+  `finished_at` datetime DEFAULT NULL,
+  `done_flights` int NOT NULL DEFAULT '0',
+  `total_flights` int DEFAULT NULL,
+  `cancelled_orders` int NOT NULL DEFAULT '0',
+  `duration_ms` decimal(12,2) DEFAULT NULL,
+  `error` varchar(500) DEFAULT NULL,
+  PRIMARY KEY (`job_id`),
+  KEY `disruption_job_started` (`started_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `flight`
 --
@@ -120,10 +144,15 @@ CREATE TABLE `flight` (
   `origin_airport` varchar(10) NOT NULL,
   `destination_airport` varchar(10) NOT NULL,
   `airplane_id` int NOT NULL,
+  `seat_version` bigint NOT NULL DEFAULT '0',
   PRIMARY KEY (`flight_num`),
   UNIQUE KEY `flight_num` (`flight_num`,`airplane_id`),
   KEY `origin_airport` (`origin_airport`,`destination_airport`),
   KEY `airplane_id` (`airplane_id`),
+  KEY `arrival_datetime` (`arrival_datetime`),
+  KEY `flight_search` (`origin_airport`,`destination_airport`,`status`,`departure_datetime`,`arrival_datetime`,`airplane_id`),
+  KEY `flight_departure` (`departure_datetime`),
+  KEY `flight_status_departure` (`status`,`departure_datetime`),
   CONSTRAINT `flight_ibfk_1` FOREIGN KEY (`origin_airport`, `destination_airport`) REFERENCES `routes` (`origin_airport`, `destination_airport`),
   CONSTRAINT `flight_ibfk_2` FOREIGN KEY (`airplane_id`) REFERENCES `airplanes` (`airplane_id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
@@ -135,7 +164,7 @@ CREATE TABLE `flight` (
 
 LOCK TABLES `flight` WRITE;
 /*!40000 ALTER TABLE `flight` DISABLE KEYS */;
-INSERT INTO `flight` VALUES ('1','2026-04-06 18:56:00','2026-04-06 21:26:00','cancelled','TLV','ATH',5),('2','2026-04-05 21:16:00','2026-04-06 08:16:00','cancelled','TLV','BKK',6),('3','2026-01-27 22:20:00','2026-01-28 09:20:00','cancelled','TLV','BKK',1),('4','2026-04-06 23:00:00','2026-04-07 01:30:00','cancelled','TLV','ATH',4),('5','2026-01-26 03:30:00','2026-01-26 08:30:00','cancelled','TLV','LHR',6),('890','2026-01-03 10:00:00','2026-01-03 15:00:00','landed','TLV','LHR',3),('F1001','2026-04-05 08:00:00','2026-04-05 10:30:00','active','TLV','ATH',1),('F1002','2026-04-06 12:00:00','2026-04-06 17:00:00','active','TLV','LHR',2),('F1003','2026-04-03 23:00:00','2026-04-04 10:00:00','active','TLV','JFK',5),('F1004','2026-04-08 09:00:00','2026-04-08 12:40:00','active','ATH','LHR',4),('F1005','2026-04-08 09:00:00','2026-04-08 20:00:00','cancelled','TLV','BKK',5),('F1006','2026-04-08 09:00:00','2026-04-08 21:00:00','delayed','EWR','HNL',6),('F1007','2026-02-18 17:00:00','2026-02-19 04:00:00','delayed','TLV','JFK',8),('F1008','2026-01-15 12:42:00','2026-01-15 17:42:00','landed','TLV','LHR',6),('F1009','2026-01-15 17:48:00','2026-01-15 20:18:00','landed','TLV','ATH',4),('F1010','2026-01-19 20:22:00','2026-01-20 07:22:00','landed','TLV','JFK',5),('F1011','2026-01-28 17:23:00','2026-01-29 04:23:00','active','TLV','JFK',5);
+INSERT INTO `flight` VALUES ('1','2026-04-06 18:56:00','2026-04-06 21:26:00','cancelled','TLV','ATH',5,0),('2','2026-04-05 21:16:00','2026-04-06 08:16:00','cancelled','TLV','BKK',6,0),('3','2026-01-27 22:20:00','2026-01-28 09:20:00','cancelled','TLV','BKK',1,0),('4','2026-04-06 23:00:00','2026-04-07 01:30:00','cancelled','TLV','ATH',4,0),('5','2026-01-26 03:30:00','2026-01-26 08:30:00','cancelled','TLV','LHR',6,0),('890','2026-01-03 10:00:00','2026-01-03 15:00:00','landed','TLV','LHR',3,0),('F1001','2026-04-05 08:00:00','2026-04-05 10:30:00','active','TLV','ATH',1,0),('F1002','2026-04-06 12:00:00','2026-04-06 17:00:00','active','TLV','LHR',2,0),('F1003','2026-04-03 23:00:00','2026-04-04 10:00:00','active','TLV','JFK',5,0),('F1004','2026-04-08 09:00:00','2026-04-08 12:40:00','active','ATH','LHR',4,0),('F1005','2026-04-08 09:00:00','2026-04-08 20:00:00','cancelled','TLV','BKK',5,0),('F1006','2026-04-08 09:00:00','2026-04-08 21:00:00','delayed','EWR','HNL',6,0),('F1007','2026-02-18 17:00:00','2026-02-19 04:00:00','delayed','TLV','JFK',8,0),('F1008','2026-01-15 12:42:00','2026-01-15 17:42:00','landed','TLV','LHR',6,0),('F1009','2026-01-15 17:48:00','2026-01-15 20:18:00','landed','TLV','ATH',4,0),('F1010','2026-01-19 20:22:00','2026-01-20 07:22:00','landed','TLV','JFK',5,0),('F1011','2026-01-28 17:23:00','2026-01-29 04:23:00','active','TLV','JFK',5,0);
 /*!40000 ALTER TABLE `flight` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -193,6 +222,34 @@ INSERT INTO `flight_class_price` VALUES ('1',5,'Business',333.00),('1',5,'Econom
 /*!40000 ALTER TABLE `flight_class_price` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `flight_inventory`
+--
+
+DROP TABLE IF EXISTS `flight_inventory`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `flight_inventory` (
+  `flight_num` varchar(20) NOT NULL,
+  `class_type` varchar(30) NOT NULL,
+  `total_seats` int NOT NULL DEFAULT '0',
+  `available_seats` int NOT NULL DEFAULT '0',
+  `sold_seats` int NOT NULL DEFAULT '0',
+  PRIMARY KEY (`flight_num`,`class_type`),
+  CONSTRAINT `flight_inventory_ibfk_1` FOREIGN KEY (`flight_num`) REFERENCES `flight` (`flight_num`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `flight_inventory`
+--
+
+LOCK TABLES `flight_inventory` WRITE;
+/*!40000 ALTER TABLE `flight_inventory` DISABLE KEYS */;
+INSERT INTO `flight_inventory` VALUES ('1','Business',12,12,0),('1','Economy',180,175,5),('2','Business',8,8,0),('2','Economy',150,149,1),('3','Economy',60,60,0),('4','Economy',40,40,0),('5','Business',8,8,0),('5','Economy',150,150,0),('890','Economy',80,80,0),('F1001','Economy',60,60,0),('F1002','Economy',60,60,0),('F1003','Business',12,11,1),('F1003','Economy',180,180,0),('F1004','Economy',40,40,0),('F1005','Business',12,12,0),('F1005','Economy',180,180,0),('F1006','Business',8,8,0),('F1006','Economy',150,146,4),('F1007','Business',25,25,0),('F1007','Economy',25,25,0),('F1008','Business',8,8,0),('F1008','Economy',150,150,0),('F1009','Economy',40,40,0),('F1010','Business',12,12,0),('F1010','Economy',180,180,0),('F1011','Business',12,12,0),('F1011','Economy',180,180,0);
+/*!40000 ALTER TABLE `flight_inventory` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `flight_seat`
 --
@@ -207,8 +264,13 @@ CREATE TABLE `flight_seat` (
   `row_num` int NOT NULL,
   `column_letter` char(1) NOT NULL,
   `seat_status` varchar(30) DEFAULT NULL,
+  `seat_version` bigint NOT NULL DEFAULT '0',
+  `hold_token` varchar(64) DEFAULT NULL,
+  `hold_expires_at` datetime DEFAULT NULL,
   PRIMARY KEY (`flight_num`,`airplane_id`,`class_type`,`row_num`,`column_letter`),
   KEY `airplane_id` (`airplane_id`,`class_type`,`row_num`,`column_letter`),
+  KEY `flight_seat_version` (`flight_num`,`seat_version`),
+  KEY `seat_hold_expiry` (`seat_status`,`hold_expires_at`),
   CONSTRAINT `flight_seat_ibfk_1` FOREIGN KEY (`flight_num`) REFERENCES `flight` (`flight_num`),
   CONSTRAINT `flight_seat_ibfk_2` FOREIGN KEY (`airplane_id`, `class_type`, `row_num`, `column_letter`) REFERENCES `seat_position` (`airplane_id`, `class_type`, `row_num`, `column_letter`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
@@ -220,7 +282,7 @@ CREATE TABLE `flight_seat` (
 
 LOCK TABLES `flight_seat` WRITE;
 /*!40000 ALTER TABLE `flight_seat` DISABLE KEYS */;
-INSERT INTO `flight_seat` VALUES ('1',5,'Business',1,'A','available'),('1',5,'Business',1,'B','available'),('1',5,'Business',1,'C','available'),('1',5,'Business',1,'D','available'),('1',5,'Business',2,'A','available'),('1',5,'Business',2,'B','available'),('1',5,'Business',2,'C','available'),('1',5,'Business',2,'D','available'),('1',5,'Business',3,'A','available'),('1',5,'Business',3,'B','available'),('1',5,'Business',3,'C','available'),('1',5,'Business',3,'D','available'),('1',5,'Economy',1,'A','available'),('1',5,'Economy',1,'B','available'),('1',5,'Economy',1,'C','available'),('1',5,'Economy',1,'D','available'),('1',5,'Economy',1,'E','available'),('1',5,'Economy',1,'F','available'),('1',5,'Economy',1,'G','available'),('1',5,'Economy',1,'H','available'),('1',5,'Economy',1,'I','available'),('1',5,'Economy',2,'A','available'),('1',5,'Economy',2,'B','available'),('1',5,'Economy',2,'C','available'),('1',5,'Economy',2,'D','available'),('1',5,'Economy',2,'E','available'),('1',5,'Economy',2,'F','available'),('1',5,'Economy',2,'G','available'),('1',5,'Economy',2,'H','available'),('1',5,'Economy',2,'I','available'),('1',5,'Economy',3,'A','available'),('1',5,'Economy',3,'B','available'),('1',5,'Economy',3,'C','available'),('1',5,'Economy',3,'D','available'),('1',5,'Economy',3,'E','available'),('1',5,'Economy',3,'F','available'),('1',5,'Economy',3,'G','available'),('1',5,'Economy',3,'H','available'),('1',5,'Economy',3,'I','available'),('1',5,'Economy',4,'A','available'),('1',5,'Economy',4,'B','available'),('1',5,'Economy',4,'C','available'),('1',5,'Economy',4,'D','available'),('1',5,'Economy',4,'E','available'),('1',5,'Economy',4,'F','available'),('1',5,'Economy',4,'G','available'),('1',5,'Economy',4,'H','available'),('1',5,'Economy',4,'I','available'),('1',5,'Economy',5,'A','available'),('1',5,'Economy',5,'B','available'),('1',5,'Economy',5,'C','available'),('1',5,'Economy',5,'D','available'),('1',5,'Economy',5,'E','available'),('1',5,'Economy',5,'F','available'),('1',5,'Economy',5,'G','available'),('1',5,'Economy',5,'H','available'),('1',5,'Economy',5,'I','available'),('1',5,'Economy',6,'A','available'),('1',5,'Economy',6,'B','available'),('1',5,'Economy',6,'C','available'),('1',5,'Economy',6,'D','available'),('1',5,'Economy',6,'E','available'),('1',5,'Economy',6,'F','available'),('1',5,'Economy',6,'G','available'),('1',5,'Economy',6,'H','available'),('1',5,'Economy',6,'I','available'),('1',5,'Economy',7,'A','available'),('1',5,'Economy',7,'B','available'),('1',5,'Economy',7,'C','available'),('1',5,'Economy',7,'D','available'),('1',5,'Economy',7,'E','available'),('1',5,'Economy',7,'F','available'),('1',5,'Economy',7,'G','available'),('1',5,'Economy',7,'H','available'),('1',5,'Economy',7,'I','available'),('1',5,'Economy',8,'A','available'),('1',5,'Economy',8,'B','available'),('1',5,'Economy',8,'C','available'),('1',5,'Economy',8,'D','available'),('1',5,'Economy',8,'E','available'),('1',5,'Economy',8,'F','available'),('1',5,'Economy',8,'G','available'),('1',5,'Economy',8,'H','available'),('1',5,'Economy',8,'I','available'),('1',5,'Economy',9,'A','available'),('1',5,'Economy',9,'B','available'),('1',5,'Economy',9,'C','available'),('1',5,'Economy',9,'D','available'),('1',5,'Economy',9,'E','available'),('1',5,'Economy',9,'F','available'),('1',5,'Economy',9,'G','available'),('1',5,'Economy',9,'H','available'),('1',5,'Economy',9,'I','available'),('1',5,'Economy',10,'A','available'),('1',5,'Economy',10,'B','available'),('1',5,'Economy',10,'C','available'),('1',5,'Economy',10,'D','available'),('1',5,'Economy',10,'E','available'),('1',5,'Economy',10,'F','available'),('1',5,'Economy',10,'G','available'),('1',5,'Economy',10,'H','available'),('1',5,'Economy',10,'I','available'),('1',5,'Economy',11,'A','available'),('1',5,'Economy',11,'B','available'),('1',5,'Economy',11,'C','available'),('1',5,'Economy',11,'D','available'),('1',5,'Economy',11,'E','available'),('1',5,'Economy',11,'F','available'),('1',5,'Economy',11,'G','available'),('1',5,'Economy',11,'H','available'),('1',5,'Economy',11,'I','available'),('1',5,'Economy',12,'A','available'),('1',5,'Economy',12,'B','available'),('1',5,'Economy',12,'C','available'),('1',5,'Economy',12,'D','available'),('1',5,'Economy',12,'E','available'),('1',5,'Economy',12,'F','available'),('1',5,'Economy',12,'G','available'),('1',5,'Economy',12,'H','available'),('1',5,'Economy',12,'I','available'),('1',5,'Economy',13,'A','available'),('1',5,'Economy',13,'B','available'),('1',5,'Economy',13,'C','available'),('1',5,'Economy',13,'D','available'),('1',5,'Economy',13,'E','available'),('1',5,'Economy',13,'F','available'),('1',5,'Economy',13,'G','available'),('1',5,'Economy',13,'H','available'),('1',5,'Economy',13,'I','available'),('1',5,'Economy',14,'A','available'),('1',5,'Economy',14,'B','available'),('1',5,'Economy',14,'C','available'),('1',5,'Economy',14,'D','available'),('1',5,'Economy',14,'E','available'),('1',5,'Economy',14,'F','available'),('1',5,'Economy',14,'G','available'),('1',5,'Economy',14,'H','available'),('1',5,'Economy',14,'I','available'),('1',5,'Economy',15,'A','available'),('1',5,'Economy',15,'B','available'),('1',5,'Economy',15,'C','available'),('1',5,'Economy',15,'D','available'),('1',5,'Economy',15,'E','available'),('1',5,'Economy',15,'F','available'),('1',5,'Economy',15,'G','available'),('1',5,'Economy',15,'H','available'),('1',5,'Economy',15,'I','available'),('1',5,'Economy',16,'A','available'),('1',5,'Economy',16,'B','available'),('1',5,'Economy',16,'C','available'),('1',5,'Economy',16,'D','available'),('1',5,'Economy',16,'E','available'),('1',5,'Economy',16,'F','available'),('1',5,'Economy',16,'G','available'),('1',5,'Economy',16,'H','available'),('1',5,'Economy',16,'I','available'),('1',5,'Economy',17,'A','available'),('1',5,'Economy',17,'B','available'),('1',5,'Economy',17,'C','available'),('1',5,'Economy',17,'D','available'),('1',5,'Economy',17,'E','available'),('1',5,'Economy',17,'F','available'),('1',5,'Economy',17,'G','available'),('1',5,'Economy',17,'H','available'),('1',5,'Economy',17,'I','available'),('1',5,'Economy',18,'A','available'),('1',5,'Economy',18,'B','available'),('1',5,'Economy',18,'C','available'),('1',5,'Economy',18,'D','available'),('1',5,'Economy',18,'E','available'),('1',5,'Economy',18,'F','available'),('1',5,'Economy',18,'G','available'),('1',5,'Economy',18,'H','available'),('1',5,'Economy',18,'I','available'),('1',5,'Economy',19,'A','available'),('1',5,'Economy',19,'B','available'),('1',5,'Economy',19,'C','available'),('1',5,'Economy',19,'D','taken'),('1',5,'Economy',19,'E','taken'),('1',5,'Economy',19,'F','available'),('1',5,'Economy',19,'G','available'),('1',5,'Economy',19,'H','available'),('1',5,'Economy',19,'I','available'),('1',5,'Economy',20,'A','available'),('1',5,'Economy',20,'B','available'),('1',5,'Economy',20,'C','available'),('1',5,'Economy',20,'D','taken'),('1',5,'Economy',20,'E','taken'),('1',5,'Economy',20,'F','taken'),('1',5,'Economy',20,'G','available'),('1',5,'Economy',20,'H','available'),('1',5,'Economy',20,'I','available'),('2',6,'Business',1,'A','available'),('2',6,'Business',1,'B','available'),('2',6,'Business',1,'C','available'),('2',6,'Business',1,'D','available'),('2',6,'Business',2,'A','available'),('2',6,'Business',2,'B','available'),('2',6,'Business',2,'C','available'),('2',6,'Business',2,'D','available'),('2',6,'Economy',1,'A','available'),('2',6,'Economy',1,'B','available'),('2',6,'Economy',1,'C','available'),('2',6,'Economy',1,'D','available'),('2',6,'Economy',1,'E','available'),('2',6,'Economy',1,'F','available'),('2',6,'Economy',1,'G','available'),('2',6,'Economy',1,'H','available'),('2',6,'Economy',1,'I','available'),('2',6,'Economy',1,'J','available'),('2',6,'Economy',2,'A','available'),('2',6,'Economy',2,'B','available'),('2',6,'Economy',2,'C','available'),('2',6,'Economy',2,'D','available'),('2',6,'Economy',2,'E','available'),('2',6,'Economy',2,'F','available'),('2',6,'Economy',2,'G','available'),('2',6,'Economy',2,'H','available'),('2',6,'Economy',2,'I','available'),('2',6,'Economy',2,'J','available'),('2',6,'Economy',3,'A','available'),('2',6,'Economy',3,'B','available'),('2',6,'Economy',3,'C','available'),('2',6,'Economy',3,'D','available'),('2',6,'Economy',3,'E','available'),('2',6,'Economy',3,'F','available'),('2',6,'Economy',3,'G','available'),('2',6,'Economy',3,'H','available'),('2',6,'Economy',3,'I','available'),('2',6,'Economy',3,'J','available'),('2',6,'Economy',4,'A','available'),('2',6,'Economy',4,'B','available'),('2',6,'Economy',4,'C','available'),('2',6,'Economy',4,'D','available'),('2',6,'Economy',4,'E','available'),('2',6,'Economy',4,'F','available'),('2',6,'Economy',4,'G','available'),('2',6,'Economy',4,'H','available'),('2',6,'Economy',4,'I','available'),('2',6,'Economy',4,'J','available'),('2',6,'Economy',5,'A','available'),('2',6,'Economy',5,'B','available'),('2',6,'Economy',5,'C','available'),('2',6,'Economy',5,'D','available'),('2',6,'Economy',5,'E','available'),('2',6,'Economy',5,'F','available'),('2',6,'Economy',5,'G','available'),('2',6,'Economy',5,'H','available'),('2',6,'Economy',5,'I','available'),('2',6,'Economy',5,'J','available'),('2',6,'Economy',6,'A','available'),('2',6,'Economy',6,'B','available'),('2',6,'Economy',6,'C','available'),('2',6,'Economy',6,'D','available'),('2',6,'Economy',6,'E','available'),('2',6,'Economy',6,'F','available'),('2',6,'Economy',6,'G','available'),('2',6,'Economy',6,'H','available'),('2',6,'Economy',6,'I','available'),('2',6,'Economy',6,'J','available'),('2',6,'Economy',7,'A','available'),('2',6,'Economy',7,'B','available'),('2',6,'Economy',7,'C','available'),('2',6,'Economy',7,'D','available'),('2',6,'Economy',7,'E','available'),('2',6,'Economy',7,'F','available'),('2',6,'Economy',7,'G','available'),('2',6,'Economy',7,'H','available'),('2',6,'Economy',7,'I','available'),('2',6,'Economy',7,'J','available'),('2',6,'Economy',8,'A','available'),('2',6,'Economy',8,'B','available'),('2',6,'Economy',8,'C','available'),('2',6,'Economy',8,'D','available'),('2',6,'Economy',8,'E','available'),('2',6,'Economy',8,'F','available'),('2',6,'Economy',8,'G','available'),('2',6,'Economy',8,'H','available'),('2',6,'Economy',8,'I','available'),('2',6,'Economy',8,'J','available'),('2',6,'Economy',9,'A','available'),('2',6,'Economy',9,'B','available'),('2',6,'Economy',9,'C','available'),('2',6,'Economy',9,'D','available'),('2',6,'Economy',9,'E','available'),('2',6,'Economy',9,'F','available'),('2',6,'Economy',9,'G','available'),('2',6,'Economy',9,'H','available'),('2',6,'Economy',9,'I','available'),('2',6,'Economy',9,'J','available'),('2',6,'Economy',10,'A','available'),('2',6,'Economy',10,'B','available'),('2',6,'Economy',10,'C','available'),('2',6,'Economy',10,'D','available'),('2',6,'Economy',10,'E','available'),('2',6,'Economy',10,'F','available'),('2',6,'Economy',10,'G','available'),('2',6,'Economy',10,'H','available'),('2',6,'Economy',10,'I','available'),('2',6,'Economy',10,'J','available'),('2',6,'Economy',11,'A','available'),('2',6,'Economy',11,'B','available'),('2',6,'Economy',11,'C','available'),('2',6,'Economy',11,'D','available'),('2',6,'Economy',11,'E','available'),('2',6,'Economy',11,'F','available'),('2',6,'Economy',11,'G','available'),('2',6,'Economy',11,'H','available'),('2',6,'Economy',11,'I','available'),('2',6,'Economy',11,'J','available'),('2',6,'Economy',12,'A','available'),('2',6,'Economy',12,'B','available'),('2',6,'Economy',12,'C','available'),('2',6,'Economy',12,'D','available'),('2',6,'Economy',12,'E','available'),('2',6,'Economy',12,'F','available'),('2',6,'Economy',12,'G','available'),('2',6,'Economy',12,'H','available'),('2',6,'Economy',12,'I','available'),('2',6,'Economy',12,'J','available'),('2',6,'Economy',13,'A','available'),('2',6,'Economy',13,'B','available'),('2',6,'Economy',13,'C','available'),('2',6,'Economy',13,'D','available'),('2',6,'Economy',13,'E','available'),('2',6,'Economy',13,'F','available'),('2',6,'Economy',13,'G','available'),('2',6,'Economy',13,'H','available'),('2',6,'Economy',13,'I','available'),('2',6,'Economy',13,'J','available'),('2',6,'Economy',14,'A','available'),('2',6,'Economy',14,'B','available'),('2',6,'Economy',14,'C','available'),('2',6,'Economy',14,'D','available'),('2',6,'Economy',14,'E','available'),('2',6,'Economy',14,'F','available'),('2',6,'Economy',14,'G','available'),('2',6,'Economy',14,'H','available'),('2',6,'Economy',14,'I','available'),('2',6,'Economy',14,'J','available'),('2',6,'Economy',15,'A','available'),('2',6,'Economy',15,'B','available'),('2',6,'Economy',15,'C','available'),('2',6,'Economy',15,'D','available'),('2',6,'Economy',15,'E','available'),('2',6,'Economy',15,'F','available'),('2',6,'Economy',15,'G','available'),('2',6,'Economy',15,'H','available'),('2',6,'Economy',15,'I','available'),('2',6,'Economy',15,'J','taken'),('3',1,'Economy',1,'A','available'),('3',1,'Economy',1,'B','available'),('3',1,'Economy',1,'C','available'),('3',1,'Economy',1,'D','available'),('3',1,'Economy',1,'E','available'),('3',1,'Economy',1,'F','available'),('3',1,'Economy',2,'A','available'),('3',1,'Economy',2,'B','available'),('3',1,'Economy',2,'C','available'),('3',1,'Economy',2,'D','available'),('3',1,'Economy',2,'E','available'),('3',1,'Economy',2,'F','available'),('3',1,'Economy',3,'A','available'),('3',1,'Economy',3,'B','available'),('3',1,'Economy',3,'C','available'),('3',1,'Economy',3,'D','available'),('3',1,'Economy',3,'E','available'),('3',1,'Economy',3,'F','available'),('3',1,'Economy',4,'A','available'),('3',1,'Economy',4,'B','available'),('3',1,'Economy',4,'C','available'),('3',1,'Economy',4,'D','available'),('3',1,'Economy',4,'E','available'),('3',1,'Economy',4,'F','available'),('3',1,'Economy',5,'A','available'),('3',1,'Economy',5,'B','available'),('3',1,'Economy',5,'C','available'),('3',1,'Economy',5,'D','available'),('3',1,'Economy',5,'E','available'),('3',1,'Economy',5,'F','available'),('3',1,'Economy',6,'A','available'),('3',1,'Economy',6,'B','available'),('3',1,'Economy',6,'C','available'),('3',1,'Economy',6,'D','available'),('3',1,'Economy',6,'E','available'),('3',1,'Economy',6,'F','available'),('3',1,'Economy',7,'A','available'),('3',1,'Economy',7,'B','available'),('3',1,'Economy',7,'C','available'),('3',1,'Economy',7,'D','available'),('3',1,'Economy',7,'E','available'),('3',1,'Economy',7,'F','available'),('3',1,'Economy',8,'A','available'),('3',1,'Economy',8,'B','available'),('3',1,'Economy',8,'C','available'),('3',1,'Economy',8,'D','available'),('3',1,'Economy',8,'E','available'),('3',1,'Economy',8,'F','available'),('3',1,'Economy',9,'A','available'),('3',1,'Economy',9,'B','available'),('3',1,'Economy',9,'C','available'),('3',1,'Economy',9,'D','available'),('3',1,'Economy',9,'E','available'),('3',1,'Economy',9,'F','available'),('3',1,'Economy',10,'A','available'),('3',1,'Economy',10,'B','available'),('3',1,'Economy',10,'C','available'),('3',1,'Economy',10,'D','available'),('3',1,'Economy',10,'E','available'),('3',1,'Economy',10,'F','available'),('4',4,'Economy',1,'A','available'),('4',4,'Economy',1,'B','available'),('4',4,'Economy',1,'C','available'),('4',4,'Economy',1,'D','available'),('4',4,'Economy',2,'A','available'),('4',4,'Economy',2,'B','available'),('4',4,'Economy',2,'C','available'),('4',4,'Economy',2,'D','available'),('4',4,'Economy',3,'A','available'),('4',4,'Economy',3,'B','available'),('4',4,'Economy',3,'C','available'),('4',4,'Economy',3,'D','available'),('4',4,'Economy',4,'A','available'),('4',4,'Economy',4,'B','available'),('4',4,'Economy',4,'C','available'),('4',4,'Economy',4,'D','available'),('4',4,'Economy',5,'A','available'),('4',4,'Economy',5,'B','available'),('4',4,'Economy',5,'C','available'),('4',4,'Economy',5,'D','available'),('4',4,'Economy',6,'A','available'),('4',4,'Economy',6,'B','available'),('4',4,'Economy',6,'C','available'),('4',4,'Economy',6,'D','available'),('4',4,'Economy',7,'A','available'),('4',4,'Economy',7,'B','available'),('4',4,'Economy',7,'C','available'),('4',4,'Economy',7,'D','available'),('4',4,'Economy',8,'A','available'),('4',4,'Economy',8,'B','available'),('4',4,'Economy',8,'C','available'),('4',4,'Economy',8,'D','available'),('4',4,'Economy',9,'A','available'),('4',4,'Economy',9,'B','available'),('4',4,'Economy',9,'C','available'),('4',4,'Economy',9,'D','available'),('4',4,'Economy',10,'A','available'),('4',4,'Economy',10,'B','available'),('4',4,'Economy',10,'C','available'),('4',4,'Economy',10,'D','available'),('5',6,'Business',1,'A','available'),('5',6,'Business',1,'B','available'),('5',6,'Business',1,'C','available'),('5',6,'Business',1,'D','available'),('5',6,'Business',2,'A','available'),('5',6,'Business',2,'B','available'),('5',6,'Business',2,'C','available'),('5',6,'Business',2,'D','available'),('5',6,'Economy',1,'A','available'),('5',6,'Economy',1,'B','available'),('5',6,'Economy',1,'C','available'),('5',6,'Economy',1,'D','available'),('5',6,'Economy',1,'E','available'),('5',6,'Economy',1,'F','available'),('5',6,'Economy',1,'G','available'),('5',6,'Economy',1,'H','available'),('5',6,'Economy',1,'I','available'),('5',6,'Economy',1,'J','available'),('5',6,'Economy',2,'A','available'),('5',6,'Economy',2,'B','available'),('5',6,'Economy',2,'C','available'),('5',6,'Economy',2,'D','available'),('5',6,'Economy',2,'E','available'),('5',6,'Economy',2,'F','available'),('5',6,'Economy',2,'G','available'),('5',6,'Economy',2,'H','available'),('5',6,'Economy',2,'I','available'),('5',6,'Economy',2,'J','available'),('5',6,'Economy',3,'A','available'),('5',6,'Economy',3,'B','available'),('5',6,'Economy',3,'C','available'),('5',6,'Economy',3,'D','available'),('5',6,'Economy',3,'E','available'),('5',6,'Economy',3,'F','available'),('5',6,'Economy',3,'G','available'),('5',6,'Economy',3,'H','available'),('5',6,'Economy',3,'I','available'),('5',6,'Economy',3,'J','available'),('5',6,'Economy',4,'A','available'),('5',6,'Economy',4,'B','available'),('5',6,'Economy',4,'C','available'),('5',6,'Economy',4,'D','available'),('5',6,'Economy',4,'E','available'),('5',6,'Economy',4,'F','available'),('5',6,'Economy',4,'G','available'),('5',6,'Economy',4,'H','available'),('5',6,'Economy',4,'I','available'),('5',6,'Economy',4,'J','available'),('5',6,'Economy',5,'A','available'),('5',6,'Economy',5,'B','available'),('5',6,'Economy',5,'C','available'),('5',6,'Economy',5,'D','available'),('5',6,'Economy',5,'E','available'),('5',6,'Economy',5,'F','available'),('5',6,'Economy',5,'G','available'),('5',6,'Economy',5,'H','available'),('5',6,'Economy',5,'I','available'),('5',6,'Economy',5,'J','available'),('5',6,'Economy',6,'A','available'),('5',6,'Economy',6,'B','available'),('5',6,'Economy',6,'C','available'),('5',6,'Economy',6,'D','available'),('5',6,'Economy',6,'E','available'),('5',6,'Economy',6,'F','available'),('5',6,'Economy',6,'G','available'),('5',6,'Economy',6,'H','available'),('5',6,'Economy',6,'I','available'),('5',6,'Economy',6,'J','available'),('5',6,'Economy',7,'A','available'),('5',6,'Economy',7,'B','available'),('5',6,'Economy',7,'C','available'),('5',6,'Economy',7,'D','available'),('5',6,'Economy',7,'E','available'),('5',6,'Economy',7,'F','available'),('5',6,'Economy',7,'G','available'),('5',6,'Economy',7,'H','available'),('5',6,'Economy',7,'I','available'),('5',6,'Economy',7,'J','available'),('5',6,'Economy',8,'A','available'),('5',6,'Economy',8,'B','available'),('5',6,'Economy',8,'C','available'),('5',6,'Economy',8,'D','available'),('5',6,'Economy',8,'E','available'),('5',6,'Economy',8,'F','available'),('5',6,'Economy',8,'G','available'),('5',6,'Economy',8,'H','available'),('5',6,'Economy',8,'I','available'),('5',6,'Economy',8,'J','available'),('5',6,'Economy',9,'A','available'),('5',6,'Economy',9,'B','available'),('5',6,'Economy',9,'C','available'),('5',6,'Economy',9,'D','available'),('5',6,'Economy',9,'E','available'),('5',6,'Economy',9,'F','available'),('5',6,'Economy',9,'G','available'),('5',6,'Economy',9,'H','available'),('5',6,'Economy',9,'I','available'),('5',6,'Economy',9,'J','available'),('5',6,'Economy',10,'A','available'),('5',6,'Economy',10,'B','available'),('5',6,'Economy',10,'C','available'),('5',6,'Economy',10,'D','available'),('5',6,'Economy',10,'E','available'),('5',6,'Economy',10,'F','available'),('5',6,'Economy',10,'G','available'),('5',6,'Economy',10,'H','available'),('5',6,'Economy',10,'I','available'),('5',6,'Economy',10,'J','available'),('5',6,'Economy',11,'A','available'),('5',6,'Economy',11,'B','available'),('5',6,'Economy',11,'C','available'),('5',6,'Economy',11,'D','available'),('5',6,'Economy',11,'E','available'),('5',6,'Economy',11,'F','available'),('5',6,'Economy',11,'G','available'),('5',6,'Economy',11,'H','available'),('5',6,'Economy',11,'I','available'),('5',6,'Economy',11,'J','available'),('5',6,'Economy',12,'A','available'),('5',6,'Economy',12,'B','available'),('5',6,'Economy',12,'C','available'),('5',6,'Economy',12,'D','available'),('5',6,'Economy',12,'E','available'),('5',6,'Economy',12,'F','available'),('5',6,'Economy',12,'G','available'),('5',6,'Economy',12,'H','available'),('5',6,'Economy',12,'I','available'),('5',6,'Economy',12,'J','available'),('5',6,'Economy',13,'A','available'),('5',6,'Economy',13,'B','available'),('5',6,'Economy',13,'C','available'),('5',6,'Economy',13,'D','available'),('5',6,'Economy',13,'E','available'),('5',6,'Economy',13,'F','available'),('5',6,'Economy',13,'G','available'),('5',6,'Economy',13,'H','available'),('5',6,'Economy',13,'I','available'),('5',6,'Economy',13,'J','available'),('5',6,'Economy',14,'A','available'),('5',6,'Economy',14,'B','available'),('5',6,'Economy',14,'C','available'),('5',6,'Economy',14,'D','available'),('5',6,'Economy',14,'E','available'),('5',6,'Economy',14,'F','available'),('5',6,'Economy',14,'G','available'),('5',6,'Economy',14,'H','available'),('5',6,'Economy',14,'I','available'),('5',6,'Economy',14,'J','available'),('5',6,'Economy',15,'A','available'),('5',6,'Economy',15,'B','available'),('5',6,'Economy',15,'C','available'),('5',6,'Economy',15,'D','available'),('5',6,'Economy',15,'E','available'),('5',6,'Economy',15,'F','available'),('5',6,'Economy',15,'G','available'),('5',6,'Economy',15,'H','available'),('5',6,'Economy',15,'I','available'),('5',6,'Economy',15,'J','available'),('890',3,'Economy',1,'A','available'),('890',3,'Economy',1,'B','available'),('890',3,'Economy',1,'C','available'),('890',3,'Economy',1,'D','available'),('890',3,'Economy',2,'A','available'),('890',3,'Economy',2,'B','available'),('890',3,'Economy',2,'C','available'),('890',3,'Economy',2,'D','available'),('890',3,'Economy',3,'A','available'),('890',3,'Economy',3,'B','available'),('890',3,'Economy',3,'C','available'),('890',3,'Economy',3,'D','available'),('890',3,'Economy',4,'A','available'),('890',3,'Economy',4,'B','available'),('890',3,'Economy',4,'C','available'),('890',3,'Economy',4,'D','available'),('890',3,'Economy',5,'A','available'),('890',3,'Economy',5,'B','available'),('890',3,'Economy',5,'C','available'),('890',3,'Economy',5,'D','available'),('890',3,'Economy',6,'A','available'),('890',3,'Economy',6,'B','available'),('890',3,'Economy',6,'C','available'),('890',3,'Economy',6,'D','available'),('890',3,'Economy',7,'A','available'),('890',3,'Economy',7,'B','available'),('890',3,'Economy',7,'C','available'),('890',3,'Economy',7,'D','available'),('890',3,'Economy',8,'A','available'),('890',3,'Economy',8,'B','available'),('890',3,'Economy',8,'C','available'),('890',3,'Economy',8,'D','available'),('890',3,'Economy',9,'A','available'),('890',3,'Economy',9,'B','available'),('890',3,'Economy',9,'C','available'),('890',3,'Economy',9,'D','available'),('890',3,'Economy',10,'A','available'),('890',3,'Economy',10,'B','available'),('890',3,'Economy',10,'C','available'),('890',3,'Economy',10,'D','available'),('890',3,'Economy',11,'A','available'),('890',3,'Economy',11,'B','available'),('890',3,'Economy',11,'C','available'),('890',3,'Economy',11,'D','available'),('890',3,'Economy',12,'A','available'),('890',3,'Economy',12,'B','available'),('890',3,'Economy',12,'C','available'),('890',3,'Economy',12,'D','available'),('890',3,'Economy',13,'A','available'),('890',3,'Economy',13,'B','available'),('890',3,'Economy',13,'C','available'),('890',3,'Economy',13,'D','available'),('890',3,'Economy',14,'A','available'),('890',3,'Economy',14,'B','available'),('890',3,'Economy',14,'C','available'),('890',3,'Economy',14,'D','available'),('890',3,'Economy',15,'A','available'),('890',3,'Economy',15,'B','available'),('890',3,'Economy',15,'C','available'),('890',3,'Economy',15,'D','available'),('890',3,'Economy',16,'A','available'),('890',3,'Economy',16,'B','available'),('890',3,'Economy',16,'C','available'),('890',3,'Economy',16,'D','available'),('890',3,'Economy',17,'A','available'),('890',3,'Economy',17,'B','available'),('890',3,'Economy',17,'C','available'),('890',3,'Economy',17,'D','available'),('890',3,'Economy',18,'A','available'),('890',3,'Economy',18,'B','available'),('890',3,'Economy',18,'C','available'),('890',3,'Economy',18,'D','available'),('890',3,'Economy',19,'A','available'),('890',3,'Economy',19,'B','available'),('890',3,'Economy',19,'C','available'),('890',3,'Economy',19,'D','available'),('890',3,'Economy',20,'A','available'),('890',3,'Economy',20,'B','available'),('890',3,'Economy',20,'C','available'),('890',3,'Economy',20,'D','available'),('F1001',1,'Economy',1,'A','available'),('F1001',1,'Economy',1,'B','available'),('F1001',1,'Economy',1,'C','available'),('F1001',1,'Economy',1,'D','available'),('F1001',1,'Economy',1,'E','available'),('F1001',1,'Economy',1,'F','available'),('F1001',1,'Economy',2,'A','available'),('F1001',1,'Economy',2,'B','available'),('F1001',1,'Economy',2,'C','available'),('F1001',1,'Economy',2,'D','available'),('F1001',1,'Economy',2,'E','available'),('F1001',1,'Economy',2,'F','available'),('F1001',1,'Economy',3,'A','available'),('F1001',1,'Economy',3,'B','available'),('F1001',1,'Economy',3,'C','available'),('F1001',1,'Economy',3,'D','available'),('F1001',1,'Economy',3,'E','available'),('F1001',1,'Economy',3,'F','available'),('F1001',1,'Economy',4,'A','available'),('F1001',1,'Economy',4,'B','available'),('F1001',1,'Economy',4,'C','available'),('F1001',1,'Economy',4,'D','available'),('F1001',1,'Economy',4,'E','available'),('F1001',1,'Economy',4,'F','available'),('F1001',1,'Economy',5,'A','available'),('F1001',1,'Economy',5,'B','available'),('F1001',1,'Economy',5,'C','available'),('F1001',1,'Economy',5,'D','available'),('F1001',1,'Economy',5,'E','available'),('F1001',1,'Economy',5,'F','available'),('F1001',1,'Economy',6,'A','available'),('F1001',1,'Economy',6,'B','available'),('F1001',1,'Economy',6,'C','available'),('F1001',1,'Economy',6,'D','available'),('F1001',1,'Economy',6,'E','available'),('F1001',1,'Economy',6,'F','available'),('F1001',1,'Economy',7,'A','available'),('F1001',1,'Economy',7,'B','available'),('F1001',1,'Economy',7,'C','available'),('F1001',1,'Economy',7,'D','available'),('F1001',1,'Economy',7,'E','available'),('F1001',1,'Economy',7,'F','available'),('F1001',1,'Economy',8,'A','available'),('F1001',1,'Economy',8,'B','available'),('F1001',1,'Economy',8,'C','available'),('F1001',1,'Economy',8,'D','available'),('F1001',1,'Economy',8,'E','available'),('F1001',1,'Economy',8,'F','available'),('F1001',1,'Economy',9,'A','available'),('F1001',1,'Economy',9,'B','available'),('F1001',1,'Economy',9,'C','available'),('F1001',1,'Economy',9,'D','available'),('F1001',1,'Economy',9,'E','available'),('F1001',1,'Economy',9,'F','available'),('F1001',1,'Economy',10,'A','available'),('F1001',1,'Economy',10,'B','available'),('F1001',1,'Economy',10,'C','available'),('F1001',1,'Economy',10,'D','available'),('F1001',1,'Economy',10,'E','available'),('F1001',1,'Economy',10,'F','available'),('F1002',2,'Economy',1,'A','available'),('F1002',2,'Economy',1,'B','available'),('F1002',2,'Economy',1,'C','available'),('F1002',2,'Economy',1,'D','available'),('F1002',2,'Economy',2,'A','available'),('F1002',2,'Economy',2,'B','available'),('F1002',2,'Economy',2,'C','available'),('F1002',2,'Economy',2,'D','available'),('F1002',2,'Economy',3,'A','available'),('F1002',2,'Economy',3,'B','available'),('F1002',2,'Economy',3,'C','available'),('F1002',2,'Economy',3,'D','available'),('F1002',2,'Economy',4,'A','available'),('F1002',2,'Economy',4,'B','available'),('F1002',2,'Economy',4,'C','available'),('F1002',2,'Economy',4,'D','available'),('F1002',2,'Economy',5,'A','available'),('F1002',2,'Economy',5,'B','available'),('F1002',2,'Economy',5,'C','available'),('F1002',2,'Economy',5,'D','available'),('F1002',2,'Economy',6,'A','available'),('F1002',2,'Economy',6,'B','available'),('F1002',2,'Economy',6,'C','available'),('F1002',2,'Economy',6,'D','available'),('F1002',2,'Economy',7,'A','available'),('F1002',2,'Economy',7,'B','available'),('F1002',2,'Economy',7,'C','available'),('F1002',2,'Economy',7,'D','available'),('F1002',2,'Economy',8,'A','available'),('F1002',2,'Economy',8,'B','available'),('F1002',2,'Economy',8,'C','available'),('F1002',2,'Economy',8,'D','available'),('F1002',2,'Economy',9,'A','available'),('F1002',2,'Economy',9,'B','available'),('F1002',2,'Economy',9,'C','available'),('F1002',2,'Economy',9,'D','available'),('F1002',2,'Economy',10,'A','available'),('F1002',2,'Economy',10,'B','available'),('F1002',2,'Economy',10,'C','available'),('F1002',2,'Economy',10,'D','available'),('F1002',2,'Economy',11,'A','available'),('F1002',2,'Economy',11,'B','available'),('F1002',2,'Economy',11,'C','available'),('F1002',2,'Economy',11,'D','available'),('F1002',2,'Economy',12,'A','available'),('F1002',2,'Economy',12,'B','available'),('F1002',2,'Economy',12,'C','available'),('F1002',2,'Economy',12,'D','available'),('F1002',2,'Economy',13,'A','available'),('F1002',2,'Economy',13,'B','available'),('F1002',2,'Economy',13,'C','available'),('F1002',2,'Economy',13,'D','available'),('F1002',2,'Economy',14,'A','available'),('F1002',2,'Economy',14,'B','available'),('F1002',2,'Economy',14,'C','available'),('F1002',2,'Economy',14,'D','available'),('F1002',2,'Economy',15,'A','available'),('F1002',2,'Economy',15,'B','available'),('F1002',2,'Economy',15,'C','available'),('F1002',2,'Economy',15,'D','available'),('F1003',5,'Business',1,'A','taken'),('F1003',5,'Business',1,'B','available'),('F1003',5,'Business',1,'C','available'),('F1003',5,'Business',1,'D','available'),('F1003',5,'Business',2,'A','available'),('F1003',5,'Business',2,'B','available'),('F1003',5,'Business',2,'C','available'),('F1003',5,'Business',2,'D','available'),('F1003',5,'Business',3,'A','available'),('F1003',5,'Business',3,'B','available'),('F1003',5,'Business',3,'C','available'),('F1003',5,'Business',3,'D','available'),('F1003',5,'Economy',1,'A','available'),('F1003',5,'Economy',1,'B','available'),('F1003',5,'Economy',1,'C','available'),('F1003',5,'Economy',1,'D','available'),('F1003',5,'Economy',1,'E','available'),('F1003',5,'Economy',1,'F','available'),('F1003',5,'Economy',1,'G','available'),('F1003',5,'Economy',1,'H','available'),('F1003',5,'Economy',1,'I','available'),('F1003',5,'Economy',2,'A','available'),('F1003',5,'Economy',2,'B','available'),('F1003',5,'Economy',2,'C','available'),('F1003',5,'Economy',2,'D','available'),('F1003',5,'Economy',2,'E','available'),('F1003',5,'Economy',2,'F','available'),('F1003',5,'Economy',2,'G','available'),('F1003',5,'Economy',2,'H','available'),('F1003',5,'Economy',2,'I','available'),('F1003',5,'Economy',3,'A','available'),('F1003',5,'Economy',3,'B','available'),('F1003',5,'Economy',3,'C','available'),('F1003',5,'Economy',3,'D','available'),('F1003',5,'Economy',3,'E','available'),('F1003',5,'Economy',3,'F','available'),('F1003',5,'Economy',3,'G','available'),('F1003',5,'Economy',3,'H','available'),('F1003',5,'Economy',3,'I','available'),('F1003',5,'Economy',4,'A','available'),('F1003',5,'Economy',4,'B','available'),('F1003',5,'Economy',4,'C','available'),('F1003',5,'Economy',4,'D','available'),('F1003',5,'Economy',4,'E','available'),('F1003',5,'Economy',4,'F','available'),('F1003',5,'Economy',4,'G','available'),('F1003',5,'Economy',4,'H','available'),('F1003',5,'Economy',4,'I','available'),('F1003',5,'Economy',5,'A','available'),('F1003',5,'Economy',5,'B','available'),('F1003',5,'Economy',5,'C','available'),('F1003',5,'Economy',5,'D','available'),('F1003',5,'Economy',5,'E','available'),('F1003',5,'Economy',5,'F','available'),('F1003',5,'Economy',5,'G','available'),('F1003',5,'Economy',5,'H','available'),('F1003',5,'Economy',5,'I','available'),('F1003',5,'Economy',6,'A','available'),('F1003',5,'Economy',6,'B','available'),('F1003',5,'Economy',6,'C','available'),('F1003',5,'Economy',6,'D','available'),('F1003',5,'Economy',6,'E','available'),('F1003',5,'Economy',6,'F','available'),('F1003',5,'Economy',6,'G','available'),('F1003',5,'Economy',6,'H','available'),('F1003',5,'Economy',6,'I','available'),('F1003',5,'Economy',7,'A','available'),('F1003',5,'Economy',7,'B','available'),('F1003',5,'Economy',7,'C','available'),('F1003',5,'Economy',7,'D','available'),('F1003',5,'Economy',7,'E','available'),('F1003',5,'Economy',7,'F','available'),('F1003',5,'Economy',7,'G','available'),('F1003',5,'Economy',7,'H','available'),('F1003',5,'Economy',7,'I','available'),('F1003',5,'Economy',8,'A','available'),('F1003',5,'Economy',8,'B','available'),('F1003',5,'Economy',8,'C','available'),('F1003',5,'Economy',8,'D','available'),('F1003',5,'Economy',8,'E','available'),('F1003',5,'Economy',8,'F','available'),('F1003',5,'Economy',8,'G','available'),('F1003',5,'Economy',8,'H','available'),('F1003',5,'Economy',8,'I','available'),('F1003',5,'Economy',9,'A','available'),('F1003',5,'Economy',9,'B','available'),('F1003',5,'Economy',9,'C','available'),('F1003',5,'Economy',9,'D','available'),('F1003',5,'Economy',9,'E','available'),('F1003',5,'Economy',9,'F','available'),('F1003',5,'Economy',9,'G','available'),('F1003',5,'Economy',9,'H','available'),('F1003',5,'Economy',9,'I','available'),('F1003',5,'Economy',10,'A','available'),('F1003',5,'Economy',10,'B','available'),('F1003',5,'Economy',10,'C','available'),('F1003',5,'Economy',10,'D','available'),('F1003',5,'Economy',10,'E','available'),('F1003',5,'Economy',10,'F','available'),('F1003',5,'Economy',10,'G','available'),('F1003',5,'Economy',10,'H','available'),('F1003',5,'Economy',10,'I','available'),('F1003',5,'Economy',11,'A','available'),('F1003',5,'Economy',11,'B','available'),('F1003',5,'Economy',11,'C','available'),('F1003',5,'Economy',11,'D','available'),('F1003',5,'Economy',11,'E','available'),('F1003',5,'Economy',11,'F','available'),('F1003',5,'Economy',11,'G','available'),('F1003',5,'Economy',11,'H','available'),('F1003',5,'Economy',11,'I','available'),('F1003',5,'Economy',12,'A','available'),('F1003',5,'Economy',12,'B','available'),('F1003',5,'Economy',12,'C','available'),('F1003',5,'Economy',12,'D','available'),('F1003',5,'Economy',12,'E','available'),('F1003',5,'Economy',12,'F','available'),('F1003',5,'Economy',12,'G','available'),('F1003',5,'Economy',12,'H','available'),('F1003',5,'Economy',12,'I','available'),('F1003',5,'Economy',13,'A','available'),('F1003',5,'Economy',13,'B','available'),('F1003',5,'Economy',13,'C','available'),('F1003',5,'Economy',13,'D','available'),('F1003',5,'Economy',13,'E','available'),('F1003',5,'Economy',13,'F','available'),('F1003',5,'Economy',13,'G','available'),('F1003',5,'Economy',13,'H','available'),('F1003',5,'Economy',13,'I','available'),('F1003',5,'Economy',14,'A','available'),('F1003',5,'Economy',14,'B','available'),('F1003',5,'Economy',14,'C','available'),('F1003',5,'Economy',14,'D','available'),('F1003',5,'Economy',14,'E','available'),('F1003',5,'Economy',14,'F','available'),('F1003',5,'Economy',14,'G','available'),('F1003',5,'Economy',14,'H','available'),('F1003',5,'Economy',14,'I','available'),('F1003',5,'Economy',15,'A','available'),('F1003',5,'Economy',15,'B','available'),('F1003',5,'Economy',15,'C','available'),('F1003',5,'Economy',15,'D','available'),('F1003',5,'Economy',15,'E','available'),('F1003',5,'Economy',15,'F','available'),('F1003',5,'Economy',15,'G','available'),('F1003',5,'Economy',15,'H','available'),('F1003',5,'Economy',15,'I','available'),('F1003',5,'Economy',16,'A','available'),('F1003',5,'Economy',16,'B','available'),('F1003',5,'Economy',16,'C','available'),('F1003',5,'Economy',16,'D','available'),('F1003',5,'Economy',16,'E','available'),('F1003',5,'Economy',16,'F','available'),('F1003',5,'Economy',16,'G','available'),('F1003',5,'Economy',16,'H','available'),('F1003',5,'Economy',16,'I','available'),('F1003',5,'Economy',17,'A','available'),('F1003',5,'Economy',17,'B','available'),('F1003',5,'Economy',17,'C','available'),('F1003',5,'Economy',17,'D','available'),('F1003',5,'Economy',17,'E','available'),('F1003',5,'Economy',17,'F','available'),('F1003',5,'Economy',17,'G','available'),('F1003',5,'Economy',17,'H','available'),('F1003',5,'Economy',17,'I','available'),('F1003',5,'Economy',18,'A','available'),('F1003',5,'Economy',18,'B','available'),('F1003',5,'Economy',18,'C','available'),('F1003',5,'Economy',18,'D','available'),('F1003',5,'Economy',18,'E','available'),('F1003',5,'Economy',18,'F','available'),('F1003',5,'Economy',18,'G','available'),('F1003',5,'Economy',18,'H','available'),('F1003',5,'Economy',18,'I','available'),('F1003',5,'Economy',19,'A','available'),('F1003',5,'Economy',19,'B','available'),('F1003',5,'Economy',19,'C','available'),('F1003',5,'Economy',19,'D','available'),('F1003',5,'Economy',19,'E','available'),('F1003',5,'Economy',19,'F','available'),('F1003',5,'Economy',19,'G','available'),('F1003',5,'Economy',19,'H','available'),('F1003',5,'Economy',19,'I','available'),('F1003',5,'Economy',20,'A','available'),('F1003',5,'Economy',20,'B','available'),('F1003',5,'Economy',20,'C','available'),('F1003',5,'Economy',20,'D','available'),('F1003',5,'Economy',20,'E','available'),('F1003',5,'Economy',20,'F','available'),('F1003',5,'Economy',20,'G','available'),('F1003',5,'Economy',20,'H','available'),('F1003',5,'Economy',20,'I','available'),('F1004',4,'Economy',1,'A','available'),('F1004',4,'Economy',1,'B','available'),('F1004',4,'Economy',1,'C','available'),('F1004',4,'Economy',1,'D','available'),('F1004',4,'Economy',2,'A','available'),('F1004',4,'Economy',2,'B','available'),('F1004',4,'Economy',2,'C','available'),('F1004',4,'Economy',2,'D','available'),('F1004',4,'Economy',3,'A','available'),('F1004',4,'Economy',3,'B','available'),('F1004',4,'Economy',3,'C','available'),('F1004',4,'Economy',3,'D','available'),('F1004',4,'Economy',4,'A','available'),('F1004',4,'Economy',4,'B','available'),('F1004',4,'Economy',4,'C','available'),('F1004',4,'Economy',4,'D','available'),('F1004',4,'Economy',5,'A','available'),('F1004',4,'Economy',5,'B','available'),('F1004',4,'Economy',5,'C','available'),('F1004',4,'Economy',5,'D','available'),('F1004',4,'Economy',6,'A','available'),('F1004',4,'Economy',6,'B','available'),('F1004',4,'Economy',6,'C','available'),('F1004',4,'Economy',6,'D','available'),('F1004',4,'Economy',7,'A','available'),('F1004',4,'Economy',7,'B','available'),('F1004',4,'Economy',7,'C','available'),('F1004',4,'Economy',7,'D','available'),('F1004',4,'Economy',8,'A','available'),('F1004',4,'Economy',8,'B','available'),('F1004',4,'Economy',8,'C','available'),('F1004',4,'Economy',8,'D','available'),('F1004',4,'Economy',9,'A','available'),('F1004',4,'Economy',9,'B','available'),('F1004',4,'Economy',9,'C','available'),('F1004',4,'Economy',9,'D','available'),('F1004',4,'Economy',10,'A','available'),('F1004',4,'Economy',10,'B','available'),('F1004',4,'Economy',10,'C','available'),('F1004',4,'Economy',10,'D','available'),('F1005',5,'Business',1,'A','available'),('F1005',5,'Business',1,'B','available'),('F1005',5,'Business',1,'C','available'),('F1005',5,'Business',1,'D','available'),('F1005',5,'Business',2,'A','available'),('F1005',5,'Business',2,'B','available'),('F1005',5,'Business',2,'C','available'),('F1005',5,'Business',2,'D','available'),('F1005',5,'Business',3,'A','available'),('F1005',5,'Business',3,'B','available'),('F1005',5,'Business',3,'C','available'),('F1005',5,'Business',3,'D','available'),('F1005',5,'Economy',1,'A','available'),('F1005',5,'Economy',1,'B','available'),('F1005',5,'Economy',1,'C','available'),('F1005',5,'Economy',1,'D','available'),('F1005',5,'Economy',1,'E','available'),('F1005',5,'Economy',1,'F','available'),('F1005',5,'Economy',1,'G','available'),('F1005',5,'Economy',1,'H','available'),('F1005',5,'Economy',1,'I','available'),('F1005',5,'Economy',2,'A','available'),('F1005',5,'Economy',2,'B','available'),('F1005',5,'Economy',2,'C','available'),('F1005',5,'Economy',2,'D','available'),('F1005',5,'Economy',2,'E','available'),('F1005',5,'Economy',2,'F','available'),('F1005',5,'Economy',2,'G','available'),('F1005',5,'Economy',2,'H','available'),('F1005',5,'Economy',2,'I','available'),('F1005',5,'Economy',3,'A','available'),('F1005',5,'Economy',3,'B','available'),('F1005',5,'Economy',3,'C','available'),('F1005',5,'Economy',3,'D','available'),('F1005',5,'Economy',3,'E','available'),('F1005',5,'Economy',3,'F','available'),('F1005',5,'Economy',3,'G','available'),('F1005',5,'Economy',3,'H','available'),('F1005',5,'Economy',3,'I','available'),('F1005',5,'Economy',4,'A','available'),('F1005',5,'Economy',4,'B','available'),('F1005',5,'Economy',4,'C','available'),('F1005',5,'Economy',4,'D','available'),('F1005',5,'Economy',4,'E','available'),('F1005',5,'Economy',4,'F','available'),('F1005',5,'Economy',4,'G','available'),('F1005',5,'Economy',4,'H','available'),('F1005',5,'Economy',4,'I','available'),('F1005',5,'Economy',5,'A','available'),('F1005',5,'Economy',5,'B','available'),('F1005',5,'Economy',5,'C','available'),('F1005',5,'Economy',5,'D','available'),('F1005',5,'Economy',5,'E','available'),('F1005',5,'Economy',5,'F','available'),('F1005',5,'Economy',5,'G','available'),('F1005',5,'Economy',5,'H','available'),('F1005',5,'Economy',5,'I','available'),('F1005',5,'Economy',6,'A','available'),('F1005',5,'Economy',6,'B','available'),('F1005',5,'Economy',6,'C','available'),('F1005',5,'Economy',6,'D','available'),('F1005',5,'Economy',6,'E','available'),('F1005',5,'Economy',6,'F','available'),('F1005',5,'Economy',6,'G','available'),('F1005',5,'Economy',6,'H','available'),('F1005',5,'Economy',6,'I','available'),('F1005',5,'Economy',7,'A','available'),('F1005',5,'Economy',7,'B','available'),('F1005',5,'Economy',7,'C','available'),('F1005',5,'Economy',7,'D','available'),('F1005',5,'Economy',7,'E','available'),('F1005',5,'Economy',7,'F','available'),('F1005',5,'Economy',7,'G','available'),('F1005',5,'Economy',7,'H','available'),('F1005',5,'Economy',7,'I','available'),('F1005',5,'Economy',8,'A','available'),('F1005',5,'Economy',8,'B','available'),('F1005',5,'Economy',8,'C','available'),('F1005',5,'Economy',8,'D','available'),('F1005',5,'Economy',8,'E','available'),('F1005',5,'Economy',8,'F','available'),('F1005',5,'Economy',8,'G','available'),('F1005',5,'Economy',8,'H','available'),('F1005',5,'Economy',8,'I','available'),('F1005',5,'Economy',9,'A','available'),('F1005',5,'Economy',9,'B','available'),('F1005',5,'Economy',9,'C','available'),('F1005',5,'Economy',9,'D','available'),('F1005',5,'Economy',9,'E','available'),('F1005',5,'Economy',9,'F','available'),('F1005',5,'Economy',9,'G','available'),('F1005',5,'Economy',9,'H','available'),('F1005',5,'Economy',9,'I','available'),('F1005',5,'Economy',10,'A','available'),('F1005',5,'Economy',10,'B','available'),('F1005',5,'Economy',10,'C','available'),('F1005',5,'Economy',10,'D','available'),('F1005',5,'Economy',10,'E','available'),('F1005',5,'Economy',10,'F','available'),('F1005',5,'Economy',10,'G','available'),('F1005',5,'Economy',10,'H','available'),('F1005',5,'Economy',10,'I','available'),('F1005',5,'Economy',11,'A','available'),('F1005',5,'Economy',11,'B','available'),('F1005',5,'Economy',11,'C','available'),('F1005',5,'Economy',11,'D','available'),('F1005',5,'Economy',11,'E','available'),('F1005',5,'Economy',11,'F','available'),('F1005',5,'Economy',11,'G','available'),('F1005',5,'Economy',11,'H','available'),('F1005',5,'Economy',11,'I','available'),('F1005',5,'Economy',12,'A','available'),('F1005',5,'Economy',12,'B','available'),('F1005',5,'Economy',12,'C','available'),('F1005',5,'Economy',12,'D','available'),('F1005',5,'Economy',12,'E','available'),('F1005',5,'Economy',12,'F','available'),('F1005',5,'Economy',12,'G','available'),('F1005',5,'Economy',12,'H','available'),('F1005',5,'Economy',12,'I','available'),('F1005',5,'Economy',13,'A','available'),('F1005',5,'Economy',13,'B','available'),('F1005',5,'Economy',13,'C','available'),('F1005',5,'Economy',13,'D','available'),('F1005',5,'Economy',13,'E','available'),('F1005',5,'Economy',13,'F','available'),('F1005',5,'Economy',13,'G','available'),('F1005',5,'Economy',13,'H','available'),('F1005',5,'Economy',13,'I','available'),('F1005',5,'Economy',14,'A','available'),('F1005',5,'Economy',14,'B','available'),('F1005',5,'Economy',14,'C','available'),('F1005',5,'Economy',14,'D','available'),('F1005',5,'Economy',14,'E','available'),('F1005',5,'Economy',14,'F','available'),('F1005',5,'Economy',14,'G','available'),('F1005',5,'Economy',14,'H','available'),('F1005',5,'Economy',14,'I','available'),('F1005',5,'Economy',15,'A','available'),('F1005',5,'Economy',15,'B','available'),('F1005',5,'Economy',15,'C','available'),('F1005',5,'Economy',15,'D','available'),('F1005',5,'Economy',15,'E','available'),('F1005',5,'Economy',15,'F','available'),('F1005',5,'Economy',15,'G','available'),('F1005',5,'Economy',15,'H','available'),('F1005',5,'Economy',15,'I','available'),('F1005',5,'Economy',16,'A','available'),('F1005',5,'Economy',16,'B','available'),('F1005',5,'Economy',16,'C','available'),('F1005',5,'Economy',16,'D','available'),('F1005',5,'Economy',16,'E','available'),('F1005',5,'Economy',16,'F','available'),('F1005',5,'Economy',16,'G','available'),('F1005',5,'Economy',16,'H','available'),('F1005',5,'Economy',16,'I','available'),('F1005',5,'Economy',17,'A','available'),('F1005',5,'Economy',17,'B','available'),('F1005',5,'Economy',17,'C','available'),('F1005',5,'Economy',17,'D','available'),('F1005',5,'Economy',17,'E','available'),('F1005',5,'Economy',17,'F','available'),('F1005',5,'Economy',17,'G','available'),('F1005',5,'Economy',17,'H','available'),('F1005',5,'Economy',17,'I','available'),('F1005',5,'Economy',18,'A','available'),('F1005',5,'Economy',18,'B','available'),('F1005',5,'Economy',18,'C','available'),('F1005',5,'Economy',18,'D','available'),('F1005',5,'Economy',18,'E','available'),('F1005',5,'Economy',18,'F','available'),('F1005',5,'Economy',18,'G','available'),('F1005',5,'Economy',18,'H','available'),('F1005',5,'Economy',18,'I','available'),('F1005',5,'Economy',19,'A','available'),('F1005',5,'Economy',19,'B','available'),('F1005',5,'Economy',19,'C','available'),('F1005',5,'Economy',19,'D','available'),('F1005',5,'Economy',19,'E','available'),('F1005',5,'Economy',19,'F','available'),('F1005',5,'Economy',19,'G','available'),('F1005',5,'Economy',19,'H','available'),('F1005',5,'Economy',19,'I','available'),('F1005',5,'Economy',20,'A','available'),('F1005',5,'Economy',20,'B','available'),('F1005',5,'Economy',20,'C','available'),('F1005',5,'Economy',20,'D','available'),('F1005',5,'Economy',20,'E','available'),('F1005',5,'Economy',20,'F','available'),('F1005',5,'Economy',20,'G','available'),('F1005',5,'Economy',20,'H','available'),('F1005',5,'Economy',20,'I','available'),('F1006',6,'Business',1,'A','available'),('F1006',6,'Business',1,'B','available'),('F1006',6,'Business',1,'C','available'),('F1006',6,'Business',1,'D','available'),('F1006',6,'Business',2,'A','available'),('F1006',6,'Business',2,'B','available'),('F1006',6,'Business',2,'C','available'),('F1006',6,'Business',2,'D','available'),('F1006',6,'Economy',1,'A','available'),('F1006',6,'Economy',1,'B','available'),('F1006',6,'Economy',1,'C','available'),('F1006',6,'Economy',1,'D','available'),('F1006',6,'Economy',1,'E','available'),('F1006',6,'Economy',1,'F','available'),('F1006',6,'Economy',1,'G','available'),('F1006',6,'Economy',1,'H','available'),('F1006',6,'Economy',1,'I','available'),('F1006',6,'Economy',1,'J','available'),('F1006',6,'Economy',2,'A','available'),('F1006',6,'Economy',2,'B','available'),('F1006',6,'Economy',2,'C','available'),('F1006',6,'Economy',2,'D','available'),('F1006',6,'Economy',2,'E','available'),('F1006',6,'Economy',2,'F','available'),('F1006',6,'Economy',2,'G','available'),('F1006',6,'Economy',2,'H','available'),('F1006',6,'Economy',2,'I','available'),('F1006',6,'Economy',2,'J','available'),('F1006',6,'Economy',3,'A','available'),('F1006',6,'Economy',3,'B','available'),('F1006',6,'Economy',3,'C','available'),('F1006',6,'Economy',3,'D','available'),('F1006',6,'Economy',3,'E','available'),('F1006',6,'Economy',3,'F','available'),('F1006',6,'Economy',3,'G','available'),('F1006',6,'Economy',3,'H','available'),('F1006',6,'Economy',3,'I','available'),('F1006',6,'Economy',3,'J','available'),('F1006',6,'Economy',4,'A','available'),('F1006',6,'Economy',4,'B','available'),('F1006',6,'Economy',4,'C','available'),('F1006',6,'Economy',4,'D','available'),('F1006',6,'Economy',4,'E','available'),('F1006',6,'Economy',4,'F','available'),('F1006',6,'Economy',4,'G','available'),('F1006',6,'Economy',4,'H','available'),('F1006',6,'Economy',4,'I','available'),('F1006',6,'Economy',4,'J','available'),('F1006',6,'Economy',5,'A','available'),('F1006',6,'Economy',5,'B','available'),('F1006',6,'Economy',5,'C','available'),('F1006',6,'Economy',5,'D','available'),('F1006',6,'Economy',5,'E','available'),('F1006',6,'Economy',5,'F','available'),('F1006',6,'Economy',5,'G','available'),('F1006',6,'Economy',5,'H','available'),('F1006',6,'Economy',5,'I','available'),('F1006',6,'Economy',5,'J','available'),('F1006',6,'Economy',6,'A','available'),('F1006',6,'Economy',6,'B','available'),('F1006',6,'Economy',6,'C','available'),('F1006',6,'Economy',6,'D','available'),('F1006',6,'Economy',6,'E','available'),('F1006',6,'Economy',6,'F','available'),('F1006',6,'Economy',6,'G','available'),('F1006',6,'Economy',6,'H','available'),('F1006',6,'Economy',6,'I','available'),('F1006',6,'Economy',6,'J','available'),('F1006',6,'Economy',7,'A','available'),('F1006',6,'Economy',7,'B','available'),('F1006',6,'Economy',7,'C','available'),('F1006',6,'Economy',7,'D','available'),('F1006',6,'Economy',7,'E','available'),('F1006',6,'Economy',7,'F','available'),('F1006',6,'Economy',7,'G','available'),('F1006',6,'Economy',7,'H','available'),('F1006',6,'Economy',7,'I','available'),('F1006',6,'Economy',7,'J','available'),('F1006',6,'Economy',8,'A','available'),('F1006',6,'Economy',8,'B','available'),('F1006',6,'Economy',8,'C','available'),('F1006',6,'Economy',8,'D','available'),('F1006',6,'Economy',8,'E','available'),('F1006',6,'Economy',8,'F','available'),('F1006',6,'Economy',8,'G','available'),('F1006',6,'Economy',8,'H','available'),('F1006',6,'Economy',8,'I','available'),('F1006',6,'Economy',8,'J','available'),('F1006',6,'Economy',9,'A','available'),('F1006',6,'Economy',9,'B','available'),('F1006',6,'Economy',9,'C','available'),('F1006',6,'Economy',9,'D','available'),('F1006',6,'Economy',9,'E','available'),('F1006',6,'Economy',9,'F','available'),('F1006',6,'Economy',9,'G','available'),('F1006',6,'Economy',9,'H','available'),('F1006',6,'Economy',9,'I','available'),('F1006',6,'Economy',9,'J','available'),('F1006',6,'Economy',10,'A','available'),('F1006',6,'Economy',10,'B','available'),('F1006',6,'Economy',10,'C','available'),('F1006',6,'Economy',10,'D','taken'),('F1006',6,'Economy',10,'E','taken'),('F1006',6,'Economy',10,'F','taken'),('F1006',6,'Economy',10,'G','taken'),('F1006',6,'Economy',10,'H','available'),('F1006',6,'Economy',10,'I','available'),('F1006',6,'Economy',10,'J','available'),('F1006',6,'Economy',11,'A','available'),('F1006',6,'Economy',11,'B','available'),('F1006',6,'Economy',11,'C','available'),('F1006',6,'Economy',11,'D','available'),('F1006',6,'Economy',11,'E','available'),('F1006',6,'Economy',11,'F','available'),('F1006',6,'Economy',11,'G','available'),('F1006',6,'Economy',11,'H','available'),('F1006',6,'Economy',11,'I','available'),('F1006',6,'Economy',11,'J','available'),('F1006',6,'Economy',12,'A','available'),('F1006',6,'Economy',12,'B','available'),('F1006',6,'Economy',12,'C','available'),('F1006',6,'Economy',12,'D','available'),('F1006',6,'Economy',12,'E','available'),('F1006',6,'Economy',12,'F','available'),('F1006',6,'Economy',12,'G','available'),('F1006',6,'Economy',12,'H','available'),('F1006',6,'Economy',12,'I','available'),('F1006',6,'Economy',12,'J','available'),('F1006',6,'Economy',13,'A','available'),('F1006',6,'Economy',13,'B','available'),('F1006',6,'Economy',13,'C','available'),('F1006',6,'Economy',13,'D','available'),('F1006',6,'Economy',13,'E','available'),('F1006',6,'Economy',13,'F','available'),('F1006',6,'Economy',13,'G','available'),('F1006',6,'Economy',13,'H','available'),('F1006',6,'Economy',13,'I','available'),('F1006',6,'Economy',13,'J','available'),('F1006',6,'Economy',14,'A','available'),('F1006',6,'Economy',14,'B','available'),('F1006',6,'Economy',14,'C','available'),('F1006',6,'Economy',14,'D','available'),('F1006',6,'Economy',14,'E','available'),('F1006',6,'Economy',14,'F','available'),('F1006',6,'Economy',14,'G','available'),('F1006',6,'Economy',14,'H','available'),('F1006',6,'Economy',14,'I','available'),('F1006',6,'Economy',14,'J','available'),('F1006',6,'Economy',15,'A','available'),('F1006',6,'Economy',15,'B','available'),('F1006',6,'Economy',15,'C','available'),('F1006',6,'Economy',15,'D','available'),('F1006',6,'Economy',15,'E','available'),('F1006',6,'Economy',15,'F','available'),('F1006',6,'Economy',15,'G','available'),('F1006',6,'Economy',15,'H','available'),('F1006',6,'Economy',15,'I','available'),('F1006',6,'Economy',15,'J','available'),('F1007',8,'Business',1,'A','available'),('F1007',8,'Business',1,'B','available'),('F1007',8,'Business',1,'C','available'),('F1007',8,'Business',1,'D','available'),('F1007',8,'Business',1,'E','available'),('F1007',8,'Business',2,'A','available'),('F1007',8,'Business',2,'B','available'),('F1007',8,'Business',2,'C','available'),('F1007',8,'Business',2,'D','available'),('F1007',8,'Business',2,'E','available'),('F1007',8,'Business',3,'A','available'),('F1007',8,'Business',3,'B','available'),('F1007',8,'Business',3,'C','available'),('F1007',8,'Business',3,'D','available'),('F1007',8,'Business',3,'E','available'),('F1007',8,'Business',4,'A','available'),('F1007',8,'Business',4,'B','available'),('F1007',8,'Business',4,'C','available'),('F1007',8,'Business',4,'D','available'),('F1007',8,'Business',4,'E','available'),('F1007',8,'Business',5,'A','available'),('F1007',8,'Business',5,'B','available'),('F1007',8,'Business',5,'C','available'),('F1007',8,'Business',5,'D','available'),('F1007',8,'Business',5,'E','available'),('F1007',8,'Economy',1,'A','available'),('F1007',8,'Economy',1,'B','available'),('F1007',8,'Economy',1,'C','available'),('F1007',8,'Economy',1,'D','available'),('F1007',8,'Economy',1,'E','available'),('F1007',8,'Economy',2,'A','available'),('F1007',8,'Economy',2,'B','available'),('F1007',8,'Economy',2,'C','available'),('F1007',8,'Economy',2,'D','available'),('F1007',8,'Economy',2,'E','available'),('F1007',8,'Economy',3,'A','available'),('F1007',8,'Economy',3,'B','available'),('F1007',8,'Economy',3,'C','available'),('F1007',8,'Economy',3,'D','available'),('F1007',8,'Economy',3,'E','available'),('F1007',8,'Economy',4,'A','available'),('F1007',8,'Economy',4,'B','available'),('F1007',8,'Economy',4,'C','available'),('F1007',8,'Economy',4,'D','available'),('F1007',8,'Economy',4,'E','available'),('F1007',8,'Economy',5,'A','available'),('F1007',8,'Economy',5,'B','available'),('F1007',8,'Economy',5,'C','available'),('F1007',8,'Economy',5,'D','available'),('F1007',8,'Economy',5,'E','available'),('F1008',6,'Business',1,'A','available'),('F1008',6,'Business',1,'B','available'),('F1008',6,'Business',1,'C','available'),('F1008',6,'Business',1,'D','available'),('F1008',6,'Business',2,'A','available'),('F1008',6,'Business',2,'B','available'),('F1008',6,'Business',2,'C','available'),('F1008',6,'Business',2,'D','available'),('F1008',6,'Economy',1,'A','available'),('F1008',6,'Economy',1,'B','available'),('F1008',6,'Economy',1,'C','available'),('F1008',6,'Economy',1,'D','available'),('F1008',6,'Economy',1,'E','available'),('F1008',6,'Economy',1,'F','available'),('F1008',6,'Economy',1,'G','available'),('F1008',6,'Economy',1,'H','available'),('F1008',6,'Economy',1,'I','available'),('F1008',6,'Economy',1,'J','available'),('F1008',6,'Economy',2,'A','available'),('F1008',6,'Economy',2,'B','available'),('F1008',6,'Economy',2,'C','available'),('F1008',6,'Economy',2,'D','available'),('F1008',6,'Economy',2,'E','available'),('F1008',6,'Economy',2,'F','available'),('F1008',6,'Economy',2,'G','available'),('F1008',6,'Economy',2,'H','available'),('F1008',6,'Economy',2,'I','available'),('F1008',6,'Economy',2,'J','available'),('F1008',6,'Economy',3,'A','available'),('F1008',6,'Economy',3,'B','available'),('F1008',6,'Economy',3,'C','available'),('F1008',6,'Economy',3,'D','available'),('F1008',6,'Economy',3,'E','available'),('F1008',6,'Economy',3,'F','available'),('F1008',6,'Economy',3,'G','available'),('F1008',6,'Economy',3,'H','available'),('F1008',6,'Economy',3,'I','available'),('F1008',6,'Economy',3,'J','available'),('F1008',6,'Economy',4,'A','available'),('F1008',6,'Economy',4,'B','available'),('F1008',6,'Economy',4,'C','available'),('F1008',6,'Economy',4,'D','available'),('F1008',6,'Economy',4,'E','available'),('F1008',6,'Economy',4,'F','available'),('F1008',6,'Economy',4,'G','available'),('F1008',6,'Economy',4,'H','available'),('F1008',6,'Economy',4,'I','available'),('F1008',6,'Economy',4,'J','available'),('F1008',6,'Economy',5,'A','available'),('F1008',6,'Economy',5,'B','available'),('F1008',6,'Economy',5,'C','available'),('F1008',6,'Economy',5,'D','available'),('F1008',6,'Economy',5,'E','available'),('F1008',6,'Economy',5,'F','available'),('F1008',6,'Economy',5,'G','available'),('F1008',6,'Economy',5,'H','available'),('F1008',6,'Economy',5,'I','available'),('F1008',6,'Economy',5,'J','available'),('F1008',6,'Economy',6,'A','available'),('F1008',6,'Economy',6,'B','available'),('F1008',6,'Economy',6,'C','available'),('F1008',6,'Economy',6,'D','available'),('F1008',6,'Economy',6,'E','available'),('F1008',6,'Economy',6,'F','available'),('F1008',6,'Economy',6,'G','available'),('F1008',6,'Economy',6,'H','available'),('F1008',6,'Economy',6,'I','available'),('F1008',6,'Economy',6,'J','available'),('F1008',6,'Economy',7,'A','available'),('F1008',6,'Economy',7,'B','available'),('F1008',6,'Economy',7,'C','available'),('F1008',6,'Economy',7,'D','available'),('F1008',6,'Economy',7,'E','available'),('F1008',6,'Economy',7,'F','available'),('F1008',6,'Economy',7,'G','available'),('F1008',6,'Economy',7,'H','available'),('F1008',6,'Economy',7,'I','available'),('F1008',6,'Economy',7,'J','available'),('F1008',6,'Economy',8,'A','available'),('F1008',6,'Economy',8,'B','available'),('F1008',6,'Economy',8,'C','available'),('F1008',6,'Economy',8,'D','available'),('F1008',6,'Economy',8,'E','available'),('F1008',6,'Economy',8,'F','available'),('F1008',6,'Economy',8,'G','available'),('F1008',6,'Economy',8,'H','available'),('F1008',6,'Economy',8,'I','available'),('F1008',6,'Economy',8,'J','available'),('F1008',6,'Economy',9,'A','available'),('F1008',6,'Economy',9,'B','available'),('F1008',6,'Economy',9,'C','available'),('F1008',6,'Economy',9,'D','available'),('F1008',6,'Economy',9,'E','available'),('F1008',6,'Economy',9,'F','available'),('F1008',6,'Economy',9,'G','available'),('F1008',6,'Economy',9,'H','available'),('F1008',6,'Economy',9,'I','available'),('F1008',6,'Economy',9,'J','available'),('F1008',6,'Economy',10,'A','available'),('F1008',6,'Economy',10,'B','available'),('F1008',6,'Economy',10,'C','available'),('F1008',6,'Economy',10,'D','available'),('F1008',6,'Economy',10,'E','available'),('F1008',6,'Economy',10,'F','available'),('F1008',6,'Economy',10,'G','available'),('F1008',6,'Economy',10,'H','available'),('F1008',6,'Economy',10,'I','available'),('F1008',6,'Economy',10,'J','available'),('F1008',6,'Economy',11,'A','available'),('F1008',6,'Economy',11,'B','available'),('F1008',6,'Economy',11,'C','available'),('F1008',6,'Economy',11,'D','available'),('F1008',6,'Economy',11,'E','available'),('F1008',6,'Economy',11,'F','available'),('F1008',6,'Economy',11,'G','available'),('F1008',6,'Economy',11,'H','available'),('F1008',6,'Economy',11,'I','available'),('F1008',6,'Economy',11,'J','available'),('F1008',6,'Economy',12,'A','available'),('F1008',6,'Economy',12,'B','available'),('F1008',6,'Economy',12,'C','available'),('F1008',6,'Economy',12,'D','available'),('F1008',6,'Economy',12,'E','available'),('F1008',6,'Economy',12,'F','available'),('F1008',6,'Economy',12,'G','available'),('F1008',6,'Economy',12,'H','available'),('F1008',6,'Economy',12,'I','available'),('F1008',6,'Economy',12,'J','available'),('F1008',6,'Economy',13,'A','available'),('F1008',6,'Economy',13,'B','available'),('F1008',6,'Economy',13,'C','available'),('F1008',6,'Economy',13,'D','available'),('F1008',6,'Economy',13,'E','available'),('F1008',6,'Economy',13,'F','available'),('F1008',6,'Economy',13,'G','available'),('F1008',6,'Economy',13,'H','available'),('F1008',6,'Economy',13,'I','available'),('F1008',6,'Economy',13,'J','available'),('F1008',6,'Economy',14,'A','available'),('F1008',6,'Economy',14,'B','available'),('F1008',6,'Economy',14,'C','available'),('F1008',6,'Economy',14,'D','available'),('F1008',6,'Economy',14,'E','available'),('F1008',6,'Economy',14,'F','available'),('F1008',6,'Economy',14,'G','available'),('F1008',6,'Economy',14,'H','available'),('F1008',6,'Economy',14,'I','available'),('F1008',6,'Economy',14,'J','available'),('F1008',6,'Economy',15,'A','available'),('F1008',6,'Economy',15,'B','available'),('F1008',6,'Economy',15,'C','available'),('F1008',6,'Economy',15,'D','available'),('F1008',6,'Economy',15,'E','available'),('F1008',6,'Economy',15,'F','available'),('F1008',6,'Economy',15,'G','available'),('F1008',6,'Economy',15,'H','available'),('F1008',6,'Economy',15,'I','available'),('F1008',6,'Economy',15,'J','available'),('F1009',4,'Economy',1,'A','available'),('F1009',4,'Economy',1,'B','available'),('F1009',4,'Economy',1,'C','available'),('F1009',4,'Economy',1,'D','available'),('F1009',4,'Economy',2,'A','available'),('F1009',4,'Economy',2,'B','available'),('F1009',4,'Economy',2,'C','available'),('F1009',4,'Economy',2,'D','available'),('F1009',4,'Economy',3,'A','available'),('F1009',4,'Economy',3,'B','available'),('F1009',4,'Economy',3,'C','available'),('F1009',4,'Economy',3,'D','available'),('F1009',4,'Economy',4,'A','available'),('F1009',4,'Economy',4,'B','available'),('F1009',4,'Economy',4,'C','available'),('F1009',4,'Economy',4,'D','available'),('F1009',4,'Economy',5,'A','available'),('F1009',4,'Economy',5,'B','available'),('F1009',4,'Economy',5,'C','available'),('F1009',4,'Economy',5,'D','available'),('F1009',4,'Economy',6,'A','available'),('F1009',4,'Economy',6,'B','available'),('F1009',4,'Economy',6,'C','available'),('F1009',4,'Economy',6,'D','available'),('F1009',4,'Economy',7,'A','available'),('F1009',4,'Economy',7,'B','available'),('F1009',4,'Economy',7,'C','available'),('F1009',4,'Economy',7,'D','available'),('F1009',4,'Economy',8,'A','available'),('F1009',4,'Economy',8,'B','available'),('F1009',4,'Economy',8,'C','available'),('F1009',4,'Economy',8,'D','available'),('F1009',4,'Economy',9,'A','available'),('F1009',4,'Economy',9,'B','available'),('F1009',4,'Economy',9,'C','available'),('F1009',4,'Economy',9,'D','available'),('F1009',4,'Economy',10,'A','available'),('F1009',4,'Economy',10,'B','available'),('F1009',4,'Economy',10,'C','available'),('F1009',4,'Economy',10,'D','available'),('F1010',5,'Business',1,'A','available'),('F1010',5,'Business',1,'B','available'),('F1010',5,'Business',1,'C','available'),('F1010',5,'Business',1,'D','available'),('F1010',5,'Business',2,'A','available'),('F1010',5,'Business',2,'B','available'),('F1010',5,'Business',2,'C','available'),('F1010',5,'Business',2,'D','available'),('F1010',5,'Business',3,'A','available'),('F1010',5,'Business',3,'B','available'),('F1010',5,'Business',3,'C','available'),('F1010',5,'Business',3,'D','available'),('F1010',5,'Economy',1,'A','available'),('F1010',5,'Economy',1,'B','available'),('F1010',5,'Economy',1,'C','available'),('F1010',5,'Economy',1,'D','available'),('F1010',5,'Economy',1,'E','available'),('F1010',5,'Economy',1,'F','available'),('F1010',5,'Economy',1,'G','available'),('F1010',5,'Economy',1,'H','available'),('F1010',5,'Economy',1,'I','available'),('F1010',5,'Economy',2,'A','available'),('F1010',5,'Economy',2,'B','available'),('F1010',5,'Economy',2,'C','available'),('F1010',5,'Economy',2,'D','available'),('F1010',5,'Economy',2,'E','available'),('F1010',5,'Economy',2,'F','available'),('F1010',5,'Economy',2,'G','available'),('F1010',5,'Economy',2,'H','available'),('F1010',5,'Economy',2,'I','available'),('F1010',5,'Economy',3,'A','available'),('F1010',5,'Economy',3,'B','available'),('F1010',5,'Economy',3,'C','available'),('F1010',5,'Economy',3,'D','available'),('F1010',5,'Economy',3,'E','available'),('F1010',5,'Economy',3,'F','available'),('F1010',5,'Economy',3,'G','available'),('F1010',5,'Economy',3,'H','available'),('F1010',5,'Economy',3,'I','available'),('F1010',5,'Economy',4,'A','available'),('F1010',5,'Economy',4,'B','available'),('F1010',5,'Economy',4,'C','available'),('F1010',5,'Economy',4,'D','available'),('F1010',5,'Economy',4,'E','available'),('F1010',5,'Economy',4,'F','available'),('F1010',5,'Economy',4,'G','available'),('F1010',5,'Economy',4,'H','available'),('F1010',5,'Economy',4,'I','available'),('F1010',5,'Economy',5,'A','available'),('F1010',5,'Economy',5,'B','available'),('F1010',5,'Economy',5,'C','available'),('F1010',5,'Economy',5,'D','available'),('F1010',5,'Economy',5,'E','available'),('F1010',5,'Economy',5,'F','available'),('F1010',5,'Economy',5,'G','available'),('F1010',5,'Economy',5,'H','available'),('F1010',5,'Economy',5,'I','available'),('F1010',5,'Economy',6,'A','available'),('F1010',5,'Economy',6,'B','available'),('F1010',5,'Economy',6,'C','available'),('F1010',5,'Economy',6,'D','available'),('F1010',5,'Economy',6,'E','available'),('F1010',5,'Economy',6,'F','available'),('F1010',5,'Economy',6,'G','available'),('F1010',5,'Economy',6,'H','available'),('F1010',5,'Economy',6,'I','available'),('F1010',5,'Economy',7,'A','available'),('F1010',5,'Economy',7,'B','available'),('F1010',5,'Economy',7,'C','available'),('F1010',5,'Economy',7,'D','available'),('F1010',5,'Economy',7,'E','available'),('F1010',5,'Economy',7,'F','available'),('F1010',5,'Economy',7,'G','available'),('F1010',5,'Economy',7,'H','available'),('F1010',5,'Economy',7,'I','available'),('F1010',5,'Economy',8,'A','available'),('F1010',5,'Economy',8,'B','available'),('F1010',5,'Economy',8,'C','available'),('F1010',5,'Economy',8,'D','available'),('F1010',5,'Economy',8,'E','available'),('F1010',5,'Economy',8,'F','available'),('F1010',5,'Economy',8,'G','available'),('F1010',5,'Economy',8,'H','available'),('F1010',5,'Economy',8,'I','available'),('F1010',5,'Economy',9,'A','available'),('F1010',5,'Economy',9,'B','available'),('F1010',5,'Economy',9,'C','available'),('F1010',5,'Economy',9,'D','available'),('F1010',5,'Economy',9,'E','available'),('F1010',5,'Economy',9,'F','available'),('F1010',5,'Economy',9,'G','available'),('F1010',5,'Economy',9,'H','available'),('F1010',5,'Economy',9,'I','available'),('F1010',5,'Economy',10,'A','available'),('F1010',5,'Economy',10,'B','available'),('F1010',5,'Economy',10,'C','available'),('F1010',5,'Economy',10,'D','available'),('F1010',5,'Economy',10,'E','available'),('F1010',5,'Economy',10,'F','available'),('F1010',5,'Economy',10,'G','available'),('F1010',5,'Economy',10,'H','available'),('F1010',5,'Economy',10,'I','available'),('F1010',5,'Economy',11,'A','available'),('F1010',5,'Economy',11,'B','available'),('F1010',5,'Economy',11,'C','available'),('F1010',5,'Economy',11,'D','available'),('F1010',5,'Economy',11,'E','available'),('F1010',5,'Economy',11,'F','available'),('F1010',5,'Economy',11,'G','available'),('F1010',5,'Economy',11,'H','available'),('F1010',5,'Economy',11,'I','available'),('F1010',5,'Economy',12,'A','available'),('F1010',5,'Economy',12,'B','available'),('F1010',5,'Economy',12,'C','available'),('F1010',5,'Economy',12,'D','available'),('F1010',5,'Economy',12,'E','available'),('F1010',5,'Economy',12,'F','available'),('F1010',5,'Economy',12,'G','available'),('F1010',5,'Economy',12,'H','available'),('F1010',5,'Economy',12,'I','available'),('F1010',5,'Economy',13,'A','available'),('F1010',5,'Economy',13,'B','available'),('F1010',5,'Economy',13,'C','available'),('F1010',5,'Economy',13,'D','available'),('F1010',5,'Economy',13,'E','available'),('F1010',5,'Economy',13,'F','available'),('F1010',5,'Economy',13,'G','available'),('F1010',5,'Economy',13,'H','available'),('F1010',5,'Economy',13,'I','available'),('F1010',5,'Economy',14,'A','available'),('F1010',5,'Economy',14,'B','available'),('F1010',5,'Economy',14,'C','available'),('F1010',5,'Economy',14,'D','available'),('F1010',5,'Economy',14,'E','available'),('F1010',5,'Economy',14,'F','available'),('F1010',5,'Economy',14,'G','available'),('F1010',5,'Economy',14,'H','available'),('F1010',5,'Economy',14,'I','available'),('F1010',5,'Economy',15,'A','available'),('F1010',5,'Economy',15,'B','available'),('F1010',5,'Economy',15,'C','available'),('F1010',5,'Economy',15,'D','available'),('F1010',5,'Economy',15,'E','available'),('F1010',5,'Economy',15,'F','available'),('F1010',5,'Economy',15,'G','available'),('F1010',5,'Economy',15,'H','available'),('F1010',5,'Economy',15,'I','available'),('F1010',5,'Economy',16,'A','available'),('F1010',5,'Economy',16,'B','available'),('F1010',5,'Economy',16,'C','available'),('F1010',5,'Economy',16,'D','available'),('F1010',5,'Economy',16,'E','available'),('F1010',5,'Economy',16,'F','available'),('F1010',5,'Economy',16,'G','available'),('F1010',5,'Economy',16,'H','available'),('F1010',5,'Economy',16,'I','available'),('F1010',5,'Economy',17,'A','available'),('F1010',5,'Economy',17,'B','available'),('F1010',5,'Economy',17,'C','available'),('F1010',5,'Economy',17,'D','available'),('F1010',5,'Economy',17,'E','available'),('F1010',5,'Economy',17,'F','available'),('F1010',5,'Economy',17,'G','available'),('F1010',5,'Economy',17,'H','available'),('F1010',5,'Economy',17,'I','available'),('F1010',5,'Economy',18,'A','available'),('F1010',5,'Economy',18,'B','available'),('F1010',5,'Economy',18,'C','available'),('F1010',5,'Economy',18,'D','available'),('F1010',5,'Economy',18,'E','available'),('F1010',5,'Economy',18,'F','available'),('F1010',5,'Economy',18,'G','available'),('F1010',5,'Economy',18,'H','available'),('F1010',5,'Economy',18,'I','available'),('F1010',5,'Economy',19,'A','available'),('F1010',5,'Economy',19,'B','available'),('F1010',5,'Economy',19,'C','available'),('F1010',5,'Economy',19,'D','available'),('F1010',5,'Economy',19,'E','available'),('F1010',5,'Economy',19,'F','available'),('F1010',5,'Economy',19,'G','available'),('F1010',5,'Economy',19,'H','available'),('F1010',5,'Economy',19,'I','available'),('F1010',5,'Economy',20,'A','available'),('F1010',5,'Economy',20,'B','available'),('F1010',5,'Economy',20,'C','available'),('F1010',5,'Economy',20,'D','available'),('F1010',5,'Economy',20,'E','available'),('F1010',5,'Economy',20,'F','available'),('F1010',5,'Economy',20,'G','available'),('F1010',5,'Economy',20,'H','available'),('F1010',5,'Economy',20,'I','available'),('F1011',5,'Business',1,'A','available'),('F1011',5,'Business',1,'B','available'),('F1011',5,'Business',1,'C','available'),('F1011',5,'Business',1,'D','available'),('F1011',5,'Business',2,'A','available'),('F1011',5,'Business',2,'B','available'),('F1011',5,'Business',2,'C','available'),('F1011',5,'Business',2,'D','available'),('F1011',5,'Business',3,'A','available'),('F1011',5,'Business',3,'B','available'),('F1011',5,'Business',3,'C','available'),('F1011',5,'Business',3,'D','available'),('F1011',5,'Economy',1,'A','available'),('F1011',5,'Economy',1,'B','available'),('F1011',5,'Economy',1,'C','available'),('F1011',5,'Economy',1,'D','available'),('F1011',5,'Economy',1,'E','available'),('F1011',5,'Economy',1,'F','available'),('F1011',5,'Economy',1,'G','available'),('F1011',5,'Economy',1,'H','available'),('F1011',5,'Economy',1,'I','available'),('F1011',5,'Economy',2,'A','available'),('F1011',5,'Economy',2,'B','available'),('F1011',5,'Economy',2,'C','available'),('F1011',5,'Economy',2,'D','available'),('F1011',5,'Economy',2,'E','available'),('F1011',5,'Economy',2,'F','available'),('F1011',5,'Economy',2,'G','available'),('F1011',5,'Economy',2,'H','available'),('F1011',5,'Economy',2,'I','available'),('F1011',5,'Economy',3,'A','available'),('F1011',5,'Economy',3,'B','available'),('F1011',5,'Economy',3,'C','available'),('F1011',5,'Economy',3,'D','available'),('F1011',5,'Economy',3,'E','available'),('F1011',5,'Economy',3,'F','available'),('F1011',5,'Economy',3,'G','available'),('F1011',5,'Economy',3,'H','available'),('F1011',5,'Economy',3,'I','available'),('F1011',5,'Economy',4,'A','available'),('F1011',5,'Economy',4,'B','available'),('F1011',5,'Economy',4,'C','available'),('F1011',5,'Economy',4,'D','available'),('F1011',5,'Economy',4,'E','available'),('F1011',5,'Economy',4,'F','available'),('F1011',5,'Economy',4,'G','available'),('F1011',5,'Economy',4,'H','available'),('F1011',5,'Economy',4,'I','available'),('F1011',5,'Economy',5,'A','available'),('F1011',5,'Economy',5,'B','available'),('F1011',5,'Economy',5,'C','available'),('F1011',5,'Economy',5,'D','available'),('F1011',5,'Economy',5,'E','available'),('F1011',5,'Economy',5,'F','available'),('F1011',5,'Economy',5,'G','available'),('F1011',5,'Economy',5,'H','available'),('F1011',5,'Economy',5,'I','available'),('F1011',5,'Economy',6,'A','available'),('F1011',5,'Economy',6,'B','available'),('F1011',5,'Economy',6,'C','available'),('F1011',5,'Economy',6,'D','available'),('F1011',5,'Economy',6,'E','available'),('F1011',5,'Economy',6,'F','available'),('F1011',5,'Economy',6,'G','available'),('F1011',5,'Economy',6,'H','available'),('F1011',5,'Economy',6,'I','available'),('F1011',5,'Economy',7,'A','available'),('F1011',5,'Economy',7,'B','available'),('F1011',5,'Economy',7,'C','available'),('F1011',5,'Economy',7,'D','available'),('F1011',5,'Economy',7,'E','available'),('F1011',5,'Economy',7,'F','available'),('F1011',5,'Economy',7,'G','available'),('F1011',5,'Economy',7,'H','available'),('F1011',5,'Economy',7,'I','available'),('F1011',5,'Economy',8,'A','available'),('F1011',5,'Economy',8,'B','available'),('F1011',5,'Economy',8,'C','available'),('F1011',5,'Economy',8,'D','available'),('F1011',5,'Economy',8,'E','available'),('F1011',5,'Economy',8,'F','available'),('F1011',5,'Economy',8,'G','available'),('F1011',5,'Economy',8,'H','available'),('F1011',5,'Economy',8,'I','available'),('F1011',5,'Economy',9,'A','available'),('F1011',5,'Economy',9,'B','available'),('F1011',5,'Economy',9,'C','available'),('F1011',5,'Economy',9,'D','available'),('F1011',5,'Economy',9,'E','available'),('F1011',5,'Economy',9,'F','available'),('F1011',5,'Economy',9,'G','available'),('F1011',5,'Economy',9,'H','available'),('F1011',5,'Economy',9,'I','available'),('F1011',5,'Economy',10,'A','available'),('F1011',5,'Economy',10,'B','available'),('F1011',5,'Economy',10,'C','available'),('F1011',5,'Economy',10,'D','available'),('F1011',5,'Economy',10,'E','available'),('F1011',5,'Economy',10,'F','available'),('F1011',5,'Economy',10,'G','available'),('F1011',5,'Economy',10,'H','available'),('F1011',5,'Economy',10,'I','available'),('F1011',5,'Economy',11,'A','available'),('F1011',5,'Economy',11,'B','available'),('F1011',5,'Economy',11,'C','available'),('F1011',5,'Economy',11,'D','available'),('F1011',5,'Economy',11,'E','available'),('F1011',5,'Economy',11,'F','available'),('F1011',5,'Economy',11,'G','available'),('F1011',5,'Economy',11,'H','available'),('F1011',5,'Economy',11,'I','available'),('F1011',5,'Economy',12,'A','available'),('F1011',5,'Economy',12,'B','available'),('F1011',5,'Economy',12,'C','available'),('F1011',5,'Economy',12,'D','available'),('F1011',5,'Economy',12,'E','available'),('F1011',5,'Economy',12,'F','available'),('F1011',5,'Economy',12,'G','available'),('F1011',5,'Economy',12,'H','available'),('F1011',5,'Economy',12,'I','available'),('F1011',5,'Economy',13,'A','available'),('F1011',5,'Economy',13,'B','available'),('F1011',5,'Economy',13,'C','available'),('F1011',5,'Economy',13,'D','available'),('F1011',5,'Economy',13,'E','available'),('F1011',5,'Economy',13,'F','available'),('F1011',5,'Economy',13,'G','available'),('F1011',5,'Economy',13,'H','available'),('F1011',5,'Economy',13,'I','available'),('F1011',5,'Economy',14,'A','available'),('F1011',5,'Economy',14,'B','available'),('F1011',5,'Economy',14,'C','available'),('F1011',5,'Economy',14,'D','available'),('F1011',5,'Economy',14,'E','available'),('F1011',5,'Economy',14,'F','available'),('F1011',5,'Economy',14,'G','available'),('F1011',5,'Economy',14,'H','available'),('F1011',5,'Economy',14,'I','available'),('F1011',5,'Economy',15,'A','available'),('F1011',5,'Economy',15,'B','available'),('F1011',5,'Economy',15,'C','available'),('F1011',5,'Economy',15,'D','available'),('F1011',5,'Economy',15,'E','available'),('F1011',5,'Economy',15,'F','available'),('F1011',5,'Economy',15,'G','available'),('F1011',5,'Economy',15,'H','available'),('F1011',5,'Economy',15,'I','available'),('F1011',5,'Economy',16,'A','available'),('F1011',5,'Economy',16,'B','available'),('F1011',5,'Economy',16,'C','available'),('F1011',5,'Economy',16,'D','available'),('F1011',5,'Economy',16,'E','available'),('F1011',5,'Economy',16,'F','available'),('F1011',5,'Economy',16,'G','available'),('F1011',5,'Economy',16,'H','available'),('F1011',5,'Economy',16,'I','available'),('F1011',5,'Economy',17,'A','available'),('F1011',5,'Economy',17,'B','available'),('F1011',5,'Economy',17,'C','available'),('F1011',5,'Economy',17,'D','available'),('F1011',5,'Economy',17,'E','available'),('F1011',5,'Economy',17,'F','available'),('F1011',5,'Economy',17,'G','available'),('F1011',5,'Economy',17,'H','available'),('F1011',5,'Economy',17,'I','available'),('F1011',5,'Economy',18,'A','available'),('F1011',5,'Economy',18,'B','available'),('F1011',5,'Economy',18,'C','available'),('F1011',5,'Economy',18,'D','available'),('F1011',5,'Economy',18,'E','available'),('F1011',5,'Economy',18,'F','available'),('F1011',5,'Economy',18,'G','available'),('F1011',5,'Economy',18,'H','available'),('F1011',5,'Economy',18,'I','available'),('F1011',5,'Economy',19,'A','available'),('F1011',5,'Economy',19,'B','available'),('F1011',5,'Economy',19,'C','available'),('F1011',5,'Economy',19,'D','available'),('F1011',5,'Economy',19,'E','available'),('F1011',5,'Economy',19,'F','available'),('F1011',5,'Economy',19,'G','available'),('F1011',5,'Economy',19,'H','available'),('F1011',5,'Economy',19,'I','available'),('F1011',5,'Economy',20,'A','available'),('F1011',5,'Economy',20,'B','available'),('F1011',5,'Economy',20,'C','available'),('F1011',5,'Economy',20,'D','available'),('F1011',5,'Economy',20,'E','available'),('F1011',5,'Economy',20,'F','available'),('F1011',5,'Economy',20,'G','available'),('F1011',5,'Economy',20,'H','available'),('F1011',5,'Economy',20,'I','available');
+INSERT INTO `flight_seat` VALUES ('1',5,'Business',1,'A','available',0,NULL,NULL),('1',5,'Business',1,'B','available',0,NULL,NULL),('1',5,'Business',1,'C','available',0,NULL,NULL),('1',5,'Business',1,'D','available',0,NULL,NULL),('1',5,'Business',2,'A','available',0,NULL,NULL),('1',5,'Business',2,'B','available',0,NULL,NULL),('1',5,'Business',2,'C','available',0,NULL,NULL),('1',5,'Business',2,'D','available',0,NULL,NULL),('1',5,'Business',3,'A','available',0,NULL,NULL),('1',5,'Business',3,'B','available',0,NULL,NULL),('1',5,'Business',3,'C','available',0,NULL,NULL),('1',5,'Business',3,'D','available',0,NULL,NULL),('1',5,'Economy',1,'A','available',0,NULL,NULL),('1',5,'Economy',1,'B','available',0,NULL,NULL),('1',5,'Economy',1,'C','available',0,NULL,NULL),('1',5,'Economy',1,'D','available',0,NULL,NULL),('1',5,'Economy',1,'E','available',0,NULL,NULL),('1',5,'Economy',1,'F','available',0,NULL,NULL),('1',5,'Economy',1,'G','available',0,NULL,NULL),('1',5,'Economy',1,'H','available',0,NULL,NULL),('1',5,'Economy',1,'I','available',0,NULL,NULL),('1',5,'Economy',2,'A','available',0,NULL,NULL),('1',5,'Economy',2,'B','available',0,NULL,NULL),('1',5,'Economy',2,'C','available',0,NULL,NULL),('1',5,'Economy',2,'D','available',0,NULL,NULL),('1',5,'Economy',2,'E','available',0,NULL,NULL),('1',5,'Economy',2,'F','available',0,NULL,NULL),('1',5,'Economy',2,'G','available',0,NULL,NULL),('1',5,'Economy',2,'H','available',0,NULL,NULL),('1',5,'Economy',2,'I','available',0,NULL,NULL),('1',5,'Economy',3,'A','available',0,NULL,NULL),('1',5,'Economy',3,'B','available',0,NULL,NULL),('1',5,'Economy',3,'C','available',0,NULL,NULL),('1',5,'Economy',3,'D','available',0,NULL,NULL),('1',5,'Economy',3,'E','available',0,NULL,NULL),('1',5,'Economy',3,'F','available',0,NULL,NULL),('1',5,'Economy',3,'G','available',0,NULL,NULL),('1',5,'Economy',3,'H','available',0,NULL,NULL),('1',5,'Economy',3,'I','available',0,NULL,NULL),('1',5,'Economy',4,'A','available',0,NULL,NULL),('1',5,'Economy',4,'B','available',0,NULL,NULL),('1',5,'Economy',4,'C','available',0,NULL,NULL),('1',5,'Economy',4,'D','available',0,NULL,NULL),('1',5,'Economy',4,'E','available',0,NULL,NULL),('1',5,'Economy',4,'F','available',0,NULL,NULL),('1',5,'Economy',4,'G','available',0,NULL,NULL),('1',5,'Economy',4,'H','available',0,NULL,NULL),('1',5,'Economy',4,'I','available',0,NULL,NULL),('1',5,'Economy',5,'A','available',0,NULL,NULL),('1',5,'Economy',5,'B','available',0,NULL,NULL),('1',5,'Economy',5,'C','available',0,NULL,NULL),('1',5,'Economy',5,'D','available',0,NULL,NULL),('1',5,'Economy',5,'E','available',0,NULL,NULL),('1',5,'Economy',5,'F','available',0,NULL,NULL),('1',5,'Economy',5,'G','available',0,NULL,NULL),('1',5,'Economy',5,'H','available',0,NULL,NULL),('1',5,'Economy',5,'I','available',0,NULL,NULL),('1',5,'Economy',6,'A','available',0,NULL,NULL),('1',5,'Economy',6,'B','available',0,NULL,NULL),('1',5,'Economy',6,'C','available',0,NULL,NULL),('1',5,'Economy',6,'D','available',0,NULL,NULL),('1',5,'Economy',6,'E','available',0,NULL,NULL),('1',5,'Economy',6,'F','available',0,NULL,NULL),('1',5,'Economy',6,'G','available',0,NULL,NULL),('1',5,'Economy',6,'H','available',0,NULL,NULL),('1',5,'Economy',6,'I','available',0,NULL,NULL),('1',5,'Economy',7,'A','available',0,NULL,NULL),('1',5,'Economy',7,'B','available',0,NULL,NULL),('1',5,'Economy',7,'C','available',0,NULL,NULL),('1',5,'Economy',7,'D','available',0,NULL,NULL),('1',5,'Economy',7,'E','available',0,NULL,NULL),('1',5,'Economy',7,'F','available',0,NULL,NULL),('1',5,'Economy',7,'G','available',0,NULL,NULL),('1',5,'Economy',7,'H','available',0,NULL,NULL),('1',5,'Economy',7,'I','available',0,NULL,NULL),('1',5,'Economy',8,'A','available',0,NULL,NULL),('1',5,'Economy',8,'B','available',0,NULL,NULL),('1',5,'Economy',8,'C','available',0,NULL,NULL),('1',5,'Economy',8,'D','available',0,NULL,NULL),('1',5,'Economy',8,'E','available',0,NULL,NULL),('1',5,'Economy',8,'F','available',0,NULL,NULL),('1',5,'Economy',8,'G','available',0,NULL,NULL),('1',5,'Economy',8,'H','available',0,NULL,NULL),('1',5,'Economy',8,'I','available',0,NULL,NULL),('1',5,'Economy',9,'A','available',0,NULL,NULL),('1',5,'Economy',9,'B','available',0,NULL,NULL),('1',5,'Economy',9,'C','available',0,NULL,NULL),('1',5,'Economy',9,'D','available',0,NULL,NULL),('1',5,'Economy',9,'E','available',0,NULL,NULL),('1',5,'Economy',9,'F','available',0,NULL,NULL),('1',5,'Economy',9,'G','available',0,NULL,NULL),('1',5,'Economy',9,'H','available',0,NULL,NULL),('1',5,'Economy',9,'I','available',0,NULL,NULL),('1',5,'Economy',10,'A','available',0,NULL,NULL),('1',5,'Economy',10,'B','available',0,NULL,NULL),('1',5,'Economy',10,'C','available',0,NULL,NULL),('1',5,'Economy',10,'D','available',0,NULL,NULL),('1',5,'Economy',10,'E','available',0,NULL,NULL),('1',5,'Economy',10,'F','available',0,NULL,NULL),('1',5,'Economy',10,'G','available',0,NULL,NULL),('1',5,'Economy',10,'H','available',0,NULL,NULL),('1',5,'Economy',10,'I','available',0,NULL,NULL),('1',5,'Economy',11,'A','available',0,NULL,NULL),('1',5,'Economy',11,'B','available',0,NULL,NULL),('1',5,'Economy',11,'C','available',0,NULL,NULL),('1',5,'Economy',11,'D','available',0,NULL,NULL),('1',5,'Economy',11,'E','available',0,NULL,NULL),('1',5,'Economy',11,'F','available',0,NULL,NULL),('1',5,'Economy',11,'G','available',0,NULL,NULL),('1',5,'Economy',11,'H','available',0,NULL,NULL),('1',5,'Economy',11,'I','available',0,NULL,NULL),('1',5,'Economy',12,'A','available',0,NULL,NULL),('1',5,'Economy',12,'B','available',0,NULL,NULL),('1',5,'Economy',12,'C','available',0,NULL,NULL),('1',5,'Economy',12,'D','available',0,NULL,NULL),('1',5,'Economy',12,'E','available',0,NULL,NULL),('1',5,'Economy',12,'F','available',0,NULL,NULL),('1',5,'Economy',12,'G','available',0,NULL,NULL),('1',5,'Economy',12,'H','available',0,NULL,NULL),('1',5,'Economy',12,'I','available',0,NULL,NULL),('1',5,'Economy',13,'A','available',0,NULL,NULL),('1',5,'Economy',13,'B','available',0,NULL,NULL),('1',5,'Economy',13,'C','available',0,NULL,NULL),('1',5,'Economy',13,'D','available',0,NULL,NULL),('1',5,'Economy',13,'E','available',0,NULL,NULL),('1',5,'Economy',13,'F','available',0,NULL,NULL),('1',5,'Economy',13,'G','available',0,NULL,NULL),('1',5,'Economy',13,'H','available',0,NULL,NULL),('1',5,'Economy',13,'I','available',0,NULL,NULL),('1',5,'Economy',14,'A','available',0,NULL,NULL),('1',5,'Economy',14,'B','available',0,NULL,NULL),('1',5,'Economy',14,'C','available',0,NULL,NULL),('1',5,'Economy',14,'D','available',0,NULL,NULL),('1',5,'Economy',14,'E','available',0,NULL,NULL),('1',5,'Economy',14,'F','available',0,NULL,NULL),('1',5,'Economy',14,'G','available',0,NULL,NULL),('1',5,'Economy',14,'H','available',0,NULL,NULL),('1',5,'Economy',14,'I','available',0,NULL,NULL),('1',5,'Economy',15,'A','available',0,NULL,NULL),('1',5,'Economy',15,'B','available',0,NULL,NULL),('1',5,'Economy',15,'C','available',0,NULL,NULL),('1',5,'Economy',15,'D','available',0,NULL,NULL),('1',5,'Economy',15,'E','available',0,NULL,NULL),('1',5,'Economy',15,'F','available',0,NULL,NULL),('1',5,'Economy',15,'G','available',0,NULL,NULL),('1',5,'Economy',15,'H','available',0,NULL,NULL),('1',5,'Economy',15,'I','available',0,NULL,NULL),('1',5,'Economy',16,'A','available',0,NULL,NULL),('1',5,'Economy',16,'B','available',0,NULL,NULL),('1',5,'Economy',16,'C','available',0,NULL,NULL),('1',5,'Economy',16,'D','available',0,NULL,NULL),('1',5,'Economy',16,'E','available',0,NULL,NULL),('1',5,'Economy',16,'F','available',0,NULL,NULL),('1',5,'Economy',16,'G','available',0,NULL,NULL),('1',5,'Economy',16,'H','available',0,NULL,NULL),('1',5,'Economy',16,'I','available',0,NULL,NULL),('1',5,'Economy',17,'A','available',0,NULL,NULL),('1',5,'Economy',17,'B','available',0,NULL,NULL),('1',5,'Economy',17,'C','available',0,NULL,NULL),('1',5,'Economy',17,'D','available',0,NULL,NULL),('1',5,'Economy',17,'E','available',0,NULL,NULL),('1',5,'Economy',17,'F','available',0,NULL,NULL),('1',5,'Economy',17,'G','available',0,NULL,NULL),('1',5,'Economy',17,'H','available',0,NULL,NULL),('1',5,'Economy',17,'I','available',0,NULL,NULL),('1',5,'Economy',18,'A','available',0,NULL,NULL),('1',5,'Economy',18,'B','available',0,NULL,NULL),('1',5,'Economy',18,'C','available',0,NULL,NULL),('1',5,'Economy',18,'D','available',0,NULL,NULL),('1',5,'Economy',18,'E','available',0,NULL,NULL),('1',5,'Economy',18,'F','available',0,NULL,NULL),('1',5,'Economy',18,'G','available',0,NULL,NULL),('1',5,'Economy',18,'H','available',0,NULL,NULL),('1',5,'Economy',18,'I','available',0,NULL,NULL),('1',5,'Economy',19,'A','available',0,NULL,NULL),('1',5,'Economy',19,'B','available',0,NULL,NULL),('1',5,'Economy',19,'C','available',0,NULL,NULL),('1',5,'Economy',19,'D','taken',0,NULL,NULL),('1',5,'Economy',19,'E','taken',0,NULL,NULL),('1',5,'Economy',19,'F','available',0,NULL,NULL),('1',5,'Economy',19,'G','available',0,NULL,NULL),('1',5,'Economy',19,'H','available',0,NULL,NULL),('1',5,'Economy',19,'I','available',0,NULL,NULL),('1',5,'Economy',20,'A','available',0,NULL,NULL),('1',5,'Economy',20,'B','available',0,NULL,NULL),('1',5,'Economy',20,'C','available',0,NULL,NULL),('1',5,'Economy',20,'D','taken',0,NULL,NULL),('1',5,'Economy',20,'E','taken',0,NULL,NULL),('1',5,'Economy',20,'F','taken',0,NULL,NULL),('1',5,'Economy',20,'G','available',0,NULL,NULL),('1',5,'Economy',20,'H','available',0,NULL,NULL),('1',5,'Economy',20,'I','available',0,NULL,NULL),('2',6,'Business',1,'A','available',0,NULL,NULL),('2',6,'Business',1,'B','available',0,NULL,NULL),('2',6,'Business',1,'C','available',0,NULL,NULL),('2',6,'Business',1,'D','available',0,NULL,NULL),('2',6,'Business',2,'A','available',0,NULL,NULL),('2',6,'Business',2,'B','available',0,NULL,NULL),('2',6,'Business',2,'C','available',0,NULL,NULL),('2',6,'Business',2,'D','available',0,NULL,NULL),('2',6,'Economy',1,'A','available',0,NULL,NULL),('2',6,'Economy',1,'B','available',0,NULL,NULL),('2',6,'Economy',1,'C','available',0,NULL,NULL),('2',6,'Economy',1,'D','available',0,NULL,NULL),('2',6,'Economy',1,'E','available',0,NULL,NULL),('2',6,'Economy',1,'F','available',0,NULL,NULL),('2',6,'Economy',1,'G','available',0,NULL,NULL),('2',6,'Economy',1,'H','available',0,NULL,NULL),('2',6,'Economy',1,'I','available',0,NULL,NULL),('2',6,'Economy',1,'J','available',0,NULL,NULL),('2',6,'Economy',2,'A','available',0,NULL,NULL),('2',6,'Economy',2,'B','available',0,NULL,NULL),('2',6,'Economy',2,'C','available',0,NULL,NULL),('2',6,'Economy',2,'D','available',0,NULL,NULL),('2',6,'Economy',2,'E','available',0,NULL,NULL),('2',6,'Economy',2,'F','available',0,NULL,NULL),('2',6,'Economy',2,'G','available',0,NULL,NULL),('2',6,'Economy',2,'H','available',0,NULL,NULL),('2',6,'Economy',2,'I','available',0,NULL,NULL),('2',6,'Economy',2,'J','available',0,NULL,NULL),('2',6,'Economy',3,'A','available',0,NULL,NULL),('2',6,'Economy',3,'B','available',0,NULL,NULL),('2',6,'Economy',3,'C','available',0,NULL,NULL),('2',6,'Economy',3,'D','available',0,NULL,NULL),('2',6,'Economy',3,'E','available',0,NULL,NULL),('2',6,'Economy',3,'F','available',0,NULL,NULL),('2',6,'Economy',3,'G','available',0,NULL,NULL),('2',6,'Economy',3,'H','available',0,NULL,NULL),('2',6,'Economy',3,'I','available',0,NULL,NULL),('2',6,'Economy',3,'J','available',0,NULL,NULL),('2',6,'Economy',4,'A','available',0,NULL,NULL),('2',6,'Economy',4,'B','available',0,NULL,NULL),('2',6,'Economy',4,'C','available',0,NULL,NULL),('2',6,'Economy',4,'D','available',0,NULL,NULL),('2',6,'Economy',4,'E','available',0,NULL,NULL),('2',6,'Economy',4,'F','available',0,NULL,NULL),('2',6,'Economy',4,'G','available',0,NULL,NULL),('2',6,'Economy',4,'H','available',0,NULL,NULL),('2',6,'Economy',4,'I','available',0,NULL,NULL),('2',6,'Economy',4,'J','available',0,NULL,NULL),('2',6,'Economy',5,'A','available',0,NULL,NULL),('2',6,'Economy',5,'B','available',0,NULL,NULL),('2',6,'Economy',5,'C','available',0,NULL,NULL),('2',6,'Economy',5,'D','available',0,NULL,NULL),('2',6,'Economy',5,'E','available',0,NULL,NULL),('2',6,'Economy',5,'F','available',0,NULL,NULL),('2',6,'Economy',5,'G','available',0,NULL,NULL),('2',6,'Economy',5,'H','available',0,NULL,NULL),('2',6,'Economy',5,'I','available',0,NULL,NULL),('2',6,'Economy',5,'J','available',0,NULL,NULL),('2',6,'Economy',6,'A','available',0,NULL,NULL),('2',6,'Economy',6,'B','available',0,NULL,NULL),('2',6,'Economy',6,'C','available',0,NULL,NULL),('2',6,'Economy',6,'D','available',0,NULL,NULL),('2',6,'Economy',6,'E','available',0,NULL,NULL),('2',6,'Economy',6,'F','available',0,NULL,NULL),('2',6,'Economy',6,'G','available',0,NULL,NULL),('2',6,'Economy',6,'H','available',0,NULL,NULL),('2',6,'Economy',6,'I','available',0,NULL,NULL),('2',6,'Economy',6,'J','available',0,NULL,NULL),('2',6,'Economy',7,'A','available',0,NULL,NULL),('2',6,'Economy',7,'B','available',0,NULL,NULL),('2',6,'Economy',7,'C','available',0,NULL,NULL),('2',6,'Economy',7,'D','available',0,NULL,NULL),('2',6,'Economy',7,'E','available',0,NULL,NULL),('2',6,'Economy',7,'F','available',0,NULL,NULL),('2',6,'Economy',7,'G','available',0,NULL,NULL),('2',6,'Economy',7,'H','available',0,NULL,NULL),('2',6,'Economy',7,'I','available',0,NULL,NULL),('2',6,'Economy',7,'J','available',0,NULL,NULL),('2',6,'Economy',8,'A','available',0,NULL,NULL),('2',6,'Economy',8,'B','available',0,NULL,NULL),('2',6,'Economy',8,'C','available',0,NULL,NULL),('2',6,'Economy',8,'D','available',0,NULL,NULL),('2',6,'Economy',8,'E','available',0,NULL,NULL),('2',6,'Economy',8,'F','available',0,NULL,NULL),('2',6,'Economy',8,'G','available',0,NULL,NULL),('2',6,'Economy',8,'H','available',0,NULL,NULL),('2',6,'Economy',8,'I','available',0,NULL,NULL),('2',6,'Economy',8,'J','available',0,NULL,NULL),('2',6,'Economy',9,'A','available',0,NULL,NULL),('2',6,'Economy',9,'B','available',0,NULL,NULL),('2',6,'Economy',9,'C','available',0,NULL,NULL),('2',6,'Economy',9,'D','available',0,NULL,NULL),('2',6,'Economy',9,'E','available',0,NULL,NULL),('2',6,'Economy',9,'F','available',0,NULL,NULL),('2',6,'Economy',9,'G','available',0,NULL,NULL),('2',6,'Economy',9,'H','available',0,NULL,NULL),('2',6,'Economy',9,'I','available',0,NULL,NULL),('2',6,'Economy',9,'J','available',0,NULL,NULL),('2',6,'Economy',10,'A','available',0,NULL,NULL),('2',6,'Economy',10,'B','available',0,NULL,NULL),('2',6,'Economy',10,'C','available',0,NULL,NULL),('2',6,'Economy',10,'D','available',0,NULL,NULL),('2',6,'Economy',10,'E','available',0,NULL,NULL),('2',6,'Economy',10,'F','available',0,NULL,NULL),('2',6,'Economy',10,'G','available',0,NULL,NULL),('2',6,'Economy',10,'H','available',0,NULL,NULL),('2',6,'Economy',10,'I','available',0,NULL,NULL),('2',6,'Economy',10,'J','available',0,NULL,NULL),('2',6,'Economy',11,'A','available',0,NULL,NULL),('2',6,'Economy',11,'B','available',0,NULL,NULL),('2',6,'Economy',11,'C','available',0,NULL,NULL),('2',6,'Economy',11,'D','available',0,NULL,NULL),('2',6,'Economy',11,'E','available',0,NULL,NULL),('2',6,'Economy',11,'F','available',0,NULL,NULL),('2',6,'Economy',11,'G','available',0,NULL,NULL),('2',6,'Economy',11,'H','available',0,NULL,NULL),('2',6,'Economy',11,'I','available',0,NULL,NULL),('2',6,'Economy',11,'J','available',0,NULL,NULL),('2',6,'Economy',12,'A','available',0,NULL,NULL),('2',6,'Economy',12,'B','available',0,NULL,NULL),('2',6,'Economy',12,'C','available',0,NULL,NULL),('2',6,'Economy',12,'D','available',0,NULL,NULL),('2',6,'Economy',12,'E','available',0,NULL,NULL),('2',6,'Economy',12,'F','available',0,NULL,NULL),('2',6,'Economy',12,'G','available',0,NULL,NULL),('2',6,'Economy',12,'H','available',0,NULL,NULL),('2',6,'Economy',12,'I','available',0,NULL,NULL),('2',6,'Economy',12,'J','available',0,NULL,NULL),('2',6,'Economy',13,'A','available',0,NULL,NULL),('2',6,'Economy',13,'B','available',0,NULL,NULL),('2',6,'Economy',13,'C','available',0,NULL,NULL),('2',6,'Economy',13,'D','available',0,NULL,NULL),('2',6,'Economy',13,'E','available',0,NULL,NULL),('2',6,'Economy',13,'F','available',0,NULL,NULL),('2',6,'Economy',13,'G','available',0,NULL,NULL),('2',6,'Economy',13,'H','available',0,NULL,NULL),('2',6,'Economy',13,'I','available',0,NULL,NULL),('2',6,'Economy',13,'J','available',0,NULL,NULL),('2',6,'Economy',14,'A','available',0,NULL,NULL),('2',6,'Economy',14,'B','available',0,NULL,NULL),('2',6,'Economy',14,'C','available',0,NULL,NULL),('2',6,'Economy',14,'D','available',0,NULL,NULL),('2',6,'Economy',14,'E','available',0,NULL,NULL),('2',6,'Economy',14,'F','available',0,NULL,NULL),('2',6,'Economy',14,'G','available',0,NULL,NULL),('2',6,'Economy',14,'H','available',0,NULL,NULL),('2',6,'Economy',14,'I','available',0,NULL,NULL),('2',6,'Economy',14,'J','available',0,NULL,NULL),('2',6,'Economy',15,'A','available',0,NULL,NULL),('2',6,'Economy',15,'B','available',0,NULL,NULL),('2',6,'Economy',15,'C','available',0,NULL,NULL),('2',6,'Economy',15,'D','available',0,NULL,NULL),('2',6,'Economy',15,'E','available',0,NULL,NULL),('2',6,'Economy',15,'F','available',0,NULL,NULL),('2',6,'Economy',15,'G','available',0,NULL,NULL),('2',6,'Economy',15,'H','available',0,NULL,NULL),('2',6,'Economy',15,'I','available',0,NULL,NULL),('2',6,'Economy',15,'J','taken',0,NULL,NULL),('3',1,'Economy',1,'A','available',0,NULL,NULL),('3',1,'Economy',1,'B','available',0,NULL,NULL),('3',1,'Economy',1,'C','available',0,NULL,NULL),('3',1,'Economy',1,'D','available',0,NULL,NULL),('3',1,'Economy',1,'E','available',0,NULL,NULL),('3',1,'Economy',1,'F','available',0,NULL,NULL),('3',1,'Economy',2,'A','available',0,NULL,NULL),('3',1,'Economy',2,'B','available',0,NULL,NULL),('3',1,'Economy',2,'C','available',0,NULL,NULL),('3',1,'Economy',2,'D','available',0,NULL,NULL),('3',1,'Economy',2,'E','available',0,NULL,NULL),('3',1,'Economy',2,'F','available',0,NULL,NULL),('3',1,'Economy',3,'A','available',0,NULL,NULL),('3',1,'Economy',3,'B','available',0,NULL,NULL),('3',1,'Economy',3,'C','available',0,NULL,NULL),('3',1,'Economy',3,'D','available',0,NULL,NULL),('3',1,'Economy',3,'E','available',0,NULL,NULL),('3',1,'Economy',3,'F','available',0,NULL,NULL),('3',1,'Economy',4,'A','available',0,NULL,NULL),('3',1,'Economy',4,'B','available',0,NULL,NULL),('3',1,'Economy',4,'C','available',0,NULL,NULL),('3',1,'Economy',4,'D','available',0,NULL,NULL),('3',1,'Economy',4,'E','available',0,NULL,NULL),('3',1,'Economy',4,'F','available',0,NULL,NULL),('3',1,'Economy',5,'A','available',0,NULL,NULL),('3',1,'Economy',5,'B','available',0,NULL,NULL),('3',1,'Economy',5,'C','available',0,NULL,NULL),('3',1,'Economy',5,'D','available',0,NULL,NULL),('3',1,'Economy',5,'E','available',0,NULL,NULL),('3',1,'Economy',5,'F','available',0,NULL,NULL),('3',1,'Economy',6,'A','available',0,NULL,NULL),('3',1,'Economy',6,'B','available',0,NULL,NULL),('3',1,'Economy',6,'C','available',0,NULL,NULL),('3',1,'Economy',6,'D','available',0,NULL,NULL),('3',1,'Economy',6,'E','available',0,NULL,NULL),('3',1,'Economy',6,'F','available',0,NULL,NULL),('3',1,'Economy',7,'A','available',0,NULL,NULL),('3',1,'Economy',7,'B','available',0,NULL,NULL),('3',1,'Economy',7,'C','available',0,NULL,NULL),('3',1,'Economy',7,'D','available',0,NULL,NULL),('3',1,'Economy',7,'E','available',0,NULL,NULL),('3',1,'Economy',7,'F','available',0,NULL,NULL),('3',1,'Economy',8,'A','available',0,NULL,NULL),('3',1,'Economy',8,'B','available',0,NULL,NULL),('3',1,'Economy',8,'C','available',0,NULL,NULL),('3',1,'Economy',8,'D','available',0,NULL,NULL),('3',1,'Economy',8,'E','available',0,NULL,NULL),('3',1,'Economy',8,'F','available',0,NULL,NULL),('3',1,'Economy',9,'A','available',0,NULL,NULL),('3',1,'Economy',9,'B','available',0,NULL,NULL),('3',1,'Economy',9,'C','available',0,NULL,NULL),('3',1,'Economy',9,'D','available',0,NULL,NULL),('3',1,'Economy',9,'E','available',0,NULL,NULL),('3',1,'Economy',9,'F','available',0,NULL,NULL),('3',1,'Economy',10,'A','available',0,NULL,NULL),('3',1,'Economy',10,'B','available',0,NULL,NULL),('3',1,'Economy',10,'C','available',0,NULL,NULL),('3',1,'Economy',10,'D','available',0,NULL,NULL),('3',1,'Economy',10,'E','available',0,NULL,NULL),('3',1,'Economy',10,'F','available',0,NULL,NULL),('4',4,'Economy',1,'A','available',0,NULL,NULL),('4',4,'Economy',1,'B','available',0,NULL,NULL),('4',4,'Economy',1,'C','available',0,NULL,NULL),('4',4,'Economy',1,'D','available',0,NULL,NULL),('4',4,'Economy',2,'A','available',0,NULL,NULL),('4',4,'Economy',2,'B','available',0,NULL,NULL),('4',4,'Economy',2,'C','available',0,NULL,NULL),('4',4,'Economy',2,'D','available',0,NULL,NULL),('4',4,'Economy',3,'A','available',0,NULL,NULL),('4',4,'Economy',3,'B','available',0,NULL,NULL),('4',4,'Economy',3,'C','available',0,NULL,NULL),('4',4,'Economy',3,'D','available',0,NULL,NULL),('4',4,'Economy',4,'A','available',0,NULL,NULL),('4',4,'Economy',4,'B','available',0,NULL,NULL),('4',4,'Economy',4,'C','available',0,NULL,NULL),('4',4,'Economy',4,'D','available',0,NULL,NULL),('4',4,'Economy',5,'A','available',0,NULL,NULL),('4',4,'Economy',5,'B','available',0,NULL,NULL),('4',4,'Economy',5,'C','available',0,NULL,NULL),('4',4,'Economy',5,'D','available',0,NULL,NULL),('4',4,'Economy',6,'A','available',0,NULL,NULL),('4',4,'Economy',6,'B','available',0,NULL,NULL),('4',4,'Economy',6,'C','available',0,NULL,NULL),('4',4,'Economy',6,'D','available',0,NULL,NULL),('4',4,'Economy',7,'A','available',0,NULL,NULL),('4',4,'Economy',7,'B','available',0,NULL,NULL),('4',4,'Economy',7,'C','available',0,NULL,NULL),('4',4,'Economy',7,'D','available',0,NULL,NULL),('4',4,'Economy',8,'A','available',0,NULL,NULL),('4',4,'Economy',8,'B','available',0,NULL,NULL),('4',4,'Economy',8,'C','available',0,NULL,NULL),('4',4,'Economy',8,'D','available',0,NULL,NULL),('4',4,'Economy',9,'A','available',0,NULL,NULL),('4',4,'Economy',9,'B','available',0,NULL,NULL),('4',4,'Economy',9,'C','available',0,NULL,NULL),('4',4,'Economy',9,'D','available',0,NULL,NULL),('4',4,'Economy',10,'A','available',0,NULL,NULL),('4',4,'Economy',10,'B','available',0,NULL,NULL),('4',4,'Economy',10,'C','available',0,NULL,NULL),('4',4,'Economy',10,'D','available',0,NULL,NULL),('5',6,'Business',1,'A','available',0,NULL,NULL),('5',6,'Business',1,'B','available',0,NULL,NULL),('5',6,'Business',1,'C','available',0,NULL,NULL),('5',6,'Business',1,'D','available',0,NULL,NULL),('5',6,'Business',2,'A','available',0,NULL,NULL),('5',6,'Business',2,'B','available',0,NULL,NULL),('5',6,'Business',2,'C','available',0,NULL,NULL),('5',6,'Business',2,'D','available',0,NULL,NULL),('5',6,'Economy',1,'A','available',0,NULL,NULL),('5',6,'Economy',1,'B','available',0,NULL,NULL),('5',6,'Economy',1,'C','available',0,NULL,NULL),('5',6,'Economy',1,'D','available',0,NULL,NULL),('5',6,'Economy',1,'E','available',0,NULL,NULL),('5',6,'Economy',1,'F','available',0,NULL,NULL),('5',6,'Economy',1,'G','available',0,NULL,NULL),('5',6,'Economy',1,'H','available',0,NULL,NULL),('5',6,'Economy',1,'I','available',0,NULL,NULL),('5',6,'Economy',1,'J','available',0,NULL,NULL),('5',6,'Economy',2,'A','available',0,NULL,NULL),('5',6,'Economy',2,'B','available',0,NULL,NULL),('5',6,'Economy',2,'C','available',0,NULL,NULL),('5',6,'Economy',2,'D','available',0,NULL,NULL),('5',6,'Economy',2,'E','available',0,NULL,NULL),('5',6,'Economy',2,'F','available',0,NULL,NULL),('5',6,'Economy',2,'G','available',0,NULL,NULL),('5',6,'Economy',2,'H','available',0,NULL,NULL),('5',6,'Economy',2,'I','available',0,NULL,NULL),('5',6,'Economy',2,'J','available',0,NULL,NULL),('5',6,'Economy',3,'A','available',0,NULL,NULL),('5',6,'Economy',3,'B','available',0,NULL,NULL),('5',6,'Economy',3,'C','available',0,NULL,NULL),('5',6,'Economy',3,'D','available',0,NULL,NULL),('5',6,'Economy',3,'E','available',0,NULL,NULL),('5',6,'Economy',3,'F','available',0,NULL,NULL),('5',6,'Economy',3,'G','available',0,NULL,NULL),('5',6,'Economy',3,'H','available',0,NULL,NULL),('5',6,'Economy',3,'I','available',0,NULL,NULL),('5',6,'Economy',3,'J','available',0,NULL,NULL),('5',6,'Economy',4,'A','available',0,NULL,NULL),('5',6,'Economy',4,'B','available',0,NULL,NULL),('5',6,'Economy',4,'C','available',0,NULL,NULL),('5',6,'Economy',4,'D','available',0,NULL,NULL),('5',6,'Economy',4,'E','available',0,NULL,NULL),('5',6,'Economy',4,'F','available',0,NULL,NULL),('5',6,'Economy',4,'G','available',0,NULL,NULL),('5',6,'Economy',4,'H','available',0,NULL,NULL),('5',6,'Economy',4,'I','available',0,NULL,NULL),('5',6,'Economy',4,'J','available',0,NULL,NULL),('5',6,'Economy',5,'A','available',0,NULL,NULL),('5',6,'Economy',5,'B','available',0,NULL,NULL),('5',6,'Economy',5,'C','available',0,NULL,NULL),('5',6,'Economy',5,'D','available',0,NULL,NULL),('5',6,'Economy',5,'E','available',0,NULL,NULL),('5',6,'Economy',5,'F','available',0,NULL,NULL),('5',6,'Economy',5,'G','available',0,NULL,NULL),('5',6,'Economy',5,'H','available',0,NULL,NULL),('5',6,'Economy',5,'I','available',0,NULL,NULL),('5',6,'Economy',5,'J','available',0,NULL,NULL),('5',6,'Economy',6,'A','available',0,NULL,NULL),('5',6,'Economy',6,'B','available',0,NULL,NULL),('5',6,'Economy',6,'C','available',0,NULL,NULL),('5',6,'Economy',6,'D','available',0,NULL,NULL),('5',6,'Economy',6,'E','available',0,NULL,NULL),('5',6,'Economy',6,'F','available',0,NULL,NULL),('5',6,'Economy',6,'G','available',0,NULL,NULL),('5',6,'Economy',6,'H','available',0,NULL,NULL),('5',6,'Economy',6,'I','available',0,NULL,NULL),('5',6,'Economy',6,'J','available',0,NULL,NULL),('5',6,'Economy',7,'A','available',0,NULL,NULL),('5',6,'Economy',7,'B','available',0,NULL,NULL),('5',6,'Economy',7,'C','available',0,NULL,NULL),('5',6,'Economy',7,'D','available',0,NULL,NULL),('5',6,'Economy',7,'E','available',0,NULL,NULL),('5',6,'Economy',7,'F','available',0,NULL,NULL),('5',6,'Economy',7,'G','available',0,NULL,NULL),('5',6,'Economy',7,'H','available',0,NULL,NULL),('5',6,'Economy',7,'I','available',0,NULL,NULL),('5',6,'Economy',7,'J','available',0,NULL,NULL),('5',6,'Economy',8,'A','available',0,NULL,NULL),('5',6,'Economy',8,'B','available',0,NULL,NULL),('5',6,'Economy',8,'C','available',0,NULL,NULL),('5',6,'Economy',8,'D','available',0,NULL,NULL),('5',6,'Economy',8,'E','available',0,NULL,NULL),('5',6,'Economy',8,'F','available',0,NULL,NULL),('5',6,'Economy',8,'G','available',0,NULL,NULL),('5',6,'Economy',8,'H','available',0,NULL,NULL),('5',6,'Economy',8,'I','available',0,NULL,NULL),('5',6,'Economy',8,'J','available',0,NULL,NULL),('5',6,'Economy',9,'A','available',0,NULL,NULL),('5',6,'Economy',9,'B','available',0,NULL,NULL),('5',6,'Economy',9,'C','available',0,NULL,NULL),('5',6,'Economy',9,'D','available',0,NULL,NULL),('5',6,'Economy',9,'E','available',0,NULL,NULL),('5',6,'Economy',9,'F','available',0,NULL,NULL),('5',6,'Economy',9,'G','available',0,NULL,NULL),('5',6,'Economy',9,'H','available',0,NULL,NULL),('5',6,'Economy',9,'I','available',0,NULL,NULL),('5',6,'Economy',9,'J','available',0,NULL,NULL),('5',6,'Economy',10,'A','available',0,NULL,NULL),('5',6,'Economy',10,'B','available',0,NULL,NULL),('5',6,'Economy',10,'C','available',0,NULL,NULL),('5',6,'Economy',10,'D','available',0,NULL,NULL),('5',6,'Economy',10,'E','available',0,NULL,NULL),('5',6,'Economy',10,'F','available',0,NULL,NULL),('5',6,'Economy',10,'G','available',0,NULL,NULL),('5',6,'Economy',10,'H','available',0,NULL,NULL),('5',6,'Economy',10,'I','available',0,NULL,NULL),('5',6,'Economy',10,'J','available',0,NULL,NULL),('5',6,'Economy',11,'A','available',0,NULL,NULL),('5',6,'Economy',11,'B','available',0,NULL,NULL),('5',6,'Economy',11,'C','available',0,NULL,NULL),('5',6,'Economy',11,'D','available',0,NULL,NULL),('5',6,'Economy',11,'E','available',0,NULL,NULL),('5',6,'Economy',11,'F','available',0,NULL,NULL),('5',6,'Economy',11,'G','available',0,NULL,NULL),('5',6,'Economy',11,'H','available',0,NULL,NULL),('5',6,'Economy',11,'I','available',0,NULL,NULL),('5',6,'Economy',11,'J','available',0,NULL,NULL),('5',6,'Economy',12,'A','available',0,NULL,NULL),('5',6,'Economy',12,'B','available',0,NULL,NULL),('5',6,'Economy',12,'C','available',0,NULL,NULL),('5',6,'Economy',12,'D','available',0,NULL,NULL),('5',6,'Economy',12,'E','available',0,NULL,NULL),('5',6,'Economy',12,'F','available',0,NULL,NULL),('5',6,'Economy',12,'G','available',0,NULL,NULL),('5',6,'Economy',12,'H','available',0,NULL,NULL),('5',6,'Economy',12,'I','available',0,NULL,NULL),('5',6,'Economy',12,'J','available',0,NULL,NULL),('5',6,'Economy',13,'A','available',0,NULL,NULL),('5',6,'Economy',13,'B','available',0,NULL,NULL),('5',6,'Economy',13,'C','available',0,NULL,NULL),('5',6,'Economy',13,'D','available',0,NULL,NULL),('5',6,'Economy',13,'E','available',0,NULL,NULL),('5',6,'Economy',13,'F','available',0,NULL,NULL),('5',6,'Economy',13,'G','available',0,NULL,NULL),('5',6,'Economy',13,'H','available',0,NULL,NULL),('5',6,'Economy',13,'I','available',0,NULL,NULL),('5',6,'Economy',13,'J','available',0,NULL,NULL),('5',6,'Economy',14,'A','available',0,NULL,NULL),('5',6,'Economy',14,'B','available',0,NULL,NULL),('5',6,'Economy',14,'C','available',0,NULL,NULL),('5',6,'Economy',14,'D','available',0,NULL,NULL),('5',6,'Economy',14,'E','available',0,NULL,NULL),('5',6,'Economy',14,'F','available',0,NULL,NULL),('5',6,'Economy',14,'G','available',0,NULL,NULL),('5',6,'Economy',14,'H','available',0,NULL,NULL),('5',6,'Economy',14,'I','available',0,NULL,NULL),('5',6,'Economy',14,'J','available',0,NULL,NULL),('5',6,'Economy',15,'A','available',0,NULL,NULL),('5',6,'Economy',15,'B','available',0,NULL,NULL),('5',6,'Economy',15,'C','available',0,NULL,NULL),('5',6,'Economy',15,'D','available',0,NULL,NULL),('5',6,'Economy',15,'E','available',0,NULL,NULL),('5',6,'Economy',15,'F','available',0,NULL,NULL),('5',6,'Economy',15,'G','available',0,NULL,NULL),('5',6,'Economy',15,'H','available',0,NULL,NULL),('5',6,'Economy',15,'I','available',0,NULL,NULL),('5',6,'Economy',15,'J','available',0,NULL,NULL),('890',3,'Economy',1,'A','available',0,NULL,NULL),('890',3,'Economy',1,'B','available',0,NULL,NULL),('890',3,'Economy',1,'C','available',0,NULL,NULL),('890',3,'Economy',1,'D','available',0,NULL,NULL),('890',3,'Economy',2,'A','available',0,NULL,NULL),('890',3,'Economy',2,'B','available',0,NULL,NULL),('890',3,'Economy',2,'C','available',0,NULL,NULL),('890',3,'Economy',2,'D','available',0,NULL,NULL),('890',3,'Economy',3,'A','available',0,NULL,NULL),('890',3,'Economy',3,'B','available',0,NULL,NULL),('890',3,'Economy',3,'C','available',0,NULL,NULL),('890',3,'Economy',3,'D','available',0,NULL,NULL),('890',3,'Economy',4,'A','available',0,NULL,NULL),('890',3,'Economy',4,'B','available',0,NULL,NULL),('890',3,'Economy',4,'C','available',0,NULL,NULL),('890',3,'Economy',4,'D','available',0,NULL,NULL),('890',3,'Economy',5,'A','available',0,NULL,NULL),('890',3,'Economy',5,'B','available',0,NULL,NULL),('890',3,'Economy',5,'C','available',0,NULL,NULL),('890',3,'Economy',5,'D','available',0,NULL,NULL),('890',3,'Economy',6,'A','available',0,NULL,NULL),('890',3,'Economy',6,'B','available',0,NULL,NULL),('890',3,'Economy',6,'C','available',0,NULL,NULL),('890',3,'Economy',6,'D','available',0,NULL,NULL),('890',3,'Economy',7,'A','available',0,NULL,NULL),('890',3,'Economy',7,'B','available',0,NULL,NULL),('890',3,'Economy',7,'C','available',0,NULL,NULL),('890',3,'Economy',7,'D','available',0,NULL,NULL),('890',3,'Economy',8,'A','available',0,NULL,NULL),('890',3,'Economy',8,'B','available',0,NULL,NULL),('890',3,'Economy',8,'C','available',0,NULL,NULL),('890',3,'Economy',8,'D','available',0,NULL,NULL),('890',3,'Economy',9,'A','available',0,NULL,NULL),('890',3,'Economy',9,'B','available',0,NULL,NULL),('890',3,'Economy',9,'C','available',0,NULL,NULL),('890',3,'Economy',9,'D','available',0,NULL,NULL),('890',3,'Economy',10,'A','available',0,NULL,NULL),('890',3,'Economy',10,'B','available',0,NULL,NULL),('890',3,'Economy',10,'C','available',0,NULL,NULL),('890',3,'Economy',10,'D','available',0,NULL,NULL),('890',3,'Economy',11,'A','available',0,NULL,NULL),('890',3,'Economy',11,'B','available',0,NULL,NULL),('890',3,'Economy',11,'C','available',0,NULL,NULL),('890',3,'Economy',11,'D','available',0,NULL,NULL),('890',3,'Economy',12,'A','available',0,NULL,NULL),('890',3,'Economy',12,'B','available',0,NULL,NULL),('890',3,'Economy',12,'C','available',0,NULL,NULL),('890',3,'Economy',12,'D','available',0,NULL,NULL),('890',3,'Economy',13,'A','available',0,NULL,NULL),('890',3,'Economy',13,'B','available',0,NULL,NULL),('890',3,'Economy',13,'C','available',0,NULL,NULL),('890',3,'Economy',13,'D','available',0,NULL,NULL),('890',3,'Economy',14,'A','available',0,NULL,NULL),('890',3,'Economy',14,'B','available',0,NULL,NULL),('890',3,'Economy',14,'C','available',0,NULL,NULL),('890',3,'Economy',14,'D','available',0,NULL,NULL),('890',3,'Economy',15,'A','available',0,NULL,NULL),('890',3,'Economy',15,'B','available',0,NULL,NULL),('890',3,'Economy',15,'C','available',0,NULL,NULL),('890',3,'Economy',15,'D','available',0,NULL,NULL),('890',3,'Economy',16,'A','available',0,NULL,NULL),('890',3,'Economy',16,'B','available',0,NULL,NULL),('890',3,'Economy',16,'C','available',0,NULL,NULL),('890',3,'Economy',16,'D','available',0,NULL,NULL),('890',3,'Economy',17,'A','available',0,NULL,NULL),('890',3,'Economy',17,'B','available',0,NULL,NULL),('890',3,'Economy',17,'C','available',0,NULL,NULL),('890',3,'Economy',17,'D','available',0,NULL,NULL),('890',3,'Economy',18,'A','available',0,NULL,NULL),('890',3,'Economy',18,'B','available',0,NULL,NULL),('890',3,'Economy',18,'C','available',0,NULL,NULL),('890',3,'Economy',18,'D','available',0,NULL,NULL),('890',3,'Economy',19,'A','available',0,NULL,NULL),('890',3,'Economy',19,'B','available',0,NULL,NULL),('890',3,'Economy',19,'C','available',0,NULL,NULL),('890',3,'Economy',19,'D','available',0,NULL,NULL),('890',3,'Economy',20,'A','available',0,NULL,NULL),('890',3,'Economy',20,'B','available',0,NULL,NULL),('890',3,'Economy',20,'C','available',0,NULL,NULL),('890',3,'Economy',20,'D','available',0,NULL,NULL),('F1001',1,'Economy',1,'A','available',0,NULL,NULL),('F1001',1,'Economy',1,'B','available',0,NULL,NULL),('F1001',1,'Economy',1,'C','available',0,NULL,NULL),('F1001',1,'Economy',1,'D','available',0,NULL,NULL),('F1001',1,'Economy',1,'E','available',0,NULL,NULL),('F1001',1,'Economy',1,'F','available',0,NULL,NULL),('F1001',1,'Economy',2,'A','available',0,NULL,NULL),('F1001',1,'Economy',2,'B','available',0,NULL,NULL),('F1001',1,'Economy',2,'C','available',0,NULL,NULL),('F1001',1,'Economy',2,'D','available',0,NULL,NULL),('F1001',1,'Economy',2,'E','available',0,NULL,NULL),('F1001',1,'Economy',2,'F','available',0,NULL,NULL),('F1001',1,'Economy',3,'A','available',0,NULL,NULL),('F1001',1,'Economy',3,'B','available',0,NULL,NULL),('F1001',1,'Economy',3,'C','available',0,NULL,NULL),('F1001',1,'Economy',3,'D','available',0,NULL,NULL),('F1001',1,'Economy',3,'E','available',0,NULL,NULL),('F1001',1,'Economy',3,'F','available',0,NULL,NULL),('F1001',1,'Economy',4,'A','available',0,NULL,NULL),('F1001',1,'Economy',4,'B','available',0,NULL,NULL),('F1001',1,'Economy',4,'C','available',0,NULL,NULL),('F1001',1,'Economy',4,'D','available',0,NULL,NULL),('F1001',1,'Economy',4,'E','available',0,NULL,NULL),('F1001',1,'Economy',4,'F','available',0,NULL,NULL),('F1001',1,'Economy',5,'A','available',0,NULL,NULL),('F1001',1,'Economy',5,'B','available',0,NULL,NULL),('F1001',1,'Economy',5,'C','available',0,NULL,NULL),('F1001',1,'Economy',5,'D','available',0,NULL,NULL),('F1001',1,'Economy',5,'E','available',0,NULL,NULL),('F1001',1,'Economy',5,'F','available',0,NULL,NULL),('F1001',1,'Economy',6,'A','available',0,NULL,NULL),('F1001',1,'Economy',6,'B','available',0,NULL,NULL),('F1001',1,'Economy',6,'C','available',0,NULL,NULL),('F1001',1,'Economy',6,'D','available',0,NULL,NULL),('F1001',1,'Economy',6,'E','available',0,NULL,NULL),('F1001',1,'Economy',6,'F','available',0,NULL,NULL),('F1001',1,'Economy',7,'A','available',0,NULL,NULL),('F1001',1,'Economy',7,'B','available',0,NULL,NULL),('F1001',1,'Economy',7,'C','available',0,NULL,NULL),('F1001',1,'Economy',7,'D','available',0,NULL,NULL),('F1001',1,'Economy',7,'E','available',0,NULL,NULL),('F1001',1,'Economy',7,'F','available',0,NULL,NULL),('F1001',1,'Economy',8,'A','available',0,NULL,NULL),('F1001',1,'Economy',8,'B','available',0,NULL,NULL),('F1001',1,'Economy',8,'C','available',0,NULL,NULL),('F1001',1,'Economy',8,'D','available',0,NULL,NULL),('F1001',1,'Economy',8,'E','available',0,NULL,NULL),('F1001',1,'Economy',8,'F','available',0,NULL,NULL),('F1001',1,'Economy',9,'A','available',0,NULL,NULL),('F1001',1,'Economy',9,'B','available',0,NULL,NULL),('F1001',1,'Economy',9,'C','available',0,NULL,NULL),('F1001',1,'Economy',9,'D','available',0,NULL,NULL),('F1001',1,'Economy',9,'E','available',0,NULL,NULL),('F1001',1,'Economy',9,'F','available',0,NULL,NULL),('F1001',1,'Economy',10,'A','available',0,NULL,NULL),('F1001',1,'Economy',10,'B','available',0,NULL,NULL),('F1001',1,'Economy',10,'C','available',0,NULL,NULL),('F1001',1,'Economy',10,'D','available',0,NULL,NULL),('F1001',1,'Economy',10,'E','available',0,NULL,NULL),('F1001',1,'Economy',10,'F','available',0,NULL,NULL),('F1002',2,'Economy',1,'A','available',0,NULL,NULL),('F1002',2,'Economy',1,'B','available',0,NULL,NULL),('F1002',2,'Economy',1,'C','available',0,NULL,NULL),('F1002',2,'Economy',1,'D','available',0,NULL,NULL),('F1002',2,'Economy',2,'A','available',0,NULL,NULL),('F1002',2,'Economy',2,'B','available',0,NULL,NULL),('F1002',2,'Economy',2,'C','available',0,NULL,NULL),('F1002',2,'Economy',2,'D','available',0,NULL,NULL),('F1002',2,'Economy',3,'A','available',0,NULL,NULL),('F1002',2,'Economy',3,'B','available',0,NULL,NULL),('F1002',2,'Economy',3,'C','available',0,NULL,NULL),('F1002',2,'Economy',3,'D','available',0,NULL,NULL),('F1002',2,'Economy',4,'A','available',0,NULL,NULL),('F1002',2,'Economy',4,'B','available',0,NULL,NULL),('F1002',2,'Economy',4,'C','available',0,NULL,NULL),('F1002',2,'Economy',4,'D','available',0,NULL,NULL),('F1002',2,'Economy',5,'A','available',0,NULL,NULL),('F1002',2,'Economy',5,'B','available',0,NULL,NULL),('F1002',2,'Economy',5,'C','available',0,NULL,NULL),('F1002',2,'Economy',5,'D','available',0,NULL,NULL),('F1002',2,'Economy',6,'A','available',0,NULL,NULL),('F1002',2,'Economy',6,'B','available',0,NULL,NULL),('F1002',2,'Economy',6,'C','available',0,NULL,NULL),('F1002',2,'Economy',6,'D','available',0,NULL,NULL),('F1002',2,'Economy',7,'A','available',0,NULL,NULL),('F1002',2,'Economy',7,'B','available',0,NULL,NULL),('F1002',2,'Economy',7,'C','available',0,NULL,NULL),('F1002',2,'Economy',7,'D','available',0,NULL,NULL),('F1002',2,'Economy',8,'A','available',0,NULL,NULL),('F1002',2,'Economy',8,'B','available',0,NULL,NULL),('F1002',2,'Economy',8,'C','available',0,NULL,NULL),('F1002',2,'Economy',8,'D','available',0,NULL,NULL),('F1002',2,'Economy',9,'A','available',0,NULL,NULL),('F1002',2,'Economy',9,'B','available',0,NULL,NULL),('F1002',2,'Economy',9,'C','available',0,NULL,NULL),('F1002',2,'Economy',9,'D','available',0,NULL,NULL),('F1002',2,'Economy',10,'A','available',0,NULL,NULL),('F1002',2,'Economy',10,'B','available',0,NULL,NULL),('F1002',2,'Economy',10,'C','available',0,NULL,NULL),('F1002',2,'Economy',10,'D','available',0,NULL,NULL),('F1002',2,'Economy',11,'A','available',0,NULL,NULL),('F1002',2,'Economy',11,'B','available',0,NULL,NULL),('F1002',2,'Economy',11,'C','available',0,NULL,NULL),('F1002',2,'Economy',11,'D','available',0,NULL,NULL),('F1002',2,'Economy',12,'A','available',0,NULL,NULL),('F1002',2,'Economy',12,'B','available',0,NULL,NULL),('F1002',2,'Economy',12,'C','available',0,NULL,NULL),('F1002',2,'Economy',12,'D','available',0,NULL,NULL),('F1002',2,'Economy',13,'A','available',0,NULL,NULL),('F1002',2,'Economy',13,'B','available',0,NULL,NULL),('F1002',2,'Economy',13,'C','available',0,NULL,NULL),('F1002',2,'Economy',13,'D','available',0,NULL,NULL),('F1002',2,'Economy',14,'A','available',0,NULL,NULL),('F1002',2,'Economy',14,'B','available',0,NULL,NULL),('F1002',2,'Economy',14,'C','available',0,NULL,NULL),('F1002',2,'Economy',14,'D','available',0,NULL,NULL),('F1002',2,'Economy',15,'A','available',0,NULL,NULL),('F1002',2,'Economy',15,'B','available',0,NULL,NULL),('F1002',2,'Economy',15,'C','available',0,NULL,NULL),('F1002',2,'Economy',15,'D','available',0,NULL,NULL),('F1003',5,'Business',1,'A','taken',0,NULL,NULL),('F1003',5,'Business',1,'B','available',0,NULL,NULL),('F1003',5,'Business',1,'C','available',0,NULL,NULL),('F1003',5,'Business',1,'D','available',0,NULL,NULL),('F1003',5,'Business',2,'A','available',0,NULL,NULL),('F1003',5,'Business',2,'B','available',0,NULL,NULL),('F1003',5,'Business',2,'C','available',0,NULL,NULL),('F1003',5,'Business',2,'D','available',0,NULL,NULL),('F1003',5,'Business',3,'A','available',0,NULL,NULL),('F1003',5,'Business',3,'B','available',0,NULL,NULL),('F1003',5,'Business',3,'C','available',0,NULL,NULL),('F1003',5,'Business',3,'D','available',0,NULL,NULL),('F1003',5,'Economy',1,'A','available',0,NULL,NULL),('F1003',5,'Economy',1,'B','available',0,NULL,NULL),('F1003',5,'Economy',1,'C','available',0,NULL,NULL),('F1003',5,'Economy',1,'D','available',0,NULL,NULL),('F1003',5,'Economy',1,'E','available',0,NULL,NULL),('F1003',5,'Economy',1,'F','available',0,NULL,NULL),('F1003',5,'Economy',1,'G','available',0,NULL,NULL),('F1003',5,'Economy',1,'H','available',0,NULL,NULL),('F1003',5,'Economy',1,'I','available',0,NULL,NULL),('F1003',5,'Economy',2,'A','available',0,NULL,NULL),('F1003',5,'Economy',2,'B','available',0,NULL,NULL),('F1003',5,'Economy',2,'C','available',0,NULL,NULL),('F1003',5,'Economy',2,'D','available',0,NULL,NULL),('F1003',5,'Economy',2,'E','available',0,NULL,NULL),('F1003',5,'Economy',2,'F','available',0,NULL,NULL),('F1003',5,'Economy',2,'G','available',0,NULL,NULL),('F1003',5,'Economy',2,'H','available',0,NULL,NULL),('F1003',5,'Economy',2,'I','available',0,NULL,NULL),('F1003',5,'Economy',3,'A','available',0,NULL,NULL),('F1003',5,'Economy',3,'B','available',0,NULL,NULL),('F1003',5,'Economy',3,'C','available',0,NULL,NULL),('F1003',5,'Economy',3,'D','available',0,NULL,NULL),('F1003',5,'Economy',3,'E','available',0,NULL,NULL),('F1003',5,'Economy',3,'F','available',0,NULL,NULL),('F1003',5,'Economy',3,'G','available',0,NULL,NULL),('F1003',5,'Economy',3,'H','available',0,NULL,NULL),('F1003',5,'Economy',3,'I','available',0,NULL,NULL),('F1003',5,'Economy',4,'A','available',0,NULL,NULL),('F1003',5,'Economy',4,'B','available',0,NULL,NULL),('F1003',5,'Economy',4,'C','available',0,NULL,NULL),('F1003',5,'Economy',4,'D','available',0,NULL,NULL),('F1003',5,'Economy',4,'E','available',0,NULL,NULL),('F1003',5,'Economy',4,'F','available',0,NULL,NULL),('F1003',5,'Economy',4,'G','available',0,NULL,NULL),('F1003',5,'Economy',4,'H','available',0,NULL,NULL),('F1003',5,'Economy',4,'I','available',0,NULL,NULL),('F1003',5,'Economy',5,'A','available',0,NULL,NULL),('F1003',5,'Economy',5,'B','available',0,NULL,NULL),('F1003',5,'Economy',5,'C','available',0,NULL,NULL),('F1003',5,'Economy',5,'D','available',0,NULL,NULL),('F1003',5,'Economy',5,'E','available',0,NULL,NULL),('F1003',5,'Economy',5,'F','available',0,NULL,NULL),('F1003',5,'Economy',5,'G','available',0,NULL,NULL),('F1003',5,'Economy',5,'H','available',0,NULL,NULL),('F1003',5,'Economy',5,'I','available',0,NULL,NULL),('F1003',5,'Economy',6,'A','available',0,NULL,NULL),('F1003',5,'Economy',6,'B','available',0,NULL,NULL),('F1003',5,'Economy',6,'C','available',0,NULL,NULL),('F1003',5,'Economy',6,'D','available',0,NULL,NULL),('F1003',5,'Economy',6,'E','available',0,NULL,NULL),('F1003',5,'Economy',6,'F','available',0,NULL,NULL),('F1003',5,'Economy',6,'G','available',0,NULL,NULL),('F1003',5,'Economy',6,'H','available',0,NULL,NULL),('F1003',5,'Economy',6,'I','available',0,NULL,NULL),('F1003',5,'Economy',7,'A','available',0,NULL,NULL),('F1003',5,'Economy',7,'B','available',0,NULL,NULL),('F1003',5,'Economy',7,'C','available',0,NULL,NULL),('F1003',5,'Economy',7,'D','available',0,NULL,NULL),('F1003',5,'Economy',7,'E','available',0,NULL,NULL),('F1003',5,'Economy',7,'F','available',0,NULL,NULL),('F1003',5,'Economy',7,'G','available',0,NULL,NULL),('F1003',5,'Economy',7,'H','available',0,NULL,NULL),('F1003',5,'Economy',7,'I','available',0,NULL,NULL),('F1003',5,'Economy',8,'A','available',0,NULL,NULL),('F1003',5,'Economy',8,'B','available',0,NULL,NULL),('F1003',5,'Economy',8,'C','available',0,NULL,NULL),('F1003',5,'Economy',8,'D','available',0,NULL,NULL),('F1003',5,'Economy',8,'E','available',0,NULL,NULL),('F1003',5,'Economy',8,'F','available',0,NULL,NULL),('F1003',5,'Economy',8,'G','available',0,NULL,NULL),('F1003',5,'Economy',8,'H','available',0,NULL,NULL),('F1003',5,'Economy',8,'I','available',0,NULL,NULL),('F1003',5,'Economy',9,'A','available',0,NULL,NULL),('F1003',5,'Economy',9,'B','available',0,NULL,NULL),('F1003',5,'Economy',9,'C','available',0,NULL,NULL),('F1003',5,'Economy',9,'D','available',0,NULL,NULL),('F1003',5,'Economy',9,'E','available',0,NULL,NULL),('F1003',5,'Economy',9,'F','available',0,NULL,NULL),('F1003',5,'Economy',9,'G','available',0,NULL,NULL),('F1003',5,'Economy',9,'H','available',0,NULL,NULL),('F1003',5,'Economy',9,'I','available',0,NULL,NULL),('F1003',5,'Economy',10,'A','available',0,NULL,NULL),('F1003',5,'Economy',10,'B','available',0,NULL,NULL),('F1003',5,'Economy',10,'C','available',0,NULL,NULL),('F1003',5,'Economy',10,'D','available',0,NULL,NULL),('F1003',5,'Economy',10,'E','available',0,NULL,NULL),('F1003',5,'Economy',10,'F','available',0,NULL,NULL),('F1003',5,'Economy',10,'G','available',0,NULL,NULL),('F1003',5,'Economy',10,'H','available',0,NULL,NULL),('F1003',5,'Economy',10,'I','available',0,NULL,NULL),('F1003',5,'Economy',11,'A','available',0,NULL,NULL),('F1003',5,'Economy',11,'B','available',0,NULL,NULL),('F1003',5,'Economy',11,'C','available',0,NULL,NULL),('F1003',5,'Economy',11,'D','available',0,NULL,NULL),('F1003',5,'Economy',11,'E','available',0,NULL,NULL),('F1003',5,'Economy',11,'F','available',0,NULL,NULL),('F1003',5,'Economy',11,'G','available',0,NULL,NULL),('F1003',5,'Economy',11,'H','available',0,NULL,NULL),('F1003',5,'Economy',11,'I','available',0,NULL,NULL),('F1003',5,'Economy',12,'A','available',0,NULL,NULL),('F1003',5,'Economy',12,'B','available',0,NULL,NULL),('F1003',5,'Economy',12,'C','available',0,NULL,NULL),('F1003',5,'Economy',12,'D','available',0,NULL,NULL),('F1003',5,'Economy',12,'E','available',0,NULL,NULL),('F1003',5,'Economy',12,'F','available',0,NULL,NULL),('F1003',5,'Economy',12,'G','available',0,NULL,NULL),('F1003',5,'Economy',12,'H','available',0,NULL,NULL),('F1003',5,'Economy',12,'I','available',0,NULL,NULL),('F1003',5,'Economy',13,'A','available',0,NULL,NULL),('F1003',5,'Economy',13,'B','available',0,NULL,NULL),('F1003',5,'Economy',13,'C','available',0,NULL,NULL),('F1003',5,'Economy',13,'D','available',0,NULL,NULL),('F1003',5,'Economy',13,'E','available',0,NULL,NULL),('F1003',5,'Economy',13,'F','available',0,NULL,NULL),('F1003',5,'Economy',13,'G','available',0,NULL,NULL),('F1003',5,'Economy',13,'H','available',0,NULL,NULL),('F1003',5,'Economy',13,'I','available',0,NULL,NULL),('F1003',5,'Economy',14,'A','available',0,NULL,NULL),('F1003',5,'Economy',14,'B','available',0,NULL,NULL),('F1003',5,'Economy',14,'C','available',0,NULL,NULL),('F1003',5,'Economy',14,'D','available',0,NULL,NULL),('F1003',5,'Economy',14,'E','available',0,NULL,NULL),('F1003',5,'Economy',14,'F','available',0,NULL,NULL),('F1003',5,'Economy',14,'G','available',0,NULL,NULL),('F1003',5,'Economy',14,'H','available',0,NULL,NULL),('F1003',5,'Economy',14,'I','available',0,NULL,NULL),('F1003',5,'Economy',15,'A','available',0,NULL,NULL),('F1003',5,'Economy',15,'B','available',0,NULL,NULL),('F1003',5,'Economy',15,'C','available',0,NULL,NULL),('F1003',5,'Economy',15,'D','available',0,NULL,NULL),('F1003',5,'Economy',15,'E','available',0,NULL,NULL),('F1003',5,'Economy',15,'F','available',0,NULL,NULL),('F1003',5,'Economy',15,'G','available',0,NULL,NULL),('F1003',5,'Economy',15,'H','available',0,NULL,NULL),('F1003',5,'Economy',15,'I','available',0,NULL,NULL),('F1003',5,'Economy',16,'A','available',0,NULL,NULL),('F1003',5,'Economy',16,'B','available',0,NULL,NULL),('F1003',5,'Economy',16,'C','available',0,NULL,NULL),('F1003',5,'Economy',16,'D','available',0,NULL,NULL),('F1003',5,'Economy',16,'E','available',0,NULL,NULL),('F1003',5,'Economy',16,'F','available',0,NULL,NULL),('F1003',5,'Economy',16,'G','available',0,NULL,NULL),('F1003',5,'Economy',16,'H','available',0,NULL,NULL),('F1003',5,'Economy',16,'I','available',0,NULL,NULL),('F1003',5,'Economy',17,'A','available',0,NULL,NULL),('F1003',5,'Economy',17,'B','available',0,NULL,NULL),('F1003',5,'Economy',17,'C','available',0,NULL,NULL),('F1003',5,'Economy',17,'D','available',0,NULL,NULL),('F1003',5,'Economy',17,'E','available',0,NULL,NULL),('F1003',5,'Economy',17,'F','available',0,NULL,NULL),('F1003',5,'Economy',17,'G','available',0,NULL,NULL),('F1003',5,'Economy',17,'H','available',0,NULL,NULL),('F1003',5,'Economy',17,'I','available',0,NULL,NULL),('F1003',5,'Economy',18,'A','available',0,NULL,NULL),('F1003',5,'Economy',18,'B','available',0,NULL,NULL),('F1003',5,'Economy',18,'C','available',0,NULL,NULL),('F1003',5,'Economy',18,'D','available',0,NULL,NULL),('F1003',5,'Economy',18,'E','available',0,NULL,NULL),('F1003',5,'Economy',18,'F','available',0,NULL,NULL),('F1003',5,'Economy',18,'G','available',0,NULL,NULL),('F1003',5,'Economy',18,'H','available',0,NULL,NULL),('F1003',5,'Economy',18,'I','available',0,NULL,NULL),('F1003',5,'Economy',19,'A','available',0,NULL,NULL),('F1003',5,'Economy',19,'B','available',0,NULL,NULL),('F1003',5,'Economy',19,'C','available',0,NULL,NULL),('F1003',5,'Economy',19,'D','available',0,NULL,NULL),('F1003',5,'Economy',19,'E','available',0,NULL,NULL),('F1003',5,'Economy',19,'F','available',0,NULL,NULL),('F1003',5,'Economy',19,'G','available',0,NULL,NULL),('F1003',5,'Economy',19,'H','available',0,NULL,NULL),('F1003',5,'Economy',19,'I','available',0,NULL,NULL),('F1003',5,'Economy',20,'A','available',0,NULL,NULL),('F1003',5,'Economy',20,'B','available',0,NULL,NULL),('F1003',5,'Economy',20,'C','available',0,NULL,NULL),('F1003',5,'Economy',20,'D','available',0,NULL,NULL),('F1003',5,'Economy',20,'E','available',0,NULL,NULL),('F1003',5,'Economy',20,'F','available',0,NULL,NULL),('F1003',5,'Economy',20,'G','available',0,NULL,NULL),('F1003',5,'Economy',20,'H','available',0,NULL,NULL),('F1003',5,'Economy',20,'I','available',0,NULL,NULL),('F1004',4,'Economy',1,'A','available',0,NULL,NULL),('F1004',4,'Economy',1,'B','available',0,NULL,NULL),('F1004',4,'Economy',1,'C','available',0,NULL,NULL),('F1004',4,'Economy',1,'D','available',0,NULL,NULL),('F1004',4,'Economy',2,'A','available',0,NULL,NULL),('F1004',4,'Economy',2,'B','available',0,NULL,NULL),('F1004',4,'Economy',2,'C','available',0,NULL,NULL),('F1004',4,'Economy',2,'D','available',0,NULL,NULL),('F1004',4,'Economy',3,'A','available',0,NULL,NULL),('F1004',4,'Economy',3,'B','available',0,NULL,NULL),('F1004',4,'Economy',3,'C','available',0,NULL,NULL),('F1004',4,'Economy',3,'D','available',0,NULL,NULL),('F1004',4,'Economy',4,'A','available',0,NULL,NULL),('F1004',4,'Economy',4,'B','available',0,NULL,NULL),('F1004',4,'Economy',4,'C','available',0,NULL,NULL),('F1004',4,'Economy',4,'D','available',0,NULL,NULL),('F1004',4,'Economy',5,'A','available',0,NULL,NULL),('F1004',4,'Economy',5,'B','available',0,NULL,NULL),('F1004',4,'Economy',5,'C','available',0,NULL,NULL),('F1004',4,'Economy',5,'D','available',0,NULL,NULL),('F1004',4,'Economy',6,'A','available',0,NULL,NULL),('F1004',4,'Economy',6,'B','available',0,NULL,NULL),('F1004',4,'Economy',6,'C','available',0,NULL,NULL),('F1004',4,'Economy',6,'D','available',0,NULL,NULL),('F1004',4,'Economy',7,'A','available',0,NULL,NULL),('F1004',4,'Economy',7,'B','available',0,NULL,NULL),('F1004',4,'Economy',7,'C','available',0,NULL,NULL),('F1004',4,'Economy',7,'D','available',0,NULL,NULL),('F1004',4,'Economy',8,'A','available',0,NULL,NULL),('F1004',4,'Economy',8,'B','available',0,NULL,NULL),('F1004',4,'Economy',8,'C','available',0,NULL,NULL),('F1004',4,'Economy',8,'D','available',0,NULL,NULL),('F1004',4,'Economy',9,'A','available',0,NULL,NULL),('F1004',4,'Economy',9,'B','available',0,NULL,NULL),('F1004',4,'Economy',9,'C','available',0,NULL,NULL),('F1004',4,'Economy',9,'D','available',0,NULL,NULL),('F1004',4,'Economy',10,'A','available',0,NULL,NULL),('F1004',4,'Economy',10,'B','available',0,NULL,NULL),('F1004',4,'Economy',10,'C','available',0,NULL,NULL),('F1004',4,'Economy',10,'D','available',0,NULL,NULL),('F1005',5,'Business',1,'A','available',0,NULL,NULL),('F1005',5,'Business',1,'B','available',0,NULL,NULL),('F1005',5,'Business',1,'C','available',0,NULL,NULL),('F1005',5,'Business',1,'D','available',0,NULL,NULL),('F1005',5,'Business',2,'A','available',0,NULL,NULL),('F1005',5,'Business',2,'B','available',0,NULL,NULL),('F1005',5,'Business',2,'C','available',0,NULL,NULL),('F1005',5,'Business',2,'D','available',0,NULL,NULL),('F1005',5,'Business',3,'A','available',0,NULL,NULL),('F1005',5,'Business',3,'B','available',0,NULL,NULL),('F1005',5,'Business',3,'C','available',0,NULL,NULL),('F1005',5,'Business',3,'D','available',0,NULL,NULL),('F1005',5,'Economy',1,'A','available',0,NULL,NULL),('F1005',5,'Economy',1,'B','available',0,NULL,NULL),('F1005',5,'Economy',1,'C','available',0,NULL,NULL),('F1005',5,'Economy',1,'D','available',0,NULL,NULL),('F1005',5,'Economy',1,'E','available',0,NULL,NULL),('F1005',5,'Economy',1,'F','available',0,NULL,NULL),('F1005',5,'Economy',1,'G','available',0,NULL,NULL),('F1005',5,'Economy',1,'H','available',0,NULL,NULL),('F1005',5,'Economy',1,'I','available',0,NULL,NULL),('F1005',5,'Economy',2,'A','available',0,NULL,NULL),('F1005',5,'Economy',2,'B','available',0,NULL,NULL),('F1005',5,'Economy',2,'C','available',0,NULL,NULL),('F1005',5,'Economy',2,'D','available',0,NULL,NULL),('F1005',5,'Economy',2,'E','available',0,NULL,NULL),('F1005',5,'Economy',2,'F','available',0,NULL,NULL),('F1005',5,'Economy',2,'G','available',0,NULL,NULL),('F1005',5,'Economy',2,'H','available',0,NULL,NULL),('F1005',5,'Economy',2,'I','available',0,NULL,NULL),('F1005',5,'Economy',3,'A','available',0,NULL,NULL),('F1005',5,'Economy',3,'B','available',0,NULL,NULL),('F1005',5,'Economy',3,'C','available',0,NULL,NULL),('F1005',5,'Economy',3,'D','available',0,NULL,NULL),('F1005',5,'Economy',3,'E','available',0,NULL,NULL),('F1005',5,'Economy',3,'F','available',0,NULL,NULL),('F1005',5,'Economy',3,'G','available',0,NULL,NULL),('F1005',5,'Economy',3,'H','available',0,NULL,NULL),('F1005',5,'Economy',3,'I','available',0,NULL,NULL),('F1005',5,'Economy',4,'A','available',0,NULL,NULL),('F1005',5,'Economy',4,'B','available',0,NULL,NULL),('F1005',5,'Economy',4,'C','available',0,NULL,NULL),('F1005',5,'Economy',4,'D','available',0,NULL,NULL),('F1005',5,'Economy',4,'E','available',0,NULL,NULL),('F1005',5,'Economy',4,'F','available',0,NULL,NULL),('F1005',5,'Economy',4,'G','available',0,NULL,NULL),('F1005',5,'Economy',4,'H','available',0,NULL,NULL),('F1005',5,'Economy',4,'I','available',0,NULL,NULL),('F1005',5,'Economy',5,'A','available',0,NULL,NULL),('F1005',5,'Economy',5,'B','available',0,NULL,NULL),('F1005',5,'Economy',5,'C','available',0,NULL,NULL),('F1005',5,'Economy',5,'D','available',0,NULL,NULL),('F1005',5,'Economy',5,'E','available',0,NULL,NULL),('F1005',5,'Economy',5,'F','available',0,NULL,NULL),('F1005',5,'Economy',5,'G','available',0,NULL,NULL),('F1005',5,'Economy',5,'H','available',0,NULL,NULL),('F1005',5,'Economy',5,'I','available',0,NULL,NULL),('F1005',5,'Economy',6,'A','available',0,NULL,NULL),('F1005',5,'Economy',6,'B','available',0,NULL,NULL),('F1005',5,'Economy',6,'C','available',0,NULL,NULL),('F1005',5,'Economy',6,'D','available',0,NULL,NULL),('F1005',5,'Economy',6,'E','available',0,NULL,NULL),('F1005',5,'Economy',6,'F','available',0,NULL,NULL),('F1005',5,'Economy',6,'G','available',0,NULL,NULL),('F1005',5,'Economy',6,'H','available',0,NULL,NULL),('F1005',5,'Economy',6,'I','available',0,NULL,NULL),('F1005',5,'Economy',7,'A','available',0,NULL,NULL),('F1005',5,'Economy',7,'B','available',0,NULL,NULL),('F1005',5,'Economy',7,'C','available',0,NULL,NULL),('F1005',5,'Economy',7,'D','available',0,NULL,NULL),('F1005',5,'Economy',7,'E','available',0,NULL,NULL),('F1005',5,'Economy',7,'F','available',0,NULL,NULL),('F1005',5,'Economy',7,'G','available',0,NULL,NULL),('F1005',5,'Economy',7,'H','available',0,NULL,NULL),('F1005',5,'Economy',7,'I','available',0,NULL,NULL),('F1005',5,'Economy',8,'A','available',0,NULL,NULL),('F1005',5,'Economy',8,'B','available',0,NULL,NULL),('F1005',5,'Economy',8,'C','available',0,NULL,NULL),('F1005',5,'Economy',8,'D','available',0,NULL,NULL),('F1005',5,'Economy',8,'E','available',0,NULL,NULL),('F1005',5,'Economy',8,'F','available',0,NULL,NULL),('F1005',5,'Economy',8,'G','available',0,NULL,NULL),('F1005',5,'Economy',8,'H','available',0,NULL,NULL),('F1005',5,'Economy',8,'I','available',0,NULL,NULL),('F1005',5,'Economy',9,'A','available',0,NULL,NULL),('F1005',5,'Economy',9,'B','available',0,NULL,NULL),('F1005',5,'Economy',9,'C','available',0,NULL,NULL),('F1005',5,'Economy',9,'D','available',0,NULL,NULL),('F1005',5,'Economy',9,'E','available',0,NULL,NULL),('F1005',5,'Economy',9,'F','available',0,NULL,NULL),('F1005',5,'Economy',9,'G','available',0,NULL,NULL),('F1005',5,'Economy',9,'H','available',0,NULL,NULL),('F1005',5,'Economy',9,'I','available',0,NULL,NULL),('F1005',5,'Economy',10,'A','available',0,NULL,NULL),('F1005',5,'Economy',10,'B','available',0,NULL,NULL),('F1005',5,'Economy',10,'C','available',0,NULL,NULL),('F1005',5,'Economy',10,'D','available',0,NULL,NULL),('F1005',5,'Economy',10,'E','available',0,NULL,NULL),('F1005',5,'Economy',10,'F','available',0,NULL,NULL),('F1005',5,'Economy',10,'G','available',0,NULL,NULL),('F1005',5,'Economy',10,'H','available',0,NULL,NULL),('F1005',5,'Economy',10,'I','available',0,NULL,NULL),('F1005',5,'Economy',11,'A','available',0,NULL,NULL),('F1005',5,'Economy',11,'B','available',0,NULL,NULL),('F1005',5,'Economy',11,'C','available',0,NULL,NULL),('F1005',5,'Economy',11,'D','available',0,NULL,NULL),('F1005',5,'Economy',11,'E','available',0,NULL,NULL),('F1005',5,'Economy',11,'F','available',0,NULL,NULL),('F1005',5,'Economy',11,'G','available',0,NULL,NULL),('F1005',5,'Economy',11,'H','available',0,NULL,NULL),('F1005',5,'Economy',11,'I','available',0,NULL,NULL),('F1005',5,'Economy',12,'A','available',0,NULL,NULL),('F1005',5,'Economy',12,'B','available',0,NULL,NULL),('F1005',5,'Economy',12,'C','available',0,NULL,NULL),('F1005',5,'Economy',12,'D','available',0,NULL,NULL),('F1005',5,'Economy',12,'E','available',0,NULL,NULL),('F1005',5,'Economy',12,'F','available',0,NULL,NULL),('F1005',5,'Economy',12,'G','available',0,NULL,NULL),('F1005',5,'Economy',12,'H','available',0,NULL,NULL),('F1005',5,'Economy',12,'I','available',0,NULL,NULL),('F1005',5,'Economy',13,'A','available',0,NULL,NULL),('F1005',5,'Economy',13,'B','available',0,NULL,NULL),('F1005',5,'Economy',13,'C','available',0,NULL,NULL),('F1005',5,'Economy',13,'D','available',0,NULL,NULL),('F1005',5,'Economy',13,'E','available',0,NULL,NULL),('F1005',5,'Economy',13,'F','available',0,NULL,NULL),('F1005',5,'Economy',13,'G','available',0,NULL,NULL),('F1005',5,'Economy',13,'H','available',0,NULL,NULL),('F1005',5,'Economy',13,'I','available',0,NULL,NULL),('F1005',5,'Economy',14,'A','available',0,NULL,NULL),('F1005',5,'Economy',14,'B','available',0,NULL,NULL),('F1005',5,'Economy',14,'C','available',0,NULL,NULL),('F1005',5,'Economy',14,'D','available',0,NULL,NULL),('F1005',5,'Economy',14,'E','available',0,NULL,NULL),('F1005',5,'Economy',14,'F','available',0,NULL,NULL),('F1005',5,'Economy',14,'G','available',0,NULL,NULL),('F1005',5,'Economy',14,'H','available',0,NULL,NULL),('F1005',5,'Economy',14,'I','available',0,NULL,NULL),('F1005',5,'Economy',15,'A','available',0,NULL,NULL),('F1005',5,'Economy',15,'B','available',0,NULL,NULL),('F1005',5,'Economy',15,'C','available',0,NULL,NULL),('F1005',5,'Economy',15,'D','available',0,NULL,NULL),('F1005',5,'Economy',15,'E','available',0,NULL,NULL),('F1005',5,'Economy',15,'F','available',0,NULL,NULL),('F1005',5,'Economy',15,'G','available',0,NULL,NULL),('F1005',5,'Economy',15,'H','available',0,NULL,NULL),('F1005',5,'Economy',15,'I','available',0,NULL,NULL),('F1005',5,'Economy',16,'A','available',0,NULL,NULL),('F1005',5,'Economy',16,'B','available',0,NULL,NULL),('F1005',5,'Economy',16,'C','available',0,NULL,NULL),('F1005',5,'Economy',16,'D','available',0,NULL,NULL),('F1005',5,'Economy',16,'E','available',0,NULL,NULL),('F1005',5,'Economy',16,'F','available',0,NULL,NULL),('F1005',5,'Economy',16,'G','available',0,NULL,NULL),('F1005',5,'Economy',16,'H','available',0,NULL,NULL),('F1005',5,'Economy',16,'I','available',0,NULL,NULL),('F1005',5,'Economy',17,'A','available',0,NULL,NULL),('F1005',5,'Economy',17,'B','available',0,NULL,NULL),('F1005',5,'Economy',17,'C','available',0,NULL,NULL),('F1005',5,'Economy',17,'D','available',0,NULL,NULL),('F1005',5,'Economy',17,'E','available',0,NULL,NULL),('F1005',5,'Economy',17,'F','available',0,NULL,NULL),('F1005',5,'Economy',17,'G','available',0,NULL,NULL),('F1005',5,'Economy',17,'H','available',0,NULL,NULL),('F1005',5,'Economy',17,'I','available',0,NULL,NULL),('F1005',5,'Economy',18,'A','available',0,NULL,NULL),('F1005',5,'Economy',18,'B','available',0,NULL,NULL),('F1005',5,'Economy',18,'C','available',0,NULL,NULL),('F1005',5,'Economy',18,'D','available',0,NULL,NULL),('F1005',5,'Economy',18,'E','available',0,NULL,NULL),('F1005',5,'Economy',18,'F','available',0,NULL,NULL),('F1005',5,'Economy',18,'G','available',0,NULL,NULL),('F1005',5,'Economy',18,'H','available',0,NULL,NULL),('F1005',5,'Economy',18,'I','available',0,NULL,NULL),('F1005',5,'Economy',19,'A','available',0,NULL,NULL),('F1005',5,'Economy',19,'B','available',0,NULL,NULL),('F1005',5,'Economy',19,'C','available',0,NULL,NULL),('F1005',5,'Economy',19,'D','available',0,NULL,NULL),('F1005',5,'Economy',19,'E','available',0,NULL,NULL),('F1005',5,'Economy',19,'F','available',0,NULL,NULL),('F1005',5,'Economy',19,'G','available',0,NULL,NULL),('F1005',5,'Economy',19,'H','available',0,NULL,NULL),('F1005',5,'Economy',19,'I','available',0,NULL,NULL),('F1005',5,'Economy',20,'A','available',0,NULL,NULL),('F1005',5,'Economy',20,'B','available',0,NULL,NULL),('F1005',5,'Economy',20,'C','available',0,NULL,NULL),('F1005',5,'Economy',20,'D','available',0,NULL,NULL),('F1005',5,'Economy',20,'E','available',0,NULL,NULL),('F1005',5,'Economy',20,'F','available',0,NULL,NULL),('F1005',5,'Economy',20,'G','available',0,NULL,NULL),('F1005',5,'Economy',20,'H','available',0,NULL,NULL),('F1005',5,'Economy',20,'I','available',0,NULL,NULL),('F1006',6,'Business',1,'A','available',0,NULL,NULL),('F1006',6,'Business',1,'B','available',0,NULL,NULL),('F1006',6,'Business',1,'C','available',0,NULL,NULL),('F1006',6,'Business',1,'D','available',0,NULL,NULL),('F1006',6,'Business',2,'A','available',0,NULL,NULL),('F1006',6,'Business',2,'B','available',0,NULL,NULL),('F1006',6,'Business',2,'C','available',0,NULL,NULL),('F1006',6,'Business',2,'D','available',0,NULL,NULL),('F1006',6,'Economy',1,'A','available',0,NULL,NULL),('F1006',6,'Economy',1,'B','available',0,NULL,NULL),('F1006',6,'Economy',1,'C','available',0,NULL,NULL),('F1006',6,'Economy',1,'D','available',0,NULL,NULL),('F1006',6,'Economy',1,'E','available',0,NULL,NULL),('F1006',6,'Economy',1,'F','available',0,NULL,NULL),('F1006',6,'Economy',1,'G','available',0,NULL,NULL),('F1006',6,'Economy',1,'H','available',0,NULL,NULL),('F1006',6,'Economy',1,'I','available',0,NULL,NULL),('F1006',6,'Economy',1,'J','available',0,NULL,NULL),('F1006',6,'Economy',2,'A','available',0,NULL,NULL),('F1006',6,'Economy',2,'B','available',0,NULL,NULL),('F1006',6,'Economy',2,'C','available',0,NULL,NULL),('F1006',6,'Economy',2,'D','available',0,NULL,NULL),('F1006',6,'Economy',2,'E','available',0,NULL,NULL),('F1006',6,'Economy',2,'F','available',0,NULL,NULL),('F1006',6,'Economy',2,'G','available',0,NULL,NULL),('F1006',6,'Economy',2,'H','available',0,NULL,NULL),('F1006',6,'Economy',2,'I','available',0,NULL,NULL),('F1006',6,'Economy',2,'J','available',0,NULL,NULL),('F1006',6,'Economy',3,'A','available',0,NULL,NULL),('F1006',6,'Economy',3,'B','available',0,NULL,NULL),('F1006',6,'Economy',3,'C','available',0,NULL,NULL),('F1006',6,'Economy',3,'D','available',0,NULL,NULL),('F1006',6,'Economy',3,'E','available',0,NULL,NULL),('F1006',6,'Economy',3,'F','available',0,NULL,NULL),('F1006',6,'Economy',3,'G','available',0,NULL,NULL),('F1006',6,'Economy',3,'H','available',0,NULL,NULL),('F1006',6,'Economy',3,'I','available',0,NULL,NULL),('F1006',6,'Economy',3,'J','available',0,NULL,NULL),('F1006',6,'Economy',4,'A','available',0,NULL,NULL),('F1006',6,'Economy',4,'B','available',0,NULL,NULL),('F1006',6,'Economy',4,'C','available',0,NULL,NULL),('F1006',6,'Economy',4,'D','available',0,NULL,NULL),('F1006',6,'Economy',4,'E','available',0,NULL,NULL),('F1006',6,'Economy',4,'F','available',0,NULL,NULL),('F1006',6,'Economy',4,'G','available',0,NULL,NULL),('F1006',6,'Economy',4,'H','available',0,NULL,NULL),('F1006',6,'Economy',4,'I','available',0,NULL,NULL),('F1006',6,'Economy',4,'J','available',0,NULL,NULL),('F1006',6,'Economy',5,'A','available',0,NULL,NULL),('F1006',6,'Economy',5,'B','available',0,NULL,NULL),('F1006',6,'Economy',5,'C','available',0,NULL,NULL),('F1006',6,'Economy',5,'D','available',0,NULL,NULL),('F1006',6,'Economy',5,'E','available',0,NULL,NULL),('F1006',6,'Economy',5,'F','available',0,NULL,NULL),('F1006',6,'Economy',5,'G','available',0,NULL,NULL),('F1006',6,'Economy',5,'H','available',0,NULL,NULL),('F1006',6,'Economy',5,'I','available',0,NULL,NULL),('F1006',6,'Economy',5,'J','available',0,NULL,NULL),('F1006',6,'Economy',6,'A','available',0,NULL,NULL),('F1006',6,'Economy',6,'B','available',0,NULL,NULL),('F1006',6,'Economy',6,'C','available',0,NULL,NULL),('F1006',6,'Economy',6,'D','available',0,NULL,NULL),('F1006',6,'Economy',6,'E','available',0,NULL,NULL),('F1006',6,'Economy',6,'F','available',0,NULL,NULL),('F1006',6,'Economy',6,'G','available',0,NULL,NULL),('F1006',6,'Economy',6,'H','available',0,NULL,NULL),('F1006',6,'Economy',6,'I','available',0,NULL,NULL),('F1006',6,'Economy',6,'J','available',0,NULL,NULL),('F1006',6,'Economy',7,'A','available',0,NULL,NULL),('F1006',6,'Economy',7,'B','available',0,NULL,NULL),('F1006',6,'Economy',7,'C','available',0,NULL,NULL),('F1006',6,'Economy',7,'D','available',0,NULL,NULL),('F1006',6,'Economy',7,'E','available',0,NULL,NULL),('F1006',6,'Economy',7,'F','available',0,NULL,NULL),('F1006',6,'Economy',7,'G','available',0,NULL,NULL),('F1006',6,'Economy',7,'H','available',0,NULL,NULL),('F1006',6,'Economy',7,'I','available',0,NULL,NULL),('F1006',6,'Economy',7,'J','available',0,NULL,NULL),('F1006',6,'Economy',8,'A','available',0,NULL,NULL),('F1006',6,'Economy',8,'B','available',0,NULL,NULL),('F1006',6,'Economy',8,'C','available',0,NULL,NULL),('F1006',6,'Economy',8,'D','available',0,NULL,NULL),('F1006',6,'Economy',8,'E','available',0,NULL,NULL),('F1006',6,'Economy',8,'F','available',0,NULL,NULL),('F1006',6,'Economy',8,'G','available',0,NULL,NULL),('F1006',6,'Economy',8,'H','available',0,NULL,NULL),('F1006',6,'Economy',8,'I','available',0,NULL,NULL),('F1006',6,'Economy',8,'J','available',0,NULL,NULL),('F1006',6,'Economy',9,'A','available',0,NULL,NULL),('F1006',6,'Economy',9,'B','available',0,NULL,NULL),('F1006',6,'Economy',9,'C','available',0,NULL,NULL),('F1006',6,'Economy',9,'D','available',0,NULL,NULL),('F1006',6,'Economy',9,'E','available',0,NULL,NULL),('F1006',6,'Economy',9,'F','available',0,NULL,NULL),('F1006',6,'Economy',9,'G','available',0,NULL,NULL),('F1006',6,'Economy',9,'H','available',0,NULL,NULL),('F1006',6,'Economy',9,'I','available',0,NULL,NULL),('F1006',6,'Economy',9,'J','available',0,NULL,NULL),('F1006',6,'Economy',10,'A','available',0,NULL,NULL),('F1006',6,'Economy',10,'B','available',0,NULL,NULL),('F1006',6,'Economy',10,'C','available',0,NULL,NULL),('F1006',6,'Economy',10,'D','taken',0,NULL,NULL),('F1006',6,'Economy',10,'E','taken',0,NULL,NULL),('F1006',6,'Economy',10,'F','taken',0,NULL,NULL),('F1006',6,'Economy',10,'G','taken',0,NULL,NULL),('F1006',6,'Economy',10,'H','available',0,NULL,NULL),('F1006',6,'Economy',10,'I','available',0,NULL,NULL),('F1006',6,'Economy',10,'J','available',0,NULL,NULL),('F1006',6,'Economy',11,'A','available',0,NULL,NULL),('F1006',6,'Economy',11,'B','available',0,NULL,NULL),('F1006',6,'Economy',11,'C','available',0,NULL,NULL),('F1006',6,'Economy',11,'D','available',0,NULL,NULL),('F1006',6,'Economy',11,'E','available',0,NULL,NULL),('F1006',6,'Economy',11,'F','available',0,NULL,NULL),('F1006',6,'Economy',11,'G','available',0,NULL,NULL),('F1006',6,'Economy',11,'H','available',0,NULL,NULL),('F1006',6,'Economy',11,'I','available',0,NULL,NULL),('F1006',6,'Economy',11,'J','available',0,NULL,NULL),('F1006',6,'Economy',12,'A','available',0,NULL,NULL),('F1006',6,'Economy',12,'B','available',0,NULL,NULL),('F1006',6,'Economy',12,'C','available',0,NULL,NULL),('F1006',6,'Economy',12,'D','available',0,NULL,NULL),('F1006',6,'Economy',12,'E','available',0,NULL,NULL),('F1006',6,'Economy',12,'F','available',0,NULL,NULL),('F1006',6,'Economy',12,'G','available',0,NULL,NULL),('F1006',6,'Economy',12,'H','available',0,NULL,NULL),('F1006',6,'Economy',12,'I','available',0,NULL,NULL),('F1006',6,'Economy',12,'J','available',0,NULL,NULL),('F1006',6,'Economy',13,'A','available',0,NULL,NULL),('F1006',6,'Economy',13,'B','available',0,NULL,NULL),('F1006',6,'Economy',13,'C','available',0,NULL,NULL),('F1006',6,'Economy',13,'D','available',0,NULL,NULL),('F1006',6,'Economy',13,'E','available',0,NULL,NULL),('F1006',6,'Economy',13,'F','available',0,NULL,NULL),('F1006',6,'Economy',13,'G','available',0,NULL,NULL),('F1006',6,'Economy',13,'H','available',0,NULL,NULL),('F1006',6,'Economy',13,'I','available',0,NULL,NULL),('F1006',6,'Economy',13,'J','available',0,NULL,NULL),('F1006',6,'Economy',14,'A','available',0,NULL,NULL),('F1006',6,'Economy',14,'B','available',0,NULL,NULL),('F1006',6,'Economy',14,'C','available',0,NULL,NULL),('F1006',6,'Economy',14,'D','available',0,NULL,NULL),('F1006',6,'Economy',14,'E','available',0,NULL,NULL),('F1006',6,'Economy',14,'F','available',0,NULL,NULL),('F1006',6,'Economy',14,'G','available',0,NULL,NULL),('F1006',6,'Economy',14,'H','available',0,NULL,NULL),('F1006',6,'Economy',14,'I','available',0,NULL,NULL),('F1006',6,'Economy',14,'J','available',0,NULL,NULL),('F1006',6,'Economy',15,'A','available',0,NULL,NULL),('F1006',6,'Economy',15,'B','available',0,NULL,NULL),('F1006',6,'Economy',15,'C','available',0,NULL,NULL),('F1006',6,'Economy',15,'D','available',0,NULL,NULL),('F1006',6,'Economy',15,'E','available',0,NULL,NULL),('F1006',6,'Economy',15,'F','available',0,NULL,NULL),('F1006',6,'Economy',15,'G','available',0,NULL,NULL),('F1006',6,'Economy',15,'H','available',0,NULL,NULL),('F1006',6,'Economy',15,'I','available',0,NULL,NULL),('F1006',6,'Economy',15,'J','available',0,NULL,NULL),('F1007',8,'Business',1,'A','available',0,NULL,NULL),('F1007',8,'Business',1,'B','available',0,NULL,NULL),('F1007',8,'Business',1,'C','available',0,NULL,NULL),('F1007',8,'Business',1,'D','available',0,NULL,NULL),('F1007',8,'Business',1,'E','available',0,NULL,NULL),('F1007',8,'Business',2,'A','available',0,NULL,NULL),('F1007',8,'Business',2,'B','available',0,NULL,NULL),('F1007',8,'Business',2,'C','available',0,NULL,NULL),('F1007',8,'Business',2,'D','available',0,NULL,NULL),('F1007',8,'Business',2,'E','available',0,NULL,NULL),('F1007',8,'Business',3,'A','available',0,NULL,NULL),('F1007',8,'Business',3,'B','available',0,NULL,NULL),('F1007',8,'Business',3,'C','available',0,NULL,NULL),('F1007',8,'Business',3,'D','available',0,NULL,NULL),('F1007',8,'Business',3,'E','available',0,NULL,NULL),('F1007',8,'Business',4,'A','available',0,NULL,NULL),('F1007',8,'Business',4,'B','available',0,NULL,NULL),('F1007',8,'Business',4,'C','available',0,NULL,NULL),('F1007',8,'Business',4,'D','available',0,NULL,NULL),('F1007',8,'Business',4,'E','available',0,NULL,NULL),('F1007',8,'Business',5,'A','available',0,NULL,NULL),('F1007',8,'Business',5,'B','available',0,NULL,NULL),('F1007',8,'Business',5,'C','available',0,NULL,NULL),('F1007',8,'Business',5,'D','available',0,NULL,NULL),('F1007',8,'Business',5,'E','available',0,NULL,NULL),('F1007',8,'Economy',1,'A','available',0,NULL,NULL),('F1007',8,'Economy',1,'B','available',0,NULL,NULL),('F1007',8,'Economy',1,'C','available',0,NULL,NULL),('F1007',8,'Economy',1,'D','available',0,NULL,NULL),('F1007',8,'Economy',1,'E','available',0,NULL,NULL),('F1007',8,'Economy',2,'A','available',0,NULL,NULL),('F1007',8,'Economy',2,'B','available',0,NULL,NULL),('F1007',8,'Economy',2,'C','available',0,NULL,NULL),('F1007',8,'Economy',2,'D','available',0,NULL,NULL),('F1007',8,'Economy',2,'E','available',0,NULL,NULL),('F1007',8,'Economy',3,'A','available',0,NULL,NULL),('F1007',8,'Economy',3,'B','available',0,NULL,NULL),('F1007',8,'Economy',3,'C','available',0,NULL,NULL),('F1007',8,'Economy',3,'D','available',0,NULL,NULL),('F1007',8,'Economy',3,'E','available',0,NULL,NULL),('F1007',8,'Economy',4,'A','available',0,NULL,NULL),('F1007',8,'Economy',4,'B','available',0,NULL,NULL),('F1007',8,'Economy',4,'C','available',0,NULL,NULL),('F1007',8,'Economy',4,'D','available',0,NULL,NULL),('F1007',8,'Economy',4,'E','available',0,NULL,NULL),('F1007',8,'Economy',5,'A','available',0,NULL,NULL),('F1007',8,'Economy',5,'B','available',0,NULL,NULL),('F1007',8,'Economy',5,'C','available',0,NULL,NULL),('F1007',8,'Economy',5,'D','available',0,NULL,NULL),('F1007',8,'Economy',5,'E','available',0,NULL,NULL),('F1008',6,'Business',1,'A','available',0,NULL,NULL),('F1008',6,'Business',1,'B','available',0,NULL,NULL),('F1008',6,'Business',1,'C','available',0,NULL,NULL),('F1008',6,'Business',1,'D','available',0,NULL,NULL),('F1008',6,'Business',2,'A','available',0,NULL,NULL),('F1008',6,'Business',2,'B','available',0,NULL,NULL),('F1008',6,'Business',2,'C','available',0,NULL,NULL),('F1008',6,'Business',2,'D','available',0,NULL,NULL),('F1008',6,'Economy',1,'A','available',0,NULL,NULL),('F1008',6,'Economy',1,'B','available',0,NULL,NULL),('F1008',6,'Economy',1,'C','available',0,NULL,NULL),('F1008',6,'Economy',1,'D','available',0,NULL,NULL),('F1008',6,'Economy',1,'E','available',0,NULL,NULL),('F1008',6,'Economy',1,'F','available',0,NULL,NULL),('F1008',6,'Economy',1,'G','available',0,NULL,NULL),('F1008',6,'Economy',1,'H','available',0,NULL,NULL),('F1008',6,'Economy',1,'I','available',0,NULL,NULL),('F1008',6,'Economy',1,'J','available',0,NULL,NULL),('F1008',6,'Economy',2,'A','available',0,NULL,NULL),('F1008',6,'Economy',2,'B','available',0,NULL,NULL),('F1008',6,'Economy',2,'C','available',0,NULL,NULL),('F1008',6,'Economy',2,'D','available',0,NULL,NULL),('F1008',6,'Economy',2,'E','available',0,NULL,NULL),('F1008',6,'Economy',2,'F','available',0,NULL,NULL),('F1008',6,'Economy',2,'G','available',0,NULL,NULL),('F1008',6,'Economy',2,'H','available',0,NULL,NULL),('F1008',6,'Economy',2,'I','available',0,NULL,NULL),('F1008',6,'Economy',2,'J','available',0,NULL,NULL),('F1008',6,'Economy',3,'A','available',0,NULL,NULL),('F1008',6,'Economy',3,'B','available',0,NULL,NULL),('F1008',6,'Economy',3,'C','available',0,NULL,NULL),('F1008',6,'Economy',3,'D','available',0,NULL,NULL),('F1008',6,'Economy',3,'E','available',0,NULL,NULL),('F1008',6,'Economy',3,'F','available',0,NULL,NULL),('F1008',6,'Economy',3,'G','available',0,NULL,NULL),('F1008',6,'Economy',3,'H','available',0,NULL,NULL),('F1008',6,'Economy',3,'I','available',0,NULL,NULL),('F1008',6,'Economy',3,'J','available',0,NULL,NULL),('F1008',6,'Economy',4,'A','available',0,NULL,NULL),('F1008',6,'Economy',4,'B','available',0,NULL,NULL),('F1008',6,'Economy',4,'C','available',0,NULL,NULL),('F1008',6,'Economy',4,'D','available',0,NULL,NULL),('F1008',6,'Economy',4,'E','available',0,NULL,NULL),('F1008',6,'Economy',4,'F','available',0,NULL,NULL),('F1008',6,'Economy',4,'G','available',0,NULL,NULL),('F1008',6,'Economy',4,'H','available',0,NULL,NULL),('F1008',6,'Economy',4,'I','available',0,NULL,NULL),('F1008',6,'Economy',4,'J','available',0,NULL,NULL),('F1008',6,'Economy',5,'A','available',0,NULL,NULL),('F1008',6,'Economy',5,'B','available',0,NULL,NULL),('F1008',6,'Economy',5,'C','available',0,NULL,NULL),('F1008',6,'Economy',5,'D','available',0,NULL,NULL),('F1008',6,'Economy',5,'E','available',0,NULL,NULL),('F1008',6,'Economy',5,'F','available',0,NULL,NULL),('F1008',6,'Economy',5,'G','available',0,NULL,NULL),('F1008',6,'Economy',5,'H','available',0,NULL,NULL),('F1008',6,'Economy',5,'I','available',0,NULL,NULL),('F1008',6,'Economy',5,'J','available',0,NULL,NULL),('F1008',6,'Economy',6,'A','available',0,NULL,NULL),('F1008',6,'Economy',6,'B','available',0,NULL,NULL),('F1008',6,'Economy',6,'C','available',0,NULL,NULL),('F1008',6,'Economy',6,'D','available',0,NULL,NULL),('F1008',6,'Economy',6,'E','available',0,NULL,NULL),('F1008',6,'Economy',6,'F','available',0,NULL,NULL),('F1008',6,'Economy',6,'G','available',0,NULL,NULL),('F1008',6,'Economy',6,'H','available',0,NULL,NULL),('F1008',6,'Economy',6,'I','available',0,NULL,NULL),('F1008',6,'Economy',6,'J','available',0,NULL,NULL),('F1008',6,'Economy',7,'A','available',0,NULL,NULL),('F1008',6,'Economy',7,'B','available',0,NULL,NULL),('F1008',6,'Economy',7,'C','available',0,NULL,NULL),('F1008',6,'Economy',7,'D','available',0,NULL,NULL),('F1008',6,'Economy',7,'E','available',0,NULL,NULL),('F1008',6,'Economy',7,'F','available',0,NULL,NULL),('F1008',6,'Economy',7,'G','available',0,NULL,NULL),('F1008',6,'Economy',7,'H','available',0,NULL,NULL),('F1008',6,'Economy',7,'I','available',0,NULL,NULL),('F1008',6,'Economy',7,'J','available',0,NULL,NULL),('F1008',6,'Economy',8,'A','available',0,NULL,NULL),('F1008',6,'Economy',8,'B','available',0,NULL,NULL),('F1008',6,'Economy',8,'C','available',0,NULL,NULL),('F1008',6,'Economy',8,'D','available',0,NULL,NULL),('F1008',6,'Economy',8,'E','available',0,NULL,NULL),('F1008',6,'Economy',8,'F','available',0,NULL,NULL),('F1008',6,'Economy',8,'G','available',0,NULL,NULL),('F1008',6,'Economy',8,'H','available',0,NULL,NULL),('F1008',6,'Economy',8,'I','available',0,NULL,NULL),('F1008',6,'Economy',8,'J','available',0,NULL,NULL),('F1008',6,'Economy',9,'A','available',0,NULL,NULL),('F1008',6,'Economy',9,'B','available',0,NULL,NULL),('F1008',6,'Economy',9,'C','available',0,NULL,NULL),('F1008',6,'Economy',9,'D','available',0,NULL,NULL),('F1008',6,'Economy',9,'E','available',0,NULL,NULL),('F1008',6,'Economy',9,'F','available',0,NULL,NULL),('F1008',6,'Economy',9,'G','available',0,NULL,NULL),('F1008',6,'Economy',9,'H','available',0,NULL,NULL),('F1008',6,'Economy',9,'I','available',0,NULL,NULL),('F1008',6,'Economy',9,'J','available',0,NULL,NULL),('F1008',6,'Economy',10,'A','available',0,NULL,NULL),('F1008',6,'Economy',10,'B','available',0,NULL,NULL),('F1008',6,'Economy',10,'C','available',0,NULL,NULL),('F1008',6,'Economy',10,'D','available',0,NULL,NULL),('F1008',6,'Economy',10,'E','available',0,NULL,NULL),('F1008',6,'Economy',10,'F','available',0,NULL,NULL),('F1008',6,'Economy',10,'G','available',0,NULL,NULL),('F1008',6,'Economy',10,'H','available',0,NULL,NULL),('F1008',6,'Economy',10,'I','available',0,NULL,NULL),('F1008',6,'Economy',10,'J','available',0,NULL,NULL),('F1008',6,'Economy',11,'A','available',0,NULL,NULL),('F1008',6,'Economy',11,'B','available',0,NULL,NULL),('F1008',6,'Economy',11,'C','available',0,NULL,NULL),('F1008',6,'Economy',11,'D','available',0,NULL,NULL),('F1008',6,'Economy',11,'E','available',0,NULL,NULL),('F1008',6,'Economy',11,'F','available',0,NULL,NULL),('F1008',6,'Economy',11,'G','available',0,NULL,NULL),('F1008',6,'Economy',11,'H','available',0,NULL,NULL),('F1008',6,'Economy',11,'I','available',0,NULL,NULL),('F1008',6,'Economy',11,'J','available',0,NULL,NULL),('F1008',6,'Economy',12,'A','available',0,NULL,NULL),('F1008',6,'Economy',12,'B','available',0,NULL,NULL),('F1008',6,'Economy',12,'C','available',0,NULL,NULL),('F1008',6,'Economy',12,'D','available',0,NULL,NULL),('F1008',6,'Economy',12,'E','available',0,NULL,NULL),('F1008',6,'Economy',12,'F','available',0,NULL,NULL),('F1008',6,'Economy',12,'G','available',0,NULL,NULL),('F1008',6,'Economy',12,'H','available',0,NULL,NULL),('F1008',6,'Economy',12,'I','available',0,NULL,NULL),('F1008',6,'Economy',12,'J','available',0,NULL,NULL),('F1008',6,'Economy',13,'A','available',0,NULL,NULL),('F1008',6,'Economy',13,'B','available',0,NULL,NULL),('F1008',6,'Economy',13,'C','available',0,NULL,NULL),('F1008',6,'Economy',13,'D','available',0,NULL,NULL),('F1008',6,'Economy',13,'E','available',0,NULL,NULL),('F1008',6,'Economy',13,'F','available',0,NULL,NULL),('F1008',6,'Economy',13,'G','available',0,NULL,NULL),('F1008',6,'Economy',13,'H','available',0,NULL,NULL),('F1008',6,'Economy',13,'I','available',0,NULL,NULL),('F1008',6,'Economy',13,'J','available',0,NULL,NULL),('F1008',6,'Economy',14,'A','available',0,NULL,NULL),('F1008',6,'Economy',14,'B','available',0,NULL,NULL),('F1008',6,'Economy',14,'C','available',0,NULL,NULL),('F1008',6,'Economy',14,'D','available',0,NULL,NULL),('F1008',6,'Economy',14,'E','available',0,NULL,NULL),('F1008',6,'Economy',14,'F','available',0,NULL,NULL),('F1008',6,'Economy',14,'G','available',0,NULL,NULL),('F1008',6,'Economy',14,'H','available',0,NULL,NULL),('F1008',6,'Economy',14,'I','available',0,NULL,NULL),('F1008',6,'Economy',14,'J','available',0,NULL,NULL),('F1008',6,'Economy',15,'A','available',0,NULL,NULL),('F1008',6,'Economy',15,'B','available',0,NULL,NULL),('F1008',6,'Economy',15,'C','available',0,NULL,NULL),('F1008',6,'Economy',15,'D','available',0,NULL,NULL),('F1008',6,'Economy',15,'E','available',0,NULL,NULL),('F1008',6,'Economy',15,'F','available',0,NULL,NULL),('F1008',6,'Economy',15,'G','available',0,NULL,NULL),('F1008',6,'Economy',15,'H','available',0,NULL,NULL),('F1008',6,'Economy',15,'I','available',0,NULL,NULL),('F1008',6,'Economy',15,'J','available',0,NULL,NULL),('F1009',4,'Economy',1,'A','available',0,NULL,NULL),('F1009',4,'Economy',1,'B','available',0,NULL,NULL),('F1009',4,'Economy',1,'C','available',0,NULL,NULL),('F1009',4,'Economy',1,'D','available',0,NULL,NULL),('F1009',4,'Economy',2,'A','available',0,NULL,NULL),('F1009',4,'Economy',2,'B','available',0,NULL,NULL),('F1009',4,'Economy',2,'C','available',0,NULL,NULL),('F1009',4,'Economy',2,'D','available',0,NULL,NULL),('F1009',4,'Economy',3,'A','available',0,NULL,NULL),('F1009',4,'Economy',3,'B','available',0,NULL,NULL),('F1009',4,'Economy',3,'C','available',0,NULL,NULL),('F1009',4,'Economy',3,'D','available',0,NULL,NULL),('F1009',4,'Economy',4,'A','available',0,NULL,NULL),('F1009',4,'Economy',4,'B','available',0,NULL,NULL),('F1009',4,'Economy',4,'C','available',0,NULL,NULL),('F1009',4,'Economy',4,'D','available',0,NULL,NULL),('F1009',4,'Economy',5,'A','available',0,NULL,NULL),('F1009',4,'Economy',5,'B','available',0,NULL,NULL),('F1009',4,'Economy',5,'C','available',0,NULL,NULL),('F1009',4,'Economy',5,'D','available',0,NULL,NULL),('F1009',4,'Economy',6,'A','available',0,NULL,NULL),('F1009',4,'Economy',6,'B','available',0,NULL,NULL),('F1009',4,'Economy',6,'C','available',0,NULL,NULL),('F1009',4,'Economy',6,'D','available',0,NULL,NULL),('F1009',4,'Economy',7,'A','available',0,NULL,NULL),('F1009',4,'Economy',7,'B','available',0,NULL,NULL),('F1009',4,'Economy',7,'C','available',0,NULL,NULL),('F1009',4,'Economy',7,'D','available',0,NULL,NULL),('F1009',4,'Economy',8,'A','available',0,NULL,NULL),('F1009',4,'Economy',8,'B','available',0,NULL,NULL),('F1009',4,'Economy',8,'C','available',0,NULL,NULL),('F1009',4,'Economy',8,'D','available',0,NULL,NULL),('F1009',4,'Economy',9,'A','available',0,NULL,NULL),('F1009',4,'Economy',9,'B','available',0,NULL,NULL),('F1009',4,'Economy',9,'C','available',0,NULL,NULL),('F1009',4,'Economy',9,'D','available',0,NULL,NULL),('F1009',4,'Economy',10,'A','available',0,NULL,NULL),('F1009',4,'Economy',10,'B','available',0,NULL,NULL),('F1009',4,'Economy',10,'C','available',0,NULL,NULL),('F1009',4,'Economy',10,'D','available',0,NULL,NULL),('F1010',5,'Business',1,'A','available',0,NULL,NULL),('F1010',5,'Business',1,'B','available',0,NULL,NULL),('F1010',5,'Business',1,'C','available',0,NULL,NULL),('F1010',5,'Business',1,'D','available',0,NULL,NULL),('F1010',5,'Business',2,'A','available',0,NULL,NULL),('F1010',5,'Business',2,'B','available',0,NULL,NULL),('F1010',5,'Business',2,'C','available',0,NULL,NULL),('F1010',5,'Business',2,'D','available',0,NULL,NULL),('F1010',5,'Business',3,'A','available',0,NULL,NULL),('F1010',5,'Business',3,'B','available',0,NULL,NULL),('F1010',5,'Business',3,'C','available',0,NULL,NULL),('F1010',5,'Business',3,'D','available',0,NULL,NULL),('F1010',5,'Economy',1,'A','available',0,NULL,NULL),('F1010',5,'Economy',1,'B','available',0,NULL,NULL),('F1010',5,'Economy',1,'C','available',0,NULL,NULL),('F1010',5,'Economy',1,'D','available',0,NULL,NULL),('F1010',5,'Economy',1,'E','available',0,NULL,NULL),('F1010',5,'Economy',1,'F','available',0,NULL,NULL),('F1010',5,'Economy',1,'G','available',0,NULL,NULL),('F1010',5,'Economy',1,'H','available',0,NULL,NULL),('F1010',5,'Economy',1,'I','available',0,NULL,NULL),('F1010',5,'Economy',2,'A','available',0,NULL,NULL),('F1010',5,'Economy',2,'B','available',0,NULL,NULL),('F1010',5,'Economy',2,'C','available',0,NULL,NULL),('F1010',5,'Economy',2,'D','available',0,NULL,NULL),('F1010',5,'Economy',2,'E','available',0,NULL,NULL),('F1010',5,'Economy',2,'F','available',0,NULL,NULL),('F1010',5,'Economy',2,'G','available',0,NULL,NULL),('F1010',5,'Economy',2,'H','available',0,NULL,NULL),('F1010',5,'Economy',2,'I','available',0,NULL,NULL),('F1010',5,'Economy',3,'A','available',0,NULL,NULL),('F1010',5,'Economy',3,'B','available',0,NULL,NULL),('F1010',5,'Economy',3,'C','available',0,NULL,NULL),('F1010',5,'Economy',3,'D','available',0,NULL,NULL),('F1010',5,'Economy',3,'E','available',0,NULL,NULL),('F1010',5,'Economy',3,'F','available',0,NULL,NULL),('F1010',5,'Economy',3,'G','available',0,NULL,NULL),('F1010',5,'Economy',3,'H','available',0,NULL,NULL),('F1010',5,'Economy',3,'I','available',0,NULL,NULL),('F1010',5,'Economy',4,'A','available',0,NULL,NULL),('F1010',5,'Economy',4,'B','available',0,NULL,NULL),('F1010',5,'Economy',4,'C','available',0,NULL,NULL),('F1010',5,'Economy',4,'D','available',0,NULL,NULL),('F1010',5,'Economy',4,'E','available',0,NULL,NULL),('F1010',5,'Economy',4,'F','available',0,NULL,NULL),('F1010',5,'Economy',4,'G','available',0,NULL,NULL),('F1010',5,'Economy',4,'H','available',0,NULL,NULL),('F1010',5,'Economy',4,'I','available',0,NULL,NULL),('F1010',5,'Economy',5,'A','available',0,NULL,NULL),('F1010',5,'Economy',5,'B','available',0,NULL,NULL),('F1010',5,'Economy',5,'C','available',0,NULL,NULL),('F1010',5,'Economy',5,'D','available',0,NULL,NULL),('F1010',5,'Economy',5,'E','available',0,NULL,NULL),('F1010',5,'Economy',5,'F','available',0,NULL,NULL),('F1010',5,'Economy',5,'G','available',0,NULL,NULL),('F1010',5,'Economy',5,'H','available',0,NULL,NULL),('F1010',5,'Economy',5,'I','available',0,NULL,NULL),('F1010',5,'Economy',6,'A','available',0,NULL,NULL),('F1010',5,'Economy',6,'B','available',0,NULL,NULL),('F1010',5,'Economy',6,'C','available',0,NULL,NULL),('F1010',5,'Economy',6,'D','available',0,NULL,NULL),('F1010',5,'Economy',6,'E','available',0,NULL,NULL),('F1010',5,'Economy',6,'F','available',0,NULL,NULL),('F1010',5,'Economy',6,'G','available',0,NULL,NULL),('F1010',5,'Economy',6,'H','available',0,NULL,NULL),('F1010',5,'Economy',6,'I','available',0,NULL,NULL),('F1010',5,'Economy',7,'A','available',0,NULL,NULL),('F1010',5,'Economy',7,'B','available',0,NULL,NULL),('F1010',5,'Economy',7,'C','available',0,NULL,NULL),('F1010',5,'Economy',7,'D','available',0,NULL,NULL),('F1010',5,'Economy',7,'E','available',0,NULL,NULL),('F1010',5,'Economy',7,'F','available',0,NULL,NULL),('F1010',5,'Economy',7,'G','available',0,NULL,NULL),('F1010',5,'Economy',7,'H','available',0,NULL,NULL),('F1010',5,'Economy',7,'I','available',0,NULL,NULL),('F1010',5,'Economy',8,'A','available',0,NULL,NULL),('F1010',5,'Economy',8,'B','available',0,NULL,NULL),('F1010',5,'Economy',8,'C','available',0,NULL,NULL),('F1010',5,'Economy',8,'D','available',0,NULL,NULL),('F1010',5,'Economy',8,'E','available',0,NULL,NULL),('F1010',5,'Economy',8,'F','available',0,NULL,NULL),('F1010',5,'Economy',8,'G','available',0,NULL,NULL),('F1010',5,'Economy',8,'H','available',0,NULL,NULL),('F1010',5,'Economy',8,'I','available',0,NULL,NULL),('F1010',5,'Economy',9,'A','available',0,NULL,NULL),('F1010',5,'Economy',9,'B','available',0,NULL,NULL),('F1010',5,'Economy',9,'C','available',0,NULL,NULL),('F1010',5,'Economy',9,'D','available',0,NULL,NULL),('F1010',5,'Economy',9,'E','available',0,NULL,NULL),('F1010',5,'Economy',9,'F','available',0,NULL,NULL),('F1010',5,'Economy',9,'G','available',0,NULL,NULL),('F1010',5,'Economy',9,'H','available',0,NULL,NULL),('F1010',5,'Economy',9,'I','available',0,NULL,NULL),('F1010',5,'Economy',10,'A','available',0,NULL,NULL),('F1010',5,'Economy',10,'B','available',0,NULL,NULL),('F1010',5,'Economy',10,'C','available',0,NULL,NULL),('F1010',5,'Economy',10,'D','available',0,NULL,NULL),('F1010',5,'Economy',10,'E','available',0,NULL,NULL),('F1010',5,'Economy',10,'F','available',0,NULL,NULL),('F1010',5,'Economy',10,'G','available',0,NULL,NULL),('F1010',5,'Economy',10,'H','available',0,NULL,NULL),('F1010',5,'Economy',10,'I','available',0,NULL,NULL),('F1010',5,'Economy',11,'A','available',0,NULL,NULL),('F1010',5,'Economy',11,'B','available',0,NULL,NULL),('F1010',5,'Economy',11,'C','available',0,NULL,NULL),('F1010',5,'Economy',11,'D','available',0,NULL,NULL),('F1010',5,'Economy',11,'E','available',0,NULL,NULL),('F1010',5,'Economy',11,'F','available',0,NULL,NULL),('F1010',5,'Economy',11,'G','available',0,NULL,NULL),('F1010',5,'Economy',11,'H','available',0,NULL,NULL),('F1010',5,'Economy',11,'I','available',0,NULL,NULL),('F1010',5,'Economy',12,'A','available',0,NULL,NULL),('F1010',5,'Economy',12,'B','available',0,NULL,NULL),('F1010',5,'Economy',12,'C','available',0,NULL,NULL),('F1010',5,'Economy',12,'D','available',0,NULL,NULL),('F1010',5,'Economy',12,'E','available',0,NULL,NULL),('F1010',5,'Economy',12,'F','available',0,NULL,NULL),('F1010',5,'Economy',12,'G','available',0,NULL,NULL),('F1010',5,'Economy',12,'H','available',0,NULL,NULL),('F1010',5,'Economy',12,'I','available',0,NULL,NULL),('F1010',5,'Economy',13,'A','available',0,NULL,NULL),('F1010',5,'Economy',13,'B','available',0,NULL,NULL),('F1010',5,'Economy',13,'C','available',0,NULL,NULL),('F1010',5,'Economy',13,'D','available',0,NULL,NULL),('F1010',5,'Economy',13,'E','available',0,NULL,NULL),('F1010',5,'Economy',13,'F','available',0,NULL,NULL),('F1010',5,'Economy',13,'G','available',0,NULL,NULL),('F1010',5,'Economy',13,'H','available',0,NULL,NULL),('F1010',5,'Economy',13,'I','available',0,NULL,NULL),('F1010',5,'Economy',14,'A','available',0,NULL,NULL),('F1010',5,'Economy',14,'B','available',0,NULL,NULL),('F1010',5,'Economy',14,'C','available',0,NULL,NULL),('F1010',5,'Economy',14,'D','available',0,NULL,NULL),('F1010',5,'Economy',14,'E','available',0,NULL,NULL),('F1010',5,'Economy',14,'F','available',0,NULL,NULL),('F1010',5,'Economy',14,'G','available',0,NULL,NULL),('F1010',5,'Economy',14,'H','available',0,NULL,NULL),('F1010',5,'Economy',14,'I','available',0,NULL,NULL),('F1010',5,'Economy',15,'A','available',0,NULL,NULL),('F1010',5,'Economy',15,'B','available',0,NULL,NULL),('F1010',5,'Economy',15,'C','available',0,NULL,NULL),('F1010',5,'Economy',15,'D','available',0,NULL,NULL),('F1010',5,'Economy',15,'E','available',0,NULL,NULL),('F1010',5,'Economy',15,'F','available',0,NULL,NULL),('F1010',5,'Economy',15,'G','available',0,NULL,NULL),('F1010',5,'Economy',15,'H','available',0,NULL,NULL),('F1010',5,'Economy',15,'I','available',0,NULL,NULL),('F1010',5,'Economy',16,'A','available',0,NULL,NULL),('F1010',5,'Economy',16,'B','available',0,NULL,NULL),('F1010',5,'Economy',16,'C','available',0,NULL,NULL),('F1010',5,'Economy',16,'D','available',0,NULL,NULL),('F1010',5,'Economy',16,'E','available',0,NULL,NULL),('F1010',5,'Economy',16,'F','available',0,NULL,NULL),('F1010',5,'Economy',16,'G','available',0,NULL,NULL),('F1010',5,'Economy',16,'H','available',0,NULL,NULL),('F1010',5,'Economy',16,'I','available',0,NULL,NULL),('F1010',5,'Economy',17,'A','available',0,NULL,NULL),('F1010',5,'Economy',17,'B','available',0,NULL,NULL),('F1010',5,'Economy',17,'C','available',0,NULL,NULL),('F1010',5,'Economy',17,'D','available',0,NULL,NULL),('F1010',5,'Economy',17,'E','available',0,NULL,NULL),('F1010',5,'Economy',17,'F','available',0,NULL,NULL),('F1010',5,'Economy',17,'G','available',0,NULL,NULL),('F1010',5,'Economy',17,'H','available',0,NULL,NULL),('F1010',5,'Economy',17,'I','available',0,NULL,NULL),('F1010',5,'Economy',18,'A','available',0,NULL,NULL),('F1010',5,'Economy',18,'B','available',0,NULL,NULL),('F1010',5,'Economy',18,'C','available',0,NULL,NULL),('F1010',5,'Economy',18,'D','available',0,NULL,NULL),('F1010',5,'Economy',18,'E','available',0,NULL,NULL),('F1010',5,'Economy',18,'F','available',0,NULL,NULL),('F1010',5,'Economy',18,'G','available',0,NULL,NULL),('F1010',5,'Economy',18,'H','available',0,NULL,NULL),('F1010',5,'Economy',18,'I','available',0,NULL,NULL),('F1010',5,'Economy',19,'A','available',0,NULL,NULL),('F1010',5,'Economy',19,'B','available',0,NULL,NULL),('F1010',5,'Economy',19,'C','available',0,NULL,NULL),('F1010',5,'Economy',19,'D','available',0,NULL,NULL),('F1010',5,'Economy',19,'E','available',0,NULL,NULL),('F1010',5,'Economy',19,'F','available',0,NULL,NULL),('F1010',5,'Economy',19,'G','available',0,NULL,NULL),('F1010',5,'Economy',19,'H','available',0,NULL,NULL),('F1010',5,'Economy',19,'I','available',0,NULL,NULL),('F1010',5,'Economy',20,'A','available',0,NULL,NULL),('F1010',5,'Economy',20,'B','available',0,NULL,NULL),('F1010',5,'Economy',20,'C','available',0,NULL,NULL),('F1010',5,'Economy',20,'D','available',0,NULL,NULL),('F1010',5,'Economy',20,'E','available',0,NULL,NULL),('F1010',5,'Economy',20,'F','available',0,NULL,NULL),('F1010',5,'Economy',20,'G','available',0,NULL,NULL),('F1010',5,'Economy',20,'H','available',0,NULL,NULL),('F1010',5,'Economy',20,'I','available',0,NULL,NULL),('F1011',5,'Business',1,'A','available',0,NULL,NULL),('F1011',5,'Business',1,'B','available',0,NULL,NULL),('F1011',5,'Business',1,'C','available',0,NULL,NULL),('F1011',5,'Business',1,'D','available',0,NULL,NULL),('F1011',5,'Business',2,'A','available',0,NULL,NULL),('F1011',5,'Business',2,'B','available',0,NULL,NULL),('F1011',5,'Business',2,'C','available',0,NULL,NULL),('F1011',5,'Business',2,'D','available',0,NULL,NULL),('F1011',5,'Business',3,'A','available',0,NULL,NULL),('F1011',5,'Business',3,'B','available',0,NULL,NULL),('F1011',5,'Business',3,'C','available',0,NULL,NULL),('F1011',5,'Business',3,'D','available',0,NULL,NULL),('F1011',5,'Economy',1,'A','available',0,NULL,NULL),('F1011',5,'Economy',1,'B','available',0,NULL,NULL),('F1011',5,'Economy',1,'C','available',0,NULL,NULL),('F1011',5,'Economy',1,'D','available',0,NULL,NULL),('F1011',5,'Economy',1,'E','available',0,NULL,NULL),('F1011',5,'Economy',1,'F','available',0,NULL,NULL),('F1011',5,'Economy',1,'G','available',0,NULL,NULL),('F1011',5,'Economy',1,'H','available',0,NULL,NULL),('F1011',5,'Economy',1,'I','available',0,NULL,NULL),('F1011',5,'Economy',2,'A','available',0,NULL,NULL),('F1011',5,'Economy',2,'B','available',0,NULL,NULL),('F1011',5,'Economy',2,'C','available',0,NULL,NULL),('F1011',5,'Economy',2,'D','available',0,NULL,NULL),('F1011',5,'Economy',2,'E','available',0,NULL,NULL),('F1011',5,'Economy',2,'F','available',0,NULL,NULL),('F1011',5,'Economy',2,'G','available',0,NULL,NULL),('F1011',5,'Economy',2,'H','available',0,NULL,NULL),('F1011',5,'Economy',2,'I','available',0,NULL,NULL),('F1011',5,'Economy',3,'A','available',0,NULL,NULL),('F1011',5,'Economy',3,'B','available',0,NULL,NULL),('F1011',5,'Economy',3,'C','available',0,NULL,NULL),('F1011',5,'Economy',3,'D','available',0,NULL,NULL),('F1011',5,'Economy',3,'E','available',0,NULL,NULL),('F1011',5,'Economy',3,'F','available',0,NULL,NULL),('F1011',5,'Economy',3,'G','available',0,NULL,NULL),('F1011',5,'Economy',3,'H','available',0,NULL,NULL),('F1011',5,'Economy',3,'I','available',0,NULL,NULL),('F1011',5,'Economy',4,'A','available',0,NULL,NULL),('F1011',5,'Economy',4,'B','available',0,NULL,NULL),('F1011',5,'Economy',4,'C','available',0,NULL,NULL),('F1011',5,'Economy',4,'D','available',0,NULL,NULL),('F1011',5,'Economy',4,'E','available',0,NULL,NULL),('F1011',5,'Economy',4,'F','available',0,NULL,NULL),('F1011',5,'Economy',4,'G','available',0,NULL,NULL),('F1011',5,'Economy',4,'H','available',0,NULL,NULL),('F1011',5,'Economy',4,'I','available',0,NULL,NULL),('F1011',5,'Economy',5,'A','available',0,NULL,NULL),('F1011',5,'Economy',5,'B','available',0,NULL,NULL),('F1011',5,'Economy',5,'C','available',0,NULL,NULL),('F1011',5,'Economy',5,'D','available',0,NULL,NULL),('F1011',5,'Economy',5,'E','available',0,NULL,NULL),('F1011',5,'Economy',5,'F','available',0,NULL,NULL),('F1011',5,'Economy',5,'G','available',0,NULL,NULL),('F1011',5,'Economy',5,'H','available',0,NULL,NULL),('F1011',5,'Economy',5,'I','available',0,NULL,NULL),('F1011',5,'Economy',6,'A','available',0,NULL,NULL),('F1011',5,'Economy',6,'B','available',0,NULL,NULL),('F1011',5,'Economy',6,'C','available',0,NULL,NULL),('F1011',5,'Economy',6,'D','available',0,NULL,NULL),('F1011',5,'Economy',6,'E','available',0,NULL,NULL),('F1011',5,'Economy',6,'F','available',0,NULL,NULL),('F1011',5,'Economy',6,'G','available',0,NULL,NULL),('F1011',5,'Economy',6,'H','available',0,NULL,NULL),('F1011',5,'Economy',6,'I','available',0,NULL,NULL),('F1011',5,'Economy',7,'A','available',0,NULL,NULL),('F1011',5,'Economy',7,'B','available',0,NULL,NULL),('F1011',5,'Economy',7,'C','available',0,NULL,NULL),('F1011',5,'Economy',7,'D','available',0,NULL,NULL),('F1011',5,'Economy',7,'E','available',0,NULL,NULL),('F1011',5,'Economy',7,'F','available',0,NULL,NULL),('F1011',5,'Economy',7,'G','available',0,NULL,NULL),('F1011',5,'Economy',7,'H','available',0,NULL,NULL),('F1011',5,'Economy',7,'I','available',0,NULL,NULL),('F1011',5,'Economy',8,'A','available',0,NULL,NULL),('F1011',5,'Economy',8,'B','available',0,NULL,NULL),('F1011',5,'Economy',8,'C','available',0,NULL,NULL),('F1011',5,'Economy',8,'D','available',0,NULL,NULL),('F1011',5,'Economy',8,'E','available',0,NULL,NULL),('F1011',5,'Economy',8,'F','available',0,NULL,NULL),('F1011',5,'Economy',8,'G','available',0,NULL,NULL),('F1011',5,'Economy',8,'H','available',0,NULL,NULL),('F1011',5,'Economy',8,'I','available',0,NULL,NULL),('F1011',5,'Economy',9,'A','available',0,NULL,NULL),('F1011',5,'Economy',9,'B','available',0,NULL,NULL),('F1011',5,'Economy',9,'C','available',0,NULL,NULL),('F1011',5,'Economy',9,'D','available',0,NULL,NULL),('F1011',5,'Economy',9,'E','available',0,NULL,NULL),('F1011',5,'Economy',9,'F','available',0,NULL,NULL),('F1011',5,'Economy',9,'G','available',0,NULL,NULL),('F1011',5,'Economy',9,'H','available',0,NULL,NULL),('F1011',5,'Economy',9,'I','available',0,NULL,NULL),('F1011',5,'Economy',10,'A','available',0,NULL,NULL),('F1011',5,'Economy',10,'B','available',0,NULL,NULL),('F1011',5,'Economy',10,'C','available',0,NULL,NULL),('F1011',5,'Economy',10,'D','available',0,NULL,NULL),('F1011',5,'Economy',10,'E','available',0,NULL,NULL),('F1011',5,'Economy',10,'F','available',0,NULL,NULL),('F1011',5,'Economy',10,'G','available',0,NULL,NULL),('F1011',5,'Economy',10,'H','available',0,NULL,NULL),('F1011',5,'Economy',10,'I','available',0,NULL,NULL),('F1011',5,'Economy',11,'A','available',0,NULL,NULL),('F1011',5,'Economy',11,'B','available',0,NULL,NULL),('F1011',5,'Economy',11,'C','available',0,NULL,NULL),('F1011',5,'Economy',11,'D','available',0,NULL,NULL),('F1011',5,'Economy',11,'E','available',0,NULL,NULL),('F1011',5,'Economy',11,'F','available',0,NULL,NULL),('F1011',5,'Economy',11,'G','available',0,NULL,NULL),('F1011',5,'Economy',11,'H','available',0,NULL,NULL),('F1011',5,'Economy',11,'I','available',0,NULL,NULL),('F1011',5,'Economy',12,'A','available',0,NULL,NULL),('F1011',5,'Economy',12,'B','available',0,NULL,NULL),('F1011',5,'Economy',12,'C','available',0,NULL,NULL),('F1011',5,'Economy',12,'D','available',0,NULL,NULL),('F1011',5,'Economy',12,'E','available',0,NULL,NULL),('F1011',5,'Economy',12,'F','available',0,NULL,NULL),('F1011',5,'Economy',12,'G','available',0,NULL,NULL),('F1011',5,'Economy',12,'H','available',0,NULL,NULL),('F1011',5,'Economy',12,'I','available',0,NULL,NULL),('F1011',5,'Economy',13,'A','available',0,NULL,NULL),('F1011',5,'Economy',13,'B','available',0,NULL,NULL),('F1011',5,'Economy',13,'C','available',0,NULL,NULL),('F1011',5,'Economy',13,'D','available',0,NULL,NULL),('F1011',5,'Economy',13,'E','available',0,NULL,NULL),('F1011',5,'Economy',13,'F','available',0,NULL,NULL),('F1011',5,'Economy',13,'G','available',0,NULL,NULL),('F1011',5,'Economy',13,'H','available',0,NULL,NULL),('F1011',5,'Economy',13,'I','available',0,NULL,NULL),('F1011',5,'Economy',14,'A','available',0,NULL,NULL),('F1011',5,'Economy',14,'B','available',0,NULL,NULL),('F1011',5,'Economy',14,'C','available',0,NULL,NULL),('F1011',5,'Economy',14,'D','available',0,NULL,NULL),('F1011',5,'Economy',14,'E','available',0,NULL,NULL),('F1011',5,'Economy',14,'F','available',0,NULL,NULL),('F1011',5,'Economy',14,'G','available',0,NULL,NULL),('F1011',5,'Economy',14,'H','available',0,NULL,NULL),('F1011',5,'Economy',14,'I','available',0,NULL,NULL),('F1011',5,'Economy',15,'A','available',0,NULL,NULL),('F1011',5,'Economy',15,'B','available',0,NULL,NULL),('F1011',5,'Economy',15,'C','available',0,NULL,NULL),('F1011',5,'Economy',15,'D','available',0,NULL,NULL),('F1011',5,'Economy',15,'E','available',0,NULL,NULL),('F1011',5,'Economy',15,'F','available',0,NULL,NULL),('F1011',5,'Economy',15,'G','available',0,NULL,NULL),('F1011',5,'Economy',15,'H','available',0,NULL,NULL),('F1011',5,'Economy',15,'I','available',0,NULL,NULL),('F1011',5,'Economy',16,'A','available',0,NULL,NULL),('F1011',5,'Economy',16,'B','available',0,NULL,NULL),('F1011',5,'Economy',16,'C','available',0,NULL,NULL),('F1011',5,'Economy',16,'D','available',0,NULL,NULL),('F1011',5,'Economy',16,'E','available',0,NULL,NULL),('F1011',5,'Economy',16,'F','available',0,NULL,NULL),('F1011',5,'Economy',16,'G','available',0,NULL,NULL),('F1011',5,'Economy',16,'H','available',0,NULL,NULL),('F1011',5,'Economy',16,'I','available',0,NULL,NULL),('F1011',5,'Economy',17,'A','available',0,NULL,NULL),('F1011',5,'Economy',17,'B','available',0,NULL,NULL),('F1011',5,'Economy',17,'C','available',0,NULL,NULL),('F1011',5,'Economy',17,'D','available',0,NULL,NULL),('F1011',5,'Economy',17,'E','available',0,NULL,NULL),('F1011',5,'Economy',17,'F','available',0,NULL,NULL),('F1011',5,'Economy',17,'G','available',0,NULL,NULL),('F1011',5,'Economy',17,'H','available',0,NULL,NULL),('F1011',5,'Economy',17,'I','available',0,NULL,NULL),('F1011',5,'Economy',18,'A','available',0,NULL,NULL),('F1011',5,'Economy',18,'B','available',0,NULL,NULL),('F1011',5,'Economy',18,'C','available',0,NULL,NULL),('F1011',5,'Economy',18,'D','available',0,NULL,NULL),('F1011',5,'Economy',18,'E','available',0,NULL,NULL),('F1011',5,'Economy',18,'F','available',0,NULL,NULL),('F1011',5,'Economy',18,'G','available',0,NULL,NULL),('F1011',5,'Economy',18,'H','available',0,NULL,NULL),('F1011',5,'Economy',18,'I','available',0,NULL,NULL),('F1011',5,'Economy',19,'A','available',0,NULL,NULL),('F1011',5,'Economy',19,'B','available',0,NULL,NULL),('F1011',5,'Economy',19,'C','available',0,NULL,NULL),('F1011',5,'Economy',19,'D','available',0,NULL,NULL),('F1011',5,'Economy',19,'E','available',0,NULL,NULL),('F1011',5,'Economy',19,'F','available',0,NULL,NULL),('F1011',5,'Economy',19,'G','available',0,NULL,NULL),('F1011',5,'Economy',19,'H','available',0,NULL,NULL),('F1011',5,'Economy',19,'I','available',0,NULL,NULL),('F1011',5,'Economy',20,'A','available',0,NULL,NULL),('F1011',5,'Economy',20,'B','available',0,NULL,NULL),('F1011',5,'Economy',20,'C','available',0,NULL,NULL),('F1011',5,'Economy',20,'D','available',0,NULL,NULL),('F1011',5,'Economy',20,'E','available',0,NULL,NULL),('F1011',5,'Economy',20,'F','available',0,NULL,NULL),('F1011',5,'Economy',20,'G','available',0,NULL,NULL),('F1011',5,'Economy',20,'H','available',0,NULL,NULL),('F1011',5,'Economy',20,'I','available',0,NULL,NULL);
 /*!40000 ALTER TABLE `flight_seat` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -251,6 +313,20 @@ INSERT INTO `flight_worker` VALUES ('3',2101),('4',2101),('5',2101),('F1005',210
 /*!40000 ALTER TABLE `flight_worker` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `maintenance_state`
+--
+
+DROP TABLE IF EXISTS `maintenance_state`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `maintenance_state` (
+  `name` varchar(50) NOT NULL,
+  `watermark` datetime DEFAULT NULL,
+  PRIMARY KEY (`name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `managers`
 --
@@ -323,8 +399,13 @@ CREATE TABLE `orders` (
   `status` varchar(30) DEFAULT NULL,
   `total_paid` decimal(10,2) DEFAULT NULL,
   `cancellation_fee` decimal(10,2) DEFAULT NULL,
+  `idempotency_key` varchar(64) DEFAULT NULL,
+  `request_hash` char(64) DEFAULT NULL,
+  `seats_count` int NOT NULL DEFAULT '0',
   PRIMARY KEY (`order_id`),
-  KEY `email` (`email`),
+  UNIQUE KEY `order_idempotency_key` (`email`,`idempotency_key`),
+  KEY `order_history` (`email`,`order_date`),
+  KEY `order_history_status` (`email`,`status`,`order_date`),
   KEY `flight_num` (`flight_num`),
   CONSTRAINT `orders_ibfk_1` FOREIGN KEY (`email`) REFERENCES `users` (`email`),
   CONSTRAINT `orders_ibfk_2` FOREIGN KEY (`flight_num`) REFERENCES `flight` (`flight_num`)
@@ -337,7 +418,7 @@ CREATE TABLE `orders` (
 
 LOCK TABLES `orders` WRITE;
 /*!40000 ALTER TABLE `orders` DISABLE KEYS */;
-INSERT INTO `orders` VALUES (5001,'noa.reg1@flytau.com','F1001','2026-01-02','customer cancellation',0.00,0.00),(5002,'yuval.reg2@flytau.com','F1003','2026-01-02','Active',1900.00,0.00),(5003,'sagi@flytau.com','F1004','2026-01-02','customer cancellation',660.00,33.00),(5004,'ronnie@flytau.com','F1006','2026-01-02','customer cancellation',2600.00,130.00),(5005,'ronnie@1','1','2026-01-13','system cancellation',0.00,0.00),(5006,'ronnie@1','1','2026-01-13','system cancellation',0.00,0.00),(5007,'ronnie@1','1','2026-01-13','system cancellation',0.00,0.00),(5008,'ronnie@1','1','2026-01-13','system cancellation',0.00,0.00),(5009,'ronnie@1','1','2026-01-13','system cancellation',0.00,0.00),(5010,'yuval@3','1','2026-01-13','system cancellation',666.00,0.00),(5011,'sagi@5','4','2026-01-13','system cancellation',0.00,0.00),(5012,'Yael@20','F1001','2026-01-13','Active',18.00,0.00),(5013,'noa.reg1@flytau.com','F1001','2026-01-14','customer cancellation',27.00,0.00),(5014,'noa.reg1@flytau.com','4','2026-01-17','customer cancellation',390.00,0.00),(5015,'noa.reg1@flytau.com','F1001','2026-01-17','customer cancellation',0.00,0.00),(5016,'yoav@600','F1006','2026-01-17','Active',5200.00,260.00),(5017,'yuval@44','2','2026-01-20','system cancellation',0.00,0.00);
+INSERT INTO `orders` VALUES (5001,'noa.reg1@flytau.com','F1001','2026-01-02','customer cancellation',0.00,0.00,NULL,NULL,0),(5002,'yuval.reg2@flytau.com','F1003','2026-01-02','Active',1900.00,0.00,NULL,NULL,1),(5003,'sagi@flytau.com','F1004','2026-01-02','customer cancellation',660.00,33.00,NULL,NULL,0),(5004,'ronnie@flytau.com','F1006','2026-01-02','customer cancellation',2600.00,130.00,NULL,NULL,0),(5005,'ronnie@1','1','2026-01-13','system cancellation',0.00,0.00,NULL,NULL,0),(5006,'ronnie@1','1','2026-01-13','system cancellation',0.00,0.00,NULL,NULL,0),(5007,'ronnie@1','1','2026-01-13','system cancellation',0.00,0.00,NULL,NULL,0),(5008,'ronnie@1','1','2026-01-13','system cancellation',0.00,0.00,NULL,NULL,0),(5009,'ronnie@1','1','2026-01-13','system cancellation',0.00,0.00,NULL,NULL,0),(5010,'yuval@3','1','2026-01-13','system cancellation',666.00,0.00,NULL,NULL,0),(5011,'sagi@5','4','2026-01-13','system cancellation',0.00,0.00,NULL,NULL,0),(5012,'Yael@20','F1001','2026-01-13','Active',18.00,0.00,NULL,NULL,2),(5013,'noa.reg1@flytau.com','F1001','2026-01-14','customer cancellation',27.00,0.00,NULL,NULL,0),(5014,'noa.reg1@flytau.com','4','2026-01-17','customer cancellation',390.00,0.00,NULL,NULL,0),(5015,'noa.reg1@flytau.com','F1001','2026-01-17','customer cancellation',0.00,0.00,NULL,NULL,0),(5016,'yoav@600','F1006','2026-01-17','Active',5200.00,260.00,NULL,NULL,4),(5017,'yuval@44','2','2026-01-20','system cancellation',0.00,0.00,NULL,NULL,0);
 /*!40000 ALTER TABLE `orders` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -391,6 +472,31 @@ INSERT INTO `routes` VALUES ('ACC','LOS',60),('ADD','NBO',120),('AKL','SYD',185)
 /*!40000 ALTER TABLE `routes` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `schema_migrations`
+--
+
+DROP TABLE IF EXISTS `schema_migrations`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `schema_migrations` (
+  `version` int NOT NULL,
+  `name` varchar(100) NOT NULL,
+  `applied_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`version`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `schema_migrations`
+--
+
+LOCK TABLES `schema_migrations` WRITE;
+/*!40000 ALTER TABLE `schema_migrations` DISABLE KEYS */;
+INSERT INTO `schema_migrations` VALUES (1,'maintenance_state','2026-01-20 23:09:15'),(2,'flight_inventory','2026-01-20 23:09:15'),(3,'flight_search_index','2026-01-20 23:09:15'),(4,'seat_version','2026-01-20 23:09:15'),(5,'seat_hold','2026-01-20 23:09:15'),(6,'order_idempotency_key','2026-01-20 23:09:15'),(7,'order_seats_count','2026-01-20 23:09:15'),(8,'flight_departure_index','2026-01-20 23:09:15'),(9,'disruption_job','2026-01-20 23:09:15');
+/*!40000 ALTER TABLE `schema_migrations` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `seat_position`
 --
@@ -0,0 +1,91 @@
+import argparse
+import threading
+import time
+from booking import BookingService
+from utils import UserService
+from stress_booking import verify
+
+#run against a local copy of the database only - it books and then cancels real orders
+
+
+def book_orders(flight_num, orders, seats_per_order, class_type, email):
+    """
+    :return: order ids of the booked orders (stops when the class is full)
+    """
+    guest = {"first_name": "Bench", "last_name": "Cancel", "phone_num": "0500000000"}
+    order_ids = []
+    for _ in range(orders):
+        try:
+            result = BookingService.book_group(flight_num, email, class_type=class_type, count=seats_per_order,
+                                               guest=guest)
+        except ValueError as e:
+            print("booking stopped:", e)
+            break
+        order_ids.append(result["order_id"])
+    return order_ids
+
+
+def cancel_worker(order_ids, batch, email, results, lock):
+    for i in range(0, len(order_ids), batch):
+        chunk = order_ids[i:i + batch]
+        start = time.perf_counter()
+        try:
+            cancelled = UserService.cancel_orders(chunk, email)
+            outcome = "cancelled"
+        except Exception as e:
+            cancelled = 0
+            outcome = "errors"
+            print("cancel error:", repr(e))
+        with lock:
+            results[outcome] += cancelled if outcome == "cancelled" else 1
+            results["latencies"].append(time.perf_counter() - start)
+
+
+def main():
+    """
+    python bench_cancel.py --flight F12 [--orders 200] [--seats 2] [--threads 8] [--batch 1]
+    mass-cancellation event: book --orders orders on the flight, then cancel them all from --threads threads,
+    --batch orders per cancel_orders() call (one transaction each)
+    """
+    parser = argparse.ArgumentParser(description="order cancellation throughput benchmark (local database only)")
+    parser.add_argument("--flight", required=True, help="flight number to book and cancel on")
+    parser.add_argument("--orders", type=int, default=200)
+    parser.add_argument("--seats", type=int, default=2, help="seats per order")
+    parser.add_argument("--class", dest="class_type", default="Economy")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=1, help="orders cancelled per transaction")
+    parser.add_argument("--email", default="bench-cancel@flytau.test")
+    args = parser.parse_args()
+
+    order_ids = book_orders(args.flight, args.orders, args.seats, args.class_type, args.email)
+    if not order_ids:
+        print("no orders booked")
+        return
+
+    results = {"cancelled": 0, "errors": 0, "latencies": []}
+    lock = threading.Lock()
+    shares = [order_ids[i::args.threads] for i in range(args.threads)]
+    threads = [threading.Thread(target=cancel_worker, args=(share, args.batch, args.email, results, lock))
+               for share in shares if share]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(results["latencies"])
+    p95 = latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0
+    print(f"{len(order_ids)} orders x {args.seats} seats, {len(threads)} threads, batch {args.batch}: {elapsed:.2f}s")
+    print(f"cancelled {results['cancelled']}  errors {results['errors']}")
+    print(f"{results['cancelled'] / elapsed:.1f} orders/s  {results['cancelled'] * args.seats / elapsed:.1f} seats/s"
+          f"  p95 {1000 * p95:.1f} ms per transaction")
+
+    checks = verify(args.flight)
+    for name, count in checks.items():
+        print(f"{name}: {count}")
+    print("OK - seats and inventory consistent" if not any(checks.values()) else "FAILED - inconsistent seats")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import argparse
+import contextlib
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+import exports
+from exports import ExportService, ALL_ORDER_COLUMNS, _encode
+
+STATUSES = ("active", "completed", "customer cancellation", "system cancellation")
+
+
+def make_row(order_id, rnd):
+    """
+    :return: one synthetic EXPORT_ALL_ORDERS row
+    """
+    departure = datetime(2026, 1, 1) + timedelta(minutes=rnd.randrange(365 * 24 * 60))
+    return (order_id, f"customer{order_id % 5000}@example.com", departure.date() - timedelta(days=rnd.randint(1, 90)),
+            rnd.choice(STATUSES), Decimal(rnd.randint(100, 5000)) / 4, Decimal(0), rnd.randint(1, 6),
+            f"FT{order_id % 9000:04d}", "TLV", "JFK", departure, "active")
+
+
+class SyntheticCursor:
+    """
+    Stands in for the unbuffered cursor: rows are made on fetchmany(), so the rows held at any time are
+    the current batch only - the same as a server-side MySQL cursor.
+    """
+    def __init__(self, rows, seed=0):
+        self._rnd = random.Random(seed)
+        self._left = rows
+        self._next_id = 1
+
+    def execute(self, query, params):
+        pass
+
+    def fetchmany(self, size):
+        n = min(size, self._left)
+        self._left -= n
+        self._next_id += n
+        return [make_row(order_id, self._rnd) for order_id in range(self._next_id - n, self._next_id)]
+
+    def fetchall(self):
+        return self.fetchmany(self._left)
+
+
+def streamed(rows, fmt):
+    """
+    ExportService.all_orders read through the synthetic cursor, chunks written to nowhere
+    :return: (bytes sent, rows)
+    """
+    exports.stream_cursor = lambda: contextlib.nullcontext(SyntheticCursor(rows))
+    sent = sum(len(chunk) for chunk in ExportService.all_orders(fmt))
+    return sent, rows
+
+
+def buffered(rows, fmt):
+    """
+    baseline: fetch every row, then build the whole response body
+    """
+    body = "".join(_encode(ALL_ORDER_COLUMNS, [SyntheticCursor(rows).fetchall()], fmt))
+    return len(body), rows
+
+
+def measure(fn, *args):
+    """
+    :return: (result, seconds, peak traced memory in KiB)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak / 1024
+
+
+def main():
+    """
+    python bench_export.py [--rows N,N,...] [--batch N] [--no-baseline]
+    """
+    parser = argparse.ArgumentParser(description="streaming export memory benchmark")
+    parser.add_argument("--rows", default="1000,20000,200000", help="comma separated row counts")
+    parser.add_argument("--batch", type=int, default=exports.EXPORT_BATCH, help="rows per fetch (FLYTAU_EXPORT_BATCH)")
+    parser.add_argument("--no-baseline", action="store_true", help="skip the fetch-everything baseline")
+    args = parser.parse_args()
+    exports.EXPORT_BATCH = args.batch
+
+    print(f"python-side memory only (tracemalloc): the MySQL driver's own buffers are not traced, batch {args.batch}")
+    print(f"{'format':<8}{'rows':>8}{'MiB sent':>10}{'stream s':>10}{'stream KiB':>12}{'buffered s':>12}{'buffered KiB':>14}")
+    for fmt in exports.EXPORT_FORMATS:
+        for rows in (int(n) for n in args.rows.split(",")):
+            (sent, _), seconds, peak = measure(streamed, rows, fmt)
+            line = f"{fmt:<8}{rows:>8}{sent / 2 ** 20:>10.1f}{seconds:>10.2f}{peak:>12.1f}"
+            if not args.no_baseline:
+                (old_sent, _), old_seconds, old_peak = measure(buffered, rows, fmt)
+                assert old_sent == sent
+                line += f"{old_seconds:>12.2f}{old_peak:>14.1f}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
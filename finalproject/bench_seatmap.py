@@ -0,0 +1,120 @@
+import argparse
+import random
+import timeit
+import tracemalloc
+from seatmap import SeatLayout, SeatMap
+
+#layouts to compare: name -> list of (class_type, rows, cols)
+LAYOUTS = {
+    "small": [("Economy", 20, 6)],
+    "big": [("Business", 8, 4), ("Economy", 40, 9)],
+    "very large": [("Business", 16, 6), ("Economy", 90, 10)],
+}
+
+
+def build_seat_classes(rows):
+    """
+    the previous seat map builder (dict per seat), kept here as the baseline
+    """
+    classes = {}
+
+    for class_type, r, c, status, price in rows:
+        cls = classes.setdefault(class_type, {
+            "price": (float(price) if price is not None else None),
+            "cols": set(),
+            "grid": {}
+        })
+
+        if cls["price"] is None and price is not None:
+            cls["price"] = float(price)
+
+        cls["cols"].add(c)
+        cls["grid"].setdefault(r, {})[c] = {"status": status}
+
+    for ct in classes:
+        classes[ct]["cols"] = sorted(classes[ct]["cols"])
+        classes[ct]["rows"] = sorted(classes[ct]["grid"].keys())
+
+    order_pref = {"Business": 0, "Economy": 1}
+    return sorted(classes.items(), key=lambda kv: order_pref.get(kv[0], 999))
+
+
+def make_flight(spec, taken_ratio, seed=0):
+    """
+    :return: (layout seats, SEAT_MAP-style rows, taken seats, prices) of a synthetic flight
+    """
+    rnd = random.Random(seed)
+    prices = {"Business": 1200.0, "Economy": 350.0}
+    seats, rows, taken = [], [], []
+    for class_type, n_rows, n_cols in spec:
+        for r in range(1, n_rows + 1):
+            for c in "ABCDEFGHJK"[:n_cols]:
+                is_taken = rnd.random() < taken_ratio
+                seats.append((class_type, r, c))
+                rows.append((class_type, r, c, "TAKEN" if is_taken else "AVAILABLE", prices[class_type]))
+                if is_taken:
+                    taken.append((class_type, r, c))
+    return seats, rows, taken, prices
+
+
+def render_dicts(rows):
+    """
+    build + walk the seat map the way seats.html does (previous implementation)
+    """
+    free = 0
+    for class_type, info in build_seat_classes(rows):
+        for r in info["rows"]:
+            for c in info["cols"]:
+                seat = info["grid"].get(r, {}).get(c)
+                if seat and seat["status"] != "TAKEN":
+                    free += 1
+    return free
+
+
+def render_compact(layout, taken, prices):
+    """
+    build + walk the seat map the way seats.html does (cached layout + status bytes)
+    """
+    seat_map = SeatMap(layout, layout.status(taken), prices)
+    free = 0
+    for class_type, info in seat_map.classes():
+        for r in info.rows:
+            for c in info.cols:
+                seat = info.grid.get(r, {}).get(c)
+                if seat and seat["status"] != "TAKEN":
+                    free += 1
+    return free
+
+
+def peak_kib(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    """
+    python bench_seatmap.py [--number N] [--taken RATIO]
+    """
+    parser = argparse.ArgumentParser(description="seat map builder micro-benchmark")
+    parser.add_argument("--number", type=int, default=200, help="renders per measurement")
+    parser.add_argument("--taken", type=float, default=0.3, help="share of taken seats")
+    args = parser.parse_args()
+
+    print(f"{'layout':<12}{'seats':>7}{'dicts us':>12}{'compact us':>12}{'speedup':>9}{'dicts KiB':>11}{'compact KiB':>13}")
+    for name, spec in LAYOUTS.items():
+        seats, rows, taken, prices = make_flight(spec, args.taken)
+        layout = SeatLayout(1, seats)
+        assert render_dicts(rows) == render_compact(layout, taken, prices)
+
+        old = min(timeit.repeat(lambda: render_dicts(rows), number=args.number, repeat=5)) / args.number
+        new = min(timeit.repeat(lambda: render_compact(layout, taken, prices), number=args.number, repeat=5)) / args.number
+        old_mem = peak_kib(lambda: build_seat_classes(rows))
+        new_mem = peak_kib(lambda: SeatMap(layout, layout.status(taken), prices).classes())
+        print(f"{name:<12}{len(seats):>7}{old * 1e6:>12.1f}{new * 1e6:>12.1f}{old / new:>8.1f}x{old_mem:>11.1f}{new_mem:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from cache import RouteGraph
+from timetable import Timetable, MAX_STOPS, MIN_CONNECTION_MINUTES, MAX_CONNECTION_MINUTES
+
+#first day of the synthetic timetable
+START = datetime(2030, 1, 1)
+
+
+def make_network(airports, hubs, flights, days, seed=0):
+    """
+    a few hubs connected to every airport, spokes connected to the hubs and to a few other spokes
+    :return: (routes rows, timetable rows) of a synthetic network
+    """
+    rnd = random.Random(seed)
+    names = [f"A{i:03d}" for i in range(airports)]
+    routes = {}
+    for i, hub in enumerate(names[:hubs]):
+        for other in names[i + 1:]:
+            routes[(hub, other)] = rnd.randint(60, 300)
+    for spoke in names[hubs:]:
+        for other in rnd.sample(names[hubs:], 3):
+            if other != spoke and (other, spoke) not in routes:
+                routes[(spoke, other)] = rnd.randint(60, 240)
+
+    pairs = list(routes)
+    rows = []
+    for n in range(flights):
+        a, b = rnd.choice(pairs)
+        if rnd.random() < 0.5:
+            a, b = b, a
+        #hub routes get most of the traffic
+        if names.index(a) >= hubs and names.index(b) >= hubs and rnd.random() < 0.7:
+            continue
+        dep = START + timedelta(minutes=rnd.randrange(days * 24 * 60))
+        duration = routes.get((a, b)) or routes[(b, a)]
+        rows.append((f"F{n}", a, b, dep, dep + timedelta(minutes=duration), rnd.randint(0, 200)))
+    return [(a, b, d) for (a, b), d in routes.items()], rows
+
+
+def exhaustive_search(tt, origin, destination, day_start, day_end, passengers=1, max_stops=MAX_STOPS, limit=20):
+    """
+    the previous itinerary search (enumerate every path, then sort), kept here as the baseline
+    """
+    max_legs = max_stops + 1
+    hops = tt._hops_to(destination, max_legs)
+    if origin not in hops:
+        return []
+    min_gap = timedelta(minutes=MIN_CONNECTION_MINUTES)
+    max_gap = timedelta(minutes=MAX_CONNECTION_MINUTES)
+    found = []
+
+    def extend(path, airport, earliest, latest):
+        legs_left = max_legs - len(path)
+        for leg in tt._departures(airport, earliest, latest, passengers):
+            if leg.destination == destination:
+                found.append(path + [leg])
+            elif legs_left > 1 and hops.get(leg.destination, max_legs) < legs_left \
+                    and all(p.origin != leg.destination for p in path):
+                extend(path + [leg], leg.destination, leg.arr + min_gap, leg.arr + max_gap)
+
+    extend([], origin, day_start, day_end)
+    found.sort(key=lambda legs: (legs[-1].arr, len(legs), legs[0].dep))
+    return found[:limit]
+
+
+def timed(fn, queries):
+    start = time.perf_counter()
+    results = [fn(*q) for q in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def main():
+    """
+    python bench_timetable.py [--flights N] [--airports N] [--hubs N] [--days N] [--searches N]
+    """
+    parser = argparse.ArgumentParser(description="connecting itinerary search micro-benchmark")
+    parser.add_argument("--flights", type=int, default=200000)
+    parser.add_argument("--airports", type=int, default=80)
+    parser.add_argument("--hubs", type=int, default=5)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--searches", type=int, default=20, help="searches per measurement")
+    parser.add_argument("--no-baseline", action="store_true", help="skip the exhaustive search")
+    args = parser.parse_args()
+
+    routes, rows = make_network(args.airports, args.hubs, args.flights, args.days)
+    graph = RouteGraph(lambda: routes, lambda: 1)
+    tt = Timetable(lambda: rows, lambda flight_num: None, graph)
+    start = time.perf_counter()
+    tt._ensure_fresh()
+    print(f"{len(rows)} flights, {len(graph.airports())} airports, {len(routes)} routes,"
+          f" index built in {1000 * (time.perf_counter() - start):.0f} ms")
+
+    rnd = random.Random(1)
+    spokes = graph.airports()[args.hubs:]
+    queries = []
+    for _ in range(args.searches):
+        origin, destination = rnd.sample(spokes, 2)
+        day = START + timedelta(days=rnd.randrange(args.days - 3))
+        queries.append((origin, destination, day, day + timedelta(days=1)))
+
+    new, new_results = timed(tt.search, queries)
+    print(f"best-first   {1000 * new:10.2f} ms per search")
+    if args.no_baseline:
+        return
+    old, old_results = timed(lambda *q: exhaustive_search(tt, *q), queries)
+    print(f"exhaustive   {1000 * old:10.2f} ms per search   speedup {old / new:.1f}x")
+    same = sum([legs[-1].arr for legs in a] == [legs[-1].arr for legs in b] for a, b in zip(new_results, old_results))
+    print(f"same arrival times as the exhaustive search: {same}/{len(queries)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import hashlib
+import os
+from datetime import date
+from mysql.connector import errorcode, IntegrityError
+import queries
+from utils import db_cur, transaction, next_seat_version, invalidate_flight_search
+from events import seat_events
+from holds import seat_key
+
+#group booking settings (can be overridden by env variables)
+MAX_GROUP_SEATS = int(os.environ.get("FLYTAU_MAX_GROUP_SEATS", 1000))
+ORDER_SEAT_BATCH = int(os.environ.get("FLYTAU_ORDER_SEAT_BATCH", 250))
+
+
+def _seat_tuples(n: int):
+    """
+    :return: row-constructor list "(%s,%s,%s,%s,%s), ..." for n seats (full flight_seat primary key)
+    """
+    return ", ".join(["(%s,%s,%s,%s,%s)"] * n)
+
+
+def _request_hash(flight_num: str, seats, class_type: str | None, count: int | None):
+    """
+    :return: sha256 (hex) of what is booked - the flight and the seats (or class and count)
+    """
+    if seats is not None:
+        what = ",".join(sorted({f"{ct}|{int(rn)}|{cl}" for ct, rn, cl in seats}))
+    else:
+        what = f"{class_type}*{count}"
+    return hashlib.sha256(f"{flight_num}\n{what}".encode()).hexdigest()
+
+
+class IdempotencyKeyReused(ValueError):
+    """the idempotency key already has an order for a different flight or seats"""
+    def __init__(self):
+        super().__init__("This idempotency key was already used for a different booking.")
+
+
+class _Replayed(Exception):
+    """the idempotency key already has an order - leave the transaction without booking"""
+    def __init__(self, order_id):
+        super().__init__(order_id)
+        self.order_id = order_id
+
+
+class BookingService:
+    """Seat booking: one transaction per order, seats locked by primary key."""
+    @staticmethod
+    def book_seats(flight_num: str, email: str, seats, hold_token: str | None = None, guest: dict | None = None,
+                   idempotency_key: str | None = None):
+        """
+        book the chosen seats
+        :param seats: list of (class_type, row_num, column_letter)
+        :param hold_token: the session's hold token - seats it holds can be booked
+        :param guest: dict (first_name, last_name, phone_num) for guest orders
+        :param idempotency_key: token of the submission - a replay returns the original order
+        :raise IdempotencyKeyReused: if the key already has an order for other seats
+        :raise ValueError: if the flight or a seat can't be booked
+        :return: the order_id (new, or the original one for a replay)
+        """
+        return BookingService._book(flight_num, email, seats=seats, hold_token=hold_token, guest=guest,
+                                    idempotency_key=idempotency_key)["order_id"]
+
+    @staticmethod
+    def find_by_idempotency_key(email: str, idempotency_key: str):
+        """
+        :return: (order_id, request_hash) of the customer's order created with this key, or None
+        """
+        with db_cur() as cursor:
+            cursor.execute(queries.ORDER_BY_IDEMPOTENCY_KEY, (email, idempotency_key))
+            return cursor.fetchone()
+
+    @staticmethod
+    def book_group(flight_num: str, email: str, seats=None, class_type: str | None = None, count: int | None = None,
+                   guest: dict | None = None, idempotency_key: str | None = None):
+        """
+        group / charter booking of a large seat block, in one order
+        :param seats: list of (class_type, row_num, column_letter), or None to book by count
+        :param class_type: with count - book the first `count` free seats of this class
+        :param idempotency_key: token of the submission - a replay returns the original order
+        :raise IdempotencyKeyReused: if the key already has an order for other seats
+        :raise ValueError: if the flight or a seat can't be booked
+        :return: dict (order_id, seats, total_paid, replayed)
+        """
+        if seats is None and (not class_type or not count or count < 1):
+            raise ValueError("Choose seats, or a class and a number of seats.")
+        size = len(seats) if seats is not None else count
+        if size > MAX_GROUP_SEATS:
+            raise ValueError(f"A group booking can have at most {MAX_GROUP_SEATS} seats.")
+        return BookingService._book(flight_num, email, seats=seats, class_type=class_type, count=count, guest=guest,
+                                    idempotency_key=idempotency_key)
+
+    @staticmethod
+    def _book(flight_num: str, email: str, seats=None, hold_token: str | None = None, guest: dict | None = None,
+              class_type: str | None = None, count: int | None = None, idempotency_key: str | None = None):
+        """
+        book once per customer and idempotency key: a key that already has an order for the same flight and seats
+        returns it (replayed=True) without booking again - checked before the transaction, again under the flight
+        lock, and enforced by the unique key on orders (email, idempotency_key). the same key with another
+        flight or seats raises IdempotencyKeyReused.
+        :return: dict (order_id, seats, total_paid, replayed)
+        """
+        request_hash = _request_hash(flight_num, seats, class_type, count) if idempotency_key else None
+        if idempotency_key:
+            row = BookingService.find_by_idempotency_key(email, idempotency_key)
+            if row is not None:
+                return BookingService._replayed(row, request_hash)
+        try:
+            return BookingService._book_once(flight_num, email, seats, hold_token, guest, class_type, count,
+                                             idempotency_key, request_hash)
+        except _Replayed as e:
+            return BookingService._replayed((e.order_id, request_hash), request_hash)
+        except IntegrityError as e:
+            row = BookingService.find_by_idempotency_key(email, idempotency_key) if idempotency_key else None
+            if e.errno != errorcode.ER_DUP_ENTRY or row is None:
+                raise
+            return BookingService._replayed(row, request_hash)
+
+    @staticmethod
+    def _replayed(row, request_hash):
+        """
+        :param row: (order_id, request_hash) of the order that has the key
+        :raise IdempotencyKeyReused: if that order was booked for a different request
+        """
+        order_id, booked_hash = row
+        if booked_hash is not None and booked_hash != request_hash:
+            raise IdempotencyKeyReused()
+        return {"order_id": order_id, "seats": [], "total_paid": None, "replayed": True}
+
+    @staticmethod
+    def _book_once(flight_num, email, seats, hold_token, guest, class_type, count, idempotency_key, request_hash):
+        """
+        book seats in one transaction:
+        lock the flight row (seat version bump - serializes bookings of a flight), lock exactly the requested
+        seats (or pick and lock `count` free seats of `class_type`) with one row-constructor statement, verify them,
+        create the order and insert its seats in batches, take the seats with a conditional UPDATE whose affected
+        rows are verified, and update the inventory. any failure rolls everything back.
+        :return: dict (order_id, seats, total_paid, replayed)
+        """
+        if seats is not None:
+            seats = list(dict.fromkeys((ct, int(rn), cl) for ct, rn, cl in seats))
+            if not seats:
+                raise ValueError("No seats selected.")
+
+        with transaction() as cursor:
+            if guest is not None:
+                cursor.execute(queries.INSERT_GUEST_INTO_USERS, (email, guest["first_name"], guest["last_name"]))
+                cursor.execute("""
+                    INSERT IGNORE INTO user_phones (email, phone_num)
+                    VALUES (%s, %s)
+                """, (email, guest["phone_num"]))
+
+            version = next_seat_version(cursor, flight_num)
+            if idempotency_key:
+                #a concurrent submission with the same key may have committed while we waited for the lock
+                cursor.execute(queries.ORDER_BY_IDEMPOTENCY_KEY, (email, idempotency_key))
+                row = cursor.fetchone()
+                if row:
+                    BookingService._replayed(row, request_hash)
+                    raise _Replayed(row[0])
+            cursor.execute(queries.FLIGHT_FOR_BOOKING, (flight_num,))
+            flight = cursor.fetchone()
+            if flight is None:
+                raise ValueError("Flight not found.")
+            airplane_id, status, upcoming = flight
+            if (status or "").lower() not in ("active", "delayed") or not upcoming:
+                raise ValueError("This flight is no longer open for booking.")
+
+            rows = None
+            if seats is None:
+                cursor.execute(queries.PICK_FREE_SEATS, (flight_num, class_type, count))
+                rows = cursor.fetchall()
+                if len(rows) < count:
+                    raise ValueError(f"Only {len(rows)} free {class_type} seats left on this flight.")
+                seats = [(ct, int(r), c) for ct, r, c, *_ in rows]
+
+            keys = [v for ct, rn, cl in seats for v in (flight_num, airplane_id, ct, rn, cl)]
+            if rows is None:
+                cursor.execute(queries.LOCK_SEATS_FOR_BOOKING.format(seats=_seat_tuples(len(seats))), keys)
+                rows = cursor.fetchall()
+                if len(rows) != len(seats):
+                    raise ValueError("One or more seats do not exist for this flight.")
+
+            #seats held by this session (or by an expired hold) can be booked
+            bad = [f"{r}{c}({st})" for ct, r, c, st, holder, expired in rows
+                   if (st or "").lower() != "available"
+                   and not ((st or "").lower() == "held" and ((hold_token and holder == hold_token) or expired))]
+            if bad:
+                raise ValueError("Some seats are no longer available: " + ", ".join(bad))
+
+            cursor.execute(queries.FLIGHT_CLASS_PRICES, (flight_num,))
+            price_map = {ct: float(p) for ct, p in cursor.fetchall()}
+
+            seat_inserts = []
+            seats_per_class = {}
+            total_paid = 0.0
+            for ct, rn, cl in seats:
+                if ct not in price_map:
+                    raise ValueError(f"Missing price for class '{ct}'.")
+                total_paid += price_map[ct]
+                seat_inserts.append((ct, rn, cl, price_map[ct]))
+                seats_per_class[ct] = seats_per_class.get(ct, 0) + 1
+
+            cursor.execute(queries.INSERT_TO_ORDERS, (email, flight_num, date.today(), total_paid, total_paid * 0.05,
+                                                      idempotency_key or None, request_hash, len(seats)))
+            order_id = cursor.lastrowid
+
+            #executemany sends each batch as one multi-row INSERT
+            order_seats = [(order_id, flight_num, airplane_id, ct, rn, cl, pr) for ct, rn, cl, pr in seat_inserts]
+            for i in range(0, len(order_seats), ORDER_SEAT_BATCH):
+                cursor.executemany(queries.INSERT_INTO_ORDER_SEAT, order_seats[i:i + ORDER_SEAT_BATCH])
+
+            cursor.execute(queries.TAKE_SEATS.format(seats=_seat_tuples(len(seats))), (version, *keys, hold_token))
+            if cursor.rowcount != len(seats):
+                raise ValueError("Some seats are no longer available.")
+
+            cursor.executemany(queries.INVENTORY_TAKE_SEATS,
+                               [(n, n, flight_num, ct) for ct, n in seats_per_class.items()])
+
+            cursor.execute(queries.CHECK_AVAILABLE_SEATS, (flight_num,))
+            remaining = cursor.fetchone()[0]
+            if remaining == 0:
+                cursor.execute("""
+                    UPDATE flight
+                    SET status = 'fully booked'
+                    WHERE flight_num = %s
+                """, (flight_num,))
+
+        booked = [seat_key(*seat) for seat in seats]
+        seat_events.publish(flight_num, version, taken=booked)
+        if remaining == 0:
+            invalidate_flight_search(flight_num)
+        return {"order_id": order_id, "seats": booked, "total_paid": round(total_paid, 2), "replayed": False}
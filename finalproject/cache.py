@@ -0,0 +1,208 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+#cache settings (can be overridden by env variables)
+ROUTE_CACHE_TTL = float(os.environ.get("FLYTAU_ROUTE_CACHE_TTL", 300))
+SEARCH_CACHE_SIZE = int(os.environ.get("FLYTAU_SEARCH_CACHE_SIZE", 1024))
+SEARCH_CACHE_TTL = float(os.environ.get("FLYTAU_SEARCH_CACHE_TTL", 60))
+FARE_CALENDAR_CACHE_SIZE = int(os.environ.get("FLYTAU_FARE_CALENDAR_CACHE_SIZE", 256))
+FARE_CALENDAR_CACHE_TTL = float(os.environ.get("FLYTAU_FARE_CALENDAR_CACHE_TTL", 300))
+
+
+def route_key(origin: str, destination: str):
+    """
+    routes are bidirectional, so (TLV, ATH) and (ATH, TLV) share one key
+    """
+    return tuple(sorted((origin, destination)))
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries also expire after `ttl` seconds.
+    Entries can carry tags (e.g. a route) so related entries can be invalidated together.
+    """
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._tags = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _remove(self, key):
+        _, _, tags = self._data.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def get(self, key, default=None):
+        """
+        :return: cached value, or default if missing / expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at, _ = entry
+            if time.monotonic() >= expires_at:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, tags=()):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, time.monotonic() + self.ttl, tuple(tags))
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._data) > self.maxsize:
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def invalidate_tag(self, tag):
+        """
+        drop every entry carrying the tag
+        :return: number of dropped entries
+        """
+        with self._lock:
+            keys = list(self._tags.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._data)
+            self._data.clear()
+            self._tags.clear()
+
+    def stats(self):
+        """
+        :return: dict of hit / miss / eviction counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_s": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations
+            }
+
+
+class RouteGraph:
+    """
+    In-process cache of the routes table: airports, bidirectional adjacency and durations.
+    - loaded lazily on first use
+    - after `ttl` seconds the cached version is compared with the db version and reloaded only if it changed
+    - invalidate() drops the cache (call it after changing routes)
+    """
+    def __init__(self, load_routes, routes_version, ttl: float = ROUTE_CACHE_TTL):
+        """
+        :param load_routes: function returning rows of (origin, destination, duration)
+        :param routes_version: function returning a cheap fingerprint of the routes table
+        :param ttl: seconds between version checks
+        """
+        self._load_routes = load_routes
+        self._routes_version = routes_version
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._checked_at = 0.0
+        self._version = None
+        self._airports = []
+        self._adjacency = {}
+        self._durations = {}
+        self.loads = 0
+
+    def _build(self, rows):
+        adjacency = {}
+        durations = {}
+        for origin, destination, duration in rows:
+            adjacency.setdefault(origin, set()).add(destination)
+            adjacency.setdefault(destination, set()).add(origin)
+            if duration is not None:
+                durations.setdefault((origin, destination), int(duration))
+                durations.setdefault((destination, origin), int(duration))
+        self._adjacency = adjacency
+        self._durations = durations
+        self._airports = sorted(adjacency)
+
+    def _ensure_fresh(self):
+        now = time.monotonic()
+        if self._loaded and now - self._checked_at < self.ttl:
+            return
+        with self._lock:
+            if self._loaded and now - self._checked_at < self.ttl:
+                return
+            version = self._routes_version()
+            if not self._loaded or version != self._version:
+                self._build(self._load_routes())
+                self._version = version
+                self._loaded = True
+                self.loads += 1
+            self._checked_at = time.monotonic()
+
+    def invalidate(self):
+        """
+        drop the cached graph, the next lookup reloads it
+        """
+        with self._lock:
+            self._loaded = False
+            self._checked_at = 0.0
+
+    def airports(self):
+        """
+        :return: sorted list of all airports that appear in a route
+        """
+        self._ensure_fresh()
+        return list(self._airports)
+
+    def has_route(self, origin: str, destination: str):
+        """
+        :return: True if a route exists in either direction
+        """
+        self._ensure_fresh()
+        return destination in self._adjacency.get(origin, ())
+
+    def destinations(self, origin: str):
+        """
+        :return: set of airports directly connected to origin
+        """
+        self._ensure_fresh()
+        return set(self._adjacency.get(origin, ()))
+
+    def duration(self, origin: str, destination: str):
+        """
+        :return: route duration in minutes (either direction), or None
+        """
+        self._ensure_fresh()
+        return self._durations.get((origin, destination))
+
+
+#flight rows per (route, date) without seat counts (those are read live) and the route's dates, invalidated per route
+search_cache = TTLCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL)
+
+#lowest fares per day, one entry per (route, month), invalidated per route
+fare_calendar_cache = TTLCache(FARE_CALENDAR_CACHE_SIZE, FARE_CALENDAR_CACHE_TTL)
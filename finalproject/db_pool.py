@@ -0,0 +1,199 @@
+import os
+import threading
+import time
+from collections import deque
+import mysql.connector
+from mysql.connector import errors
+
+#mysql connection settings
+DB_CONFIG = {
+    "host": os.environ.get("FLYTAU_DB_HOST", "localhost"),
+    "user": os.environ.get("FLYTAU_DB_USER", "root"),
+    "password": os.environ.get("FLYTAU_DB_PASSWORD", "nok95nok"),
+    "database": os.environ.get("FLYTAU_DB_NAME", "FLYTAU"),
+    "autocommit": True
+}
+
+#pool settings (can be overridden by env variables)
+POOL_SIZE = int(os.environ.get("FLYTAU_POOL_SIZE", 5))
+POOL_MAX_OVERFLOW = int(os.environ.get("FLYTAU_POOL_MAX_OVERFLOW", 10))
+POOL_TIMEOUT = float(os.environ.get("FLYTAU_POOL_TIMEOUT", 10))
+POOL_MAX_AGE = float(os.environ.get("FLYTAU_POOL_MAX_AGE", 1800))
+POOL_PRE_PING = os.environ.get("FLYTAU_POOL_PRE_PING", "1") == "1"
+
+
+class PoolTimeout(errors.PoolError):
+    """Raised when no connection could be borrowed within the pool timeout."""
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of mysql connections.
+    - keeps up to `size` idle connections open between requests
+    - allows `max_overflow` extra connections under load (closed when returned)
+    - pings a connection before handing it out (pre_ping)
+    - recycles connections older than `max_age` seconds
+    """
+    def __init__(self, config: dict, size: int = POOL_SIZE, max_overflow: int = POOL_MAX_OVERFLOW,
+                 timeout: float = POOL_TIMEOUT, max_age: float = POOL_MAX_AGE, pre_ping: bool = POOL_PRE_PING):
+        self.config = dict(config)
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.max_age = max_age
+        self.pre_ping = pre_ping
+
+        self._idle = deque()
+        self._created_at = {}
+        self._open = 0
+        self._cond = threading.Condition()
+
+        self._checkouts = 0
+        self._timeouts = 0
+        self._recycled = 0
+        self._broken = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _connect(self):
+        conn = mysql.connector.connect(**self.config)
+        self._created_at[id(conn)] = time.monotonic()
+        return conn
+
+    def _close(self, conn):
+        self._created_at.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_usable(self, conn):
+        """
+        check the connection age and (optionally) ping it
+        :return: bool
+        """
+        created = self._created_at.get(id(conn), 0)
+        if self.max_age and time.monotonic() - created > self.max_age:
+            self._recycled += 1
+            return False
+        if self.pre_ping:
+            try:
+                conn.ping(reconnect=False)
+            except errors.Error:
+                self._broken += 1
+                return False
+        return True
+
+    def acquire(self):
+        """
+        borrow a connection from the pool, open a new one if allowed,
+        otherwise wait until one is returned
+        :return: mysql connection
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        while True:
+            conn = None
+            with self._cond:
+                while not self._idle and self._open >= self.size + self.max_overflow:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeout(f"No database connection available within {self.timeout}s.")
+                    self._cond.wait(remaining)
+
+                if self._idle:
+                    conn = self._idle.pop()
+                else:
+                    self._open += 1
+
+            if conn is not None and not self._is_usable(conn):
+                self._discard(conn)
+                continue
+
+            if conn is None:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._open -= 1
+                        self._cond.notify()
+                    raise
+
+            self._record_wait(time.monotonic() - start)
+            return conn
+
+    def release(self, conn, discard: bool = False):
+        """
+        return a connection to the pool
+        :param conn: connection received from acquire()
+        :param discard: close the connection instead of reusing it (e.g. after a connection error)
+        """
+        if not discard:
+            try:
+                if conn.unread_result:
+                    conn.consume_results()
+                if conn.in_transaction:
+                    conn.rollback()
+                if not conn.autocommit:
+                    conn.autocommit = True
+            except errors.Error:
+                discard = True
+
+        with self._cond:
+            if discard or len(self._idle) >= self.size:
+                self._open -= 1
+                self._cond.notify()
+            else:
+                self._idle.append(conn)
+                self._cond.notify()
+                return
+        self._close(conn)
+
+    def _discard(self, conn):
+        self._close(conn)
+        with self._cond:
+            self._open -= 1
+            self._cond.notify()
+
+    def _record_wait(self, waited: float):
+        with self._cond:
+            self._checkouts += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+    def stats(self):
+        """
+        pool metrics for monitoring
+        :return: dict of counters (wait times in milliseconds)
+        """
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                "size": self.size,
+                "max_overflow": self.max_overflow,
+                "open": self._open,
+                "idle": idle,
+                "in_use": self._open - idle,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "recycled": self._recycled,
+                "broken": self._broken,
+                "wait_avg_ms": round(1000 * self._wait_total / self._checkouts, 3) if self._checkouts else 0.0,
+                "wait_max_ms": round(1000 * self._wait_max, 3)
+            }
+
+    def dispose(self):
+        """
+        close all idle connections (e.g. after fork or on shutdown)
+        """
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._close(conn)
+
+
+pool = ConnectionPool(DB_CONFIG)
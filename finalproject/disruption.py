@@ -0,0 +1,231 @@
+import argparse
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+import queries
+from utils import db_cur, transaction, bound_connection, invalidate_flight_search, flight_cancellable_sql
+from events import seat_events
+
+#bulk disruption settings (can be overridden by env variables)
+DISRUPTION_CHUNK = int(os.environ.get("FLYTAU_DISRUPTION_CHUNK", 50))
+DISRUPTION_JOB_STALE = int(os.environ.get("FLYTAU_DISRUPTION_JOB_STALE", 300))
+
+
+def _in_list(n: int):
+    return ", ".join(["%s"] * n)
+
+
+class DisruptionFilter:
+    """Which flights a disruption hits: an airport (departing or arriving), a departure window and/or an airplane."""
+    __slots__ = ("airport", "start", "end", "airplane_id")
+
+    def __init__(self, airport=None, start=None, end=None, airplane_id=None):
+        """
+        :param start: first departure datetime of the window
+        :param end: last departure datetime of the window
+        :raise ValueError: if the filter is empty or the window is invalid
+        """
+        self.airport = (airport or "").strip().upper() or None
+        self.start = start
+        self.end = end
+        try:
+            self.airplane_id = int(airplane_id) if airplane_id not in (None, "") else None
+        except (TypeError, ValueError):
+            raise ValueError("Invalid airplane id.")
+        if not self.start or not self.end:
+            raise ValueError("Choose the departure time window.")
+        if self.end < self.start:
+            raise ValueError("The time window ends before it starts.")
+        if self.airport is None and self.airplane_id is None:
+            raise ValueError("Choose an airport or an airplane.")
+
+    def sql(self):
+        """
+        :return: (WHERE conditions on flight f, params)
+        """
+        conditions = ["f.departure_datetime BETWEEN %s AND %s"]
+        params = [self.start, self.end]
+        if self.airport:
+            conditions.append("(f.origin_airport = %s OR f.destination_airport = %s)")
+            params += [self.airport, self.airport]
+        if self.airplane_id is not None:
+            conditions.append("f.airplane_id = %s")
+            params.append(self.airplane_id)
+        return " AND ".join(conditions), params
+
+    def to_dict(self):
+        return {"airport": self.airport, "start": self.start.strftime("%Y-%m-%d %H:%M:%S"),
+                "end": self.end.strftime("%Y-%m-%d %H:%M:%S"), "airplane_id": self.airplane_id}
+
+
+class DisruptionService:
+    """Bulk cancellation of the flights (and their orders) hit by a disruption, e.g. a closed airport."""
+    @staticmethod
+    def preview(flt: DisruptionFilter):
+        """
+        one aggregate query: the matching flights with their active orders
+        :return: dict (flights, totals). flights rows are dicts, cancellable is False inside the 72 hour limit
+        """
+        where, params = flt.sql()
+        with db_cur() as cursor:
+            cursor.execute(queries.DISRUPTION_PREVIEW.format(where=where, cancellable=flight_cancellable_sql()), params)
+            rows = cursor.fetchall()
+
+        flights = [{"flight_num": fn, "origin": origin, "destination": dest, "departure": dep, "status": status,
+                    "airplane_id": plane, "active_orders": int(orders), "active_revenue": float(revenue),
+                    "cancellable": bool(ok)}
+                   for fn, origin, dest, dep, status, plane, orders, revenue, ok in rows]
+        cancellable = [f for f in flights if f["cancellable"]]
+        totals = {"flights": len(flights), "cancellable_flights": len(cancellable),
+                  "too_late_flights": len(flights) - len(cancellable),
+                  "active_orders": sum(f["active_orders"] for f in cancellable),
+                  "active_revenue": round(sum(f["active_revenue"] for f in cancellable), 2)}
+        return {"flights": flights, "totals": totals}
+
+    @staticmethod
+    def cancel(flt: DisruptionFilter, chunk: int = DISRUPTION_CHUNK, progress=None):
+        """
+        cancel every matching flight that is at least 72 hours away, with its active orders (system cancellation),
+        `chunk` flights per transaction. each chunk locks its flights, re-checks the 72 hour rule and runs one
+        set-based statement per table.
+        :param progress: optional function(done_flights, total_flights, cancelled_orders) called after each chunk
+        :return: dict (flights, orders) cancelled
+        """
+        where, params = flt.sql()
+        with db_cur() as cursor:
+            cursor.execute(queries.DISRUPTION_FLIGHTS.format(where=where, cancellable=flight_cancellable_sql()), params)
+            flight_nums = [row[0] for row in cursor.fetchall()]
+
+        done = orders = 0
+        for i in range(0, len(flight_nums), chunk):
+            cancelled, cancelled_orders = DisruptionService._cancel_chunk(flight_nums[i:i + chunk])
+            done += cancelled
+            orders += cancelled_orders
+            if progress:
+                progress(done, len(flight_nums), orders)
+        return {"flights": done, "orders": orders}
+
+    @staticmethod
+    def _cancel_chunk(flight_nums):
+        """
+        :return: (cancelled flights, cancelled orders)
+        """
+        with transaction() as cursor:
+            cursor.execute(queries.LOCK_CANCELLABLE_FLIGHTS.format(flights=_in_list(len(flight_nums)),
+                                                                   cancellable=flight_cancellable_sql()), flight_nums)
+            flight_nums = [row[0] for row in cursor.fetchall()]
+            if not flight_nums:
+                return 0, 0
+            flights_in = _in_list(len(flight_nums))
+            cursor.execute(queries.CANCEL_FLIGHTS.format(flights=flights_in), flight_nums)
+            cursor.execute(queries.SEAT_VERSIONS_OF_FLIGHTS.format(flights=flights_in), flight_nums)
+            versions = cursor.fetchall()
+            cursor.execute(queries.SYSTEM_CANCEL_ORDERS_OF_FLIGHTS.format(flights=flights_in), flight_nums)
+            orders = cursor.rowcount
+            cursor.execute(queries.DELETE_ORDER_SEATS_OF_FLIGHTS.format(flights=flights_in), flight_nums)
+            cursor.execute(queries.RELEASE_SEATS_OF_FLIGHTS.format(flights=flights_in), flight_nums)
+            cursor.execute(queries.INVENTORY_RELEASE_FLIGHTS.format(flights=flights_in), flight_nums)
+
+        for flight_num, version in versions:
+            seat_events.publish(flight_num, version, resync=True)
+            invalidate_flight_search(flight_num)
+        return len(flight_nums), orders
+
+
+class DisruptionJobs:
+    """
+    Bulk cancellations started from the manager page, each in a background thread of the process that got the request.
+    Progress is kept in the disruption_job table, so any worker process can report it, and a job cut off by a
+    restart shows as 'interrupted' once it made no progress for `stale` seconds.
+    """
+    def __init__(self, stale: int = DISRUPTION_JOB_STALE):
+        self.stale = stale
+
+    def start(self, flt: DisruptionFilter, chunk: int = DISRUPTION_CHUNK):
+        """
+        :return: job id
+        """
+        job_id = uuid.uuid4().hex[:12]
+        with db_cur() as cursor:
+            cursor.execute(queries.INSERT_DISRUPTION_JOB, (job_id, json.dumps(flt.to_dict())))
+        threading.Thread(target=self._run, args=(job_id, flt, chunk), name=f"disruption-{job_id}",
+                         daemon=True).start()
+        return job_id
+
+    def _run(self, job_id, flt, chunk):
+        def progress(done, total, orders):
+            with db_cur() as cursor:
+                cursor.execute(queries.DISRUPTION_JOB_PROGRESS, (done, total, orders, job_id))
+
+        start = time.perf_counter()
+        with bound_connection():
+            try:
+                result = DisruptionService.cancel(flt, chunk, progress)
+                finish = ("done", result["flights"], result["orders"], None)
+            except Exception as e:
+                print("bulk disruption FAILED:", repr(e))
+                finish = ("failed", None, None, repr(e)[:500])
+            with db_cur() as cursor:
+                cursor.execute(queries.FINISH_DISRUPTION_JOB,
+                               (*finish, round(1000 * (time.perf_counter() - start), 2), job_id))
+
+    def get(self, job_id):
+        """
+        :return: dict of the job's progress, or None
+        """
+        if not job_id:
+            return None
+        with db_cur() as cursor:
+            cursor.execute(queries.GET_DISRUPTION_JOB, (self.stale, job_id))
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        job_id, flt, state, started, finished, done, total, orders, duration, error = row
+        return {"id": job_id, "filter": json.loads(flt), "state": state,
+                "started_at": started.strftime("%Y-%m-%d %H:%M:%S"),
+                "finished_at": finished.strftime("%Y-%m-%d %H:%M:%S") if finished else None,
+                "done_flights": done, "total_flights": total, "cancelled_orders": orders,
+                "duration_ms": float(duration) if duration is not None else None, "error": error}
+
+
+disruption_jobs = DisruptionJobs()
+
+
+def main():
+    """
+    python disruption.py --from "2026-02-01 06:00" --to "2026-02-01 22:00" [--airport TLV] [--airplane 3] [--yes]
+    prints the preview, and cancels the flights only with --yes
+    """
+    parser = argparse.ArgumentParser(description="FlyTAU bulk disruption: cancel many flights and their orders")
+    parser.add_argument("--airport", help="flights departing from or arriving at this airport")
+    parser.add_argument("--from", dest="start", required=True, help="window start, YYYY-MM-DD HH:MM")
+    parser.add_argument("--to", dest="end", required=True, help="window end, YYYY-MM-DD HH:MM")
+    parser.add_argument("--airplane", help="flights of this airplane id")
+    parser.add_argument("--chunk", type=int, default=DISRUPTION_CHUNK, help="flights per transaction")
+    parser.add_argument("--yes", action="store_true", help="cancel the flights (otherwise preview only)")
+    args = parser.parse_args()
+
+    flt = DisruptionFilter(args.airport, datetime.strptime(args.start, "%Y-%m-%d %H:%M"),
+                           datetime.strptime(args.end, "%Y-%m-%d %H:%M"), args.airplane)
+    preview = DisruptionService.preview(flt)
+    for f in preview["flights"]:
+        mark = "" if f["cancellable"] else "  (less than 72 hours - kept)"
+        print(f"{f['flight_num']:<8} {f['origin']}->{f['destination']} {f['departure']} {f['status']:<13}"
+              f" {f['active_orders']:>4} active orders{mark}")
+    totals = preview["totals"]
+    print(f"{totals['cancellable_flights']} of {totals['flights']} flights can be cancelled,"
+          f" {totals['active_orders']} active orders")
+    if not args.yes:
+        return
+
+    start = time.perf_counter()
+    result = DisruptionService.cancel(
+        flt, args.chunk, lambda done, total, orders: print(f"cancelled {done}/{total} flights, {orders} orders"))
+    print(f"done: {result['flights']} flights, {result['orders']} orders in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
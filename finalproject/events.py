@@ -0,0 +1,248 @@
+import asyncio
+import json
+import os
+import threading
+from urllib.parse import urlsplit, parse_qs
+
+#seat event settings (can be overridden by env variables)
+SEAT_EVENTS_HOST = os.environ.get("FLYTAU_SEAT_EVENTS_HOST", "127.0.0.1")
+SEAT_EVENTS_PORT = int(os.environ.get("FLYTAU_SEAT_EVENTS_PORT", 5001))
+#public base url of the stream when it is behind a proxy, e.g. https://flytau.example/seat-events
+SEAT_EVENTS_URL = os.environ.get("FLYTAU_SEAT_EVENTS_URL", "")
+SEAT_EVENTS_POLL = float(os.environ.get("FLYTAU_SEAT_EVENTS_POLL", 2))
+SEAT_EVENTS_HEARTBEAT = float(os.environ.get("FLYTAU_SEAT_EVENTS_HEARTBEAT", 15))
+#a watcher that doesn't read its events is dropped once this many bytes are waiting to be sent to it
+SEAT_EVENTS_MAX_PENDING = int(os.environ.get("FLYTAU_SEAT_EVENTS_MAX_PENDING", 64 * 1024))
+
+#the flight number part of /flights/<flight_num>/seats/events
+EVENTS_PATH_PREFIX = "/flights/"
+EVENTS_PATH_SUFFIX = "/seats/events"
+
+
+class SeatEventHub:
+    """
+    In-process pub/sub of seat changes per flight.
+    Publishers (booking / cancellation, after commit) hand the event to the listeners, which must not block
+    (the seat event stream only queues it on its event loop).
+    Events carry the flight's seat version, which grows by 1 per change, so a watcher that sees a gap
+    (a change made by another process) knows it has to resync.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listeners = []
+        self.published = 0
+
+    def listen(self, listener):
+        """
+        :param listener: function(event dict) called for every published event
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def publish(self, flight_num: str, version, taken=(), released=(), resync: bool = False):
+        """
+        notify the listeners about a committed seat change
+        :param version: the flight's seat version after the change
+        :param taken: seats ('class|row|column') that became taken
+        :param released: seats that became available
+        :param resync: True if watchers should reload the whole seat availability (e.g. flight cancelled)
+        """
+        with self._lock:
+            listeners = list(self._listeners)
+            self.published += 1
+        if not listeners or version is None:
+            return
+        event = {"flight_num": flight_num, "version": int(version), "delta": not resync,
+                 "taken": list(taken), "released": list(released)}
+        for listener in listeners:
+            listener(event)
+
+    def stats(self):
+        with self._lock:
+            return {"listeners": len(self._listeners), "published": self.published}
+
+
+class _Watcher:
+    """One open event stream: the connection's writer and the seat version it was last sent."""
+    __slots__ = ("writer", "version")
+
+    def __init__(self, writer, version):
+        self.writer = writer
+        self.version = version
+
+
+class SeatEventStream:
+    """
+    Server-sent events of seat changes, GET /flights/<flight_num>/seats/events on its own port.
+    Runs an asyncio event loop in one daemon thread: a watcher is an open socket in its flight's set,
+    so idle watchers cost a connection and a few objects each, not a thread.
+    - events published in this process are pushed right away (with the taken / released seats)
+    - once every `poll` seconds, one query reads the seat versions of all watched flights, so changes made by
+      other worker processes are pushed too (as a version only - the page then fetches the delta)
+    - the port is bound with SO_REUSEPORT, so every worker process can serve streams
+    """
+    def __init__(self, hub: SeatEventHub, load_versions, host: str = SEAT_EVENTS_HOST, port: int = SEAT_EVENTS_PORT,
+                 poll: float = SEAT_EVENTS_POLL, heartbeat: float = SEAT_EVENTS_HEARTBEAT,
+                 max_pending: int = SEAT_EVENTS_MAX_PENDING):
+        """
+        :param load_versions: function(list of flight_num) returning {flight_num: seat version}
+        """
+        self.hub = hub
+        self._load_versions = load_versions
+        self.host = host
+        self.port = port
+        self.poll = poll
+        self.heartbeat = heartbeat
+        self.max_pending = max_pending
+        self._loop = None
+        self._watchers = {}
+        self.running = False
+        self.connections = 0
+        self.sent = 0
+        self.dropped = 0
+        self.poll_errors = 0
+
+    def start(self):
+        """
+        start the event loop thread (once); the stream is off if the port can't be bound
+        """
+        if self._loop is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        threading.Thread(target=self._run, args=(ready,), name="seat-events", daemon=True).start()
+        ready.wait(5)
+
+    def _run(self, ready):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port, reuse_port=True))
+        except (OSError, ValueError) as e:
+            print("seat event stream is off:", repr(e))
+            ready.set()
+            return
+        self.running = True
+        self.hub.listen(self._publish)
+        self._loop.create_task(self._poll_versions())
+        self._loop.create_task(self._heartbeats())
+        ready.set()
+        self._loop.run_forever()
+
+    def url(self, request_host: str, flight_num: str, scheme: str = "http"):
+        """
+        :param request_host: host of the page request (the stream is on the same host, its own port)
+        :return: url of the flight's event stream, or None if the stream is off
+        """
+        if not self.running:
+            return None
+        base = SEAT_EVENTS_URL or f"{scheme}://{urlsplit('//' + request_host).hostname}:{self.port}"
+        return f"{base.rstrip('/')}{EVENTS_PATH_PREFIX}{flight_num}{EVENTS_PATH_SUFFIX}"
+
+    #everything below runs on the event loop
+
+    async def _handle(self, reader, writer):
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 10)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, *_ = lines[0].split(" ") + ["", ""]
+        headers = dict(line.split(":", 1) for line in lines[1:] if ":" in line)
+        headers = {k.strip().lower(): v.strip() for k, v in headers.items()}
+        path = urlsplit(target)
+        flight_num = path.path[len(EVENTS_PATH_PREFIX):-len(EVENTS_PATH_SUFFIX)]
+        if method != "GET" or not path.path.startswith(EVENTS_PATH_PREFIX) \
+                or not path.path.endswith(EVENTS_PATH_SUFFIX) or not flight_num or "/" in flight_num:
+            writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            writer.close()
+            return
+
+        #EventSource sends the last event id (= seat version) when it reconnects
+        since = headers.get("last-event-id") or parse_qs(path.query).get("since", [""])[0]
+        watcher = _Watcher(writer, int(since) if since.isdigit() else -1)
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                     b"Access-Control-Allow-Origin: *\r\nConnection: keep-alive\r\n\r\nretry: 5000\n\n")
+        watchers = self._watchers.setdefault(flight_num, set())
+        watchers.add(watcher)
+        self.connections += 1
+        try:
+            #nothing more is read - this only waits for the client to go away
+            while await reader.read(1024):
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            watchers.discard(watcher)
+            if not watchers and self._watchers.get(flight_num) is watchers:
+                del self._watchers[flight_num]
+            writer.close()
+
+    def _send(self, watcher, text: str):
+        transport = watcher.writer.transport
+        if transport.is_closing():
+            return
+        if transport.get_write_buffer_size() > self.max_pending:
+            #the client doesn't read - drop it, EventSource reconnects and resyncs
+            self.dropped += 1
+            transport.abort()
+            return
+        watcher.writer.write(text.encode())
+        self.sent += 1
+
+    def _push(self, event):
+        """
+        send an event to the flight's watchers that are behind it: the seats of a delta only to the watchers
+        that have the version right before it, the others get the version to resync from
+        """
+        version = event["version"]
+        delta = f"id: {version}\nevent: seats\ndata: {json.dumps(event)}\n\n"
+        resync = None
+        for watcher in list(self._watchers.get(event["flight_num"], ())):
+            if watcher.version >= version:
+                continue
+            if event["delta"] and watcher.version == version - 1:
+                self._send(watcher, delta)
+            else:
+                resync = resync or f"id: {version}\nevent: seats\ndata: " \
+                                   f"{json.dumps({'flight_num': event['flight_num'], 'version': version, 'delta': False})}\n\n"
+                self._send(watcher, resync)
+            watcher.version = version
+
+    def _publish(self, event):
+        #called from the publishing thread: only queue the event on the loop
+        self._loop.call_soon_threadsafe(self._push, event)
+
+    async def _poll_versions(self):
+        while True:
+            await asyncio.sleep(self.poll)
+            flights = list(self._watchers)
+            if not flights:
+                continue
+            try:
+                versions = await self._loop.run_in_executor(None, self._load_versions, flights)
+            except Exception as e:
+                self.poll_errors += 1
+                print("seat event version poll FAILED:", repr(e))
+                continue
+            for flight_num, version in versions.items():
+                self._push({"flight_num": flight_num, "version": int(version), "delta": False})
+
+    async def _heartbeats(self):
+        #a comment line every `heartbeat` seconds keeps proxies from closing idle streams and finds dead clients
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            for watchers in list(self._watchers.values()):
+                for watcher in list(watchers):
+                    self._send(watcher, ": ping\n\n")
+
+    def stats(self):
+        watchers = self._watchers
+        return {"running": self.running, "port": self.port, "flights": len(watchers),
+                "watchers": sum(len(w) for w in list(watchers.values())), "connections": self.connections,
+                "sent": self.sent, "dropped": self.dropped, "poll_errors": self.poll_errors,
+                "published": self.hub.published}
+
+
+#seat taken / released events of this process, pushed to seat pages by the seat event stream
+seat_events = SeatEventHub()
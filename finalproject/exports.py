@@ -0,0 +1,110 @@
+import csv
+import io
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+import queries
+from utils import stream_cursor
+
+#export settings (can be overridden by env variables)
+EXPORT_BATCH = int(os.environ.get("FLYTAU_EXPORT_BATCH", 500))
+
+#export format -> mimetype
+EXPORT_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+CUSTOMER_ORDER_COLUMNS = ("order_id", "order_date", "status", "total_paid", "cancellation_fee", "seats_count",
+                          "flight_num", "origin", "destination", "departure", "arrival", "flight_status")
+MANIFEST_COLUMNS = ("class_type", "row_num", "column_letter", "order_id", "order_status", "email",
+                    "first_name", "last_name", "birth_date", "passport_num", "price_paid")
+ALL_ORDER_COLUMNS = ("order_id", "email", "order_date", "status", "total_paid", "cancellation_fee", "seats_count",
+                     "flight_num", "origin", "destination", "departure", "flight_status")
+
+
+def _json_value(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _stream_rows(query: str, params):
+    """
+    read a query with an unbuffered cursor, EXPORT_BATCH rows at a time
+    :return: generator of row batches
+    """
+    with stream_cursor() as cursor:
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(EXPORT_BATCH)
+            if not rows:
+                break
+            yield rows
+
+
+def _encode(columns, batches, fmt: str):
+    """
+    :return: generator of text chunks (one per batch) in the export format, CSV with a header line
+    """
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        yield buffer.getvalue()
+        for rows in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(rows)
+            yield buffer.getvalue()
+    else:
+        for rows in batches:
+            yield "".join(json.dumps(dict(zip(columns, row)), default=_json_value) + "\n" for row in rows)
+
+
+class ExportService:
+    """
+    Streaming exports: rows go from an unbuffered server-side cursor straight into the response,
+    so memory use is flat however many rows are exported.
+    Each method returns a generator of text chunks, to be wrapped in a streaming response.
+    """
+    @staticmethod
+    def customer_orders(email: str, fmt: str = "csv", status: str | None = None):
+        """
+        the customer's whole order history, newest first
+        """
+        filters, params = "", [email]
+        if status:
+            filters = queries.ORDER_HISTORY_STATUS
+            params.append(status)
+        return _encode(CUSTOMER_ORDER_COLUMNS,
+                       _stream_rows(queries.EXPORT_CUSTOMER_ORDERS.format(filters=filters), params), fmt)
+
+    @staticmethod
+    def flight_manifest(flight_num: str, fmt: str = "csv"):
+        """
+        passenger manifest of a flight: one row per booked seat with the passenger details
+        """
+        return _encode(MANIFEST_COLUMNS, _stream_rows(queries.EXPORT_FLIGHT_MANIFEST, (flight_num,)), fmt)
+
+    @staticmethod
+    def all_orders(fmt: str = "csv", status: str | None = None, start: date | None = None, end: date | None = None):
+        """
+        manager dump of all orders, by order number
+        :param start: first order date
+        :param end: last order date
+        """
+        filters, params = [], []
+        if status:
+            filters.append("AND o.status = %s")
+            params.append(status)
+        if start:
+            filters.append("AND o.order_date >= %s")
+            params.append(start)
+        if end:
+            filters.append("AND o.order_date <= %s")
+            params.append(end)
+        return _encode(ALL_ORDER_COLUMNS,
+                       _stream_rows(queries.EXPORT_ALL_ORDERS.format(filters=" ".join(filters)), params), fmt)
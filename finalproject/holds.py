@@ -0,0 +1,143 @@
+import os
+import queries
+from utils import db_cur, transaction, next_seat_version, FlightService
+from events import seat_events
+
+#seat hold settings (can be overridden by env variables)
+SEAT_HOLD_TTL = int(os.environ.get("FLYTAU_SEAT_HOLD_TTL", 600))
+HOLD_SWEEP_FLIGHTS = int(os.environ.get("FLYTAU_HOLD_SWEEP_FLIGHTS", 200))
+AUTO_ASSIGN_ATTEMPTS = int(os.environ.get("FLYTAU_AUTO_ASSIGN_ATTEMPTS", 3))
+
+
+def seat_key(class_type, row_num, col):
+    return f"{class_type}|{row_num}|{col}"
+
+
+def _seat_predicate(seats):
+    """
+    :param seats: list of (class_type, row_num, column_letter)
+    :return: (row-constructor list "(%s,%s,%s), ..." for an IN, params)
+    """
+    sql = ", ".join(["(%s,%s,%s)"] * len(seats))
+    params = [v for seat in seats for v in seat]
+    return sql, params
+
+
+class FlightNotOpen(ValueError):
+    """The flight is cancelled, landed, fully booked or already departed - its seats can't be held."""
+    def __init__(self):
+        super().__init__("This flight is no longer open for booking.")
+
+
+class SeatHoldService:
+    """Short-lived seat holds between choosing seats and confirming the order."""
+    @staticmethod
+    def hold_seats(flight_num: str, seats, token: str, ttl: int = SEAT_HOLD_TTL):
+        """
+        hold the seats for the session (replacing its previous holds on this flight).
+        seats that are available, already held by this token or held by an expired hold can be taken.
+        :param seats: list of (class_type, row_num, column_letter)
+        :param token: the session's hold token
+        :raise FlightNotOpen: if the flight can't be booked (the same check as booking, under the flight lock)
+        :raise ValueError: if a seat doesn't exist or is taken / held by someone else
+        """
+        predicate, params = _seat_predicate(seats)
+        wanted = {seat_key(*seat) for seat in seats}
+
+        with transaction() as cursor:
+            #bumping the version locks the flight row, so it can't be cancelled or land while we hold
+            version = next_seat_version(cursor, flight_num)
+            cursor.execute(queries.FLIGHT_FOR_BOOKING, (flight_num,))
+            flight = cursor.fetchone()
+            if flight is None:
+                raise ValueError("Flight not found.")
+            _, status, upcoming = flight
+            if (status or "").lower() not in ("active", "delayed") or not upcoming:
+                raise FlightNotOpen()
+            cursor.execute(queries.HOLDS_OF_TOKEN, (flight_num, token))
+            previous = {seat_key(*row) for row in cursor.fetchall()}
+
+            cursor.execute(queries.SEATS_FOR_HOLD.format(seats=predicate), (flight_num, *params))
+            rows = cursor.fetchall()
+            if len(rows) != len(wanted):
+                raise ValueError("One or more seats do not exist for this flight.")
+
+            bad = [f"{r}{c}" for ct, r, c, status, holder, expired in rows
+                   if not (status == "available" or (status == "held" and (holder == token or expired)))]
+            if bad:
+                raise ValueError("Some seats are no longer available: " + ", ".join(bad))
+
+            cursor.execute(queries.RELEASE_HOLDS_OF_TOKEN, (version, flight_num, token))
+            cursor.execute(queries.HOLD_SEATS.format(seats=predicate), (token, ttl, version, flight_num, *params))
+
+        seat_events.publish(flight_num, version, taken=wanted - previous, released=previous - wanted)
+
+    @staticmethod
+    def hold_block(flight_num: str, class_type: str, count: int, token: str, seat_map=None,
+                   ttl: int = SEAT_HOLD_TTL):
+        """
+        auto-assign: hold the best block of `count` adjacent free seats of the class (see SeatMap.find_block).
+        if another customer takes a seat of the block first, the seat map is re-read and the block is picked again.
+        :param seat_map: the flight's current SeatMap, if the caller already has it
+        :raise ValueError: if the class doesn't have enough free seats
+        :return: the held seats, list of (class_type, row_num, column_letter)
+        """
+        for attempt in range(AUTO_ASSIGN_ATTEMPTS):
+            if seat_map is None or attempt:
+                seat_map = FlightService.get_seat_map(flight_num)
+                if seat_map is None:
+                    raise ValueError("Flight not found.")
+            seats = seat_map.find_block(class_type, count)
+            if seats is None:
+                raise ValueError(f"There are not {count} free {class_type} seats left on this flight.")
+            try:
+                SeatHoldService.hold_seats(flight_num, seats, token, ttl)
+                return seats
+            except FlightNotOpen:
+                raise
+            except ValueError:
+                if attempt == AUTO_ASSIGN_ATTEMPTS - 1:
+                    raise
+
+    @staticmethod
+    def release_holds(flight_num: str, token: str):
+        """
+        release the session's holds on a flight (e.g. when it goes back to choose seats again)
+        :return: number of released seats
+        """
+        with db_cur() as cursor:
+            cursor.execute(queries.HOLDS_OF_TOKEN, (flight_num, token))
+            if not cursor.fetchall():
+                return 0
+
+        with transaction() as cursor:
+            version = next_seat_version(cursor, flight_num)
+            cursor.execute(queries.HOLDS_OF_TOKEN + " FOR UPDATE", (flight_num, token))
+            released = [seat_key(*row) for row in cursor.fetchall()]
+            cursor.execute(queries.RELEASE_HOLDS_OF_TOKEN, (version, flight_num, token))
+
+        seat_events.publish(flight_num, version, released=released)
+        return len(released)
+
+    @staticmethod
+    def release_expired_holds(max_flights: int = HOLD_SWEEP_FLIGHTS):
+        """
+        sweeper: release expired holds in bulk, one short transaction per flight
+        :return: number of released seats
+        """
+        with db_cur() as cursor:
+            cursor.execute("SELECT NOW()")
+            (until,) = cursor.fetchone()
+            cursor.execute(queries.FLIGHTS_WITH_EXPIRED_HOLDS, (until, max_flights))
+            flights = [row[0] for row in cursor.fetchall()]
+
+        total = 0
+        for flight_num in flights:
+            with transaction() as cursor:
+                version = next_seat_version(cursor, flight_num)
+                cursor.execute(queries.EXPIRED_HOLDS_OF_FLIGHT, (flight_num, until))
+                released = [seat_key(*row) for row in cursor.fetchall()]
+                cursor.execute(queries.RELEASE_EXPIRED_HOLDS_OF_FLIGHT, (version, flight_num, until))
+            seat_events.publish(flight_num, version, released=released)
+            total += len(released)
+        return total
@@ -1,13 +1,21 @@
 import os
-from flask import Flask, request, redirect, render_template, url_for, session, flash
+import uuid
+from flask import Flask, request, redirect, render_template, url_for, session, flash, jsonify
 from flask_session import Session
-from datetime import timedelta, datetime, date
+from datetime import timedelta, datetime
 import mysql.connector
-from utils import build_seat_classes, authenticate,route_exists, flight_exists, db_cur, can_cancel_flight, _parse_mysql_dt, FlightService, UserService, get_available_dates, get_all_airports
+from utils import authenticate, route_exists, db_cur, can_cancel_flight, FlightService, UserService, get_all_airports, release_request_connection, seat_layouts, day_range, seat_stream
+from search import SearchService
+from holds import SeatHoldService, seat_key
+from booking import BookingService, IdempotencyKeyReused
+from disruption import DisruptionFilter, DisruptionService, disruption_jobs
+from exports import ExportService, EXPORT_FORMATS
 from functools import wraps
 from reports import report_revenue, report_operational,report_cancellation
 import queries
-import time
+from db_pool import pool
+from maintenance import scheduler
+from cache import search_cache
 
 #initialize app
 app = Flask(__name__)
@@ -27,6 +35,13 @@ app.config.update(
 )
 Session(app)
 
+@app.teardown_request
+def release_db_connection(exc):
+    """
+    return the request's database connection to the pool
+    """
+    release_request_connection(exc)
+
 def manager_only(fn):
     """
     decorator to check whether the user is a manager
@@ -54,55 +69,15 @@ def not_manager(fn):
     return wrapper
 
 
-_last_maint_run = 0
-
-@app.before_request
-def auto_land_flights():
-    """
-    change flight status to 'landed' if a flight has landed,
-    change flight status to 'fully booked' if there are no seats available,
-    change flight status back to 'active' from 'fully booked' if seats have been freed.
-    Maintenance: update flight statuses.
-    Runs rarely and never blocks the page if DB/query fails.
-    """
-    global _last_maint_run
-
-    if request.path.startswith("/static"):
-        return None
-
-    now = time.time()
-    if now - _last_maint_run < 15:
-        return None
-    _last_maint_run = now
+#flight status maintenance runs in a background thread, not in the request path.
+#set FLYTAU_MAINTENANCE=off when a separate `python maintenance.py` worker is used.
+if os.environ.get("FLYTAU_MAINTENANCE", "thread") == "thread":
+    scheduler.start()
 
-    try:
-        with db_cur() as cursor:
-            cursor.execute(queries.FLIGHTS_TO_LAND)
-            flights_landed = [row[0] for row in cursor.fetchall()]
-            cursor.execute(queries.FLIGHT_STATUS_LANDED)
-            for fn in flights_landed:
-                cursor.execute(queries.CHANGE_ORDER_STATUS_AFTER_LANDING, (fn,))
-            cursor.execute(queries.FLIGHT_STATUS_FULLY_BOOKED)
-            cursor.execute(queries.FLIGHT_STATUS_ACTIVE_FROM_FULLY_BOOKED)
-    except Exception as e:
-        print("auto_land_flights FAILED:", repr(e))
-        return None
-
-    return None
-
-@app.before_request
-def auto_land_flights():
-    """
-
-    """
-    try:
-        with db_cur() as cursor:
-            cursor.execute(queries.FLIGHT_STATUS_LANDED)
-            cursor.execute(queries.FLIGHT_STATUS_FULLY_BOOKED)
-            cursor.execute(queries.FLIGHT_STATUS_ACTIVE_FROM_FULLY_BOOKED)
-    except Exception as e:
-        print("auto_land_flights error:", e)
-        return None
+#seat pages get live seat changes from the seat event stream (its own port, one event loop thread).
+#set FLYTAU_SEAT_EVENTS=off to have the pages poll the availability endpoint instead.
+if os.environ.get("FLYTAU_SEAT_EVENTS", "on") == "on":
+    seat_stream.start()
 
 @app.route('/', methods=['GET', 'POST'])
 def home():
@@ -111,6 +86,8 @@ def home():
     - display a different page according to the session role.
     - check if the searched origin and destination airports route exist
     - get flight data for the selected route and date
+    - flexible dates: show the lowest fare per day around the date (or for the whole month)
+    - connections: show itineraries with up to 2 stops
     - redirect to the order page
     """
     airports = get_all_airports()
@@ -139,29 +116,91 @@ def home():
     destination = request.form.get("destination") or None
     passengers = int(request.form.get("passengers", 1))
     selected_date = request.form.get("date") or None
+    flex = (request.form.get("flex") or "").strip()
+    connections = request.form.get("connections") == "1"
 
-    available_dates = []
+    if passengers < 1:
+        return render_template(
+            "search_flights.html",
+            airports=airports,
+            origin=origin,
+            destination=destination,
+            passengers=1,
+            error="Choose at least one passenger."
+        )
 
-    if origin and destination:
+    if selected_date:
+        try:
+            day_range(selected_date)
+        except ValueError:
+            return render_template(
+                "search_flights.html",
+                airports=airports,
+                origin=origin,
+                destination=destination,
+                passengers=passengers,
+                error="Please choose a valid date."
+            )
+
+    if origin and destination and selected_date and connections:
+        itineraries = SearchService.itineraries(origin, destination, selected_date, passengers)
+        if itineraries:
+            return render_template(
+                "itineraries.html",
+                itineraries=itineraries,
+                date=selected_date,
+                origin=origin,
+                destination=destination,
+                passengers=passengers
+            )
+        error = "No direct or connecting flights found for the selected date."
+        return render_template(
+            "search_flights.html",
+            airports=airports,
+            origin=origin,
+            destination=destination,
+            passengers=passengers,
+            error=error
+        )
+
+    if origin and destination and flex:
+        calendar = []
         if not route_exists(origin, destination):
             error = "No route exists between the selected airports."
         else:
-            available_dates = get_available_dates(origin, destination)
+            calendar = SearchService.fare_calendar(origin, destination, selected_date,
+                                                   days=int(flex) if flex.isdigit() else 0,
+                                                   whole_month=(flex == "month"))
+        return render_template(
+            "search_flights.html",
+            airports=airports,
+            origin=origin,
+            destination=destination,
+            passengers=passengers,
+            flex=flex,
+            calendar=calendar,
+            error=error
+        )
 
-    if selected_date and origin and destination and not error:
-        if available_dates and selected_date not in available_dates:
-            error = "No flights available on this date for the selected route."
-        else:
-            data = flight_exists(selected_date, origin, destination)
-            if data:
+    if origin and destination:
+        result = SearchService.search(origin, destination, selected_date, passengers)
+        if not result["route_exists"]:
+            error = "No route exists between the selected airports."
+        elif selected_date:
+            available_dates = result["available_dates"]
+            if result["flights"]:
                 return render_template(
                     "order.html",
-                    options=data,
+                    options=result["flights"],
                     date=selected_date,
                     origin=origin,
                     destination=destination,
                     passengers=passengers
                 )
+            elif result["flights_on_date"]:
+                error = f"No flight on this date has {passengers} available seats."
+            elif available_dates and selected_date not in available_dates:
+                error = "No flights available on this date for the selected route."
             else:
                 error = "No active flights found for the selected date."
 
@@ -202,28 +241,84 @@ def seats_page(flight_num):
     - gets information about the flight seats
     - creates a grid for the seats
     - checks if enough seats selected by user
+    - holds the selected seats for a few minutes (other customers see them as taken)
+    - auto-assign: picks the best block of adjacent free seats in the chosen class
     redirect to order summary page
     """
     passengers = int(request.args.get("passengers", 1))
-    with db_cur() as cursor:
-        cursor.execute(queries.SEAT_MAP,(flight_num,))
-        rows = cursor.fetchall()
-
-    sorted_classes = build_seat_classes(rows)
+    hold_token = session.setdefault("hold_token", uuid.uuid4().hex)
+    if request.method == "GET":
+        #choosing seats again - give back the seats this session is holding
+        SeatHoldService.release_holds(flight_num, hold_token)
+    seat_map = FlightService.get_seat_map(flight_num)
+    sorted_classes = seat_map.classes() if seat_map else []
     if request.method == "POST":
         selected = request.form.getlist("seats")
-        if len(selected) != passengers:
+        error = None
+        auto_class = request.form.get("auto_class")
+        if auto_class:
+            try:
+                seats = SeatHoldService.hold_block(flight_num, auto_class, passengers, hold_token, seat_map)
+                selected = [seat_key(*seat) for seat in seats]
+            except ValueError as e:
+                error = str(e)
+                seat_map = FlightService.get_seat_map(flight_num)
+                sorted_classes = seat_map.classes() if seat_map else []
+        elif len(selected) != passengers:
             error = f"You must choose exactly {passengers} seats. You selected {len(selected)}."
+        else:
+            try:
+                seats = [(ct, int(rn), cl) for ct, rn, cl in (x.split("|") for x in selected)]
+            except ValueError:
+                seats = None
+                error = "Problematic seats choice."
+            if seats:
+                try:
+                    SeatHoldService.hold_seats(flight_num, seats, hold_token)
+                except ValueError as e:
+                    error = str(e)
+                    seat_map = FlightService.get_seat_map(flight_num)
+                    sorted_classes = seat_map.classes() if seat_map else []
+        if error:
             return render_template(
                 "seats.html",
                 flight_num=flight_num,
                 classes=sorted_classes,
+                seat_map=seat_map,
                 passengers=passengers,
+                seat_events_url=seat_stream.url(request.host, flight_num, request.scheme),
                 error=error
             )
         return redirect(url_for("order_summary", flight_num=flight_num, selected_seats=selected))
 
-    return render_template("seats.html", flight_num=flight_num, classes=sorted_classes, passengers=passengers)
+    return render_template("seats.html", flight_num=flight_num, classes=sorted_classes, seat_map=seat_map,
+                           passengers=passengers,
+                           seat_events_url=seat_stream.url(request.host, flight_num, request.scheme))
+
+
+@app.route('/flights/<flight_num>/seats/availability', methods=['GET'])
+@not_manager
+def seat_availability(flight_num):
+    """
+    app route for seat availability (json), fetched by the seat page when the seat event stream tells it
+    the version changed (or polled when the stream is off)
+    - ETag is the flight's seat version: answers 304 if nothing changed
+    - ?since=<version> returns only the seats taken / released after that version
+    """
+    since = request.args.get("since", type=int)
+    version = FlightService.get_seat_version(flight_num)
+    if version is None:
+        return jsonify({"error": "Flight not found."}), 404
+
+    if request.if_none_match.contains(f"{flight_num}-{version}"):
+        response = app.response_class(status=304)
+    else:
+        data = FlightService.seat_availability(flight_num, since)
+        response = jsonify(data)
+        version = data["version"]
+    response.set_etag(f"{flight_num}-{version}")
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 @app.route('/order_summary', methods=['GET', 'POST'])
@@ -253,8 +348,11 @@ def order_summary():
                 error="Missing flight number or selected seats."
             )
 
-        return render_template(tmpl, flight_num=flight_num, selected_seats=selected_seats)
+        #one idempotency key per summary page - a resubmitted form finds its order instead of booking again
+        return render_template(tmpl, flight_num=flight_num, selected_seats=selected_seats,
+                               idempotency_key=uuid.uuid4().hex)
 
+    idempotency_key = (request.form.get("idempotency_key") or "").strip() or None
     flight_num = (request.form.get("flight_num") or "").strip()
     selected_seats_raw = request.form.getlist("selected_seats")
 
@@ -307,82 +405,50 @@ def order_summary():
                                error="Problematic seats choice.")
 
     try:
-        with db_cur() as cursor:
-            if role != "customer":
-                cursor.execute(queries.INSERT_GUEST_INTO_USERS,(email, guest_payload["first_name"], guest_payload["last_name"]))
-                cursor.execute("""
-                    INSERT IGNORE INTO user_phones (email, phone_num)
-                    VALUES (%s, %s)
-                """, (email, guest_payload["phone_num"]))
-
-            seat_where = " OR ".join(["(row_num=%s AND column_letter=%s)"] * len(parsed))
-            params = [flight_num]
-            for ct, rn, cl in parsed:
-                params.extend([rn, cl])
-
-            cursor.execute(f"""
-                SELECT airplane_id, class_type, row_num, column_letter, seat_status
-                FROM flight_seat
-                WHERE flight_num = %s AND ({seat_where})
-            """, tuple(params))
-
-            rows = cursor.fetchall()
-
-            if len(rows) != len(parsed):
-                raise Exception("One or more seats do not exist for this flight.")
-
-            not_available = [x for x in rows if (x[4] or "").lower() != "available"]
-            if not_available:
-                bad = [f"{x[2]}{x[3]}({x[4]})" for x in not_available]
-                raise Exception("Some seats are no longer available: " + ", ".join(bad))
-
-            airplane_id = rows[0][0]
-
-            cursor.execute("""
-                SELECT class_type, price
-                FROM flight_class_price
-                WHERE flight_num = %s
-            """, (flight_num,))
-            price_rows = cursor.fetchall()
-            price_map = {ct: float(p) for (ct, p) in price_rows}
+        order_id = BookingService.book_seats(flight_num, email, parsed, hold_token=session.get("hold_token"),
+                                             guest=guest_payload, idempotency_key=idempotency_key)
+        return redirect(url_for("final_summary", order_id=order_id))
 
-            seat_inserts = []
-            total_paid = 0.0
-
-            for (airplane_id_db, class_type_db, row_num_db, col_db, status_db) in rows:
-                if class_type_db not in price_map:
-                    raise Exception(f"Missing price for class '{class_type_db}'.")
-
-                pr = price_map[class_type_db]
-                total_paid += pr
-                seat_inserts.append((class_type_db, row_num_db, col_db, pr))
-
-            cursor.execute(queries.INSERT_TO_ORDERS, (email, flight_num, date.today(), total_paid, total_paid * 0.05))
-
-            order_id = cursor.lastrowid
-
-            cursor.executemany(queries.INSERT_INTO_ORDER_SEAT, [(order_id, flight_num, airplane_id, ct, rn, cl, pr) for (ct, rn, cl, pr) in seat_inserts])
-
-            cursor.execute(f"""
-                UPDATE flight_seat
-                SET seat_status = 'taken'
-                WHERE flight_num = %s AND ({seat_where})
-            """, tuple(params))
+    except IdempotencyKeyReused as e:
+        return render_template(tmpl, flight_num=flight_num, selected_seats=selected_seats_raw, error=str(e)), 422
+    except Exception as e:
+        return render_template(tmpl, flight_num=flight_num, selected_seats=selected_seats_raw, error=str(e))
 
-            cursor.execute(queries.CHECK_AVAILABLE_SEATS, (flight_num,))
-            remaining = cursor.fetchone()[0]
 
-            if remaining == 0:
-                cursor.execute("""
-                    UPDATE flight
-                    SET status = 'fully booked'
-                    WHERE flight_num = %s
-                """, (flight_num,))
+@app.route('/api/group_booking', methods=['POST'])
+@not_manager
+def group_booking():
+    """
+    app route for group / charter bookings (json), for logged in customers
+    body: {"flight_num": ..., "seats": ["Economy|12|C", ...]} or {"flight_num": ..., "class_type": ..., "count": N}
+    an Idempotency-Key header makes retries safe: a replay answers 200 with the original order_id,
+    the same key with a different flight or seats answers 422
+    """
+    email = (session.get("email") or "").strip()
+    if session.get("role") != "customer" or not email:
+        return jsonify({"error": "You must be logged in."}), 401
 
-            return redirect(url_for("final_summary", order_id=order_id))
+    body = request.get_json(silent=True) or {}
+    flight_num = str(body.get("flight_num") or "").strip()
+    try:
+        seats = None
+        if body.get("seats") is not None:
+            seats = [(ct.strip(), int(rn), cl.strip()) for ct, rn, cl in (str(x).split("|") for x in body["seats"])]
+        count = int(body["count"]) if body.get("count") is not None else None
+    except (TypeError, ValueError):
+        return jsonify({"error": "Problematic seats choice."}), 400
+    if not flight_num:
+        return jsonify({"error": "Missing flight number."}), 400
 
-    except Exception as e:
-        return render_template(tmpl, flight_num=flight_num, selected_seats=selected_seats_raw, error=str(e))
+    try:
+        result = BookingService.book_group(flight_num, email, seats=seats, class_type=body.get("class_type"),
+                                           count=count, idempotency_key=request.headers.get("Idempotency-Key"))
+    except IdempotencyKeyReused as e:
+        return jsonify({"error": str(e)}), 422
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 409
+    result["final_summary"] = url_for("final_summary", order_id=result["order_id"])
+    return jsonify(result), 200 if result["replayed"] else 201
 
 
 @app.route("/final_summary", methods=["GET"])
@@ -549,20 +615,12 @@ def find_order():
         elif not order_id.isdigit():
             error = "Order ID must be a number."
         else:
-            query = queries.FIND_GUEST_ORDER
-
-            with db_cur() as cursor:
-                cursor.execute(query, (email, int(order_id)))
-                rows = cursor.fetchall()
+            rows = UserService.find_order(email, int(order_id))
 
             if not rows:
                 error = "No matching order found."
             else:
-                for r in rows:
-                    oid = r[0]
-                    order_status = r[2]
-                    departure_dt = r[8]
-                    can_cancel[oid] = UserService.is_order_cancellable(order_status, departure_dt)
+                can_cancel = {r[0]: r[12] for r in rows}
 
     return render_template("find_order.html", rows=rows, error=error,
                            email=email, order_id=order_id, can_cancel=can_cancel)
@@ -574,53 +632,71 @@ def my_orders():
     """
     app route for the order history page:
     - get the user email from the current session
-    - get the given filtered status
-    - get the customer's order history
+    - get the given filtered status (and/or cancellable orders only)
+    - get one page of the customer's order history (?after= cursor of the previous page)
     """
     email = session.get("email")
     if not email:
         return redirect(url_for("login"))
 
     selected_status = (request.args.get("status", "") or "").strip()
+    cancellable_only = request.args.get("cancellable") == "1"
+    after = request.args.get("after") or None
 
-    query = queries.FIND_CUSTOMER_ORDERS
-
-    params = [email]
-
-    if selected_status:
-        query += " AND o.status = %s "
-        params.append(selected_status)
+    #the status counts are computed on the first page and kept in the session for the next pages of the same query
+    facets_key = [email, selected_status, cancellable_only]
+    kept = session.get("order_history_facets")
+    known_facets = None
+    if after and kept and kept.get("key") == facets_key:
+        known_facets = (kept["facets"], kept["cancellable"])
 
-    query += '''
-        GROUP BY
-          o.order_id, o.order_date, o.status, o.total_paid, o.cancellation_fee,
-          f.flight_num, f.origin_airport, f.destination_airport,
-          f.departure_datetime, f.arrival_datetime, f.status
-        ORDER BY o.order_date DESC;
-    '''
-
-    with db_cur() as cursor:
-        cursor.execute(query, tuple(params))
-        rows = cursor.fetchall()
-
-    can_cancel = {}
-    for r in rows:
-        oid = r[0]
-        order_status = r[2]
-        departure_dt = r[8]
-        can_cancel[oid] = UserService.is_order_cancellable(order_status, departure_dt)
+    try:
+        rows, facets, cancellable_count, next_after = UserService.order_history(
+            email, selected_status or None, after, cancellable_only, known_facets=known_facets)
+    except ValueError:
+        return redirect(url_for("my_orders", status=selected_status or None))
+    if known_facets is None:
+        session["order_history_facets"] = {"key": facets_key, "facets": facets, "cancellable": cancellable_count}
 
-    statuses = UserService.get_statuses(email)
+    can_cancel = {r[0]: r[12] for r in rows}
 
     return render_template(
         "my_orders.html",
         rows=rows,
-        statuses=statuses,
+        facets=facets,
         selected_status=selected_status,
+        cancellable_only=cancellable_only,
+        cancellable_count=cancellable_count,
         can_cancel=can_cancel,
+        next_after=next_after,
+        first_page=after is None,
         email=email
     )
 
+def _export_response(chunks, fmt: str, filename: str):
+    """
+    streaming download of an export (the body is generated while it is sent)
+    """
+    response = app.response_class(chunks, mimetype=EXPORT_FORMATS[fmt])
+    response.headers["Content-Disposition"] = f'attachment; filename="{filename}.{fmt}"'
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+@app.route('/my_orders/export', methods=['GET'])
+@not_manager
+def export_my_orders():
+    """
+    app route for downloading the customer's whole order history (?format=csv|ndjson, optional ?status=)
+    """
+    email = session.get("email")
+    if not email:
+        return redirect(url_for("login"))
+    fmt = request.args.get("format", "csv")
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": "Unknown export format."}), 400
+    status = (request.args.get("status") or "").strip() or None
+    return _export_response(ExportService.customer_orders(email, fmt, status), fmt, "flytau_orders")
+
 @app.route('/orders/<int:order_id>/cancel', methods=['GET','POST'])
 def cancel_order_confirm(order_id):
     """
@@ -646,13 +722,15 @@ def cancel_order_confirm(order_id):
 
         return render_template("cancel_order_confirm.html", row=row, guest_email=email, redirect_to=redirect_to)
 
-    with db_cur() as cursor:
-        cursor.execute("SELECT f.flight_num FROM orders o JOIN flight f ON f.flight_num = o.flight_num WHERE o.order_id=%s AND o.email=%s LIMIT 1", (order_id, email))
-        flight_num = cursor.fetchone()[0]
-        cursor.execute("UPDATE orders SET status = %s, total_paid = cancellation_fee, cancellation_fee = 0 WHERE order_id = %s AND email = %s;",
-            ("customer cancellation", order_id, email))
-        cursor.execute(queries.RELEASE_SEATS_OF_ORDER, (order_id, flight_num))
-        cursor.execute("DELETE FROM order_seat WHERE order_id = %s;", (order_id,))
+    try:
+        UserService.cancel_orders([order_id], email)
+    except ValueError as e:
+        with db_cur() as cursor:
+            cursor.execute(queries.ORDER_DETAILS, (order_id, email))
+            row = cursor.fetchone()
+            cursor.fetchall()
+        return render_template("cancel_order_confirm.html", row=row, guest_email=email, redirect_to=redirect_to,
+                               error=str(e))
 
     if redirect_to == "my_orders":
         return redirect(url_for("my_orders"))
@@ -689,31 +767,64 @@ def cancellation_report():
     return render_template("cancellation_report.html", avg_rate=c[0],max_rate=c[1],min_rate=c[2],months_json=c[3],rates_json=c[4],results=c[5])
 
 
+@app.route('/manager/pool_stats', methods=['GET'])
+@manager_only
+def pool_stats():
+    """
+    app route for the database connection pool metrics (json)
+    """
+    return jsonify(pool.stats())
+
+@app.route('/manager/cache_stats', methods=['GET'])
+@manager_only
+def cache_stats():
+    """
+    app route for the search cache hit / miss / eviction statistics (json)
+    """
+    stats = search_cache.stats()
+    stats["seat_layouts"] = seat_layouts.stats()
+    stats["seat_events"] = seat_stream.stats()
+    return jsonify(stats)
+
+@app.route('/manager/maintenance_stats', methods=['GET'])
+@manager_only
+def maintenance_stats():
+    """
+    app route for the flight status maintenance timings (json)
+    """
+    return jsonify(scheduler.stats())
+
+
 @app.route('/manager', methods=['GET'])
 @manager_only
 def manager_home():
     """
     app route for the manager dashboard page
-    - can filter flights by status
+    - can filter flights by status, and/or cancellable flights only
     - shows a cancel option if cancellable
+    - one page of flights at a time (?after= cursor of the previous page)
     """
     selected_status = (request.args.get("status", "") or "").strip()
+    cancellable_only = request.args.get("cancellable") == "1"
+    after = request.args.get("after") or None
 
     statuses = FlightService.get_flight_statuses()
-    flights = FlightService.get_flights(selected_status)
+    try:
+        flights, next_after = FlightService.get_flights(selected_status, cancellable_only, after)
+    except ValueError:
+        return redirect(url_for("manager_home", status=selected_status or None))
 
-    can_cancel = {}
-    for f in flights:
-        flight_num = f[0]
-        dep_dt = _parse_mysql_dt(f[3])
-        can_cancel[flight_num] = can_cancel_flight(dep_dt)
+    can_cancel = {f[0]: f[7] for f in flights}
 
     return render_template(
         "manager_home.html",
         statuses=statuses,
         selected_status=selected_status,
+        cancellable_only=cancellable_only,
         flights=flights,
-        can_cancel=can_cancel
+        can_cancel=can_cancel,
+        next_after=next_after,
+        first_page=after is None
     )
 
 @app.route('/manager/flights/<flight_num>/status', methods=['POST'])
@@ -732,8 +843,7 @@ def update_flight_status(flight_num):
     if new_status not in allowed:
         return redirect(url_for("manager_home"))
 
-    with db_cur() as cursor:
-        cursor.execute("UPDATE flight SET status = %s WHERE flight_num = %s",(new_status, flight_num))
+    FlightService.set_flight_status(flight_num, new_status)
 
     return redirect(url_for("manager_home", status=request.args.get("status", "")))
 
@@ -782,6 +892,100 @@ def cancel_flight_confirm(flight_num):
     FlightService.cancel_flight_and_orders(flight_num)
     return redirect(url_for("manager_home"))
 
+def _disruption_filter(values):
+    """
+    :param values: request args / form / json body with airport, start, end, airplane_id
+    :raise ValueError: if the filter is invalid
+    :return: DisruptionFilter
+    """
+    window = []
+    for name in ("start", "end"):
+        raw = (values.get(name) or "").strip()
+        try:
+            window.append(datetime.strptime(raw.replace("T", " ")[:16], "%Y-%m-%d %H:%M") if raw else None)
+        except ValueError:
+            raise ValueError("Invalid time window.")
+    return DisruptionFilter(values.get("airport"), window[0], window[1], values.get("airplane_id"))
+
+@app.route('/manager/disruption', methods=['GET', 'POST'])
+@manager_only
+def manager_disruption():
+    """
+    app route for the bulk disruption page (e.g. weather closes an airport):
+    - GET with a filter (airport, departure window, airplane): preview of the flights and their active orders
+    - POST: cancel every matching flight that is at least 72 hours away, in the background, with progress
+    json clients get the preview / job as json
+    """
+    if request.method == "POST":
+        values = request.get_json(silent=True) or request.form
+        try:
+            flt = _disruption_filter(values)
+        except ValueError as e:
+            if request.is_json:
+                return jsonify({"error": str(e)}), 400
+            return render_template("manager_disruption.html", airports=get_all_airports(), values=values,
+                                   error=str(e))
+        job_id = disruption_jobs.start(flt)
+        if request.is_json:
+            return jsonify({"job_id": job_id, "progress": url_for("disruption_job", job_id=job_id)}), 202
+        return redirect(url_for("manager_disruption", job=job_id, **flt.to_dict()))
+
+    values = request.args
+    preview = error = None
+    if values.get("start") or values.get("end"):
+        try:
+            preview = DisruptionService.preview(_disruption_filter(values))
+        except ValueError as e:
+            error = str(e)
+    if preview is not None and request.accept_mimetypes.best == "application/json":
+        return jsonify(preview)
+    return render_template("manager_disruption.html", airports=get_all_airports(), values=values, preview=preview,
+                           error=error, job=disruption_jobs.get(values.get("job", "")))
+
+@app.route('/manager/disruption/jobs/<job_id>', methods=['GET'])
+@manager_only
+def disruption_job(job_id):
+    """
+    app route for the progress of a bulk disruption (json)
+    """
+    job = disruption_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found."}), 404
+    return jsonify(job)
+
+@app.route('/manager/flights/<flight_num>/manifest', methods=['GET'])
+@manager_only
+def flight_manifest(flight_num):
+    """
+    app route for downloading the passenger manifest of a flight (?format=csv|ndjson)
+    """
+    fmt = request.args.get("format", "csv")
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": "Unknown export format."}), 400
+    if not FlightService.get_flight_basic(flight_num):
+        return jsonify({"error": "Flight not found."}), 404
+    return _export_response(ExportService.flight_manifest(flight_num, fmt), fmt, f"manifest_{flight_num}")
+
+@app.route('/manager/orders/export', methods=['GET'])
+@manager_only
+def export_all_orders():
+    """
+    app route for downloading all orders (?format=csv|ndjson, optional ?status=, ?from= / ?to= order dates YYYY-MM-DD)
+    """
+    fmt = request.args.get("format", "csv")
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": "Unknown export format."}), 400
+    dates = []
+    for name in ("from", "to"):
+        raw = (request.args.get(name) or "").strip()
+        try:
+            dates.append(datetime.strptime(raw, "%Y-%m-%d").date() if raw else None)
+        except ValueError:
+            return jsonify({"error": "Dates must be YYYY-MM-DD."}), 400
+    start, end = dates
+    status = (request.args.get("status") or "").strip() or None
+    return _export_response(ExportService.all_orders(fmt, status, start, end), fmt, "flytau_all_orders")
+
 @app.route("/manager/add_flight", methods=["GET", "POST"])
 @manager_only
 def add_flight():
@@ -0,0 +1,221 @@
+import argparse
+import os
+import threading
+import time
+from datetime import datetime
+import queries
+from utils import db_cur, transaction, bound_connection, _parse_mysql_dt, FlightService, timetable
+from cache import search_cache, fare_calendar_cache
+from holds import SeatHoldService
+
+#maintenance settings (can be overridden by env variables)
+MAINTENANCE_INTERVAL = float(os.environ.get("FLYTAU_MAINTENANCE_INTERVAL", 15))
+MAINTENANCE_MODE = os.environ.get("FLYTAU_MAINTENANCE_MODE", "incremental")
+MAINTENANCE_LOCK = "flytau_flight_maintenance"
+
+#watermark on flight.arrival_datetime, kept in maintenance_state
+LANDING_WATERMARK = "landing"
+WATERMARK_START = datetime(1970, 1, 1)
+
+
+def land_flights_full(cursor):
+    """
+    land every flight that has arrived and complete its orders (scans the whole flight table)
+    :return: number of landed flights
+    """
+    cursor.execute(queries.FLIGHTS_TO_LAND)
+    flights_landed = [row[0] for row in cursor.fetchall()]
+    cursor.execute(queries.FLIGHT_STATUS_LANDED)
+    for fn in flights_landed:
+        cursor.execute(queries.CHANGE_ORDER_STATUS_AFTER_LANDING, (fn,))
+    return len(flights_landed)
+
+
+def land_flights_incremental(cursor):
+    """
+    land only the flights that arrived since the persisted watermark, complete their orders
+    with one set-based UPDATE...JOIN and move the watermark forward (same transaction).
+    :return: number of landed flights
+    """
+    cursor.execute(queries.GET_MAINTENANCE_WATERMARK, (LANDING_WATERMARK,))
+    row = cursor.fetchone()
+    since = _parse_mysql_dt(row[0]) if row else WATERMARK_START
+
+    cursor.execute("SELECT NOW()")
+    (until,) = cursor.fetchone()
+
+    cursor.execute(queries.LAND_FLIGHTS_ARRIVED_BETWEEN, (since, until))
+    landed = cursor.rowcount
+    cursor.execute(queries.COMPLETE_ORDERS_ARRIVED_BETWEEN, (since, until))
+    cursor.execute(queries.SET_MAINTENANCE_WATERMARK, (LANDING_WATERMARK, until))
+    return landed
+
+
+def run_flight_maintenance(mode: str = MAINTENANCE_MODE):
+    """
+    change flight status to 'landed' if a flight has landed (and complete its orders),
+    in 'full' mode also sweep all flights: change flight status to 'fully booked' if there are no seats available,
+    and back to 'active' from 'fully booked' if seats have been freed,
+    release expired seat holds.
+    :param mode: 'incremental' (watermark based) or 'full'
+    :return: dict of step durations (ms) and counters
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    with transaction() as cursor:
+        if mode == "full":
+            timings["landed"] = land_flights_full(cursor)
+        else:
+            timings["landed"] = land_flights_incremental(cursor)
+    timings["landed_ms"] = round(1000 * (time.perf_counter() - start), 2)
+
+    #bookings and cancellations flip their own flight from its inventory counters (same transaction),
+    #only a full pass sweeps every flight
+    changed = 0
+    if mode == "full":
+        start = time.perf_counter()
+        with db_cur() as cursor:
+            cursor.execute(queries.FLIGHT_STATUS_FULLY_BOOKED)
+            changed = cursor.rowcount
+            cursor.execute(queries.FLIGHT_STATUS_ACTIVE_FROM_FULLY_BOOKED)
+            changed += cursor.rowcount
+        timings["fully_booked_ms"] = round(1000 * (time.perf_counter() - start), 2)
+
+    start = time.perf_counter()
+    timings["holds_released"] = SeatHoldService.release_expired_holds()
+    timings["holds_ms"] = round(1000 * (time.perf_counter() - start), 2)
+
+    #set-based updates don't tell which routes changed - drop this process's cached searches and fare calendars
+    if timings["landed"] or changed:
+        search_cache.clear()
+        fare_calendar_cache.clear()
+        timetable.invalidate()
+
+    return timings
+
+
+class MaintenanceScheduler:
+    """
+    Runs the flight status maintenance every `interval` seconds in a background thread.
+    A mysql GET_LOCK leader lock makes sure only one process (e.g. one of many gunicorn workers)
+    runs a given tick; the others skip it.
+    """
+    def __init__(self, interval: float = MAINTENANCE_INTERVAL, lock_name: str = MAINTENANCE_LOCK,
+                 mode: str = MAINTENANCE_MODE):
+        self.interval = interval
+        self.lock_name = lock_name
+        self.mode = mode
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stats = {"runs": 0, "skipped_not_leader": 0, "failures": 0, "last_run_at": None,
+                       "last_duration_ms": None, "max_duration_ms": 0.0, "last_steps": {}, "last_error": None}
+
+    def run_once(self):
+        """
+        try to become leader and run one maintenance pass
+        :return: dict of step durations, or None if another process holds the lock
+        """
+        start = time.perf_counter()
+        try:
+            with bound_connection():
+                with db_cur() as cursor:
+                    cursor.execute("SELECT GET_LOCK(%s, 0)", (self.lock_name,))
+                    (got_lock,) = cursor.fetchone()
+                if got_lock != 1:
+                    with self._lock:
+                        self._stats["skipped_not_leader"] += 1
+                    return None
+                try:
+                    steps = run_flight_maintenance(self.mode)
+                finally:
+                    with db_cur() as cursor:
+                        cursor.execute("SELECT RELEASE_LOCK(%s)", (self.lock_name,))
+                        cursor.fetchall()
+        except Exception as e:
+            with self._lock:
+                self._stats["failures"] += 1
+                self._stats["last_error"] = repr(e)
+            print("flight maintenance FAILED:", repr(e))
+            return None
+
+        duration = round(1000 * (time.perf_counter() - start), 2)
+        with self._lock:
+            self._stats["runs"] += 1
+            self._stats["last_run_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._stats["last_duration_ms"] = duration
+            self._stats["max_duration_ms"] = max(self._stats["max_duration_ms"], duration)
+            self._stats["last_steps"] = steps
+        return steps
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """
+        start the background thread (does nothing if already running)
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="flight-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def stats(self):
+        """
+        :return: dict of run counters and timings
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["interval_s"] = self.interval
+        stats["mode"] = self.mode
+        stats["running"] = bool(self._thread and self._thread.is_alive())
+        return stats
+
+
+scheduler = MaintenanceScheduler()
+
+
+def main():
+    """
+    standalone maintenance worker: python maintenance.py [--interval N] [--once] [--full] [--reconcile-inventory]
+    """
+    parser = argparse.ArgumentParser(description="FlyTAU flight status maintenance worker")
+    parser.add_argument("--interval", type=float, default=MAINTENANCE_INTERVAL, help="seconds between runs")
+    parser.add_argument("--once", action="store_true", help="run a single pass and exit")
+    parser.add_argument("--full", action="store_true", help="scan all flights instead of using the watermark")
+    parser.add_argument("--reconcile-inventory", action="store_true",
+                        help="repair flight_inventory counters from flight_seat and exit")
+    args = parser.parse_args()
+
+    if args.reconcile_inventory:
+        drift = FlightService.reconcile_inventory()
+        for flight_num, class_type, counted_av, actual_av, counted_sold, actual_sold in drift:
+            print(f"{flight_num} {class_type}: available {counted_av} -> {actual_av}, sold {counted_sold} -> {actual_sold}")
+        print(f"inventory reconciled, {len(drift)} row(s) repaired")
+        return
+
+    worker = MaintenanceScheduler(interval=args.interval, mode="full" if args.full else MAINTENANCE_MODE)
+    while True:
+        skipped = worker.stats()["skipped_not_leader"]
+        steps = worker.run_once()
+        stats = worker.stats()
+        if steps is not None:
+            print(f"[{stats['last_run_at']}] maintenance done in {stats['last_duration_ms']} ms {steps}")
+        elif stats["skipped_not_leader"] > skipped:
+            print("maintenance skipped: another process holds the lock")
+        if args.once:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
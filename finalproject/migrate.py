@@ -0,0 +1,120 @@
+import argparse
+import os
+import re
+import mysql.connector
+from utils import db_cur
+
+#versioned schema migrations: migrations/NNNN_name.sql, applied in order and recorded in schema_migrations
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+MIGRATION_FILE = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+#mysql errors meaning the change is already in the schema (table / column / index exists)
+ALREADY_APPLIED_ERRORS = {1050, 1060, 1061, 1826}
+
+CREATE_SCHEMA_MIGRATIONS = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+  version int NOT NULL,
+  name varchar(100) NOT NULL,
+  applied_at datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (version)
+)
+"""
+
+
+def list_migrations():
+    """
+    :return: sorted list of (version, name, path) found in the migrations folder
+    """
+    found = []
+    for filename in os.listdir(MIGRATIONS_DIR):
+        m = MIGRATION_FILE.match(filename)
+        if m:
+            found.append((int(m.group(1)), m.group(2), os.path.join(MIGRATIONS_DIR, filename)))
+    return sorted(found)
+
+
+def split_statements(sql: str):
+    """
+    split a migration file into statements (';' at end of line), dropping '--' comment lines
+    :return: list of statements
+    """
+    lines = [ln for ln in sql.splitlines() if not ln.strip().startswith("--")]
+    statements = re.split(r";\s*$", "\n".join(lines), flags=re.MULTILINE)
+    return [st.strip() for st in statements if st.strip()]
+
+
+def applied_versions():
+    """
+    :return: set of versions already recorded in schema_migrations
+    """
+    with db_cur() as cursor:
+        cursor.execute(CREATE_SCHEMA_MIGRATIONS)
+        cursor.execute("SELECT version FROM schema_migrations")
+        return {int(r[0]) for r in cursor.fetchall()}
+
+
+def apply_migration(version: int, name: str, path: str):
+    """
+    run all statements of one migration and record it
+    :return: number of statements that were skipped because the change already exists
+    """
+    with open(path, encoding="utf-8") as f:
+        statements = split_statements(f.read())
+
+    skipped = 0
+    with db_cur() as cursor:
+        for statement in statements:
+            try:
+                cursor.execute(statement)
+            except mysql.connector.Error as err:
+                if err.errno not in ALREADY_APPLIED_ERRORS:
+                    raise
+                skipped += 1
+        cursor.execute("INSERT INTO schema_migrations (version, name) VALUES (%s, %s)", (version, name))
+    return skipped
+
+
+def migrate(dry_run: bool = False):
+    """
+    apply all pending migrations in version order
+    :param dry_run: only list what would be applied
+    :return: (applied, pending) lists of (version, name). a dry run applies nothing, so everything is pending
+    """
+    done = applied_versions()
+    pending = [m for m in list_migrations() if m[0] not in done]
+    if not pending:
+        print("schema is up to date")
+    if dry_run:
+        for version, name, _ in pending:
+            print(f"would apply {version:04d}_{name}")
+        return [], [(v, n) for v, n, _ in pending]
+
+    applied = []
+    for version, name, path in pending:
+        skipped = apply_migration(version, name, path)
+        note = f" ({skipped} statement(s) already present)" if skipped else ""
+        print(f"applied {version:04d}_{name}{note}")
+        applied.append((version, name))
+    return applied, []
+
+
+def main():
+    """
+    python migrate.py [--status] [--dry-run]
+    """
+    parser = argparse.ArgumentParser(description="FlyTAU schema migrations")
+    parser.add_argument("--status", action="store_true", help="list migrations and whether they were applied")
+    parser.add_argument("--dry-run", action="store_true", help="show pending migrations without applying them")
+    args = parser.parse_args()
+
+    if args.status:
+        done = applied_versions()
+        for version, name, _ in list_migrations():
+            print(f"{'applied' if version in done else 'pending'}  {version:04d}_{name}")
+        return
+
+    migrate(dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+-- watermark table for incremental flight landing + index for the arrival_datetime range scan
+CREATE TABLE IF NOT EXISTS `maintenance_state` (
+  `name` varchar(50) NOT NULL,
+  `watermark` datetime DEFAULT NULL,
+  PRIMARY KEY (`name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+ALTER TABLE `flight` ADD KEY `arrival_datetime` (`arrival_datetime`);
@@ -0,0 +1,18 @@
+-- per-flight, per-class seat counters (filled from the existing flight_seat rows)
+CREATE TABLE IF NOT EXISTS `flight_inventory` (
+  `flight_num` varchar(20) NOT NULL,
+  `class_type` varchar(30) NOT NULL,
+  `total_seats` int NOT NULL DEFAULT '0',
+  `available_seats` int NOT NULL DEFAULT '0',
+  `sold_seats` int NOT NULL DEFAULT '0',
+  PRIMARY KEY (`flight_num`,`class_type`),
+  CONSTRAINT `flight_inventory_ibfk_1` FOREIGN KEY (`flight_num`) REFERENCES `flight` (`flight_num`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+INSERT IGNORE INTO `flight_inventory` (flight_num, class_type, total_seats, available_seats, sold_seats)
+SELECT flight_num, class_type,
+       COUNT(*),
+       SUM(CASE WHEN seat_status = 'available' THEN 1 ELSE 0 END),
+       SUM(CASE WHEN seat_status = 'available' THEN 0 ELSE 1 END)
+FROM flight_seat
+GROUP BY flight_num, class_type;
@@ -0,0 +1,2 @@
+-- covering index for flight search: equality on route + status, range on departure_datetime
+ALTER TABLE `flight` ADD KEY `flight_search` (`origin_airport`,`destination_airport`,`status`,`departure_datetime`,`arrival_datetime`,`airplane_id`);
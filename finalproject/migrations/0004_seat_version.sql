@@ -0,0 +1,6 @@
+-- per-flight seat map version: bumped by every seat change, stamped on the changed flight_seat rows
+ALTER TABLE `flight` ADD COLUMN `seat_version` bigint NOT NULL DEFAULT '0';
+
+ALTER TABLE `flight_seat` ADD COLUMN `seat_version` bigint NOT NULL DEFAULT '0';
+
+ALTER TABLE `flight_seat` ADD KEY `flight_seat_version` (`flight_num`,`seat_version`);
@@ -0,0 +1,6 @@
+-- temporary seat holds: seat_status = 'held' until hold_expires_at, owned by the session's hold_token
+ALTER TABLE `flight_seat` ADD COLUMN `hold_token` varchar(64) DEFAULT NULL;
+
+ALTER TABLE `flight_seat` ADD COLUMN `hold_expires_at` datetime DEFAULT NULL;
+
+ALTER TABLE `flight_seat` ADD KEY `seat_hold_expiry` (`seat_status`,`hold_expires_at`);
@@ -0,0 +1,7 @@
+-- idempotency key of the order submission, per customer: a replayed POST finds the original order instead of
+-- booking again. request_hash (sha256 of the flight and seats) tells a replay from a reused key with another payload
+ALTER TABLE `orders`
+  ADD COLUMN `idempotency_key` varchar(64) DEFAULT NULL,
+  ADD COLUMN `request_hash` char(64) DEFAULT NULL;
+
+ALTER TABLE `orders` ADD UNIQUE KEY `order_idempotency_key` (`email`, `idempotency_key`);
@@ -0,0 +1,17 @@
+-- seats of the order, stored on the order so the order history doesn't join and group order_seat
+ALTER TABLE `orders` ADD COLUMN `seats_count` int NOT NULL DEFAULT '0';
+
+UPDATE `orders` o
+JOIN (
+    SELECT order_id, COUNT(*) AS seats
+    FROM `order_seat`
+    GROUP BY order_id
+) os ON os.order_id = o.order_id
+SET o.seats_count = os.seats;
+
+-- order history pages: keyset on (order_date, order_id) per customer, with or without a status filter
+-- (order_id is the primary key, so InnoDB already appends it to both indexes)
+ALTER TABLE `orders`
+  ADD KEY `order_history` (`email`, `order_date`),
+  ADD KEY `order_history_status` (`email`, `status`, `order_date`),
+  DROP KEY `email`;
@@ -0,0 +1,5 @@
+-- manager dashboard pages: flights by departure (keyset on departure_datetime, flight_num), with or without a status
+-- (flight_num is the primary key, so InnoDB already appends it to both indexes)
+ALTER TABLE `flight`
+  ADD KEY `flight_departure` (`departure_datetime`),
+  ADD KEY `flight_status_departure` (`status`, `departure_datetime`);
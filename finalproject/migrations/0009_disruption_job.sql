@@ -0,0 +1,17 @@
+-- progress of bulk disruption jobs, so every worker process can answer the progress poll and a job cut off by a
+-- restart still has a record
+CREATE TABLE IF NOT EXISTS `disruption_job` (
+  `job_id` varchar(12) NOT NULL,
+  `disruption_filter` varchar(500) NOT NULL,
+  `state` varchar(20) NOT NULL,
+  `started_at` datetime NOT NULL,
+  `updated_at` datetime NOT NULL,
+  `finished_at` datetime DEFAULT NULL,
+  `done_flights` int NOT NULL DEFAULT '0',
+  `total_flights` int DEFAULT NULL,
+  `cancelled_orders` int NOT NULL DEFAULT '0',
+  `duration_ms` decimal(12,2) DEFAULT NULL,
+  `error` varchar(500) DEFAULT NULL,
+  PRIMARY KEY (`job_id`),
+  KEY `disruption_job_started` (`started_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
@@ -6,71 +6,167 @@ WHERE status <> 'cancelled'
   AND arrival_datetime <= NOW()
 """
 
+#full maintenance pass only: aggregates the whole inventory
 FLIGHT_STATUS_FULLY_BOOKED = """
 UPDATE flight f
+JOIN (
+    SELECT flight_num, SUM(available_seats) AS available
+    FROM flight_inventory
+    GROUP BY flight_num
+) fi ON fi.flight_num = f.flight_num
 SET f.status = 'fully booked'
-WHERE f.status NOT IN ('cancelled','landed')
-  AND NOT EXISTS (
-      SELECT 1
-      FROM flight_seat fs
-      WHERE fs.flight_num = f.flight_num
-        AND fs.seat_status = 'available'
-  );
+WHERE f.status NOT IN ('cancelled','landed','fully booked')
+  AND fi.available = 0;
 """
 
 FLIGHT_STATUS_ACTIVE_FROM_FULLY_BOOKED = """
 UPDATE flight f
+JOIN (
+    SELECT flight_num, SUM(available_seats) AS available
+    FROM flight_inventory
+    GROUP BY flight_num
+) fi ON fi.flight_num = f.flight_num
 SET f.status = 'active'
 WHERE f.status = 'fully booked'
-  AND EXISTS (
-      SELECT 1
-      FROM flight_seat fs
-      WHERE fs.flight_num = f.flight_num
-        AND fs.seat_status = 'available'
-  );
+  AND fi.available > 0;
+"""
+
+#fully booked status of given flights only, from their inventory rows: {flights} is a "%s, %s, ..." list
+FLIGHTS_FULLY_BOOKED_IF_SOLD_OUT = """
+UPDATE flight f
+SET f.status = 'fully booked'
+WHERE f.flight_num IN ({flights})
+  AND f.status NOT IN ('cancelled','landed','fully booked')
+  AND EXISTS (SELECT 1 FROM flight_inventory fi WHERE fi.flight_num = f.flight_num)
+  AND NOT EXISTS (SELECT 1 FROM flight_inventory fi WHERE fi.flight_num = f.flight_num AND fi.available_seats > 0)
+"""
+
+FLIGHTS_ACTIVE_IF_SEATS_LEFT = """
+UPDATE flight f
+SET f.status = 'active'
+WHERE f.flight_num IN ({flights})
+  AND f.status = 'fully booked'
+  AND EXISTS (SELECT 1 FROM flight_inventory fi WHERE fi.flight_num = f.flight_num AND fi.available_seats > 0)
+"""
+
+ALL_ROUTES = """
+SELECT origin_airport, destination_airport, duration
+FROM routes
+ORDER BY origin_airport, destination_airport;
 """
 
-ALL_AIRPORTS = """
-SELECT airport
+ROUTES_VERSION = """
+SELECT COUNT(*),
+       COALESCE(SUM(CRC32(CONCAT_WS('|', origin_airport, destination_airport, duration))), 0)
+FROM routes;
+"""
+
+#flights of a route (both directions) departing on one day: half-open [day, day+1) ranges, so each direction is
+#one range seek on the flight_search index. seats left are read separately (SEATS_LEFT_FOR_FLIGHTS)
+SEARCH_FLIGHTS = """
+SELECT f.flight_num, f.departure_datetime, f.arrival_datetime, f.status,
+       f.origin_airport, f.destination_airport, f.airplane_id
+FROM flight f
+WHERE f.origin_airport = %s AND f.destination_airport = %s
+  AND f.status IN ('active', 'delayed')
+  AND f.departure_datetime >= %s AND f.departure_datetime < %s
+  AND f.departure_datetime > NOW()
+UNION ALL
+SELECT f.flight_num, f.departure_datetime, f.arrival_datetime, f.status,
+       f.origin_airport, f.destination_airport, f.airplane_id
+FROM flight f
+WHERE f.origin_airport = %s AND f.destination_airport = %s
+  AND f.status IN ('active', 'delayed')
+  AND f.departure_datetime >= %s AND f.departure_datetime < %s
+  AND f.departure_datetime > NOW()
+ORDER BY departure_datetime, flight_num;
+"""
+
+#days of a route (both directions) with upcoming flights before a bound, and the most seats left on a flight of the day
+SEARCH_DATES = """
+SELECT DATE(c.departure_datetime) AS flight_date, MAX(c.available_seats) AS most_seats
 FROM (
-    SELECT origin_airport AS airport FROM routes
-    UNION
-    SELECT destination_airport AS airport FROM routes
-) t
-ORDER BY airport;
+    SELECT f.departure_datetime,
+           (SELECT COALESCE(SUM(fi.available_seats), 0)
+            FROM flight_inventory fi
+            WHERE fi.flight_num = f.flight_num) AS available_seats
+    FROM flight f
+    WHERE f.origin_airport = %s AND f.destination_airport = %s
+      AND f.status IN ('active', 'delayed')
+      AND f.departure_datetime > NOW() AND f.departure_datetime < %s
+    UNION ALL
+    SELECT f.departure_datetime,
+           (SELECT COALESCE(SUM(fi.available_seats), 0)
+            FROM flight_inventory fi
+            WHERE fi.flight_num = f.flight_num) AS available_seats
+    FROM flight f
+    WHERE f.origin_airport = %s AND f.destination_airport = %s
+      AND f.status IN ('active', 'delayed')
+      AND f.departure_datetime > NOW() AND f.departure_datetime < %s
+) c
+GROUP BY flight_date
+ORDER BY flight_date;
 """
 
-GET_AVAILABLE_FLIGHT_DATES = """
-SELECT DISTINCT DATE(departure_datetime)
-FROM flight
-WHERE status IN ('active', 'delayed')
-  AND departure_datetime > NOW()
-  AND (
-        (origin_airport = %s AND destination_airport = %s)
-     OR (origin_airport = %s AND destination_airport = %s)
-  )
-ORDER BY DATE(departure_datetime);
+FARE_CALENDAR = """
+SELECT DATE(f.departure_datetime) AS flight_date,
+       fcp.class_type,
+       COUNT(*) AS flights,
+       MIN(fcp.price) AS lowest_price
+FROM (
+    SELECT flight_num, departure_datetime
+    FROM flight
+    WHERE origin_airport = %s AND destination_airport = %s
+      AND status IN ('active', 'delayed')
+      AND departure_datetime >= %s AND departure_datetime < %s
+    UNION ALL
+    SELECT flight_num, departure_datetime
+    FROM flight
+    WHERE origin_airport = %s AND destination_airport = %s
+      AND status IN ('active', 'delayed')
+      AND departure_datetime >= %s AND departure_datetime < %s
+) f
+JOIN flight_class_price fcp
+  ON fcp.flight_num = f.flight_num
+WHERE f.departure_datetime > NOW()
+GROUP BY flight_date, fcp.class_type
+ORDER BY flight_date, fcp.class_type;
 """
 
-GET_ALL_FLIGHT_DATA = """
-SELECT *
-FROM flight
-WHERE status IN ('active','delayed')
-  AND DATE(departure_datetime) = %s
-  AND (
-        (origin_airport = %s AND destination_airport = %s)
-     OR (origin_airport = %s AND destination_airport = %s)
-  );
+TIMETABLE_FLIGHTS = """
+SELECT f.flight_num, f.origin_airport, f.destination_airport,
+       f.departure_datetime, f.arrival_datetime,
+       COALESCE(fi.available_seats, 0)
+FROM flight f
+LEFT JOIN (
+    SELECT flight_num, SUM(available_seats) AS available_seats
+    FROM flight_inventory
+    GROUP BY flight_num
+) fi ON fi.flight_num = f.flight_num
+WHERE f.status IN ('active', 'delayed')
+  AND f.departure_datetime > NOW()
 """
 
-DOES_ROUTE_EXIST = """
-SELECT 1
-FROM routes
-WHERE (origin_airport = %s AND destination_airport = %s)
-   OR (origin_airport = %s AND destination_airport = %s)
-LIMIT 1;
+TIMETABLE_FLIGHT = """
+SELECT f.flight_num, f.origin_airport, f.destination_airport,
+       f.departure_datetime, f.arrival_datetime,
+       (SELECT COALESCE(SUM(fi.available_seats), 0)
+        FROM flight_inventory fi
+        WHERE fi.flight_num = f.flight_num)
+FROM flight f
+WHERE f.flight_num = %s
+  AND f.status IN ('active', 'delayed')
+  AND f.departure_datetime > NOW()
 """
 
+SEATS_LEFT_FOR_FLIGHTS = """
+SELECT flight_num, SUM(available_seats)
+FROM flight_inventory
+WHERE flight_num IN ({placeholders})
+GROUP BY flight_num
+"""
+
+#{cancellable} is the SQL cancellation rule (utils.order_cancellable_sql / flight_cancellable_sql) in the queries below
 FIND_GUEST_ORDER = """
 SELECT
   o.order_id,
@@ -84,42 +180,52 @@ SELECT
   f.departure_datetime,
   f.arrival_datetime,
   f.status AS flight_status,
-  COUNT(os.row_num) AS seats_count
+  o.seats_count,
+  {cancellable} AS cancellable
 FROM orders o
 JOIN flight f
   ON f.flight_num = o.flight_num
-LEFT JOIN order_seat os
-  ON os.order_id = o.order_id
 WHERE o.email = %s
   AND o.order_id = %s
-GROUP BY
-  o.order_id, o.order_date, o.status, o.total_paid, o.cancellation_fee,
-  f.flight_num, f.origin_airport, f.destination_airport,
-  f.departure_datetime, f.arrival_datetime, f.status
 """
 
-FIND_CUSTOMER_ORDERS = """
-SELECT
-  o.order_id,
-  o.order_date,
-  o.status AS order_status,
-  o.total_paid,
-  o.cancellation_fee,
-  f.flight_num,
-  f.origin_airport,
-  f.destination_airport,
-  f.departure_datetime,
-  f.arrival_datetime,
-  f.status AS flight_status,
-  COUNT(os.row_num) AS seats_count
-FROM orders o
-JOIN flight f
-  ON f.flight_num = o.flight_num
-LEFT JOIN order_seat os
-  ON os.order_id = o.order_id
-WHERE o.email = %s
+#order history: one page of orders (keyset on order_date, order_id - newest first), the customer's order count
+#per status and the number of cancellable orders, in one round trip. {filters} are optional ORDER_HISTORY_* conditions
+#the status / cancellable counts ({facets} = ORDER_HISTORY_FACETS) scan all of the customer's orders, so they are
+#only computed for the first page and carried in the cursor of the next pages
+ORDER_HISTORY_PAGE = """
+(SELECT 'order' AS kind,
+        o.order_id, o.order_date, o.status, o.total_paid, o.cancellation_fee,
+        f.flight_num, f.origin_airport, f.destination_airport,
+        f.departure_datetime, f.arrival_datetime, f.status AS flight_status,
+        o.seats_count, {cancellable} AS cancellable
+ FROM orders o
+ JOIN flight f ON f.flight_num = o.flight_num
+ WHERE o.email = %s {filters}
+ ORDER BY o.order_date DESC, o.order_id DESC
+ LIMIT %s)
+{facets}
+"""
+
+ORDER_HISTORY_FACETS = """
+UNION ALL
+(SELECT 'status', NULL, NULL, o.status, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, COUNT(*), NULL
+ FROM orders o
+ WHERE o.email = %s
+ GROUP BY o.status)
+UNION ALL
+(SELECT 'cancellable', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, COUNT(*), NULL
+ FROM orders o
+ JOIN flight f ON f.flight_num = o.flight_num
+ WHERE o.email = %s AND {cancellable})
 """
 
+ORDER_HISTORY_STATUS = "AND o.status = %s"
+
+ORDER_HISTORY_CANCELLABLE = "AND {cancellable}"
+
+ORDER_HISTORY_AFTER = "AND (o.order_date < %s OR (o.order_date = %s AND o.order_id < %s))"
+
 ORDER_DETAILS = """
 SELECT o.order_id, o.order_date, o.status,
      o.total_paid, o.cancellation_fee,
@@ -131,7 +237,31 @@ WHERE o.order_id=%s AND o.email=%s
 LIMIT 1
 """
 
-RELEASE_SEATS_OF_ORDER = """
+#order cancellation: {orders} is a "%s, %s, ..." list of order ids
+ORDERS_TO_CANCEL = """
+SELECT o.order_id, o.flight_num, {cancellable} AS cancellable
+FROM orders o
+JOIN flight f ON f.flight_num = o.flight_num
+WHERE o.order_id IN ({orders}) AND o.email = %s
+"""
+
+CANCEL_ORDERS = """
+UPDATE orders
+SET status = 'customer cancellation',
+    total_paid = cancellation_fee,
+    cancellation_fee = 0,
+    seats_count = 0
+WHERE order_id IN ({orders}) AND email = %s
+"""
+
+SEATS_OF_ORDERS = """
+SELECT flight_num, class_type, row_num, column_letter
+FROM order_seat
+WHERE order_id IN ({orders})
+"""
+
+#the flights' seat versions were bumped in the same transaction - stamp the released seats with them
+RELEASE_SEATS_OF_ORDERS = """
 UPDATE flight_seat fs
 JOIN order_seat os
   ON os.flight_num = fs.flight_num
@@ -139,9 +269,15 @@ JOIN order_seat os
  AND os.class_type = fs.class_type
  AND os.row_num = fs.row_num
  AND os.column_letter = fs.column_letter
-SET fs.seat_status = 'available'
-WHERE os.order_id = %s
-  AND fs.flight_num = %s
+JOIN flight f ON f.flight_num = fs.flight_num
+SET fs.seat_status = 'available',
+    fs.seat_version = f.seat_version
+WHERE os.order_id IN ({orders})
+"""
+
+DELETE_SEATS_OF_ORDERS = """
+DELETE FROM order_seat
+WHERE order_id IN ({orders})
 """
 
 CANCELLATION_RATE_BY_MONTH = """
@@ -304,47 +440,76 @@ AND DATE(%s) >= DATE(w.work_start_date)
 ORDER BY fa.worker_id;
 """
 
-SEAT_MAP = """
-SELECT
-    sp.class_type,
-    sp.row_num,
-    sp.column_letter,
-    CASE
-      WHEN os.flight_num IS NOT NULL AND o.status = "Active" THEN 'TAKEN'
-      WHEN fs.seat_status = 'available' THEN 'AVAILABLE'
-      ELSE 'TAKEN'
-    END AS final_status,
-    fcp.price
+SEAT_LAYOUT = """
+SELECT class_type, row_num, column_letter
+FROM seat_position
+WHERE airplane_id = %s
+"""
+
+#one status read per seat map: the flight's airplane, seat version and number of flight_seat rows (in row_num),
+#its class prices and only the seats that are not available
+FLIGHT_SEAT_STATUS = """
+SELECT 'flight' AS kind, f.airplane_id, NULL AS class_type,
+       (SELECT COUNT(*) FROM flight_seat fs WHERE fs.flight_num = f.flight_num) AS row_num,
+       NULL AS column_letter, NULL AS price, f.seat_version
 FROM flight f
-JOIN seat_position sp
-  ON sp.airplane_id = f.airplane_id
+WHERE f.flight_num = %s
+UNION ALL
+SELECT 'price', fcp.airplane_id, fcp.class_type, NULL, NULL, fcp.price, NULL
+FROM flight_class_price fcp
+WHERE fcp.flight_num = %s
+UNION ALL
+SELECT 'taken', fs.airplane_id, fs.class_type, fs.row_num, fs.column_letter, NULL, NULL
+FROM flight_seat fs
+WHERE fs.flight_num = %s
+  AND (fs.seat_status IS NULL OR fs.seat_status <> 'available')
+"""
 
-LEFT JOIN flight_seat fs
-  ON fs.flight_num = f.flight_num
- AND fs.airplane_id = sp.airplane_id
- AND fs.class_type = sp.class_type
- AND fs.row_num = sp.row_num
- AND fs.column_letter = sp.column_letter
-
-LEFT JOIN order_seat os
-  ON os.flight_num = f.flight_num
- AND os.airplane_id = sp.airplane_id
- AND os.class_type = sp.class_type
- AND os.row_num = sp.row_num
- AND os.column_letter = sp.column_letter
+#seats of a flight that have a flight_seat row (only read when some are missing - those can't be booked)
+FLIGHT_SEAT_POSITIONS = """
+SELECT class_type, row_num, column_letter
+FROM flight_seat
+WHERE flight_num = %s
+"""
 
-LEFT JOIN orders o
-  ON os.order_id = o.order_id
+#seat versions: every seat change bumps flight.seat_version (in the changing transaction) and stamps the changed seats
+BUMP_SEAT_VERSION = """
+UPDATE flight
+SET seat_version = LAST_INSERT_ID(seat_version + 1)
+WHERE flight_num = %s
+"""
+
+GET_SEAT_VERSION = """
+SELECT seat_version
+FROM flight
+WHERE flight_num = %s
+"""
 
-LEFT JOIN flight_class_price fcp
-  ON fcp.flight_num  = f.flight_num
- AND fcp.airplane_id = f.airplane_id
- AND fcp.class_type  = sp.class_type
+#seat versions of the flights watched through the seat event stream: {flights} is a "%s, %s, ..." list
+SEAT_VERSIONS = """
+SELECT flight_num, seat_version
+FROM flight
+WHERE flight_num IN ({flights})
+"""
 
+#full seat availability: the version and the seats that are not available (one snapshot)
+SEATS_TAKEN_WITH_VERSION = """
+SELECT f.seat_version, fs.class_type, fs.row_num, fs.column_letter, fs.seat_status
+FROM flight f
+LEFT JOIN flight_seat fs
+  ON fs.flight_num = f.flight_num
+ AND (fs.seat_status IS NULL OR fs.seat_status <> 'available')
+WHERE f.flight_num = %s
+"""
+
+#delta seat availability: the version and the seats changed after a given version
+SEAT_CHANGES_SINCE = """
+SELECT f.seat_version, fs.class_type, fs.row_num, fs.column_letter, fs.seat_status
+FROM flight f
+LEFT JOIN flight_seat fs
+  ON fs.flight_num = f.flight_num
+ AND fs.seat_version > %s
 WHERE f.flight_num = %s
-ORDER BY
-  CASE sp.class_type WHEN 'Business' THEN 0 WHEN 'Economy' THEN 1 ELSE 2 END,
-  sp.row_num, sp.column_letter;
 """
 
 INSERT_GUEST_INTO_USERS = """
@@ -355,9 +520,56 @@ ON DUPLICATE KEY UPDATE
   l_name = VALUES(l_name)
 """
 
+#booking: the flight row is locked by the seat version bump, the requested seats by primary key
+FLIGHT_FOR_BOOKING = """
+SELECT airplane_id, status, departure_datetime > NOW()
+FROM flight
+WHERE flight_num = %s
+"""
+
+LOCK_SEATS_FOR_BOOKING = """
+SELECT class_type, row_num, column_letter, seat_status, hold_token, hold_expires_at <= NOW()
+FROM flight_seat
+WHERE (flight_num, airplane_id, class_type, row_num, column_letter) IN ({seats})
+FOR UPDATE
+"""
+
+#only seats that are still free (or held by the booking session / an expired hold) are taken - rowcount is verified
+TAKE_SEATS = """
+UPDATE flight_seat
+SET seat_status = 'taken', hold_token = NULL, hold_expires_at = NULL, seat_version = %s
+WHERE (flight_num, airplane_id, class_type, row_num, column_letter) IN ({seats})
+  AND (seat_status = 'available'
+       OR (seat_status = 'held' AND (hold_token = %s OR hold_expires_at <= NOW())))
+"""
+
+#group booking by count: the first N free seats of a class (front rows first), locked
+PICK_FREE_SEATS = """
+SELECT class_type, row_num, column_letter, seat_status, hold_token, hold_expires_at <= NOW()
+FROM flight_seat
+WHERE flight_num = %s AND class_type = %s AND seat_status = 'available'
+ORDER BY row_num, column_letter
+LIMIT %s
+FOR UPDATE
+"""
+
+FLIGHT_CLASS_PRICES = """
+SELECT class_type, price
+FROM flight_class_price
+WHERE flight_num = %s
+"""
+
 INSERT_TO_ORDERS = """
-INSERT INTO orders (email, flight_num, order_date, status, total_paid, cancellation_fee)
-VALUES (%s, %s, %s, 'Active', %s, %s)
+INSERT INTO orders (email, flight_num, order_date, status, total_paid, cancellation_fee, idempotency_key,
+                    request_hash, seats_count)
+VALUES (%s, %s, %s, 'Active', %s, %s, %s, %s, %s)
+"""
+
+#idempotency keys are chosen by the client, so they are only unique per customer
+ORDER_BY_IDEMPOTENCY_KEY = """
+SELECT order_id, request_hash
+FROM orders
+WHERE email = %s AND idempotency_key = %s
 """
 
 INSERT_INTO_ORDER_SEAT = """
@@ -367,9 +579,90 @@ VALUES (%s, %s, %s, %s, %s, %s, %s)
 """
 
 CHECK_AVAILABLE_SEATS = """
-SELECT COUNT(*)
+SELECT COALESCE(SUM(available_seats), 0)
+FROM flight_inventory
+WHERE flight_num = %s
+"""
+
+INIT_FLIGHT_INVENTORY = """
+INSERT INTO flight_inventory (flight_num, class_type, total_seats, available_seats, sold_seats)
+SELECT flight_num, class_type, COUNT(*), COUNT(*), 0
 FROM flight_seat
-WHERE flight_num = %s AND seat_status = 'available'
+WHERE flight_num = %s
+GROUP BY flight_num, class_type
+"""
+
+INVENTORY_TAKE_SEATS = """
+UPDATE flight_inventory
+SET available_seats = available_seats - %s,
+    sold_seats = sold_seats + %s
+WHERE flight_num = %s AND class_type = %s
+"""
+
+INVENTORY_RELEASE_SEATS_OF_ORDERS = """
+UPDATE flight_inventory fi
+JOIN (
+    SELECT flight_num, class_type, COUNT(*) AS seats
+    FROM order_seat
+    WHERE order_id IN ({orders})
+    GROUP BY flight_num, class_type
+) os ON os.flight_num = fi.flight_num
+    AND os.class_type = fi.class_type
+SET fi.available_seats = fi.available_seats + os.seats,
+    fi.sold_seats = fi.sold_seats - os.seats
+"""
+INVENTORY_RELEASE_FLIGHT = """
+UPDATE flight_inventory
+SET available_seats = total_seats,
+    sold_seats = 0
+WHERE flight_num = %s
+"""
+
+FLIGHT_ACTIVE_IF_SEATS_FREED = """
+UPDATE flight
+SET status = 'active'
+WHERE flight_num = %s
+  AND status = 'fully booked'
+"""
+
+FULLY_BOOKED_FLIGHTS = """
+SELECT flight_num
+FROM flight
+WHERE flight_num IN ({flights})
+  AND status = 'fully booked'
+"""
+
+INVENTORY_FROM_SEATS = """
+SELECT flight_num, class_type,
+       COUNT(*) AS total_seats,
+       SUM(CASE WHEN seat_status IN ('available', 'held') THEN 1 ELSE 0 END) AS available_seats,
+       SUM(CASE WHEN seat_status IN ('available', 'held') THEN 0 ELSE 1 END) AS sold_seats
+FROM flight_seat
+{where}
+GROUP BY flight_num, class_type
+"""
+
+INVENTORY_DRIFT = """
+SELECT s.flight_num, s.class_type,
+       fi.available_seats, s.available_seats,
+       fi.sold_seats, s.sold_seats
+FROM ({seats}) s
+LEFT JOIN flight_inventory fi
+  ON fi.flight_num = s.flight_num
+ AND fi.class_type = s.class_type
+WHERE fi.flight_num IS NULL
+   OR fi.total_seats <> s.total_seats
+   OR fi.available_seats <> s.available_seats
+   OR fi.sold_seats <> s.sold_seats
+"""
+
+RECONCILE_INVENTORY = """
+INSERT INTO flight_inventory (flight_num, class_type, total_seats, available_seats, sold_seats)
+{seats}
+ON DUPLICATE KEY UPDATE
+  total_seats = VALUES(total_seats),
+  available_seats = VALUES(available_seats),
+  sold_seats = VALUES(sold_seats)
 """
 
 ORDER_SEATS = """
@@ -396,4 +689,232 @@ WHERE status <> 'cancelled'
 """
 
 CHANGE_ORDER_STATUS_AFTER_LANDING= """
-UPDATE orders SET status = 'completed' WHERE flight_num = %s """
\ No newline at end of file
+UPDATE orders SET status = 'completed' WHERE flight_num = %s """
+
+GET_MAINTENANCE_WATERMARK = """
+SELECT watermark
+FROM maintenance_state
+WHERE name = %s
+"""
+
+SET_MAINTENANCE_WATERMARK = """
+INSERT INTO maintenance_state (name, watermark)
+VALUES (%s, %s)
+ON DUPLICATE KEY UPDATE watermark = VALUES(watermark)
+"""
+
+LAND_FLIGHTS_ARRIVED_BETWEEN = """
+UPDATE flight
+SET status = 'landed'
+WHERE arrival_datetime > %s
+  AND arrival_datetime <= %s
+  AND status NOT IN ('cancelled', 'landed')
+"""
+
+COMPLETE_ORDERS_ARRIVED_BETWEEN = """
+UPDATE orders o
+JOIN flight f
+  ON f.flight_num = o.flight_num
+SET o.status = 'completed'
+WHERE f.arrival_datetime > %s
+  AND f.arrival_datetime <= %s
+  AND f.status = 'landed'
+  AND o.status IN ('Active', 'active')
+"""
+
+
+#seat holds: seat_status = 'held' until hold_expires_at, owned by a session hold token.
+#holds don't change flight_inventory - a held seat is still unsold
+SEATS_FOR_HOLD = """
+SELECT class_type, row_num, column_letter, seat_status, hold_token, hold_expires_at <= NOW()
+FROM flight_seat
+WHERE flight_num = %s AND (class_type, row_num, column_letter) IN ({seats})
+FOR UPDATE
+"""
+
+HOLDS_OF_TOKEN = """
+SELECT class_type, row_num, column_letter
+FROM flight_seat
+WHERE flight_num = %s AND seat_status = 'held' AND hold_token = %s
+"""
+
+RELEASE_HOLDS_OF_TOKEN = """
+UPDATE flight_seat
+SET seat_status = 'available', hold_token = NULL, hold_expires_at = NULL, seat_version = %s
+WHERE flight_num = %s AND seat_status = 'held' AND hold_token = %s
+"""
+
+HOLD_SEATS = """
+UPDATE flight_seat
+SET seat_status = 'held', hold_token = %s, hold_expires_at = NOW() + INTERVAL %s SECOND, seat_version = %s
+WHERE flight_num = %s AND (class_type, row_num, column_letter) IN ({seats})
+"""
+
+FLIGHTS_WITH_EXPIRED_HOLDS = """
+SELECT DISTINCT flight_num
+FROM flight_seat
+WHERE seat_status = 'held' AND hold_expires_at <= %s
+LIMIT %s
+"""
+
+EXPIRED_HOLDS_OF_FLIGHT = """
+SELECT class_type, row_num, column_letter
+FROM flight_seat
+WHERE flight_num = %s AND seat_status = 'held' AND hold_expires_at <= %s
+FOR UPDATE
+"""
+
+RELEASE_EXPIRED_HOLDS_OF_FLIGHT = """
+UPDATE flight_seat
+SET seat_status = 'available', hold_token = NULL, hold_expires_at = NULL, seat_version = %s
+WHERE flight_num = %s AND seat_status = 'held' AND hold_expires_at <= %s
+"""
+
+#bulk disruption: {where} is the flight filter, {flights} a "%s, %s, ..." list of flight numbers,
+#{cancellable} the 72 hour rule (utils.flight_cancellable_sql)
+DISRUPTION_PREVIEW = """
+SELECT f.flight_num, f.origin_airport, f.destination_airport, f.departure_datetime, f.status, f.airplane_id,
+       COUNT(o.order_id) AS active_orders,
+       COALESCE(SUM(o.total_paid), 0) AS active_revenue,
+       {cancellable} AS cancellable
+FROM flight f
+LEFT JOIN orders o
+  ON o.flight_num = f.flight_num
+ AND (o.status = 'active' OR o.status = 'Active')
+WHERE f.status <> 'cancelled' AND {where}
+GROUP BY f.flight_num
+ORDER BY f.departure_datetime, f.flight_num
+"""
+
+DISRUPTION_FLIGHTS = """
+SELECT f.flight_num
+FROM flight f
+WHERE {where} AND {cancellable}
+ORDER BY f.flight_num
+"""
+
+LOCK_CANCELLABLE_FLIGHTS = """
+SELECT f.flight_num
+FROM flight f
+WHERE f.flight_num IN ({flights}) AND {cancellable}
+ORDER BY f.flight_num
+FOR UPDATE
+"""
+
+CANCEL_FLIGHTS = """
+UPDATE flight
+SET status = 'cancelled',
+    seat_version = seat_version + 1
+WHERE flight_num IN ({flights})
+"""
+
+SEAT_VERSIONS_OF_FLIGHTS = """
+SELECT flight_num, seat_version
+FROM flight
+WHERE flight_num IN ({flights})
+"""
+
+SYSTEM_CANCEL_ORDERS_OF_FLIGHTS = """
+UPDATE orders
+SET total_paid = 0, cancellation_fee = 0, seats_count = 0, status = 'system cancellation'
+WHERE flight_num IN ({flights})
+  AND (status = 'active' OR status = 'Active')
+"""
+
+DELETE_ORDER_SEATS_OF_FLIGHTS = """
+DELETE FROM order_seat
+WHERE flight_num IN ({flights})
+"""
+
+RELEASE_SEATS_OF_FLIGHTS = """
+UPDATE flight_seat fs
+JOIN flight f ON f.flight_num = fs.flight_num
+SET fs.seat_status = 'available', fs.hold_token = NULL, fs.hold_expires_at = NULL,
+    fs.seat_version = f.seat_version
+WHERE fs.flight_num IN ({flights})
+"""
+
+INVENTORY_RELEASE_FLIGHTS = """
+UPDATE flight_inventory
+SET available_seats = total_seats,
+    sold_seats = 0
+WHERE flight_num IN ({flights})
+"""
+
+#bulk disruption jobs: progress kept in disruption_job so any worker process can report it
+INSERT_DISRUPTION_JOB = """
+INSERT INTO disruption_job (job_id, disruption_filter, state, started_at, updated_at)
+VALUES (%s, %s, 'running', NOW(), NOW())
+"""
+
+DISRUPTION_JOB_PROGRESS = """
+UPDATE disruption_job
+SET done_flights = %s, total_flights = %s, cancelled_orders = %s, updated_at = NOW()
+WHERE job_id = %s
+"""
+
+FINISH_DISRUPTION_JOB = """
+UPDATE disruption_job
+SET state = %s, done_flights = COALESCE(%s, done_flights), cancelled_orders = COALESCE(%s, cancelled_orders),
+    error = %s, duration_ms = %s, finished_at = NOW(), updated_at = NOW()
+WHERE job_id = %s
+"""
+
+#a running job without progress for a while was cut off (e.g. its process restarted)
+GET_DISRUPTION_JOB = """
+SELECT job_id, disruption_filter,
+       CASE WHEN state = 'running' AND updated_at < NOW() - INTERVAL %s SECOND THEN 'interrupted' ELSE state END,
+       started_at, finished_at, done_flights, total_flights, cancelled_orders, duration_ms, error
+FROM disruption_job
+WHERE job_id = %s
+"""
+
+#manager dashboard: one page of flights by departure (keyset on departure_datetime, flight_num).
+#{filters} are optional MANAGER_FLIGHTS_* conditions, {cancellable} is utils.flight_cancellable_sql
+MANAGER_FLIGHTS_PAGE = """
+SELECT f.flight_num, f.origin_airport, f.destination_airport,
+       f.departure_datetime, f.arrival_datetime, f.status, f.airplane_id,
+       {cancellable} AS cancellable
+FROM flight f
+WHERE 1 = 1 {filters}
+ORDER BY f.departure_datetime, f.flight_num
+LIMIT %s
+"""
+
+MANAGER_FLIGHTS_STATUS = "AND f.status = %s"
+
+MANAGER_FLIGHTS_CANCELLABLE = "AND {cancellable}"
+
+MANAGER_FLIGHTS_AFTER = "AND (f.departure_datetime > %s OR (f.departure_datetime = %s AND f.flight_num > %s))"
+
+#streaming exports (read with utils.stream_cursor)
+EXPORT_CUSTOMER_ORDERS = """
+SELECT o.order_id, o.order_date, o.status, o.total_paid, o.cancellation_fee, o.seats_count,
+       f.flight_num, f.origin_airport, f.destination_airport, f.departure_datetime, f.arrival_datetime,
+       f.status AS flight_status
+FROM orders o
+JOIN flight f ON f.flight_num = o.flight_num
+WHERE o.email = %s {filters}
+ORDER BY o.order_date DESC, o.order_id DESC
+"""
+
+#one row per booked seat, with the passenger details of USER_DETAILS
+EXPORT_FLIGHT_MANIFEST = """
+SELECT os.class_type, os.row_num, os.column_letter, os.order_id, o.status, o.email,
+       u.f_name, u.l_name, c.birth_date, c.passport_num, os.price_at_purchase
+FROM order_seat os
+JOIN orders o ON o.order_id = os.order_id
+JOIN users u ON u.email = o.email
+LEFT JOIN customers c ON c.email = u.email
+WHERE os.flight_num = %s
+ORDER BY os.class_type, os.row_num, os.column_letter
+"""
+
+EXPORT_ALL_ORDERS = """
+SELECT o.order_id, o.email, o.order_date, o.status, o.total_paid, o.cancellation_fee, o.seats_count,
+       f.flight_num, f.origin_airport, f.destination_airport, f.departure_datetime, f.status AS flight_status
+FROM orders o
+JOIN flight f ON f.flight_num = o.flight_num
+WHERE 1 = 1 {filters}
+ORDER BY o.order_id
+"""
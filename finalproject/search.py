@@ -0,0 +1,188 @@
+import os
+from datetime import date as date_cls, datetime, timedelta
+import queries
+from utils import db_cur, route_exists, day_range, timetable, get_all_airports
+from cache import search_cache, fare_calendar_cache, route_key
+
+#largest +-N days window for flexible search
+MAX_FLEX_DAYS = 15
+#available dates are listed up to this many days ahead (can be overridden by an env variable)
+SEARCH_DATES_DAYS = int(os.environ.get("FLYTAU_SEARCH_DATES_DAYS", 180))
+
+
+class SearchService:
+    """Flight search for customers: one round trip per search."""
+    @staticmethod
+    def search(origin: str, destination: str, date: str | None, passengers: int = 1):
+        """
+        search a route: route validity (from the cached route graph), available dates,
+        the flights on the chosen date and their remaining seats.
+        the day's flights and the route's dates are cached separately, the day's seats left are always read live.
+        flights that can't fit the number of passengers are filtered out.
+        :param origin: searched origin airport
+        :param destination: searched destination airport
+        :param date: searched date ('YYYY-MM-DD') or None for dates only
+        :param passengers: number of passengers
+        :return: dict with route_exists, available_dates, flights, flights_on_date
+        """
+        result = {"route_exists": False, "available_dates": [], "flights": [], "flights_on_date": 0}
+        if not route_exists(origin, destination):
+            return result
+        result["route_exists"] = True
+
+        result["available_dates"] = [day for day, most_seats in SearchService._route_dates(origin, destination)
+                                     if most_seats >= passengers]
+        if date:
+            flights = SearchService._day_flights(origin, destination, date)
+            result["flights_on_date"] = len(flights)
+            result["flights"] = [row for row in flights if row[7] >= passengers]
+        return result
+
+    @staticmethod
+    def _route_dates(origin: str, destination: str):
+        """
+        days with upcoming flights of a route, up to SEARCH_DATES_DAYS ahead (one SEARCH_DATES query, cached per route)
+        :return: list of ('YYYY-MM-DD', most seats left on a flight of the day)
+        """
+        key = (route_key(origin, destination), None)
+        dates = search_cache.get(key)
+        if dates is None:
+            bound = datetime.combine(date_cls.today() + timedelta(days=SEARCH_DATES_DAYS), datetime.min.time())
+            with db_cur() as cur:
+                cur.execute(queries.SEARCH_DATES, (origin, destination, bound, destination, origin, bound))
+                dates = [(str(day)[:10], int(most_seats or 0)) for day, most_seats in cur.fetchall()]
+            search_cache.set(key, dates, tags=[key[0]])
+        today = date_cls.today().isoformat()
+        return [row for row in dates if row[0] >= today]
+
+    @staticmethod
+    def _day_flights(origin: str, destination: str, date: str):
+        """
+        flights of a route on one day with their seats left: the flight rows come from one SEARCH_FLIGHTS query
+        (cached per route and date, departed flights are dropped when served), the seats left from one primary key
+        read of the day's flights in flight_inventory
+        :return: list of (flight_num, departure, arrival, status, origin, destination, airplane_id, seats left)
+        """
+        key = (route_key(origin, destination), date)
+        flights = search_cache.get(key)
+        if flights is None:
+            day_start, day_end = day_range(date)
+            with db_cur() as cur:
+                cur.execute(queries.SEARCH_FLIGHTS, (origin, destination, day_start, day_end,
+                                                     destination, origin, day_start, day_end))
+                flights = [tuple(row) for row in cur.fetchall()]
+            search_cache.set(key, flights, tags=[key[0]])
+        #cached rows can outlive their departure
+        now = datetime.now()
+        flights = [row for row in flights if row[1] > now]
+        if not flights:
+            return []
+
+        flight_nums = sorted({row[0] for row in flights})
+        placeholders = ", ".join(["%s"] * len(flight_nums))
+        with db_cur() as cur:
+            cur.execute(queries.SEATS_LEFT_FOR_FLIGHTS.format(placeholders=placeholders), tuple(flight_nums))
+            seats_left = {fn: int(n or 0) for fn, n in cur.fetchall()}
+        return [(*row, seats_left.get(row[0], 0)) for row in flights]
+
+    @staticmethod
+    def fare_calendar(origin: str, destination: str, date: str | None = None, days: int = 3, whole_month: bool = False):
+        """
+        flexible-date search: for every day in the window, the number of flights and the lowest price per class
+        :param date: center date ('YYYY-MM-DD'), today if not given
+        :param days: +-N days around the date
+        :param whole_month: show the whole month of the date instead of +-N days
+        :return: list of dicts (date, flights, prices {class: lowest price}), one per day in the window
+        """
+        if not route_exists(origin, destination):
+            return []
+
+        center = datetime.strptime(date, "%Y-%m-%d").date() if date else date_cls.today()
+        if whole_month:
+            first = center.replace(day=1)
+            last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        else:
+            days = max(0, min(int(days), MAX_FLEX_DAYS))
+            first = center - timedelta(days=days)
+            last = center + timedelta(days=days)
+        first = max(first, date_cls.today())
+
+        calendar = {}
+        month = first.replace(day=1)
+        while month <= last:
+            for day, row in SearchService._month_fares(origin, destination, month).items():
+                if first.isoformat() <= day <= last.isoformat():
+                    calendar[day] = row
+            month = (month + timedelta(days=32)).replace(day=1)
+
+        result = []
+        day = first
+        while day <= last:
+            key = day.isoformat()
+            result.append(calendar.get(key, {"date": key, "flights": 0, "prices": {}}))
+            day += timedelta(days=1)
+        return result
+
+    @staticmethod
+    def _month_fares(origin: str, destination: str, month: date_cls):
+        """
+        FARE_CALENDAR for one month of a route, served from the fare calendar cache when possible
+        :return: dict of 'YYYY-MM-DD' -> day summary
+        """
+        key = (route_key(origin, destination), month.strftime("%Y-%m"))
+        days = fare_calendar_cache.get(key)
+        if days is not None:
+            return days
+
+        start = datetime(month.year, month.month, 1)
+        end = (start + timedelta(days=32)).replace(day=1)
+        with db_cur() as cur:
+            cur.execute(queries.FARE_CALENDAR, (origin, destination, start, end,
+                                                destination, origin, start, end))
+            rows = cur.fetchall()
+
+        days = {}
+        for flight_date, class_type, flights, lowest_price in rows:
+            day = str(flight_date)[:10]
+            summary = days.setdefault(day, {"date": day, "flights": 0, "prices": {}})
+            #every airplane has an Economy class, so the largest per-class count is the day's flight count
+            summary["flights"] = max(summary["flights"], int(flights))
+            summary["prices"][class_type] = float(lowest_price)
+        fare_calendar_cache.set(key, days, tags=[key[0]])
+        return days
+
+    @staticmethod
+    def itineraries(origin: str, destination: str, date: str, passengers: int = 1, max_stops: int = 2):
+        """
+        connecting-flight search (up to max_stops connections) over the in-memory timetable.
+        seat counts of the resulting legs are re-checked against flight_inventory in one query.
+        :return: list of dicts (legs, stops, departure, arrival, duration_min)
+        """
+        airports = get_all_airports()
+        if passengers < 1 or origin == destination or origin not in airports or destination not in airports:
+            return []
+
+        day_start, day_end = day_range(date)
+        found = timetable.search(origin, destination, day_start, day_end, passengers, max_stops)
+        if not found:
+            return []
+
+        flight_nums = sorted({leg.flight_num for legs in found for leg in legs})
+        placeholders = ", ".join(["%s"] * len(flight_nums))
+        with db_cur() as cur:
+            cur.execute(queries.SEATS_LEFT_FOR_FLIGHTS.format(placeholders=placeholders), tuple(flight_nums))
+            seats_left = {fn: int(n or 0) for fn, n in cur.fetchall()}
+
+        result = []
+        for legs in found:
+            if any(seats_left.get(leg.flight_num, 0) < passengers for leg in legs):
+                continue
+            result.append({
+                "legs": [(leg.flight_num, leg.origin, leg.destination, leg.dep, leg.arr,
+                          seats_left.get(leg.flight_num, 0)) for leg in legs],
+                "stops": len(legs) - 1,
+                "departure": legs[0].dep,
+                "arrival": legs[-1].arr,
+                "duration_min": int((legs[-1].arr - legs[0].dep).total_seconds() // 60)
+            })
+        return result
@@ -0,0 +1,347 @@
+import threading
+from array import array
+
+#classes are shown in this order on the seat map
+CLASS_ORDER = {"Business": 0, "Economy": 1}
+
+#seat status bytes of a flight (one byte per seat position)
+SEAT_FREE = 0
+SEAT_TAKEN = 1
+SEAT_UNAVAILABLE = 2    #the flight has no flight_seat row for the seat
+
+#seat status byte -> status shown by seats.html (the same values the seat map rows used to carry)
+SEAT_STATUS_NAMES = {SEAT_FREE: {"status": "AVAILABLE"}, SEAT_TAKEN: {"status": "TAKEN"},
+                     SEAT_UNAVAILABLE: {"status": "UNAVAILABLE"}}
+
+#aisles by number of seat columns: an aisle comes after these column counts (seats.html draws them from the layout)
+AISLES = {4: (2,), 6: (3,), 9: (3, 6), 10: (3, 7)}
+
+
+def aisles_after(n_cols):
+    """
+    :return: column counts after which there is an aisle
+    """
+    return AISLES.get(n_cols, (n_cols // 2,))
+
+
+class SeatClassLayout:
+    """
+    The seats of one class of an airplane, stored as a rows x cols array of seat positions.
+    Seats of a class get consecutive positions [start, end), slots without a seat hold -1.
+    A position is the index of the seat's status byte in the flight's SeatMap.status.
+    `aisles` are the column counts after which there is an aisle.
+    """
+    __slots__ = ("class_type", "rows", "cols", "aisles", "start", "end", "_slots", "_row_index", "_col_index")
+
+    def __init__(self, class_type, seats, start):
+        """
+        :param seats: set of (row_num, column_letter) of the class
+        :param start: position of the first seat of the class
+        """
+        self.rows = tuple(sorted({r for r, _ in seats}))
+        self.cols = tuple(sorted({c for _, c in seats}))
+        self._row_index = {r: i for i, r in enumerate(self.rows)}
+        self._col_index = {c: i for i, c in enumerate(self.cols)}
+        n_cols = len(self.cols)
+        self.aisles = aisles_after(n_cols)
+        slots = array("i", [-1]) * (len(self.rows) * n_cols)
+        pos = start
+        for r, c in sorted(seats):
+            slots[self._row_index[r] * n_cols + self._col_index[c]] = pos
+            pos += 1
+        self.class_type = class_type
+        self.start = start
+        self.end = pos
+        self._slots = slots
+
+    def position_at(self, row_idx, col_idx):
+        """
+        :param row_idx: index into rows
+        :param col_idx: index into cols
+        :return: seat position, or None if there is no seat there
+        """
+        pos = self._slots[row_idx * len(self.cols) + col_idx]
+        return pos if pos >= 0 else None
+
+    def position(self, row_num, col):
+        """
+        :return: seat position of the seat, or None if the class has no such seat
+        """
+        ri = self._row_index.get(row_num)
+        ci = self._col_index.get(col)
+        if ri is None or ci is None:
+            return None
+        return self.position_at(ri, ci)
+
+
+class SeatLayout:
+    """
+    Immutable seat layout of an airplane (it never changes after the airplane is created).
+    Every seat gets a position, so the status of a flight's seats is a bytearray with one byte per seat.
+    """
+    __slots__ = ("airplane_id", "classes", "size", "_by_class")
+
+    def __init__(self, airplane_id, seats):
+        """
+        :param seats: iterable of (class_type, row_num, column_letter)
+        """
+        by_class = {}
+        for class_type, row_num, col in seats:
+            by_class.setdefault(class_type, set()).add((int(row_num), col))
+
+        classes = []
+        pos = 0
+        for class_type in sorted(by_class, key=lambda ct: (CLASS_ORDER.get(ct, 999), ct)):
+            cls = SeatClassLayout(class_type, by_class[class_type], pos)
+            classes.append(cls)
+            pos = cls.end
+
+        self.airplane_id = airplane_id
+        self.classes = tuple(classes)
+        self.size = pos
+        self._by_class = {cls.class_type: cls for cls in classes}
+
+    def position(self, class_type, row_num, col):
+        """
+        :return: position of the seat, or None if the airplane has no such seat
+        """
+        cls = self._by_class.get(class_type)
+        return cls.position(int(row_num), col) if cls else None
+
+    def status(self, taken_seats, existing_seats=None):
+        """
+        :param taken_seats: iterable of (class_type, row_num, column_letter)
+        :param existing_seats: if given, only these seats can be free - the others are unavailable
+        :return: bytearray with one status byte per seat position: SEAT_FREE, SEAT_TAKEN or SEAT_UNAVAILABLE
+                 (unknown seats are ignored)
+        """
+        if existing_seats is None:
+            status = bytearray(self.size)
+        else:
+            status = bytearray([SEAT_UNAVAILABLE]) * self.size
+            for class_type, row_num, col in existing_seats:
+                pos = self.position(class_type, row_num, col)
+                if pos is not None:
+                    status[pos] = SEAT_FREE
+        for class_type, row_num, col in taken_seats:
+            pos = self.position(class_type, row_num, col)
+            if pos is not None:
+                status[pos] = SEAT_TAKEN
+        return status
+
+
+class SeatMap:
+    """Seat map of one flight: the airplane layout overlaid with the flight's seat status bytes (one per seat)."""
+    __slots__ = ("layout", "status", "prices", "version")
+
+    def __init__(self, layout, status, prices, version=0):
+        self.layout = layout
+        self.status = status
+        self.prices = prices
+        self.version = version
+
+    def is_taken(self, pos):
+        """
+        :return: True if the seat at the position can't be chosen (taken or unavailable)
+        """
+        return self.status[pos] != SEAT_FREE
+
+    def available_count(self, class_type=None):
+        """
+        :return: number of free seats of the class (or of the whole flight)
+        """
+        if class_type is None:
+            return self.status.count(SEAT_FREE)
+        for cls in self.layout.classes:
+            if cls.class_type == class_type:
+                return self.status[cls.start:cls.end].count(SEAT_FREE)
+        return 0
+
+    def find_block(self, class_type, count):
+        """
+        best block of `count` free adjacent seats of the class, in one pass over its grid:
+        1. one run of free seats between aisles - the tightest fitting run, front rows first
+        2. one run of free seats in a row, across an aisle
+        3. the fewest consecutive rows holding `count` free seats, longest runs of each row first
+        :return: list of (class_type, row_num, column_letter), or None if the class has fewer free seats
+        """
+        cls = next((c for c in self.layout.classes if c.class_type == class_type), None)
+        if cls is None or count < 1:
+            return None
+        status = self.status
+        n_cols = len(cls.cols)
+        aisles = set(cls.aisles)
+
+        in_segment = None    #(run length, row idx, first col idx)
+        in_row = None        #(run length, row idx, first col idx)
+        row_runs = []        #per row: list of (run length, first col idx) across aisles
+        free_per_row = []
+        for ri in range(len(cls.rows)):
+            runs = []
+            seg_start = run_start = None
+            for ci in range(n_cols + 1):
+                pos = cls.position_at(ri, ci) if ci < n_cols else None
+                free = pos is not None and status[pos] == SEAT_FREE
+                if seg_start is not None and (not free or ci in aisles):
+                    length = ci - seg_start
+                    if length >= count and (in_segment is None or length < in_segment[0]):
+                        in_segment = (length, ri, seg_start)
+                    seg_start = None
+                if run_start is not None and not free:
+                    runs.append((ci - run_start, run_start))
+                    run_start = None
+                if free:
+                    if seg_start is None:
+                        seg_start = ci
+                    if run_start is None:
+                        run_start = ci
+            for length, start in runs:
+                if length >= count and (in_row is None or length < in_row[0]):
+                    in_row = (length, ri, start)
+            row_runs.append(runs)
+            free_per_row.append(sum(length for length, _ in runs))
+
+        best = in_segment or in_row
+        if best is not None:
+            _, ri, start = best
+            return [(class_type, cls.rows[ri], cls.cols[ci]) for ci in range(start, start + count)]
+
+        #shortest window of consecutive rows with enough free seats (two pointers)
+        window = None
+        total = lo = 0
+        for hi, free in enumerate(free_per_row):
+            total += free
+            while total - free_per_row[lo] >= count:
+                total -= free_per_row[lo]
+                lo += 1
+            if total >= count and (window is None or hi - lo < window[1] - window[0]):
+                window = (lo, hi)
+        if window is None:
+            return None
+
+        seats = []
+        for ri in range(window[0], window[1] + 1):
+            for length, start in sorted(row_runs[ri], reverse=True):
+                for ci in range(start, start + min(length, count - len(seats))):
+                    seats.append((class_type, cls.rows[ri], cls.cols[ci]))
+        return seats
+
+    def classes(self):
+        """
+        :return: list of (class_type, class info) in display order. class info has price, rows, cols, aisles
+                 and grid, where grid.get(row_num, {}).get(column_letter) is {"status": 'AVAILABLE' / 'TAKEN' /
+                 'UNAVAILABLE'}, or None if there is no such seat - the same as the dict-per-seat seat map had
+        """
+        return [(cls.class_type, SeatClassView(cls, self.prices.get(cls.class_type), self.status))
+                for cls in self.layout.classes]
+
+
+class SeatClassView:
+    """
+    Template-facing view of one class: the shared layout plus the flight's price and seat status bytes.
+    grid is looked up from the status bytes on access, no dict is built per seat.
+    """
+    __slots__ = ("layout", "price", "grid")
+
+    def __init__(self, layout, price, status):
+        self.layout = layout
+        self.price = price
+        self.grid = _SeatGrid(layout, status)
+
+    @property
+    def rows(self):
+        return self.layout.rows
+
+    @property
+    def cols(self):
+        return self.layout.cols
+
+    @property
+    def aisles(self):
+        return self.layout.aisles
+
+
+class _SeatGrid:
+    """row_num -> _SeatRow, read-only (only get() is used by seats.html)"""
+    __slots__ = ("layout", "status", "_rows")
+
+    def __init__(self, layout, status):
+        self.layout = layout
+        self.status = status
+        self._rows = {}
+
+    def get(self, row_num, default=None):
+        row = self._rows.get(row_num)
+        if row is None:
+            ri = self.layout._row_index.get(row_num)
+            if ri is None:
+                return default
+            row = self._rows[row_num] = _SeatRow(self.layout, ri, self.status)
+        return row
+
+
+class _SeatRow:
+    """column_letter -> {"status": ...} of one row"""
+    __slots__ = ("col_index", "slots", "base", "status")
+
+    def __init__(self, layout, row_idx, status):
+        self.col_index = layout._col_index
+        self.slots = layout._slots
+        self.base = row_idx * len(layout.cols)
+        self.status = status
+
+    def get(self, col, default=None):
+        ci = self.col_index.get(col)
+        if ci is None:
+            return default
+        pos = self.slots[self.base + ci]
+        return SEAT_STATUS_NAMES[self.status[pos]] if pos >= 0 else default
+
+
+class SeatLayoutCache:
+    """
+    In-process cache of seat layouts, one per airplane_id.
+    Layouts never change, so entries don't expire - invalidate() exists for manual schema fixes.
+    A missing layout is loaded under a lock of its airplane, so concurrent misses load it once.
+    """
+    def __init__(self, load_seats):
+        """
+        :param load_seats: function returning rows (class_type, row_num, column_letter) of an airplane
+        """
+        self._load_seats = load_seats
+        self._lock = threading.Lock()
+        self._load_locks = {}
+        self._layouts = {}
+        self.loads = 0
+
+    def get(self, airplane_id):
+        """
+        :return: SeatLayout of the airplane (loaded on first use)
+        """
+        layout = self._layouts.get(airplane_id)
+        if layout is not None:
+            return layout
+        with self._lock:
+            load_lock = self._load_locks.setdefault(airplane_id, threading.Lock())
+        with load_lock:
+            layout = self._layouts.get(airplane_id)
+            if layout is not None:
+                return layout
+            layout = SeatLayout(airplane_id, self._load_seats(airplane_id))
+            with self._lock:
+                self._layouts[airplane_id] = layout
+                self._load_locks.pop(airplane_id, None)
+                self.loads += 1
+            return layout
+
+    def invalidate(self, airplane_id=None):
+        with self._lock:
+            if airplane_id is None:
+                self._layouts.clear()
+            else:
+                self._layouts.pop(airplane_id, None)
+
+    def stats(self):
+        with self._lock:
+            return {"layouts": len(self._layouts), "loads": self.loads,
+                    "seats": sum(layout.size for layout in self._layouts.values())}
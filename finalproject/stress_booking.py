@@ -0,0 +1,180 @@
+import argparse
+import random
+import threading
+import time
+from datetime import datetime
+from utils import db_cur
+from booking import BookingService
+
+#run against a local copy of the database only - every successful attempt creates a real order
+
+DOUBLE_BOOKED_SEATS = """
+SELECT os.class_type, os.row_num, os.column_letter, COUNT(*)
+FROM order_seat os
+JOIN orders o ON o.order_id = os.order_id
+WHERE os.flight_num = %s AND o.status = 'Active'
+GROUP BY os.class_type, os.row_num, os.column_letter
+HAVING COUNT(*) > 1
+"""
+
+TAKEN_WITHOUT_ORDER = """
+SELECT COUNT(*)
+FROM flight_seat fs
+LEFT JOIN order_seat os
+  ON os.flight_num = fs.flight_num AND os.airplane_id = fs.airplane_id AND os.class_type = fs.class_type
+ AND os.row_num = fs.row_num AND os.column_letter = fs.column_letter
+WHERE fs.flight_num = %s AND fs.seat_status = 'taken' AND os.order_id IS NULL
+"""
+
+ORDERS_WITHOUT_SEATS = """
+SELECT COUNT(*)
+FROM orders o
+WHERE o.flight_num = %s AND o.status = 'Active'
+  AND NOT EXISTS (SELECT 1 FROM order_seat os WHERE os.order_id = o.order_id)
+"""
+
+INVENTORY_MISMATCH = """
+SELECT COUNT(*)
+FROM flight_inventory fi
+JOIN (SELECT class_type, SUM(seat_status IN ('available', 'held')) AS available_seats
+      FROM flight_seat WHERE flight_num = %s GROUP BY class_type) s
+  ON s.class_type = fi.class_type
+WHERE fi.flight_num = %s AND fi.available_seats <> s.available_seats
+"""
+
+
+def free_seats(flight_num):
+    with db_cur() as cursor:
+        cursor.execute("""
+            SELECT class_type, row_num, column_letter
+            FROM flight_seat
+            WHERE flight_num = %s AND seat_status = 'available'
+        """, (flight_num,))
+        return cursor.fetchall()
+
+
+def worker(flight_num, pool_seats, attempts, seats_per_order, email, results, lock):
+    rnd = random.Random()
+    guest = {"first_name": "Stress", "last_name": "Test", "phone_num": "0500000000"}
+    for _ in range(attempts):
+        seats = rnd.sample(pool_seats, min(seats_per_order, len(pool_seats)))
+        start = time.perf_counter()
+        try:
+            BookingService.book_seats(flight_num, email, seats, guest=guest)
+            outcome = "booked"
+        except ValueError:
+            outcome = "rejected"
+        except Exception as e:
+            outcome = "errors"
+            print("booking error:", repr(e))
+        with lock:
+            results[outcome] += 1
+            results["latencies"].append(time.perf_counter() - start)
+
+
+def verify(flight_num):
+    """
+    :return: dict of consistency checks (all should be 0)
+    """
+    with db_cur() as cursor:
+        cursor.execute(DOUBLE_BOOKED_SEATS, (flight_num,))
+        double = len(cursor.fetchall())
+        cursor.execute(TAKEN_WITHOUT_ORDER, (flight_num,))
+        (orphan_seats,) = cursor.fetchone()
+        cursor.execute(ORDERS_WITHOUT_SEATS, (flight_num,))
+        (orphan_orders,) = cursor.fetchone()
+        cursor.execute(INVENTORY_MISMATCH, (flight_num, flight_num))
+        (inventory,) = cursor.fetchone()
+    return {"double_booked_seats": double, "taken_seats_without_order": orphan_seats,
+            "orders_without_seats": orphan_orders, "inventory_mismatches": inventory}
+
+
+def write_report(path, line):
+    """
+    append one measured run (with the server version) to a markdown table, to be committed with the code
+    """
+    with db_cur() as cursor:
+        cursor.execute("SELECT VERSION()")
+        (version,) = cursor.fetchone()
+    with open(path, "a", encoding="utf-8") as f:
+        if f.tell() == 0:
+            f.write("| date | server | run | booked | rejected | errors | bookings/s | p95 ms | double booked"
+                    " | taken without order | orders without seats | inventory mismatches |\n"
+                    "|---|---|---|---|---|---|---|---|---|---|---|---|\n")
+        f.write(f"| {datetime.now():%Y-%m-%d %H:%M} | {version} | {line} |\n")
+
+
+def group_latency(flight_num, sizes, class_type, email):
+    """
+    book one group per size (by count) and print the latency - it should stay flat per seat
+    """
+    guest = {"first_name": "Stress", "last_name": "Test", "phone_num": "0500000000"}
+    for size in sizes:
+        start = time.perf_counter()
+        try:
+            BookingService.book_group(flight_num, email, class_type=class_type, count=size, guest=guest)
+        except ValueError as e:
+            print(f"group of {size}: {e}")
+            continue
+        elapsed = time.perf_counter() - start
+        print(f"group of {size:>4}: {1000 * elapsed:8.1f} ms  {1000 * elapsed / size:6.2f} ms/seat")
+
+
+def main():
+    """
+    python stress_booking.py --flight F12 [--threads 16] [--attempts 50] [--seats 2] [--hot 40] [--report FILE]
+    python stress_booking.py --flight F12 --group-sizes 10,50,100,200 [--class Economy]
+    """
+    parser = argparse.ArgumentParser(description="concurrent booking stress test (local database only)")
+    parser.add_argument("--flight", required=True, help="flight number to book")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--attempts", type=int, default=50, help="booking attempts per thread")
+    parser.add_argument("--seats", type=int, default=2, help="seats per order")
+    parser.add_argument("--hot", type=int, default=40, help="all threads compete for this many free seats")
+    parser.add_argument("--email", default="stress@flytau.test")
+    parser.add_argument("--group-sizes", help="comma separated group sizes: measure group booking latency instead")
+    parser.add_argument("--class", dest="class_type", default="Economy", help="class for --group-sizes")
+    parser.add_argument("--report", help="append the measured run to this markdown file")
+    args = parser.parse_args()
+
+    if args.group_sizes:
+        group_latency(args.flight, [int(x) for x in args.group_sizes.split(",")], args.class_type, args.email)
+        print("OK - no double bookings" if not any(verify(args.flight).values()) else "FAILED - inconsistent bookings")
+        return
+
+    pool_seats = free_seats(args.flight)[:args.hot]
+    if not pool_seats:
+        print("no free seats on this flight")
+        return
+
+    results = {"booked": 0, "rejected": 0, "errors": 0, "latencies": []}
+    lock = threading.Lock()
+    threads = [threading.Thread(target=worker, args=(args.flight, pool_seats, args.attempts, args.seats,
+                                                     args.email, results, lock))
+               for _ in range(args.threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(results["latencies"])
+    p95 = latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0
+    print(f"{args.threads} threads x {args.attempts} attempts on {len(pool_seats)} hot seats in {elapsed:.2f}s")
+    print(f"booked {results['booked']}  rejected {results['rejected']}  errors {results['errors']}")
+    print(f"{results['booked'] / elapsed:.1f} bookings/s  {len(latencies) / elapsed:.1f} attempts/s  p95 {1000 * p95:.1f} ms")
+
+    checks = verify(args.flight)
+    for name, count in checks.items():
+        print(f"{name}: {count}")
+    print("OK - no double bookings" if not any(checks.values()) else "FAILED - inconsistent bookings")
+    if args.report:
+        write_report(args.report, f"{args.flight}: {args.threads} threads x {args.attempts} attempts, {args.seats} seats"
+                                  f" per order, {len(pool_seats)} hot seats | {results['booked']} | {results['rejected']}"
+                                  f" | {results['errors']} | {results['booked'] / elapsed:.1f} | {1000 * p95:.1f} | "
+                                  + " | ".join(str(count) for count in checks.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import os
+import threading
+import time
+import heapq
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+
+#timetable settings (can be overridden by env variables)
+TIMETABLE_TTL = float(os.environ.get("FLYTAU_TIMETABLE_TTL", 600))
+MIN_CONNECTION_MINUTES = int(os.environ.get("FLYTAU_MIN_CONNECTION_MINUTES", 60))
+MAX_CONNECTION_MINUTES = int(os.environ.get("FLYTAU_MAX_CONNECTION_MINUTES", 24 * 60))
+MAX_STOPS = 2
+
+
+class Leg:
+    """One scheduled flight in the timetable."""
+    __slots__ = ("flight_num", "origin", "destination", "dep", "arr", "seats")
+
+    def __init__(self, flight_num, origin, destination, dep, arr, seats):
+        self.flight_num = flight_num
+        self.origin = origin
+        self.destination = destination
+        self.dep = dep
+        self.arr = arr
+        self.seats = int(seats or 0)
+
+    def __lt__(self, other):
+        return (self.dep, self.flight_num) < (other.dep, other.flight_num)
+
+
+class Timetable:
+    """
+    In-memory index of upcoming bookable flights for connecting itinerary search.
+    - per origin airport: legs sorted by departure, so "departures from X between t1 and t2" is a bisect
+    - built lazily from the flight table, fully rebuilt every `ttl` seconds by one thread at a time
+      (other requests keep searching the previous index meanwhile)
+    - refresh_flight() updates a single flight in place (created / cancelled / status changed)
+    """
+    def __init__(self, load_flights, load_flight, route_graph, ttl: float = TIMETABLE_TTL):
+        """
+        :param load_flights: function returning rows (flight_num, origin, destination, dep, arr, seats)
+                             of all upcoming bookable flights
+        :param load_flight: function returning the same row for one flight, or None if it is not bookable
+        :param route_graph: RouteGraph used to prune airports that can't reach the destination
+        """
+        self._load_flights = load_flights
+        self._load_flight = load_flight
+        self._route_graph = route_graph
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._by_origin = {}
+        self._by_flight = {}
+        self._built_at = None
+        self.builds = 0
+
+    def _index(self, rows):
+        by_origin = {}
+        by_flight = {}
+        for row in rows:
+            leg = Leg(*row)
+            by_flight[leg.flight_num] = leg
+            by_origin.setdefault(leg.origin, []).append(leg)
+        for legs in by_origin.values():
+            legs.sort()
+        return by_origin, by_flight
+
+    def _fresh(self):
+        return self._built_at is not None and time.monotonic() - self._built_at < self.ttl
+
+    def _ensure_fresh(self):
+        if self._fresh():
+            return
+        #single flight: one thread rebuilds, the others wait only if there is no index yet
+        if not self._build_lock.acquire(blocking=self.builds == 0):
+            return
+        try:
+            if self._fresh():
+                return
+            by_origin, by_flight = self._index(self._load_flights())
+            with self._lock:
+                self._by_origin, self._by_flight = by_origin, by_flight
+                self._built_at = time.monotonic()
+                self.builds += 1
+        finally:
+            self._build_lock.release()
+
+    def invalidate(self):
+        with self._lock:
+            self._built_at = None
+
+    def _remove(self, flight_num):
+        leg = self._by_flight.pop(flight_num, None)
+        if leg is None:
+            return
+        legs = self._by_origin.get(leg.origin, [])
+        i = bisect_left(legs, leg)
+        if i < len(legs) and legs[i].flight_num == flight_num:
+            del legs[i]
+
+    def refresh_flight(self, flight_num: str):
+        """
+        reload one flight from the db and add / update / remove it in the index
+        """
+        if self._built_at is None:
+            return
+        row = self._load_flight(flight_num)
+        with self._lock:
+            self._remove(flight_num)
+            if row:
+                leg = Leg(*row)
+                self._by_flight[flight_num] = leg
+                insort(self._by_origin.setdefault(leg.origin, []), leg)
+
+    def _departures(self, airport, earliest, latest, passengers):
+        legs = self._by_origin.get(airport)
+        if not legs:
+            return
+        i = bisect_left(legs, Leg("", None, None, earliest, None, 0))
+        while i < len(legs) and legs[i].dep < latest:
+            if legs[i].seats >= passengers:
+                yield legs[i]
+            i += 1
+
+    def _hops_to(self, destination, max_hops):
+        """
+        BFS over the route graph: minimal number of legs from every airport to the destination
+        """
+        hops = {destination: 0}
+        frontier = [destination]
+        for n in range(1, max_hops + 1):
+            nxt = []
+            for airport in frontier:
+                for neighbour in self._route_graph.destinations(airport):
+                    if neighbour not in hops:
+                        hops[neighbour] = n
+                        nxt.append(neighbour)
+            frontier = nxt
+        return hops
+
+    def search(self, origin: str, destination: str, day_start: datetime, day_end: datetime,
+               passengers: int = 1, max_stops: int = MAX_STOPS, min_connection: int = MIN_CONNECTION_MINUTES,
+               max_connection: int = MAX_CONNECTION_MINUTES, limit: int = 20):
+        """
+        find itineraries of up to max_stops connections whose first leg departs in [day_start, day_end).
+        best-first search on arrival time: partial itineraries are expanded earliest arrival first, so complete
+        itineraries come out in result order and the search stops after `limit` of them. an airport is expanded
+        only for its `limit` earliest arrivals, which bounds the branching at hubs.
+        :return: list of itineraries (lists of Leg), earliest arrival first
+        """
+        if limit < 1:
+            return []
+        self._ensure_fresh()
+        max_legs = max_stops + 1
+        hops = self._hops_to(destination, max_legs)
+        if origin not in hops:
+            return []
+        min_gap = timedelta(minutes=min_connection)
+        max_gap = timedelta(minutes=max_connection)
+        found = []
+        expanded = {}
+        heap = []
+        seq = 0
+
+        def push(path, leg):
+            nonlocal seq
+            legs_left = max_legs - len(path) - 1
+            if leg.destination != destination:
+                if legs_left < 1 or hops.get(leg.destination, max_legs) > legs_left \
+                        or expanded.get(leg.destination, 0) >= limit \
+                        or any(p.origin == leg.destination for p in path):
+                    return
+            seq += 1
+            heapq.heappush(heap, (leg.arr, len(path) + 1, path[0].dep if path else leg.dep, seq, path + [leg]))
+
+        with self._lock:
+            for leg in self._departures(origin, day_start, day_end, passengers):
+                push([], leg)
+            while heap and len(found) < limit:
+                *_, path = heapq.heappop(heap)
+                last = path[-1]
+                if last.destination == destination:
+                    found.append(path)
+                    continue
+                if expanded.get(last.destination, 0) >= limit:
+                    continue
+                expanded[last.destination] = expanded.get(last.destination, 0) + 1
+                for leg in self._departures(last.destination, last.arr + min_gap, last.arr + max_gap, passengers):
+                    push(path, leg)
+        return found
+
+    def stats(self):
+        with self._lock:
+            return {"flights": len(self._by_flight), "airports": len(self._by_origin), "builds": self.builds}
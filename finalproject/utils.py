@@ -1,31 +1,184 @@
 from contextlib import contextmanager
+import os
+import threading
 import mysql.connector
+from flask import g, has_request_context
 from datetime import timedelta, datetime
 import string
 import queries
+from db_pool import pool
+from cache import RouteGraph, search_cache, fare_calendar_cache, route_key
+from timetable import Timetable
+from seatmap import SeatLayoutCache, SeatMap
+from events import seat_events, SeatEventStream
 
-#connection to mysql
+#orders per order history page / flights per manager dashboard page (can be overridden by env variables)
+ORDER_PAGE_SIZE = int(os.environ.get("FLYTAU_ORDER_PAGE_SIZE", 20))
+FLIGHT_PAGE_SIZE = int(os.environ.get("FLYTAU_FLIGHT_PAGE_SIZE", 50))
+
+#cancellation rules: customers cancel an order more than 36 hours before departure,
+#managers cancel a flight at least 72 hours before departure
+ORDER_CANCEL_HOURS = 36
+FLIGHT_CANCEL_HOURS = 72
+
+_local = threading.local()
+
+
+def _get_scope():
+    """
+    the connection scope bound to the current flask request (or thread, outside of requests)
+    :return: dict with the connection and transaction depth, or None
+    """
+    if has_request_context():
+        return g.get("db_scope")
+    return getattr(_local, "db_scope", None)
+
+
+def _set_scope(scope):
+    if has_request_context():
+        g.db_scope = scope
+    else:
+        _local.db_scope = scope
+
+
+def _drop_unread(conn):
+    try:
+        if conn.unread_result:
+            conn.consume_results()
+    except mysql.connector.Error:
+        pass
+
+
+#connection to mysql (one pooled connection per request, reused by all db_cur() calls)
 @contextmanager
 def db_cur():
+    scope = _get_scope()
     flytau_db = None
     cursor = None
+    owned = False
+    broken = False
     try:
-        flytau_db = mysql.connector.connect(
-            host = "localhost",
-            user = "root",
-            password = "nok95nok",
-            database = "FLYTAU",
-            autocommit = True
-        )
+        if scope is None:
+            flytau_db = pool.acquire()
+            if has_request_context():
+                _set_scope({"conn": flytau_db, "tx": 0})
+            else:
+                owned = True
+        else:
+            flytau_db = scope["conn"]
         cursor = flytau_db.cursor()
         yield cursor
-    except mysql.connector.Error as err:
-        raise err
+    except (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError):
+        broken = True
+        raise
     finally:
-        if cursor:
-            cursor.close()
+        try:
+            if cursor:
+                cursor.close()
+        except mysql.connector.Error:
+            pass
         if flytau_db:
-            flytau_db.close()
+            if broken and not owned:
+                _set_scope(None)
+            if owned or broken:
+                pool.release(flytau_db, discard=broken)
+            else:
+                _drop_unread(flytau_db)
+
+
+@contextmanager
+def stream_cursor():
+    """
+    unbuffered cursor on a dedicated connection for streaming large results: rows come from the server as
+    they are fetched, so memory stays flat however many rows there are. reads one consistent read-only snapshot.
+    the connection is not bound to the request - a streamed response body is generated after the view returns.
+    if the consumer stops early (e.g. the client disconnects), the connection is discarded instead of
+    reading the rest of the result.
+    :return: the cursor
+    """
+    conn = pool.acquire()
+    cursor = None
+    finished = False
+    try:
+        conn.start_transaction(consistent_snapshot=True, readonly=True)
+        cursor = conn.cursor(buffered=False)
+        yield cursor
+        finished = not conn.unread_result
+    finally:
+        if finished:
+            try:
+                cursor.close()
+            except mysql.connector.Error:
+                finished = False
+        pool.release(conn, discard=not finished)
+
+
+@contextmanager
+def transaction():
+    """
+    explicit transaction scope: every db_cur() call inside the block (including service methods)
+    runs on the same connection and is committed together, or rolled back on error.
+    nested transaction() blocks join the outer one.
+    :return: cursor on the transaction connection
+    """
+    scope = _get_scope()
+    owned = scope is None
+    if owned:
+        scope = {"conn": pool.acquire(), "tx": 0}
+        _set_scope(scope)
+    conn = scope["conn"]
+
+    outer = scope["tx"] == 0
+    if outer:
+        conn.start_transaction()
+    scope["tx"] += 1
+    try:
+        with db_cur() as cursor:
+            yield cursor
+        if outer:
+            conn.commit()
+    except Exception:
+        if outer:
+            try:
+                conn.rollback()
+            except mysql.connector.Error:
+                pass
+        raise
+    finally:
+        scope["tx"] -= 1
+        if owned and not has_request_context() and _get_scope() is scope:
+            _set_scope(None)
+            pool.release(conn)
+
+
+@contextmanager
+def bound_connection():
+    """
+    bind one pooled connection to the current thread (or request) so every db_cur() / transaction()
+    inside the block runs on it - needed for session state such as GET_LOCK.
+    :return: the bound connection
+    """
+    scope = _get_scope()
+    if scope is not None:
+        yield scope["conn"]
+        return
+    scope = {"conn": pool.acquire(), "tx": 0}
+    _set_scope(scope)
+    try:
+        yield scope["conn"]
+    finally:
+        if not has_request_context() and _get_scope() is scope:
+            _set_scope(None)
+            pool.release(scope["conn"])
+
+
+def release_request_connection(exc=None):
+    """
+    return the request's connection to the pool (called on request teardown)
+    """
+    scope = g.pop("db_scope", None)
+    if scope is not None:
+        pool.release(scope["conn"])
 
 
 def authenticate(email_or_id: str, password: str):
@@ -53,85 +206,133 @@ def authenticate(email_or_id: str, password: str):
 
     return None
 
-def flight_exists(date, origin, destination):
+def day_range(day):
     """
-    check if flight exists in the db
-    :param date: searched date
-    :param origin: searched origin airport
-    :param destination: searched destination airport
-    :return: flight data if a flight is found, else None
+    half-open datetime range [day 00:00, next day 00:00) so date filters can use an index
+    :param day: date or 'YYYY-MM-DD' string
+    :return: tuple of (start, end) datetimes
     """
-    query = queries.GET_ALL_FLIGHT_DATA
+    if isinstance(day, str):
+        day = datetime.strptime(day, "%Y-%m-%d")
+    start = datetime(day.year, day.month, day.day)
+    return start, start + timedelta(days=1)
+
+def _load_routes():
     with db_cur() as cur:
-        cur.execute(query, (date, origin, destination, destination, origin))
-        return cur.fetchall() or None
+        cur.execute(queries.ALL_ROUTES)
+        return cur.fetchall()
 
-def route_exists(origin, destination):
-    """
-    check if the route exists in the db
-    :param origin: searched origin airport
-    :param destination: searched destination airport
-    :return: 1 if route is found, else None
-    """
-    if not origin or not destination:
-        return False
 
-    query = queries.DOES_ROUTE_EXIST
+def _routes_version():
     with db_cur() as cur:
-        cur.execute(query, (origin, destination, destination, origin))
-        return cur.fetchone() is not None
+        cur.execute(queries.ROUTES_VERSION)
+        return tuple(cur.fetchone())
 
 
-def get_available_dates(origin, destination):
-    """
-    Get the available flight dates, according to the given origin and destination airports.
-    :param origin: given origin airport
-    :param destination: given destination airport
-    :return: list of available dates
-    """
-    query = queries.GET_AVAILABLE_FLIGHT_DATES
+#cached route graph (airports, adjacency, durations) - call route_graph.invalidate() after changing routes
+route_graph = RouteGraph(_load_routes, _routes_version)
+
+
+def _load_timetable():
     with db_cur() as cur:
-        cur.execute(query, (origin, destination, destination, origin))
-        return [row[0].strftime("%Y-%m-%d") for row in cur.fetchall()]
+        cur.execute(queries.TIMETABLE_FLIGHTS)
+        return cur.fetchall()
 
 
-def get_all_airports():
+def _load_timetable_flight(flight_num):
+    with db_cur() as cur:
+        cur.execute(queries.TIMETABLE_FLIGHT, (flight_num,))
+        return cur.fetchone()
+
+
+#in-memory timetable of upcoming flights for connecting itineraries
+timetable = Timetable(_load_timetable, _load_timetable_flight, route_graph)
+
+
+def _load_seat_layout(airplane_id):
+    with db_cur() as cur:
+        cur.execute(queries.SEAT_LAYOUT, (airplane_id,))
+        return cur.fetchall()
+
+
+#immutable seat layouts per airplane_id, overlaid with the flight's seat status bytes to draw seat maps
+seat_layouts = SeatLayoutCache(_load_seat_layout)
+
+
+def _load_seat_versions(flight_nums):
+    with db_cur() as cur:
+        cur.execute(queries.SEAT_VERSIONS.format(flights=", ".join(["%s"] * len(flight_nums))), tuple(flight_nums))
+        return {flight_num: int(version) for flight_num, version in cur.fetchall()}
+
+
+#server-sent events of seat changes (started by main.py)
+seat_stream = SeatEventStream(seat_events, _load_seat_versions)
+
+
+def next_seat_version(cursor, flight_num: str):
     """
-    Get all available airports from mysql(TLV, ETH, etc.)
-    :return: list of airports
+    bump the flight's seat version inside the caller's transaction (locks the flight row until commit,
+    so versions become visible in order)
+    :return: the new version, to stamp on the changed flight_seat rows
     """
-    query = queries.ALL_AIRPORTS
-    with db_cur() as cur:
-        cur.execute(query)
-        return [row[0] for row in cur.fetchall()]
+    cursor.execute(queries.BUMP_SEAT_VERSION, (flight_num,))
+    return cursor.lastrowid
 
 
-def build_seat_classes(rows):
+def sync_fully_booked(cursor, flight_nums):
     """
-    create the seat map for the given seats information (grid)
-    :return: dict of seats
+    flip the given flights to 'fully booked' when no seat is left in their inventory, and back to 'active'
+    when seats were freed (primary key reads of flight_inventory, only for these flights)
+    :return: number of flights whose status changed
     """
-    classes = {}
+    flight_nums = sorted(flight_nums)
+    if not flight_nums:
+        return 0
+    flights = ", ".join(["%s"] * len(flight_nums))
+    cursor.execute(queries.FLIGHTS_FULLY_BOOKED_IF_SOLD_OUT.format(flights=flights), flight_nums)
+    changed = cursor.rowcount
+    cursor.execute(queries.FLIGHTS_ACTIVE_IF_SEATS_LEFT.format(flights=flights), flight_nums)
+    return changed + cursor.rowcount
 
-    for class_type, r, c, status, price in rows:
-        cls = classes.setdefault(class_type, {
-            "price": (float(price) if price is not None else None),
-            "cols": set(),
-            "grid": {}
-        })
 
-        if cls["price"] is None and price is not None:
-            cls["price"] = float(price)
+def invalidate_flight_search(flight_num: str | None = None, origin: str | None = None, destination: str | None = None):
+    """
+    drop cached search results of the flight's route and refresh the flight in the timetable
+    (after a flight is created, cancelled, changes status or becomes fully booked)
+    :param flight_num: the changed flight (its route is looked up if origin / destination are not given)
+    """
+    if flight_num:
+        timetable.refresh_flight(flight_num)
+    if origin is None or destination is None:
+        with db_cur() as cur:
+            cur.execute("SELECT origin_airport, destination_airport FROM flight WHERE flight_num = %s", (flight_num,))
+            row = cur.fetchone()
+        if not row:
+            return
+        origin, destination = row
+    key = route_key(origin, destination)
+    search_cache.invalidate_tag(key)
+    fare_calendar_cache.invalidate_tag(key)
 
-        cls["cols"].add(c)
-        cls["grid"].setdefault(r, {})[c] = {"status": status}
 
-    for ct in classes:
-        classes[ct]["cols"] = sorted(classes[ct]["cols"])
-        classes[ct]["rows"] = sorted(classes[ct]["grid"].keys())
+def route_exists(origin, destination):
+    """
+    check if the route exists (in either direction)
+    :param origin: searched origin airport
+    :param destination: searched destination airport
+    :return: bool
+    """
+    if not origin or not destination:
+        return False
+    return route_graph.has_route(origin, destination)
 
-    order_pref = {"Business": 0, "Economy": 1}
-    return sorted(classes.items(), key=lambda kv: order_pref.get(kv[0], 999))
+
+def get_all_airports():
+    """
+    Get all available airports (TLV, ETH, etc.) from the cached route graph
+    :return: list of airports
+    """
+    return route_graph.airports()
 
 
 def _parse_mysql_dt(x):
@@ -151,7 +352,26 @@ def can_cancel_flight(dep_dt: datetime):
     :return: bool
     """
     dep_dt = _parse_mysql_dt(dep_dt)
-    return (dep_dt - datetime.now()) >= timedelta(hours=72)
+    return (dep_dt - datetime.now()) >= timedelta(hours=FLIGHT_CANCEL_HOURS)
+
+
+def order_cancellable_sql(orders: str = "o", flights: str = "f"):
+    """
+    SQL predicate of UserService.is_order_cancellable, to select it as a column or filter / page by it
+    :param orders: alias of the orders table
+    :param flights: alias of the flight table (joined on the order's flight)
+    """
+    return (f"({orders}.status = 'Active' AND "
+            f"{flights}.departure_datetime > NOW() + INTERVAL {ORDER_CANCEL_HOURS} HOUR)")
+
+
+def flight_cancellable_sql(flights: str = "f"):
+    """
+    SQL predicate of a flight the manager can cancel: not cancelled yet, and can_cancel_flight
+    :param flights: alias of the flight table
+    """
+    return (f"({flights}.status <> 'cancelled' AND "
+            f"{flights}.departure_datetime >= NOW() + INTERVAL {FLIGHT_CANCEL_HOURS} HOUR)")
 
 
 class FlightService:
@@ -171,29 +391,46 @@ class FlightService:
             return f"F{int(max_num) + 1}"
 
     @staticmethod
-    def get_flights(selected_status: str = ""):
+    def get_flights(selected_status: str = "", cancellable_only: bool = False, after: str | None = None,
+                    limit: int = FLIGHT_PAGE_SIZE):
         """
-        filters flights by status if chosen
+        one page of flights by departure time (keyset on departure_datetime, flight_num)
         :param selected_status: the status chosen by manager
-        :return: list of flights
+        :param cancellable_only: only flights the manager can still cancel (72 hour rule)
+        :param after: cursor of the previous page ('YYYY-MM-DD HH:MM:SS|flight_num'), None for the first page
+        :raise ValueError: if the cursor is invalid
+        :return: (list of flights (flight_num, origin, destination, departure, arrival, status, airplane_id,
+                 cancellable), next cursor or None)
         """
+        cancellable = flight_cancellable_sql()
+        filters = []
+        params = []
+        if selected_status:
+            filters.append(queries.MANAGER_FLIGHTS_STATUS)
+            params.append(selected_status)
+        if cancellable_only:
+            filters.append(queries.MANAGER_FLIGHTS_CANCELLABLE.format(cancellable=cancellable))
+        if after:
+            try:
+                departure, flight_num = after.split("|", 1)
+                departure = datetime.strptime(departure, "%Y-%m-%d %H:%M:%S")
+            except ValueError:
+                raise ValueError("Invalid page.")
+            filters.append(queries.MANAGER_FLIGHTS_AFTER)
+            params += [departure, departure, flight_num]
+        params.append(limit + 1)
+
         with db_cur() as cursor:
-            if selected_status:
-                cursor.execute("""
-                    SELECT flight_num, origin_airport, destination_airport,
-                           departure_datetime, arrival_datetime, status, airplane_id
-                    FROM flight
-                    WHERE status = %s
-                    ORDER BY departure_datetime;
-                """, (selected_status,))
-            else:
-                cursor.execute("""
-                    SELECT flight_num, origin_airport, destination_airport,
-                           departure_datetime, arrival_datetime, status, airplane_id
-                    FROM flight
-                    ORDER BY departure_datetime;
-                """)
-            return cursor.fetchall()
+            cursor.execute(queries.MANAGER_FLIGHTS_PAGE.format(filters=" ".join(filters), cancellable=cancellable),
+                           params)
+            flights = [row[:-1] + (bool(row[-1]),) for row in cursor.fetchall()]
+
+        next_after = None
+        if len(flights) > limit:
+            flights = flights[:limit]
+            last = flights[-1]
+            next_after = f"{_parse_mysql_dt(last[3]):%Y-%m-%d %H:%M:%S}|{last[0]}"
+        return flights, next_after
 
     @staticmethod
     def get_flight_basic(flight_num: str):
@@ -235,10 +472,10 @@ class FlightService:
     def cancel_flight_and_orders(flight_num: str):
         """
         - Set flight to cancelled + cancel active orders (total_paid=0, cancellation_fee=0)
-        - delete order lines of seats from order_seat
+        - delete order lines of seats from order_seat, release the seats and reset the seat inventory
         """
-        with db_cur() as cursor:
-            cursor.execute("""UPDATE orders SET total_paid = 0, cancellation_fee = 0, status = 'system cancellation'
+        with transaction() as cursor:
+            cursor.execute("""UPDATE orders SET total_paid = 0, cancellation_fee = 0, seats_count = 0, status = 'system cancellation'
                 WHERE flight_num=%s AND (status='active' OR status='Active')
             """, (flight_num,))
 
@@ -246,6 +483,43 @@ class FlightService:
 
             cursor.execute("""DELETE FROM order_seat WHERE flight_num = %s""",(flight_num,))
 
+            version = next_seat_version(cursor, flight_num)
+            cursor.execute("""UPDATE flight_seat SET seat_status = 'available', hold_token = NULL, hold_expires_at = NULL,
+                seat_version = %s WHERE flight_num = %s""", (version, flight_num))
+
+            cursor.execute(queries.INVENTORY_RELEASE_FLIGHT, (flight_num,))
+
+        seat_events.publish(flight_num, version, resync=True)
+        invalidate_flight_search(flight_num)
+
+    @staticmethod
+    def reconcile_inventory(flight_num: str | None = None):
+        """
+        repair drift between flight_inventory counters and the flight_seat rows,
+        and the fully booked status of the repaired flights
+        :param flight_num: a single flight, or None for all flights
+        :return: list of drifted rows (flight_num, class_type, counted available, actual available,
+                 counted sold, actual sold) that were repaired
+        """
+        if flight_num:
+            seats = queries.INVENTORY_FROM_SEATS.format(where="WHERE flight_num = %s")
+            params = (flight_num,)
+        else:
+            seats = queries.INVENTORY_FROM_SEATS.format(where="")
+            params = ()
+
+        changed = 0
+        with transaction() as cursor:
+            cursor.execute(queries.INVENTORY_DRIFT.format(seats=seats), params)
+            drift = cursor.fetchall()
+            if drift:
+                cursor.execute(queries.RECONCILE_INVENTORY.format(seats=seats), params)
+                changed = sync_fully_booked(cursor, {row[0] for row in drift})
+        if changed:
+            for fn in {row[0] for row in drift}:
+                invalidate_flight_search(fn)
+        return drift
+
     @staticmethod
     def get_route_duration_minutes(origin: str, destination: str):
         """
@@ -253,16 +527,7 @@ class FlightService:
         :param destination: given destination airport
         :return: duration between airports (minutes)
         """
-        with db_cur() as cursor:
-            cursor.execute("""
-                SELECT duration
-                FROM routes
-                WHERE (origin_airport=%s AND destination_airport=%s)
-                   OR (origin_airport=%s AND destination_airport=%s)
-                LIMIT 1
-            """, (origin, destination, destination, origin))
-            row = cursor.fetchone()
-            return int(row[0]) if row else None
+        return route_graph.duration(origin, destination)
 
     @staticmethod
     def get_free_airplanes(dep_dt: datetime, arr_dt: datetime):
@@ -353,7 +618,7 @@ class FlightService:
         create a new flight and insert into db
         :return: true if flight num is not taken, error if exists
         """
-        with db_cur() as cursor:
+        with transaction() as cursor:
             cursor.execute("SELECT 1 FROM flight WHERE flight_num=%s", (flight_num,))
             if cursor.fetchone():
                 return False, "Flight number already exists."
@@ -376,11 +641,14 @@ class FlightService:
                 WHERE sp.airplane_id = %s
             """, (flight_num, airplane_id, airplane_id))
 
+            cursor.execute(queries.INIT_FLIGHT_INVENTORY, (flight_num,))
+
             cursor.executemany("""
                 INSERT INTO flight_class_price (flight_num, airplane_id, class_type, price)
                 VALUES (%s, %s, %s, %s)
             """, [(flight_num, airplane_id, ct, pr) for ct, pr in prices])
 
+        invalidate_flight_search(flight_num, origin=origin, destination=destination)
         return True, None
 
     @staticmethod
@@ -525,6 +793,92 @@ class FlightService:
         FlightService.add_worker_role(worker_id=worker_id,role=role,
             lng_flight_approved=lng_flight_approved)
 
+    @staticmethod
+    def set_flight_status(flight_num: str, status: str):
+        """
+        manually change the status of a flight
+        """
+        with db_cur() as cursor:
+            cursor.execute("UPDATE flight SET status = %s WHERE flight_num = %s", (status, flight_num))
+        invalidate_flight_search(flight_num)
+
+    @staticmethod
+    def get_seat_map(flight_num: str):
+        """
+        seat map of a flight: cached airplane layout + one read of the flight's prices and taken seats
+        :return: SeatMap, or None if the flight doesn't exist
+        """
+        with db_cur() as cursor:
+            cursor.execute(queries.FLIGHT_SEAT_STATUS, (flight_num, flight_num, flight_num))
+            rows = cursor.fetchall()
+
+        airplane_id = None
+        version = 0
+        seat_rows = 0
+        prices = {}
+        taken = []
+        for kind, plane, class_type, row_num, col, price, seat_version in rows:
+            if kind == "flight":
+                airplane_id = plane
+                version = int(seat_version)
+                seat_rows = int(row_num)
+            elif kind == "price":
+                prices[class_type] = float(price)
+            else:
+                taken.append((class_type, row_num, col))
+        if airplane_id is None:
+            return None
+
+        layout = seat_layouts.get(airplane_id)
+        existing = None
+        if seat_rows != layout.size:
+            #seats without a flight_seat row can't be booked - show them as taken
+            with db_cur() as cursor:
+                cursor.execute(queries.FLIGHT_SEAT_POSITIONS, (flight_num,))
+                existing = cursor.fetchall()
+        return SeatMap(layout, layout.status(taken, existing), prices, version)
+
+    @staticmethod
+    def get_seat_version(flight_num: str):
+        """
+        :return: current seat version of the flight, or None if the flight doesn't exist
+        """
+        with db_cur() as cursor:
+            cursor.execute(queries.GET_SEAT_VERSION, (flight_num,))
+            row = cursor.fetchone()
+        return int(row[0]) if row else None
+
+    @staticmethod
+    def seat_availability(flight_num: str, since: int | None = None):
+        """
+        seat availability of a flight for polling clients
+        :param since: seat version the client already has - only seats changed after it are returned
+        :return: dict (version, delta, taken, released) with seats as 'class|row|column',
+                 or None if the flight doesn't exist. when delta is False, taken lists all taken seats.
+        """
+        with db_cur() as cursor:
+            if since is not None and since >= 0:
+                cursor.execute(queries.SEAT_CHANGES_SINCE, (since, flight_num))
+            else:
+                cursor.execute(queries.SEATS_TAKEN_WITH_VERSION, (flight_num,))
+            rows = cursor.fetchall()
+        if not rows:
+            return None
+
+        version = int(rows[0][0])
+        if since is not None and since > version:
+            #the client's version is not from this flight's history - send everything
+            return FlightService.seat_availability(flight_num)
+
+        result = {"flight_num": flight_num, "version": version, "delta": since is not None and since >= 0,
+                  "taken": [], "released": []}
+        for _, class_type, row_num, col, status in rows:
+            if class_type is None:
+                continue
+            key = "released" if status == "available" else "taken"
+            result[key].append(f"{class_type}|{row_num}|{col}")
+        return result
+
     @staticmethod
     def get_flight_statuses():
         """
@@ -552,7 +906,7 @@ class UserService:
         creates new customer in the db, inserts all the values
         - all parameters taken from the "post" form
         """
-        with db_cur() as cursor:
+        with transaction() as cursor:
             cursor.execute("""INSERT INTO users (email, f_name, l_name) VALUES (%s, %s, %s)""", (email, f_name, l_name))
 
             cursor.execute("""INSERT INTO customers (email, passport_num, birth_date, password, sign_up_date) VALUES (%s, %s, %s, %s, CURDATE())
@@ -569,24 +923,138 @@ class UserService:
         check if the order is cancellable:
         - order status must be active
         - flight must be more than 36hrs from now
+        (order_cancellable_sql is the same rule in SQL)
         :return: true if the order is cancellable, else false
         """
         if not departure_dt:
             return False
         if order_status != "Active":
             return False
-        return (departure_dt - datetime.now()) > timedelta(hours=36)
+        return (departure_dt - datetime.now()) > timedelta(hours=ORDER_CANCEL_HOURS)
 
     @staticmethod
-    def get_statuses(email):
+    def cancel_orders(order_ids, email: str):
         """
-        get all different order statuses
-        :return: list of statuses for given email
+        customer cancellation of one or many orders, atomically in one transaction:
+        the orders pay only their cancellation fee, all their seats are released with one joined UPDATE,
+        the seat inventory is adjusted and fully booked flights become active again.
+        :param order_ids: order numbers of the customer (or guest) with this email
+        :raise ValueError: if an order is not found or can't be cancelled (nothing is cancelled then)
+        :return: number of cancelled orders
         """
+        order_ids = list(dict.fromkeys(int(oid) for oid in order_ids))
+        if not order_ids:
+            return 0
+        orders_in = ", ".join(["%s"] * len(order_ids))
+
         with db_cur() as cursor:
-            query = "SELECT DISTINCT orders.status FROM orders WHERE email = %s;"
-            cursor.execute(query, (email,))
-            return [r[0] for r in cursor.fetchall()]
+            cursor.execute(queries.ORDERS_TO_CANCEL.format(orders=orders_in, cancellable=order_cancellable_sql()),
+                           (*order_ids, email))
+            flights = sorted({row[1] for row in cursor.fetchall()})
+
+        with transaction() as cursor:
+            #flight rows first (same lock order as booking), then the orders
+            versions = {flight_num: next_seat_version(cursor, flight_num) for flight_num in flights}
+            cursor.execute(queries.ORDERS_TO_CANCEL.format(orders=orders_in, cancellable=order_cancellable_sql())
+                           + " FOR UPDATE", (*order_ids, email))
+            rows = cursor.fetchall()
+            if len(rows) != len(order_ids):
+                raise ValueError("Order not found.")
+            bad = [str(oid) for oid, _, cancellable in rows if not cancellable]
+            if bad:
+                raise ValueError("These orders can no longer be cancelled: " + ", ".join(bad))
+            if {row[1] for row in rows} - versions.keys():
+                raise ValueError("Order changed, please try again.")
+
+            cursor.execute(queries.SEATS_OF_ORDERS.format(orders=orders_in), order_ids)
+            released = {}
+            for flight_num, ct, rn, cl in cursor.fetchall():
+                released.setdefault(flight_num, []).append(f"{ct}|{rn}|{cl}")
+
+            cursor.execute(queries.CANCEL_ORDERS.format(orders=orders_in), (*order_ids, email))
+            cursor.execute(queries.RELEASE_SEATS_OF_ORDERS.format(orders=orders_in), order_ids)
+            cursor.execute(queries.INVENTORY_RELEASE_SEATS_OF_ORDERS.format(orders=orders_in), order_ids)
+            cursor.execute(queries.DELETE_SEATS_OF_ORDERS.format(orders=orders_in), order_ids)
+
+            cursor.execute(queries.FULLY_BOOKED_FLIGHTS.format(flights=", ".join(["%s"] * len(flights))), flights)
+            reopened = [row[0] for row in cursor.fetchall()]
+            if reopened:
+                cursor.executemany(queries.FLIGHT_ACTIVE_IF_SEATS_FREED, [(fn,) for fn in reopened])
+
+        for flight_num, version in versions.items():
+            seat_events.publish(flight_num, version, released=released.get(flight_num, ()))
+        for flight_num in reopened:
+            invalidate_flight_search(flight_num)
+        return len(order_ids)
+
+    @staticmethod
+    def order_history(email: str, status: str | None = None, after: str | None = None,
+                      cancellable_only: bool = False, limit: int = ORDER_PAGE_SIZE, known_facets=None):
+        """
+        one page of the customer's orders, newest first, the order count per status and the number of
+        cancellable orders - in one query.
+        keyset pagination on (order_date, order_id), so a page costs the same however many orders there are.
+        the counts scan all of the customer's orders, so callers keep the first page's counts (server side) and
+        pass them back as known_facets for the next pages, which then read only their own rows.
+        :param status: only orders with this status
+        :param after: cursor of the previous page ('YYYY-MM-DD.order_id'), None for the first page
+        :param cancellable_only: only orders the customer can still cancel
+        :param known_facets: (facets, cancellable count) returned for an earlier page of the same query
+        :raise ValueError: if the cursor is invalid
+        :return: (rows, facets, cancellable count, next cursor or None). rows are (order_id, order_date, status,
+                 total_paid, cancellation_fee, flight_num, origin, destination, departure, arrival, flight_status,
+                 seats_count, cancellable), facets is a list of (status, count)
+        """
+        cancellable = order_cancellable_sql()
+        filters = []
+        params = [email]
+        if status:
+            filters.append(queries.ORDER_HISTORY_STATUS)
+            params.append(status)
+        if cancellable_only:
+            filters.append(queries.ORDER_HISTORY_CANCELLABLE.format(cancellable=cancellable))
+        if after:
+            try:
+                order_date, order_id = after.split(".")
+                order_date = datetime.strptime(order_date, "%Y-%m-%d").date()
+                order_id = int(order_id)
+            except ValueError:
+                raise ValueError("Invalid page.")
+            filters.append(queries.ORDER_HISTORY_AFTER)
+            params += [order_date, order_date, order_id]
+        params.append(limit + 1)
+        if known_facets is None:
+            params += [email, email]
+
+        query = queries.ORDER_HISTORY_PAGE.format(
+            filters=" ".join(filters), cancellable=cancellable,
+            facets=queries.ORDER_HISTORY_FACETS.format(cancellable=cancellable) if known_facets is None else "")
+        with db_cur() as cursor:
+            cursor.execute(query, params)
+            result = cursor.fetchall()
+
+        rows = [row[1:-1] + (bool(row[-1]),) for row in result if row[0] == "order"]
+        if known_facets is None:
+            facets = sorted((row[3], int(row[12])) for row in result if row[0] == "status")
+            cancellable_count = next((int(row[12]) for row in result if row[0] == "cancellable"), 0)
+        else:
+            facets, cancellable_count = known_facets
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            order_id, order_date = rows[-1][0], rows[-1][1]
+            next_after = f"{order_date:%Y-%m-%d}.{order_id}"
+        return rows, facets, cancellable_count, next_after
+
+    @staticmethod
+    def find_order(email: str, order_id: int):
+        """
+        order lookup by email and order number (guests)
+        :return: list with the order row (same columns as order_history rows), empty if not found
+        """
+        with db_cur() as cursor:
+            cursor.execute(queries.FIND_GUEST_ORDER.format(cancellable=order_cancellable_sql()), (email, order_id))
+            return [row[:-1] + (bool(row[-1]),) for row in cursor.fetchall()]
 
     @staticmethod
     def enough_seats(selected_flight_num):
@@ -595,12 +1063,7 @@ class UserService:
         :return: number of seats
         """
         with db_cur() as cursor:
-            cursor.execute("""
-                SELECT COUNT(*)
-                FROM flight_seat fs
-                WHERE fs.flight_num = %s
-                  AND fs.seat_status = 'available';
-            """, (selected_flight_num,))
+            cursor.execute(queries.CHECK_AVAILABLE_SEATS, (selected_flight_num,))
             return int(cursor.fetchone()[0])
 
 